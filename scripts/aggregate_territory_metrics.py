@@ -10,9 +10,11 @@ or city summaries).
 
 Input
 -----
-Expected input is a JSON array where each element is a "cleaned"
-business record with at least the following fields (all produced by
-``standardize_business_categories.py``):
+Expected input is a JSON array (or NDJSON, one record per line, for
+``.ndjson``/``.jsonl`` files, or a Parquet/Arrow IPC table for
+``.parquet``/``.pq``/``.arrow``/``.feather``/``.ipc`` files) where each
+element is a "cleaned" business record with at least the following
+fields (all produced by ``standardize_business_categories.py``):
 
     business_id                : unique identifier
     business_name              : cleaned name
@@ -30,14 +32,18 @@ business record with at least the following fields (all produced by
 
 Output
 ------
-JSON file containing:
+JSON file (or, for ``.parquet``/``.arrow`` output paths, a table with one
+row per territory and ``group_by``/``summary`` in its schema metadata)
+containing:
 
     {
-      "group_by": "<field>",
+      "group_by": "<level>",
       "summary": {... overall stats ...},
       "territories": [
         {
-          "territory_id": "<value of group field>",
+          "territory_id": "<value of group field>",  # "<city>|<zip>" for
+                                                     # city+zip_code, "ALL"
+                                                     # for statewide
           "business_count": int,
           "franchise_count": int,
           "independent_count": int,
@@ -47,7 +53,11 @@ JSON file containing:
           "has_valid_coordinates_count": int,
           "pct_valid_coordinates": float | null,
           "avg_rating_mean": float | null,
+          "avg_rating_variance": float | null,
+          "avg_rating_quantiles": {"p10": float, "p50": float, "p90": float} | null,
           "classification_confidence_mean": float | null,
+          "classification_confidence_variance": float | null,
+          "classification_confidence_quantiles": {...} | null,
           "classification_method_counts": {...},
           "top_sectors": [{"name": str, "count": int}],
           "top_subsectors": [{"name": str, "count": int}]
@@ -63,20 +73,128 @@ From the project root:
     python -m scripts.aggregate_territory_metrics \
         --input data/ca_businesses_standardized.json \
         --group-by zip_code
+
+Several grouping levels, including composites and a statewide total, are
+computed in one scan of the input and written one file per level (or as
+one document with ``--combined``):
+
+    python -m scripts.aggregate_territory_metrics \
+        --group-by zip_code blockgroup city city+zip_code statewide
+
+``--save-state`` also keeps the un-finalized accumulators next to each
+output (``<output stem>.state.json``). A later ``--apply-delta`` run
+applies inserted/deleted/updated records to that state and rewrites only
+the affected territories, without reading the full input. Counts, sums
+and statistics match a full rerun; after deletes or updates, names tied
+at the top-n cut-off can differ (see ``apply_delta``):
+
+    python -m scripts.aggregate_territory_metrics --group-by zip_code --save-state
+    python -m scripts.aggregate_territory_metrics --group-by zip_code \
+        --apply-delta data/business_changes.json
+
+Several inputs (e.g. per-county shards) are aggregated together; with
+``--workers`` each file, and each byte range of an NDJSON file, becomes a
+``PartialAggregate`` computed in its own process and merged in input
+order, giving the same output as a single-process run:
+
+    python -m scripts.aggregate_territory_metrics \
+        --input data/county_*.ndjson --workers 8
+
+Records can also be grouped by the community plan area containing their
+coordinates, which also places records that lack a ZIP code or block
+group; ``--layer`` adds or overrides polygon layers (see
+``spatial_assignment``):
+
+    python -m scripts.aggregate_territory_metrics --group-by community zip_code \
+        --layer city=data/city.json
+
+Grid levels bin coordinates into square or hexagonal cells of a given
+size, independent of administrative boundaries (see ``grid_cells``);
+several resolutions come out of the same pass:
+
+    python -m scripts.aggregate_territory_metrics \
+        --group-by hex_500m hex_2km hex_8km --engine numpy
+
+Parquet/Arrow inputs are memory-mapped and only the columns the metrics
+and grouping levels need are read; the numpy engine then works on the
+Arrow arrays directly instead of building a dict per record:
+
+    python -m scripts.aggregate_territory_metrics \
+        --input data/ca_businesses_standardized.parquet --engine numpy \
+        --output data/ca_businesses_standardized_by_zip_code.parquet
 """
 
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import heapq
+import itertools
 import json
 import logging
-from collections import Counter, defaultdict
+import math
+import os
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+from scripts.grid_cells import (
+    VALIDITY_FIELD,
+    GridSpec,
+    assign_cells,
+    cell_ids,
+    flagged_invalid,
+    parse_grid_field,
+)
+from scripts.spatial_assignment import (
+    DEFAULT_LAYERS,
+    assign_fields,
+    fill_missing,
+    load_layers,
+    parse_layer_spec,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# "python" accumulates dicts/Counters record by record; "numpy" encodes the
+# columns as integer codes and reduces them with bincount/unique
+ENGINES = ("python", "numpy")
+
+# Record fields a territory level can group by
+GROUP_FIELDS = ("zip_code", "blockgroup", "city")
+
+# Fields filled from the polygon containing each record (see
+# spatial_assignment), with a default layer when grouped by
+SPATIAL_GROUP_FIELDS = ("community",)
+
+# Records filled per batch when deriving spatial/grid fields from a stream
+DERIVE_BATCH_SIZE = 65_536
+
+# Level name for the single statewide total, and its territory_id
+STATEWIDE = "statewide"
+STATEWIDE_TERRITORY_ID = "ALL"
+
+# Composite levels join fields with "+" ("city+zip_code"); their
+# territory_id joins the per-field keys with "|" ("San Diego|92101")
+LEVEL_SEPARATOR = "+"
+KEY_SEPARATOR = "|"
+
 
 def _safe_mean(total: float, count: int) -> float | None:
     if count <= 0:
@@ -84,6 +202,23 @@ def _safe_mean(total: float, count: int) -> float | None:
     return total / count
 
 
+def _territory_key(value: Any) -> str:
+    return str(value).strip() if value not in (None, "") else "UNKNOWN"
+
+
+def parse_level(level: str) -> Tuple[str, ...]:
+    """
+    Fields of a grouping level: ``"zip_code"`` -> ``("zip_code",)``,
+    ``"city+zip_code"`` -> ``("city", "zip_code")``, ``"statewide"`` -> ``()``.
+    """
+    if level == STATEWIDE:
+        return ()
+    fields = tuple(field.strip() for field in level.split(LEVEL_SEPARATOR))
+    if not all(fields) or len(set(fields)) != len(fields):
+        raise ValueError(f"Invalid grouping level: {level!r}")
+    return fields
+
+
 def _top_n(counter: Counter, n: int) -> List[Dict[str, Any]]:
     """
     Return the top-n items from a Counter as a list of
@@ -96,149 +231,1955 @@ def _top_n(counter: Counter, n: int) -> List[Dict[str, Any]]:
     return [{"name": name, "count": count} for name, count in counter.most_common(n)]
 
 
-def aggregate_territories(
-    records: List[Dict[str, Any]],
-    group_by: str = "zip_code",
-    top_n: int = 5,
+def _territory_metrics(
+    territory_id: str,
+    business_count: int,
+    franchise_count: int,
+    independent_count: int,
+    unknown_franchise_count: int,
+    has_valid_coords: int,
+    avg_rating: "ValueStats",
+    class_conf: "ValueStats",
+    method_counts: Dict[str, int],
+    top_sectors: List[Dict[str, Any]],
+    top_subsectors: List[Dict[str, Any]],
 ) -> Dict[str, Any]:
+    """One entry of the output ``territories`` list."""
+    pct_franchise = (
+        franchise_count / business_count if business_count else None
+    )
+    pct_independent = (
+        independent_count / business_count if business_count else None
+    )
+    pct_valid_coords = (
+        has_valid_coords / business_count if business_count else None
+    )
+
+    return {
+        "territory_id": territory_id,
+        "business_count": business_count,
+        "franchise_count": franchise_count,
+        "independent_count": independent_count,
+        "unknown_franchise_count": unknown_franchise_count,
+        "pct_franchise": pct_franchise,
+        "pct_independent": pct_independent,
+        "has_valid_coordinates_count": has_valid_coords,
+        "pct_valid_coordinates": pct_valid_coords,
+        "avg_rating_mean": avg_rating.mean,
+        "avg_rating_variance": avg_rating.variance,
+        "avg_rating_quantiles": avg_rating.quantiles(),
+        "classification_confidence_mean": class_conf.mean,
+        "classification_confidence_variance": class_conf.variance,
+        "classification_confidence_quantiles": class_conf.quantiles(),
+        "classification_method_counts": method_counts,
+        "top_sectors": top_sectors,
+        "top_subsectors": top_subsectors,
+    }
+
+
+def _aggregate_result(group_by: str, territory_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    summary = {
+        "group_by": group_by,
+        "territory_count": len(territory_list),
+        "total_businesses": sum(t["business_count"] for t in territory_list),
+    }
+
+    return {
+        "group_by": group_by,
+        "summary": summary,
+        "territories": territory_list,
+    }
+
+
+# Every finite double is an integer multiple of 2**-1074
+_FIXED_POINT_BITS = 1074
+
+
+def _fixed_point(x: float) -> int:
+    """Finite ``x`` as an integer count of 2**-1074."""
+    numerator, denominator = x.as_integer_ratio()
+    return numerator << (_FIXED_POINT_BITS + 1 - denominator.bit_length())
+
+
+def _fixed_point_to_float(total: int) -> float:
+    """Correctly rounded float of ``total * 2**-1074``."""
+    try:
+        return total / (1 << _FIXED_POINT_BITS)
+    except OverflowError:
+        return math.inf if total > 0 else -math.inf
+
+
+class ExactSum:
     """
-    Aggregate standardized business records into territory-level metrics.
+    Order-independent float sum.
 
-    Parameters
-    ----------
-    records:
-        List of cleaned business records (dicts).
-    group_by:
-        Field name to group by (e.g. 'zip_code', 'blockgroup', 'city').
-    top_n:
-        Number of top sectors/subsectors to include per territory.
-        Values <= 0 disable the "top lists".
+    Accumulates finite values exactly as an integer count of 2**-1074, so
+    the result is the correctly rounded sum of all values however they
+    were split across partial aggregates and in whatever order those were
+    merged, and values can be removed again exactly. Non-finite values are
+    counted separately.
     """
 
-    territories: Dict[str, Dict[str, Any]] = {}
+    __slots__ = ("total", "nan", "posinf", "neginf")
 
-    # Normalise top_n to be non-negative
-    if top_n < 0:
-        top_n = 0
+    def __init__(self) -> None:
+        self.total = 0
+        self.nan = 0
+        self.posinf = 0
+        self.neginf = 0
+
+    def _add(self, x: float, sign: int) -> None:
+        if math.isfinite(x):
+            self.total += sign * _fixed_point(x)
+        elif x != x:
+            self.nan += sign
+        elif x > 0:
+            self.posinf += sign
+        else:
+            self.neginf += sign
+
+    def add(self, x: float, count: int = 1) -> None:
+        self._add(x, count)
+
+    def remove(self, x: float) -> None:
+        """Undo an earlier ``add(x)``."""
+        self._add(x, -1)
+
+    def merge(self, other: "ExactSum") -> None:
+        self.total += other.total
+        self.nan += other.nan
+        self.posinf += other.posinf
+        self.neginf += other.neginf
+
+    @property
+    def nonfinite(self) -> int:
+        return self.nan + self.posinf + self.neginf
+
+    @property
+    def special(self) -> float:
+        """The sum of the non-finite values (0.0 if there are none)."""
+        if self.nan or (self.posinf and self.neginf):
+            return math.nan
+        if self.posinf:
+            return math.inf
+        if self.neginf:
+            return -math.inf
+        return 0.0
+
+    @property
+    def value(self) -> float:
+        return _fixed_point_to_float(self.total) + self.special
+
+    def to_state(self) -> List[int]:
+        return [self.total, self.nan, self.posinf, self.neginf]
+
+    @classmethod
+    def from_state(cls, state: List[int]) -> "ExactSum":
+        exact = cls()
+        exact.total, exact.nan, exact.posinf, exact.neginf = state
+        return exact
+
+
+class FixedBinHistogram:
+    """
+    Equal-width bins over ``[low, high]`` with ``per_unit`` bins per unit.
+
+    Values are rounded to the nearest bin (out-of-range values go to the
+    end bins, NaN is skipped), so quantiles read from the bin counts are
+    exact for values on the bin grid (e.g. one-decimal ratings) and within
+    half a bin width otherwise. Bin counts add, subtract and merge exactly.
+    """
+
+    def __init__(self, low: float, high: float, per_unit: int):
+        self.low = low
+        self.per_unit = per_unit
+        self.bins = int(round((high - low) * per_unit)) + 1
+
+    def bin(self, x: float) -> Optional[int]:
+        position = (x - self.low) * self.per_unit + 0.5
+        if position != position:
+            return None
+        if position < 1:
+            return 0
+        if position >= self.bins:
+            return self.bins - 1
+        return int(position)
+
+    def value(self, index: int) -> float:
+        return self.low + index / self.per_unit
+
+    def quantiles(self, counts: Dict[int, int], total: int) -> Optional[Dict[str, float]]:
+        """Nearest-rank ``QUANTILES`` of ``total`` binned values, or None if empty."""
+        if total <= 0:
+            return None
+        result = {}
+        pending = list(QUANTILES)
+        cumulative = 0
+        for index in sorted(counts):
+            cumulative += counts[index]
+            # Nearest rank: the ceil(q * total / 100)-th smallest value
+            while pending and cumulative * 100 >= pending[0] * total:
+                result[f"p{pending.pop(0)}"] = self.value(index)
+            if not pending:
+                break
+        return result
+
+
+# Percentiles reported per territory
+QUANTILES = (10, 50, 90)
+
+# Ratings are 0-5 with one decimal; confidences 0-1 with two
+RATING_HISTOGRAM = FixedBinHistogram(0.0, 5.0, 10)
+CONFIDENCE_HISTOGRAM = FixedBinHistogram(0.0, 1.0, 100)
+
+
+class ValueStats:
+    """
+    Count, exact sums and bin counts of one numeric field within a
+    territory: mean, variance and quantiles, mergeable and removable.
+
+    ``add`` only counts the raw value. The counts are folded into the
+    summary (the exact sum, the exact sum of squares of the finite values
+    and the bins, one block of equal values at a time) when a statistic is
+    read or when more than ``histogram.bins`` distinct values are pending,
+    so memory stays within about twice the bin count.
+
+    The sums are integers, so adding, merging and removing values is exact
+    and the mean and variance are correctly rounded from them: they do not
+    depend on record order, on how the records were split, or on which of
+    them were applied as deltas.
+    """
+
+    __slots__ = ("histogram", "values", "n", "sum", "sum_squares", "bin_counts")
+
+    def __init__(self, histogram: FixedBinHistogram) -> None:
+        self.histogram = histogram
+        # Raw value counts not yet folded into the summary below
+        self.values: Counter = Counter()
+        self.n = 0
+        self.sum = ExactSum()
+        # Sum of the squared finite values, as a count of 2**-2148
+        self.sum_squares = 0
+        self.bin_counts: Counter = Counter()
+
+    def add(self, x: float) -> None:
+        values = self.values
+        if x in values:
+            values[x] += 1
+        else:
+            values[x] = 1
+            if len(values) > self.histogram.bins:
+                self.fold()
+
+    def remove(self, x: float) -> None:
+        """Undo an earlier ``add(x)``."""
+        if x in self.values:
+            _decrement(self.values, x)
+            return
+        self.fold()
+        self.n -= 1
+        self.sum.remove(x)
+        if math.isfinite(x):
+            self.sum_squares -= _fixed_point(x) ** 2
+        index = self.histogram.bin(x)
+        if index is not None:
+            _decrement(self.bin_counts, index)
+
+    def fold(self) -> None:
+        """Fold the pending raw value counts into the summary."""
+        if not self.values:
+            return
+        histogram = self.histogram
+        for x, count in self.values.items():
+            self.n += count
+            self.sum.add(x, count)
+            if math.isfinite(x):
+                self.sum_squares += _fixed_point(x) ** 2 * count
+            index = histogram.bin(x)
+            if index is not None:
+                self.bin_counts[index] += count
+        self.values = Counter()
+
+    def merge(self, other: "ValueStats") -> None:
+        self.n += other.n
+        self.sum.merge(other.sum)
+        self.sum_squares += other.sum_squares
+        self.bin_counts.update(other.bin_counts)
+        self.values.update(other.values)
+        if len(self.values) > self.histogram.bins:
+            self.fold()
+
+    @property
+    def mean(self) -> float | None:
+        self.fold()
+        return _safe_mean(self.sum.value, self.n)
+
+    @property
+    def variance(self) -> float | None:
+        """Population variance, or NaN if any value is NaN or infinite."""
+        self.fold()
+        if self.n <= 0:
+            return None
+        if self.sum.nonfinite:
+            return math.nan
+        # (n * sum(x^2) - sum(x)^2) / n^2, in units of 2**-2148
+        n = self.n
+        try:
+            return (n * self.sum_squares - self.sum.total**2) / (n * n << 2 * _FIXED_POINT_BITS)
+        except OverflowError:
+            return math.inf
+
+    def quantiles(self) -> Optional[Dict[str, float]]:
+        self.fold()
+        return self.histogram.quantiles(self.bin_counts, self.n - self.sum.nan)
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "values": list(map(list, self.values.items())),
+            "n": self.n,
+            "sum": self.sum.to_state(),
+            "sum_squares": self.sum_squares,
+            "bin_counts": sorted(self.bin_counts.items()),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any], histogram: FixedBinHistogram) -> "ValueStats":
+        stats = cls(histogram)
+        stats.values = Counter(dict(state["values"]))
+        stats.n = state["n"]
+        stats.sum = ExactSum.from_state(state["sum"])
+        stats.sum_squares = state["sum_squares"]
+        stats.bin_counts = Counter(dict(state["bin_counts"]))
+        return stats
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitters summary (Metwally et al.) with at most
+    ``capacity`` counters.
+
+    Each monitored item has an estimated ``count`` that overestimates its
+    true count by at most its ``error``, and any unmonitored item occurs at
+    most ``unmonitored_bound`` times, which never exceeds
+    ``total / capacity``. Items occurring more than that are always
+    monitored. Summaries merge (Agarwal et al., "Mergeable summaries") with
+    the same guarantees over the combined stream.
+    """
+
+    __slots__ = ("capacity", "counts", "errors", "total", "floor", "_heap", "_seq")
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("Sketch capacity must be at least 1")
+        self.capacity = capacity
+        self.counts: Dict[Any, int] = {}
+        self.errors: Dict[Any, int] = {}
+        self.total = 0
+        # Bound on unmonitored items carried over from merges
+        self.floor = 0
+        # (count, insertion seq, item); counts only grow, so entries are
+        # refreshed lazily when they reach the top
+        self._heap: List[Tuple[int, int, Any]] = []
+        self._seq = itertools.count()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "counts": self.counts,
+            "errors": self.errors,
+            "total": self.total,
+            "floor": self.floor,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        self._seq = itertools.count()
+        self._heap = [(count, next(self._seq), item) for item, count in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def _min_entry(self) -> Tuple[int, int, Any]:
+        heap, counts = self._heap, self.counts
+        while True:
+            count, seq, item = heap[0]
+            current = counts[item]
+            if current == count:
+                return heap[0]
+            heapq.heapreplace(heap, (current, seq, item))
+
+    def add(self, item: Any, count: int = 1) -> None:
+        self.total += count
+        counts = self.counts
+        if item in counts:
+            counts[item] += count
+            return
+        if len(counts) < self.capacity:
+            counts[item] = count
+            self.errors[item] = 0
+            heapq.heappush(self._heap, (count, next(self._seq), item))
+            return
+        # Replace the item with the smallest count; the newcomer inherits
+        # that count as its possible overestimate
+        minimum, _, victim = self._min_entry()
+        del counts[victim]
+        del self.errors[victim]
+        counts[item] = minimum + count
+        self.errors[item] = minimum
+        heapq.heapreplace(self._heap, (minimum + count, next(self._seq), item))
 
-    for rec in records:
-        key_raw = rec.get(group_by)
-        key = str(key_raw).strip() if key_raw not in (None, "") else "UNKNOWN"
-
-        t = territories.get(key)
-        if not t:
-            t = {
-                "territory_id": key,
-                "business_count": 0,
-                "franchise_count": 0,
-                "independent_count": 0,
-                "unknown_franchise_count": 0,
-                "has_valid_coordinates_count": 0,
-                "avg_rating_sum": 0.0,
-                "avg_rating_n": 0,
-                "class_conf_sum": 0.0,
-                "class_conf_n": 0,
-                "classification_method_counts": Counter(),
-                "sector_counts": Counter(),
-                "subsector_counts": Counter(),
-            }
-            territories[key] = t
-
-        t["business_count"] += 1
+    @property
+    def unmonitored_bound(self) -> int:
+        """Upper bound on the count of any item not in ``counts``."""
+        if len(self.counts) < self.capacity:
+            return self.floor
+        return max(self.floor, self._min_entry()[0])
+
+    def merge(self, other: "SpaceSaving") -> None:
+        if other.capacity != self.capacity:
+            raise ValueError(
+                f"Cannot merge sketches of capacity {other.capacity} into {self.capacity}"
+            )
+        bound, other_bound = self.unmonitored_bound, other.unmonitored_bound
+        counts: Dict[Any, int] = {}
+        errors: Dict[Any, int] = {}
+        for item in itertools.chain(self.counts, other.counts):
+            if item in counts:
+                continue
+            counts[item] = self.counts.get(item, bound) + other.counts.get(item, other_bound)
+            errors[item] = self.errors.get(item, bound) + other.errors.get(item, other_bound)
+
+        floor = bound + other_bound
+        if len(counts) > self.capacity:
+            ranked = sorted(counts, key=counts.__getitem__, reverse=True)
+            # Dropped items occur at most as often as their estimate
+            floor = max(floor, counts[ranked[self.capacity]])
+            counts = {item: counts[item] for item in ranked[: self.capacity]}
+            errors = {item: errors[item] for item in counts}
+
+        self.counts, self.errors = counts, errors
+        self.total += other.total
+        self.floor = floor
+        self._rebuild_heap()
+
+    def top(self, n: int) -> List[Dict[str, Any]]:
+        """Up to ``n`` ``{"name", "count", "error"}`` entries, largest estimate first."""
+        if n <= 0:
+            return []
+        errors = self.errors
+        ranked = sorted(self.counts.items(), key=lambda kv: kv[1], reverse=True)
+        return [
+            {"name": name, "count": count, "error": errors[name]}
+            for name, count in ranked[:n]
+        ]
+
+
+def _decrement(counter: Counter, key: Any) -> None:
+    count = counter.get(key, 0)
+    if count <= 0:
+        raise ValueError(f"Cannot remove {key!r}: not counted")
+    if count == 1:
+        del counter[key]
+    else:
+        counter[key] = count - 1
+
+
+class TerritoryAccumulator:
+    """
+    Un-finalized metrics for one territory.
+
+    With ``sketch_capacity`` the sector and subsector distributions are
+    kept in ``SpaceSaving`` summaries instead of exact Counters.
+    """
+
+    __slots__ = (
+        "territory_id",
+        "business_count",
+        "franchise_count",
+        "independent_count",
+        "unknown_franchise_count",
+        "has_valid_coordinates_count",
+        "avg_rating",
+        "class_conf",
+        "classification_method_counts",
+        "sector_counts",
+        "subsector_counts",
+    )
+
+    def __init__(self, territory_id: str, sketch_capacity: Optional[int] = None) -> None:
+        self.territory_id = territory_id
+        self.business_count = 0
+        self.franchise_count = 0
+        self.independent_count = 0
+        self.unknown_franchise_count = 0
+        self.has_valid_coordinates_count = 0
+        self.avg_rating = ValueStats(RATING_HISTOGRAM)
+        self.class_conf = ValueStats(CONFIDENCE_HISTOGRAM)
+        self.classification_method_counts: Counter = Counter()
+        self.sector_counts: Union[Counter, SpaceSaving]
+        self.subsector_counts: Union[Counter, SpaceSaving]
+        if sketch_capacity:
+            self.sector_counts = SpaceSaving(sketch_capacity)
+            self.subsector_counts = SpaceSaving(sketch_capacity)
+        else:
+            self.sector_counts = Counter()
+            self.subsector_counts = Counter()
+
+    def add(self, rec: Dict[str, Any]) -> None:
+        self.business_count += 1
 
         # Franchise breakdown
         is_franchise = rec.get("is_franchise")
         if is_franchise is True:
-            t["franchise_count"] += 1
+            self.franchise_count += 1
         elif is_franchise is False:
-            t["independent_count"] += 1
+            self.independent_count += 1
         else:
-            t["unknown_franchise_count"] += 1
+            self.unknown_franchise_count += 1
 
         # Coordinates
         if rec.get("has_valid_coordinates") is True:
-            t["has_valid_coordinates_count"] += 1
+            self.has_valid_coordinates_count += 1
 
         # Rating
         rating = rec.get("avg_rating")
         if isinstance(rating, (int, float)):
-            t["avg_rating_sum"] += float(rating)
-            t["avg_rating_n"] += 1
+            self.avg_rating.add(float(rating))
 
         # Classification confidence
         conf = rec.get("category_confidence")
         if isinstance(conf, (int, float)):
-            t["class_conf_sum"] += float(conf)
-            t["class_conf_n"] += 1
+            self.class_conf.add(float(conf))
 
         # Classification method
         method = (rec.get("category_method") or "unclassified").strip()
-        t["classification_method_counts"][method] += 1
+        self.classification_method_counts[method] += 1
 
         # Sector/subsector distributions
         sector = rec.get("category_sector") or "Unknown"
         subsector = rec.get("category_subsector") or "Unknown"
-        t["sector_counts"][sector] += 1
-        t["subsector_counts"][subsector] += 1
+        sector_counts = self.sector_counts
+        if type(sector_counts) is SpaceSaving:
+            sector_counts.add(sector)
+            self.subsector_counts.add(subsector)
+        else:
+            sector_counts[sector] += 1
+            self.subsector_counts[subsector] += 1
+
+    def remove(self, rec: Dict[str, Any]) -> None:
+        """
+        Undo an earlier ``add(rec)`` (exact mode only).
+
+        Raises ValueError if ``rec`` cannot have been added, leaving the
+        accumulator partially updated.
+        """
+        if isinstance(self.sector_counts, SpaceSaving):
+            raise ValueError("Records cannot be removed from sketched top-n summaries")
+        if self.business_count <= 0:
+            raise ValueError(f"Territory {self.territory_id!r} has no records to remove")
+        self.business_count -= 1
+
+        is_franchise = rec.get("is_franchise")
+        if is_franchise is True:
+            self.franchise_count -= 1
+        elif is_franchise is False:
+            self.independent_count -= 1
+        else:
+            self.unknown_franchise_count -= 1
+
+        if rec.get("has_valid_coordinates") is True:
+            self.has_valid_coordinates_count -= 1
+
+        rating = rec.get("avg_rating")
+        if isinstance(rating, (int, float)):
+            self.avg_rating.remove(float(rating))
 
-    # Build output structure
-    territory_list: List[Dict[str, Any]] = []
-    total_businesses = 0
+        conf = rec.get("category_confidence")
+        if isinstance(conf, (int, float)):
+            self.class_conf.remove(float(conf))
+
+        method = (rec.get("category_method") or "unclassified").strip()
+        _decrement(self.classification_method_counts, method)
+        _decrement(self.sector_counts, rec.get("category_sector") or "Unknown")
+        _decrement(self.subsector_counts, rec.get("category_subsector") or "Unknown")
 
-    for key, t in sorted(territories.items(), key=lambda kv: kv[0]):
-        business_count = t["business_count"]
-        total_businesses += business_count
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serializable un-finalized state (exact mode only)."""
+        if isinstance(self.sector_counts, SpaceSaving):
+            raise ValueError("Sketched territory accumulators cannot be persisted")
+        return {
+            "territory_id": self.territory_id,
+            "business_count": self.business_count,
+            "franchise_count": self.franchise_count,
+            "independent_count": self.independent_count,
+            "unknown_franchise_count": self.unknown_franchise_count,
+            "has_valid_coordinates_count": self.has_valid_coordinates_count,
+            "avg_rating": self.avg_rating.to_state(),
+            "class_conf": self.class_conf.to_state(),
+            # [key, count] pairs keep first-seen order and non-string keys
+            "classification_method_counts": list(map(list, self.classification_method_counts.items())),
+            "sector_counts": list(map(list, self.sector_counts.items())),
+            "subsector_counts": list(map(list, self.subsector_counts.items())),
+        }
 
-        franchise_count = t["franchise_count"]
-        independent_count = t["independent_count"]
-        unknown_franchise_count = t["unknown_franchise_count"]
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "TerritoryAccumulator":
+        t = cls(state["territory_id"])
+        for name in (
+            "business_count",
+            "franchise_count",
+            "independent_count",
+            "unknown_franchise_count",
+            "has_valid_coordinates_count",
+        ):
+            setattr(t, name, state[name])
+        t.avg_rating = ValueStats.from_state(state["avg_rating"], RATING_HISTOGRAM)
+        t.class_conf = ValueStats.from_state(state["class_conf"], CONFIDENCE_HISTOGRAM)
+        for name in ("classification_method_counts", "sector_counts", "subsector_counts"):
+            setattr(t, name, Counter(dict(state[name])))
+        return t
 
-        pct_franchise = (
-            franchise_count / business_count if business_count else None
+    def merge(self, other: "TerritoryAccumulator") -> None:
+        self.business_count += other.business_count
+        self.franchise_count += other.franchise_count
+        self.independent_count += other.independent_count
+        self.unknown_franchise_count += other.unknown_franchise_count
+        self.has_valid_coordinates_count += other.has_valid_coordinates_count
+        self.avg_rating.merge(other.avg_rating)
+        self.class_conf.merge(other.class_conf)
+        # Counter.update keeps first-seen key order, which decides both the
+        # method dict order and ties in the top-n lists
+        self.classification_method_counts.update(other.classification_method_counts)
+        if type(self.sector_counts) is not type(other.sector_counts):
+            raise ValueError("Cannot merge exact and sketched territory accumulators")
+        if isinstance(self.sector_counts, SpaceSaving):
+            self.sector_counts.merge(other.sector_counts)
+            self.subsector_counts.merge(other.subsector_counts)
+        else:
+            self.sector_counts.update(other.sector_counts)
+            self.subsector_counts.update(other.subsector_counts)
+
+    def finalize(self, top_n: int) -> Dict[str, Any]:
+        if isinstance(self.sector_counts, SpaceSaving):
+            metrics = self._finalize(
+                top_n, self.sector_counts.top(top_n), self.subsector_counts.top(top_n)
+            )
+            # True counts of listed names lie in [count - error, count];
+            # unlisted names occur at most *_error_bound times
+            metrics["top_sectors_error_bound"] = self.sector_counts.unmonitored_bound
+            metrics["top_subsectors_error_bound"] = self.subsector_counts.unmonitored_bound
+            return metrics
+        return self._finalize(
+            top_n, _top_n(self.sector_counts, top_n), _top_n(self.subsector_counts, top_n)
         )
-        pct_independent = (
-            independent_count / business_count if business_count else None
+
+    def _finalize(
+        self,
+        top_n: int,
+        top_sectors: List[Dict[str, Any]],
+        top_subsectors: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        return _territory_metrics(
+            territory_id=self.territory_id,
+            business_count=self.business_count,
+            franchise_count=self.franchise_count,
+            independent_count=self.independent_count,
+            unknown_franchise_count=self.unknown_franchise_count,
+            has_valid_coords=self.has_valid_coordinates_count,
+            avg_rating=self.avg_rating,
+            class_conf=self.class_conf,
+            method_counts=dict(self.classification_method_counts),
+            top_sectors=top_sectors,
+            top_subsectors=top_subsectors,
         )
 
-        has_valid_coords = t["has_valid_coordinates_count"]
-        pct_valid_coords = (
-            has_valid_coords / business_count if business_count else None
+
+class PartialAggregate:
+    """
+    Mergeable, un-finalized territory aggregation.
+
+    Build one per input file or shard (``add``/``update``), combine them
+    with ``merge`` and call ``finalize`` to get the ``aggregate_territories``
+    output. Partials are picklable, so they can be computed in worker
+    processes.
+
+    Counts, sums and variances do not depend on how records were split.
+    Key order (``classification_method_counts`` and ties in the top-n
+    lists) follows first occurrence, so merging partials in input order
+    gives output identical to a single pass over the concatenated input.
+
+    ``sketch_capacity`` switches the top-n sector/subsector lists to
+    approximate ``SpaceSaving`` summaries of that many counters per
+    territory, so memory scales with territories x capacity rather than
+    territories x distinct categories. Sketched results carry error
+    bounds and are not guaranteed identical across different splits.
+    """
+
+    def __init__(self, group_by: str = "zip_code", sketch_capacity: Optional[int] = None) -> None:
+        if sketch_capacity is not None and sketch_capacity < 1:
+            raise ValueError("Sketch capacity must be at least 1")
+        self.group_by = group_by
+        self.fields = parse_level(group_by)
+        self.sketch_capacity = sketch_capacity
+        self.territories: Dict[str, TerritoryAccumulator] = {}
+
+    def key(self, rec: Dict[str, Any]) -> str:
+        """territory_id of ``rec`` at this level."""
+        fields = self.fields
+        if len(fields) == 1:
+            key_raw = rec.get(fields[0])
+            return str(key_raw).strip() if key_raw not in (None, "") else "UNKNOWN"
+        if fields:
+            return KEY_SEPARATOR.join(_territory_key(rec.get(field)) for field in fields)
+        return STATEWIDE_TERRITORY_ID
+
+    def add(self, rec: Dict[str, Any]) -> None:
+        key = self.key(rec)
+        t = self.territories.get(key)
+        if t is None:
+            t = self.territories[key] = TerritoryAccumulator(key, self.sketch_capacity)
+        t.add(rec)
+
+    def remove(self, rec: Dict[str, Any]) -> str:
+        """Undo an earlier ``add(rec)``; returns the affected territory_id."""
+        key = self.key(rec)
+        t = self.territories.get(key)
+        if t is None:
+            raise ValueError(f"Cannot remove a record from unknown territory {key!r}")
+        t.remove(rec)
+        if not t.business_count:
+            del self.territories[key]
+        return key
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "group_by": self.group_by,
+            "territories": [t.to_state() for t in self.territories.values()],
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "PartialAggregate":
+        partial = cls(state["group_by"])
+        for t_state in state["territories"]:
+            t = TerritoryAccumulator.from_state(t_state)
+            partial.territories[t.territory_id] = t
+        return partial
+
+    def update(self, records: Iterable[Dict[str, Any]]) -> "PartialAggregate":
+        add = self.add
+        for rec in records:
+            add(rec)
+        return self
+
+    def merge(self, other: "PartialAggregate") -> "PartialAggregate":
+        """Fold ``other`` into this partial; ``other`` must not be reused."""
+        if other.group_by != self.group_by:
+            raise ValueError(
+                f"Cannot merge partials grouped by {other.group_by!r} into {self.group_by!r}"
+            )
+        if other.sketch_capacity != self.sketch_capacity:
+            raise ValueError(
+                f"Cannot merge partials with sketch capacity {other.sketch_capacity} "
+                f"into {self.sketch_capacity}"
+            )
+        territories = self.territories
+        for key, t in other.territories.items():
+            mine = territories.get(key)
+            if mine is None:
+                territories[key] = t
+            else:
+                mine.merge(t)
+        return self
+
+    def finalize(self, top_n: int = 5) -> Dict[str, Any]:
+        # Normalise top_n to be non-negative
+        if top_n < 0:
+            top_n = 0
+
+        territory_list = [
+            t.finalize(top_n)
+            for _, t in sorted(self.territories.items(), key=lambda kv: kv[0])
+        ]
+        result = _aggregate_result(self.group_by, territory_list)
+        if self.sketch_capacity:
+            result["summary"]["sketch_capacity"] = self.sketch_capacity
+        return result
+
+
+class RollupAggregate:
+    """
+    Several grouping levels (grouping sets) aggregated in one pass.
+
+    Each record is parsed once and added to one ``PartialAggregate`` per
+    level. Merges and finalizes like ``PartialAggregate``; ``finalize``
+    returns ``{level: aggregate_territories output}``.
+    """
+
+    def __init__(self, levels: Sequence[str], sketch_capacity: Optional[int] = None) -> None:
+        if not levels:
+            raise ValueError("At least one grouping level is required")
+        self.levels: Dict[str, PartialAggregate] = {
+            level: PartialAggregate(level, sketch_capacity) for level in dict.fromkeys(levels)
+        }
+
+    def add(self, rec: Dict[str, Any]) -> None:
+        for partial in self.levels.values():
+            partial.add(rec)
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"levels": [partial.to_state() for partial in self.levels.values()]}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "RollupAggregate":
+        partials = [PartialAggregate.from_state(level) for level in state["levels"]]
+        rollup = cls([partial.group_by for partial in partials])
+        rollup.levels = {partial.group_by: partial for partial in partials}
+        return rollup
+
+    def update(self, records: Iterable[Dict[str, Any]]) -> "RollupAggregate":
+        partials = list(self.levels.values())
+        for rec in records:
+            for partial in partials:
+                partial.add(rec)
+        return self
+
+    def merge(self, other: "RollupAggregate") -> "RollupAggregate":
+        """Fold ``other`` into this rollup; ``other`` must not be reused."""
+        if list(other.levels) != list(self.levels):
+            raise ValueError(
+                f"Cannot merge rollup levels {list(other.levels)} into {list(self.levels)}"
+            )
+        for level, partial in self.levels.items():
+            partial.merge(other.levels[level])
+        return self
+
+    def finalize(self, top_n: int = 5) -> Dict[str, Dict[str, Any]]:
+        return {level: partial.finalize(top_n) for level, partial in self.levels.items()}
+
+
+def _dictionary_encode(values: List[Any]) -> Tuple["np.ndarray", List[Any]]:
+    """Integer codes in first-seen order, and the distinct values."""
+    uniques = list(dict.fromkeys(values))
+    index = {value: code for code, value in enumerate(uniques)}
+    codes = np.fromiter(map(index.__getitem__, values), dtype=np.int64, count=len(values))
+    return codes, uniques
+
+
+def _sorted_codes(codes: "np.ndarray", keys: List[str]) -> Tuple["np.ndarray", List[str]]:
+    """Merge codes whose keys are equal and renumber them in sorted key order."""
+    distinct = sorted(set(keys))
+    position = {key: i for i, key in enumerate(distinct)}
+    remap = np.array([position[key] for key in keys], dtype=np.int64)
+    return remap[codes], distinct
+
+
+def _numeric_column(values: List[Any]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Mask of int/float values (as ``TerritoryAccumulator.add`` counts them) and those values."""
+    mask = np.fromiter((isinstance(v, (int, float)) for v in values), dtype=bool, count=len(values))
+    numbers = np.array([float(v) for v in values if isinstance(v, (int, float))], dtype=np.float64)
+    return mask, numbers
+
+
+def _method_name(value: Any) -> Any:
+    return (value or "unclassified").strip()
+
+
+def _category_name(value: Any) -> Any:
+    return value or "Unknown"
+
+
+class ColumnarRecords:
+    """
+    Metric columns of a record list, extracted once and shared by all
+    grouping levels of the numpy engine.
+
+    Categorical columns (method, sector, subsector) are dictionary-encoded
+    into integer codes in first-seen order. Subclasses supply the raw
+    columns from other sources by overriding ``_values``, ``_flags``,
+    ``_numeric``, ``_encoded`` and ``_field_codes``.
+    """
+
+    def __init__(self, records: Sequence[Dict[str, Any]]):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for the numpy aggregation engine")
+        self.records = records
+        self.size = len(records)
+        self._extract()
+
+    def _extract(self) -> None:
+        self.franchise, self.independent = self._flags("is_franchise")
+        self.valid_coords, _ = self._flags("has_valid_coordinates")
+        self.rating_mask, self.ratings = self._numeric("avg_rating")
+        self.conf_mask, self.confidences = self._numeric("category_confidence")
+        self.method_codes, self.methods = self._encoded("category_method", _method_name)
+        self.sector_codes, self.sectors, self.sector_values = self._category_column("category_sector")
+        self.subsector_codes, self.subsectors, self.subsector_values = self._category_column(
+            "category_subsector"
         )
 
-        territory_list.append(
-            {
-                "territory_id": key,
-                "business_count": business_count,
-                "franchise_count": franchise_count,
-                "independent_count": independent_count,
-                "unknown_franchise_count": unknown_franchise_count,
-                "pct_franchise": pct_franchise,
-                "pct_independent": pct_independent,
-                "has_valid_coordinates_count": has_valid_coords,
-                "pct_valid_coordinates": pct_valid_coords,
-                "avg_rating_mean": _safe_mean(t["avg_rating_sum"], t["avg_rating_n"]),
-                "classification_confidence_mean": _safe_mean(
-                    t["class_conf_sum"], t["class_conf_n"]
-                ),
-                "classification_method_counts": dict(
-                    t["classification_method_counts"]
-                ),
-                "top_sectors": _top_n(t["sector_counts"], top_n),
-                "top_subsectors": _top_n(t["subsector_counts"], top_n),
-            }
+    def _values(self, field: str) -> List[Any]:
+        return [rec.get(field) for rec in self.records]
+
+    def _flags(self, field: str) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Masks of values that are ``True`` and ``False`` (not just truthy)."""
+        values = self._values(field)
+        n = len(values)
+        return (
+            np.fromiter((v is True for v in values), dtype=bool, count=n),
+            np.fromiter((v is False for v in values), dtype=bool, count=n),
         )
 
-    summary = {
-        "group_by": group_by,
-        "territory_count": len(territories),
-        "total_businesses": total_businesses,
-    }
+    def _numeric(self, field: str) -> Tuple["np.ndarray", "np.ndarray"]:
+        return _numeric_column(self._values(field))
 
-    return {
-        "group_by": group_by,
-        "summary": summary,
-        "territories": territory_list,
-    }
+    def _encoded(self, field: str, normalize: Callable[[Any], Any]) -> Tuple["np.ndarray", List[Any]]:
+        """``_dictionary_encode`` of the normalized values of ``field``."""
+        return _dictionary_encode([normalize(v) for v in self._values(field)])
+
+    def _category_column(self, field: str) -> Tuple["np.ndarray", List[Any], Optional[List[Any]]]:
+        codes, names = self._encoded(field, _category_name)
+        # Non-string names can compare equal across types (1 == 1.0 == True);
+        # a Counter then reports the first one seen in each territory, so
+        # keep the raw values to look that up
+        if all(type(name) is str for name in names):
+            return codes, names, None
+        return codes, names, [_category_name(v) for v in self._values(field)]
+
+    def _field_codes(self, field: str) -> Tuple["np.ndarray", List[str]]:
+        """Per-record codes of the normalized territory key of one field."""
+        values = self._values(field)
+        try:
+            codes, uniques = _dictionary_encode(values)
+        except TypeError:
+            # Unhashable values; normalize every record instead
+            uniques = None
+        if uniques is not None and all(type(v) is str or v is None for v in uniques):
+            # Strings (and None) only: normalizing the distinct values is enough
+            return _sorted_codes(codes, [_territory_key(v) for v in uniques])
+        # Numbers can be equal across types (1 == 1.0 == True) yet format
+        # differently, so normalize per record
+        codes, uniques = _dictionary_encode([_territory_key(v) for v in values])
+        return _sorted_codes(codes, uniques)
+
+    def territory_codes(self, level: str) -> Tuple["np.ndarray", List[str]]:
+        """Per-record territory codes for ``level``, numbered in sorted territory_id order."""
+        fields = parse_level(level)
+        if not fields:
+            return np.zeros(self.size, dtype=np.int64), [STATEWIDE_TERRITORY_ID] if self.size else []
+        codes, keys = self._field_codes(fields[0])
+        if len(fields) == 1:
+            return codes, keys
+        # Composite level: combine per-field codes, then build the joined
+        # territory_id once per distinct combination
+        parts = [keys]
+        for field in fields[1:]:
+            field_codes, field_keys = self._field_codes(field)
+            codes = codes * len(field_keys) + field_codes
+            parts.append(field_keys)
+        combined, inverse = np.unique(codes, return_inverse=True)
+        joined = []
+        for code in combined.tolist():
+            components = []
+            for field_keys in reversed(parts):
+                code, component = divmod(code, len(field_keys))
+                components.append(field_keys[component])
+            joined.append(KEY_SEPARATOR.join(reversed(components)))
+        return _sorted_codes(inverse.reshape(-1), joined)
+
+
+class ArrowColumnarRecords(ColumnarRecords):
+    """
+    ``ColumnarRecords`` read straight from an Arrow table (e.g. a
+    memory-mapped Parquet/Arrow IPC input) without building record dicts.
+
+    Boolean, numeric and dictionary-encodable columns are converted with
+    Arrow kernels; any other column type falls back to its Python values,
+    so the output still matches the python engine. Absent columns read as
+    all null.
+    """
+
+    def __init__(self, table: "pa.Table"):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for the numpy aggregation engine")
+        self.table = table
+        self.size = table.num_rows
+        self._extract()
+
+    def _column(self, field: str) -> Optional["pa.Array"]:
+        if field not in self.table.column_names:
+            return None
+        return self.table.column(field).combine_chunks()
+
+    def _values(self, field: str) -> List[Any]:
+        column = self._column(field)
+        return [None] * self.size if column is None else column.to_pylist()
+
+    def _flags(self, field: str) -> Tuple["np.ndarray", "np.ndarray"]:
+        column = self._column(field)
+        if column is None:
+            return np.zeros(self.size, dtype=bool), np.zeros(self.size, dtype=bool)
+        if not pa.types.is_boolean(column.type):
+            return super()._flags(field)
+        return (
+            pc.fill_null(column, False).to_numpy(zero_copy_only=False),
+            pc.fill_null(pc.invert(column), False).to_numpy(zero_copy_only=False),
+        )
+
+    def _numeric(self, field: str) -> Tuple["np.ndarray", "np.ndarray"]:
+        column = self._column(field)
+        if column is None:
+            return np.zeros(self.size, dtype=bool), np.zeros(0, dtype=np.float64)
+        kind = column.type
+        if not (pa.types.is_integer(kind) or pa.types.is_floating(kind) or pa.types.is_boolean(kind)):
+            return super()._numeric(field)
+        mask = column.is_valid().to_numpy(zero_copy_only=False)
+        numbers = pc.drop_null(column).cast(pa.float64(), safe=False)
+        return mask, numbers.to_numpy(zero_copy_only=False)
+
+    def _encoded(self, field: str, normalize: Callable[[Any], Any]) -> Tuple["np.ndarray", List[Any]]:
+        column = self._column(field)
+        if column is None:
+            return np.zeros(self.size, dtype=np.int64), [normalize(None)] if self.size else []
+        try:
+            encoded = pc.dictionary_encode(column, null_encoding="encode")
+        except pa.ArrowNotImplementedError:
+            return super()._encoded(field, normalize)
+        # The dictionary is in first-seen order; normalizing it can merge
+        # entries, so re-encode the (few) normalized dictionary values
+        remap, uniques = _dictionary_encode([normalize(v) for v in encoded.dictionary.to_pylist()])
+        indices = encoded.indices.to_numpy(zero_copy_only=False).astype(np.int64)
+        return remap[indices], uniques
+
+    def _field_codes(self, field: str) -> Tuple["np.ndarray", List[str]]:
+        column = self._column(field)
+        if column is not None:
+            kind = column.type
+            if not (
+                pa.types.is_string(kind)
+                or pa.types.is_large_string(kind)
+                or pa.types.is_integer(kind)
+                or pa.types.is_boolean(kind)
+            ):
+                # e.g. floats: -0.0 == 0.0 but the keys differ
+                return super()._field_codes(field)
+        # Equal values of one of these types have equal keys, so normalizing
+        # the distinct values is enough
+        codes, uniques = self._encoded(field, lambda value: value)
+        return _sorted_codes(codes, [_territory_key(v) for v in uniques])
+
+
+def _group_value_stats(
+    groups: "np.ndarray",
+    values: "np.ndarray",
+    group_count: int,
+    histogram: FixedBinHistogram,
+) -> List[ValueStats]:
+    """
+    Per-group ``ValueStats`` equal to adding the same values one by one.
+
+    Each distinct (group, value) pair is counted once, so the Python-level
+    work scales with distinct values rather than records.
+    """
+    stats = [ValueStats(histogram) for _ in range(group_count)]
+    if not len(values):
+        return stats
+
+    distinct, value_codes = np.unique(values, return_inverse=True)
+    pair_groups, pair_codes, counts, _ = _pair_counts(groups, value_codes.reshape(-1), len(distinct))
+    distinct_values = distinct.tolist()
+    for g, c, n in zip(pair_groups.tolist(), pair_codes.tolist(), counts.tolist()):
+        stats[g].values[distinct_values[c]] = n
+    return stats
+
+
+def _pair_counts(
+    groups: "np.ndarray",
+    codes: "np.ndarray",
+    width: int,
+    dense_cells: int = 1 << 24,
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Distinct (group, code) pairs with their counts and the position of
+    their first record, sorted by group then code.
+
+    Uses ``bincount``/``minimum.at`` over the dense pair space when it has
+    at most ``dense_cells`` cells, and sorts (``unique``) otherwise.
+    """
+    pairs = groups * width + codes
+    cells = (int(groups.max()) + 1) * width if len(groups) else 0
+    if cells <= dense_cells:
+        counts = np.bincount(pairs, minlength=cells)
+        first = np.full(cells, len(pairs), dtype=np.int64)
+        np.minimum.at(first, pairs, np.arange(len(pairs)))
+        present = np.flatnonzero(counts)
+        counts, first = counts[present], first[present]
+        pairs = present
+    else:
+        pairs, first, counts = np.unique(pairs, return_index=True, return_counts=True)
+    return pairs // width, pairs % width, counts, first
+
+
+def _grouped_method_counts(
+    groups: "np.ndarray", codes: "np.ndarray", names: List[str], group_count: int
+) -> List[Dict[str, int]]:
+    """Per-group ``{method: count}`` in first-seen order, like the Counter it replaces."""
+    width = max(len(names), 1)
+    pair_groups, pair_codes, counts, first = _pair_counts(groups, codes, width)
+    order = np.lexsort((first, pair_groups))
+    result: List[Dict[str, int]] = [{} for _ in range(group_count)]
+    for g, c, n in zip(pair_groups[order].tolist(), pair_codes[order].tolist(), counts[order].tolist()):
+        result[g][names[c]] = n
+    return result
+
+
+def _grouped_top_n(
+    groups: "np.ndarray",
+    codes: "np.ndarray",
+    names: List[str],
+    group_count: int,
+    top_n: int,
+    values: Optional[List[Any]] = None,
+    block_cells: int = 1 << 22,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Per-group ``_top_n`` lists from a territory x category count matrix.
+
+    Each row is ranked by (count descending, first occurrence ascending),
+    which is how ``Counter.most_common`` orders ties, using
+    ``argpartition`` to select the top ``top_n`` columns. Rows are
+    processed in blocks of about ``block_cells`` matrix cells to bound
+    memory. With ``values`` (the raw column), names are taken from each
+    territory's first matching record instead of ``names``.
+    """
+    result: List[List[Dict[str, Any]]] = [[] for _ in range(group_count)]
+    width = len(names)
+    if top_n <= 0 or not width or not group_count:
+        return result
+
+    pair_groups, pair_codes, counts, first = _pair_counts(groups, codes, width)
+    # Lexicographic (-count, first) as one integer; empty cells sort last
+    scale = len(groups) + 1
+    keys = (scale - counts) * scale + first
+    empty = np.iinfo(np.int64).max
+    k = min(top_n, width)
+    rows_per_block = max(1, block_cells // width)
+    pair_bounds = np.searchsorted(pair_groups, np.arange(0, group_count + rows_per_block, rows_per_block))
+
+    for block, start in enumerate(range(0, group_count, rows_per_block)):
+        rows = min(rows_per_block, group_count - start)
+        lo, hi = pair_bounds[block], pair_bounds[block + 1]
+        key_matrix = np.full((rows, width), empty, dtype=np.int64)
+        count_matrix = np.zeros((rows, width), dtype=np.int64)
+        key_matrix[pair_groups[lo:hi] - start, pair_codes[lo:hi]] = keys[lo:hi]
+        count_matrix[pair_groups[lo:hi] - start, pair_codes[lo:hi]] = counts[lo:hi]
+
+        if k < width:
+            top = np.argpartition(key_matrix, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(width), (rows, width))
+        top = np.take_along_axis(top, np.argsort(np.take_along_axis(key_matrix, top, axis=1), axis=1), axis=1)
+        top_counts = np.take_along_axis(count_matrix, top, axis=1)
+        if values is None:
+            top_names = [[names[c] for c in columns] for columns in top.tolist()]
+        else:
+            top_first = np.take_along_axis(key_matrix, top, axis=1) % scale
+            top_names = [[values[i] for i in row] for row in top_first.tolist()]
+
+        for row, (row_names, row_counts) in enumerate(zip(top_names, top_counts.tolist())):
+            result[start + row] = [
+                {"name": name, "count": n} for name, n in zip(row_names, row_counts) if n
+            ]
+    return result
+
+
+def _aggregate_columns(columns: ColumnarRecords, group_by: str, top_n: int) -> Dict[str, Any]:
+    """``aggregate_territories`` output for one level, computed from columns."""
+    if top_n < 0:
+        top_n = 0
+
+    groups, territory_ids = columns.territory_codes(group_by)
+    group_count = len(territory_ids)
+
+    def count(mask: "np.ndarray | None" = None) -> List[int]:
+        selected = groups if mask is None else groups[mask]
+        return np.bincount(selected, minlength=group_count).tolist()
+
+    business_counts = count()
+    franchise_counts = count(columns.franchise)
+    independent_counts = count(columns.independent)
+    valid_coords_counts = count(columns.valid_coords)
+    ratings = _group_value_stats(
+        groups[columns.rating_mask], columns.ratings, group_count, RATING_HISTOGRAM
+    )
+    confidences = _group_value_stats(
+        groups[columns.conf_mask], columns.confidences, group_count, CONFIDENCE_HISTOGRAM
+    )
+    method_counts = _grouped_method_counts(groups, columns.method_codes, columns.methods, group_count)
+    top_sectors = _grouped_top_n(
+        groups, columns.sector_codes, columns.sectors, group_count, top_n, columns.sector_values
+    )
+    top_subsectors = _grouped_top_n(
+        groups, columns.subsector_codes, columns.subsectors, group_count, top_n, columns.subsector_values
+    )
+
+    territory_list = [
+        _territory_metrics(
+            territory_id=territory_ids[g],
+            business_count=business_counts[g],
+            franchise_count=franchise_counts[g],
+            independent_count=independent_counts[g],
+            unknown_franchise_count=business_counts[g] - franchise_counts[g] - independent_counts[g],
+            has_valid_coords=valid_coords_counts[g],
+            avg_rating=ratings[g],
+            class_conf=confidences[g],
+            method_counts=method_counts[g],
+            top_sectors=top_sectors[g],
+            top_subsectors=top_subsectors[g],
+        )
+        for g in range(group_count)
+    ]
+    return _aggregate_result(group_by, territory_list)
+
+
+def _new_partial(
+    group_by: Union[str, Sequence[str]], sketch_capacity: Optional[int] = None
+) -> Union[PartialAggregate, RollupAggregate]:
+    if isinstance(group_by, str):
+        return PartialAggregate(group_by, sketch_capacity)
+    return RollupAggregate(group_by, sketch_capacity)
+
+
+def aggregate_territories(
+    records: Iterable[Dict[str, Any]],
+    group_by: str = "zip_code",
+    top_n: int = 5,
+    engine: str = "python",
+    sketch_capacity: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Aggregate standardized business records into territory-level metrics.
+
+    Parameters
+    ----------
+    records:
+        Iterable of cleaned business records (dicts).
+    group_by:
+        Field name to group by (e.g. 'zip_code', 'blockgroup', 'city'),
+        a composite level such as 'city+zip_code', or 'statewide'.
+    top_n:
+        Number of top sectors/subsectors to include per territory.
+        Values <= 0 disable the "top lists".
+    engine:
+        "python" (default) or "numpy"; both give identical output. The
+        numpy engine materializes the records as a list.
+    sketch_capacity:
+        If set, approximate the top sector/subsector lists with
+        Space-Saving summaries of this many counters per territory (python
+        engine only). Each listed entry then has an ``error`` and each
+        territory ``top_sectors_error_bound``/``top_subsectors_error_bound``.
+    """
+    return aggregate_rollups(records, [group_by], top_n, engine, sketch_capacity)[group_by]
+
+
+def aggregate_rollups(
+    records: Iterable[Dict[str, Any]],
+    levels: Sequence[str] = GROUP_FIELDS,
+    top_n: int = 5,
+    engine: str = "python",
+    sketch_capacity: Optional[int] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate records at several grouping levels in a single pass.
+
+    Returns ``{level: output}`` where each output is what
+    ``aggregate_territories(records, group_by=level, top_n=top_n)`` returns.
+    The numpy engine also accepts already extracted ``ColumnarRecords``.
+    """
+    if engine == "numpy":
+        if sketch_capacity:
+            raise ValueError("Sketched top-n lists need the python engine")
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for the numpy aggregation engine")
+        if isinstance(records, ColumnarRecords):
+            columns = records
+        else:
+            columns = ColumnarRecords(records if isinstance(records, list) else list(records))
+        return {level: _aggregate_columns(columns, level, top_n) for level in dict.fromkeys(levels)}
+    if engine != "python":
+        raise ValueError(f"Unknown aggregation engine: {engine!r}")
+    return RollupAggregate(levels, sketch_capacity).update(records).finalize(top_n)
+
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+# Record fields the metrics read, besides the grouping fields
+METRIC_FIELDS = (
+    "is_franchise",
+    "has_valid_coordinates",
+    "avg_rating",
+    "category_confidence",
+    "category_method",
+    "category_sector",
+    "category_subsector",
+)
+
+
+def _is_ndjson(path: Path) -> bool:
+    return path.suffix.lower() in (".ndjson", ".jsonl")
+
+
+def _is_parquet(path: Path) -> bool:
+    return path.suffix.lower() in PARQUET_SUFFIXES
+
+
+def _is_columnar(path: Path) -> bool:
+    """Parquet or Arrow IPC (Feather v2) file, by extension."""
+    return path.suffix.lower() in PARQUET_SUFFIXES + ARROW_SUFFIXES
+
+
+def _require_pyarrow() -> None:
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Parquet/Arrow files")
+
+
+def grid_specs(levels: Sequence[str]) -> List[GridSpec]:
+    """
+    The distinct grid cell fields (see ``grid_cells``) used by ``levels``.
+    Grid levels ("hex_500m", "square_1km") are computed from the
+    coordinates rather than read from the records.
+    """
+    specs: Dict[str, GridSpec] = {}
+    for level in levels:
+        for field in parse_level(level):
+            spec = parse_grid_field(field)
+            if spec is not None:
+                specs.setdefault(field, spec)
+    return list(specs.values())
+
+
+def needed_columns(levels: Sequence[str], layers: Optional[Dict[str, str]] = None) -> List[str]:
+    """Fields read to aggregate ``levels``; columnar inputs load only these."""
+    grids = {spec.name for spec in grid_specs(levels)}
+    columns = list(METRIC_FIELDS)
+    for level in levels:
+        columns.extend(field for field in parse_level(level) if field not in columns and field not in grids)
+    if layers or grids:
+        columns.extend(field for field in ("longitude", "latitude", *(layers or ())) if field not in columns)
+    return columns
+
+
+def _derive(
+    records: List[Dict[str, Any]],
+    levels: Sequence[str],
+    layers: Optional[Dict[str, str]],
+) -> List[Dict[str, Any]]:
+    """
+    Fill the ``{field: polygon file}`` fields of ``records`` spatially and
+    set the grid cell fields of ``levels``, in place.
+    """
+    if layers:
+        assign_fields(records, load_layers(layers))
+    assign_cells(records, grid_specs(levels))
+    return records
+
+
+def _iter_derived(
+    records: Iterable[Dict[str, Any]],
+    levels: Sequence[str],
+    layers: Optional[Dict[str, str]],
+) -> Iterable[Dict[str, Any]]:
+    """``_derive`` over a record stream, ``DERIVE_BATCH_SIZE`` records at a time."""
+    if not layers and not grid_specs(levels):
+        return records
+    iterator = iter(records)
+    batches = iter(lambda: list(itertools.islice(iterator, DERIVE_BATCH_SIZE)), [])
+    return (record for batch in batches for record in _derive(batch, levels, layers))
+
+
+def _coordinate_column(table: "pa.Table", field: str) -> "np.ndarray":
+    if field not in table.column_names:
+        return np.full(table.num_rows, np.nan)
+    column = table.column(field)
+    if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+        return pc.fill_null(column.cast(pa.float64(), safe=False), math.nan).to_numpy()
+    return np.array(
+        [float(v) if isinstance(v, (int, float)) and not isinstance(v, bool) else math.nan for v in column.to_pylist()],
+        dtype=np.float64,
+    )
+
+
+def _set_column(table: "pa.Table", field: str, column: "pa.Array") -> "pa.Table":
+    if field in table.column_names:
+        return table.set_column(table.column_names.index(field), field, column)
+    return table.append_column(field, column)
+
+
+def _derive_table(table: "pa.Table", levels: Sequence[str], layers: Optional[Dict[str, str]]) -> "pa.Table":
+    """``_derive`` for an Arrow table: returns it with the fields filled."""
+    grids = grid_specs(levels)
+    if not layers and not grids:
+        return table
+    lon = _coordinate_column(table, "longitude")
+    lat = _coordinate_column(table, "latitude")
+    grid_lon = lon
+    if grids and VALIDITY_FIELD in table.column_names:
+        grid_lon = np.where(flagged_invalid(table.column(VALIDITY_FIELD).to_pylist()), np.nan, lon)
+    for field, ids in cell_ids(grids, grid_lon, lat).items():
+        table = _set_column(table, field, pa.array(ids, type=pa.string()))
+    for field, layer in load_layers(layers or {}).items():
+        present = field in table.column_names
+        values = table.column(field).to_pylist() if present else [None] * table.num_rows
+        filled = fill_missing(values, lon, lat, layer)
+        try:
+            column = pa.array(filled)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Polygon names next to non-string values: the territory key
+            # is str(value) either way
+            column = pa.array([v if v is None else str(v) for v in filled], type=pa.string())
+        table = _set_column(table, field, column)
+    return table
+
+
+def columnar_batch_count(path: Path) -> int:
+    """Row groups of a Parquet file, or record batches of an Arrow IPC file."""
+    _require_pyarrow()
+    if _is_parquet(path):
+        return pq.ParquetFile(path, memory_map=True).num_row_groups
+    with pa.memory_map(str(path), "r") as source:
+        return pa.ipc.open_file(source).num_record_batches
+
+
+def columnar_shards(path: Path, count: int) -> List[Tuple[int, int]]:
+    """Split a Parquet/Arrow file into up to ``count`` ranges of batches."""
+    batches = columnar_batch_count(path)
+    count = max(1, min(count, batches))
+    bounds = [batches * i // count for i in range(count + 1)]
+    return list(zip(bounds, bounds[1:]))
+
+
+def iter_columnar_batches(
+    path: Path,
+    columns: Optional[Sequence[str]] = None,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator["pa.RecordBatch"]:
+    """
+    Record batches ``[start, end)`` (row groups for Parquet) of a
+    memory-mapped Parquet/Arrow IPC file, reading only those of
+    ``columns`` that the file has (all columns if None).
+    """
+    _require_pyarrow()
+    if _is_parquet(path):
+        parquet_file = pq.ParquetFile(path, memory_map=True)
+        names = parquet_file.schema_arrow.names
+        present = names if columns is None else [c for c in columns if c in names]
+        stop = parquet_file.num_row_groups if end is None else end
+        for index in range(start, stop):
+            yield from parquet_file.read_row_group(index, columns=present).to_batches()
+        return
+    with pa.memory_map(str(path), "r") as source:
+        reader = pa.ipc.open_file(source)
+        names = reader.schema.names
+        present = names if columns is None else [c for c in columns if c in names]
+        stop = reader.num_record_batches if end is None else end
+        for index in range(start, stop):
+            yield reader.get_batch(index).select(present)
+
+
+def read_columnar_table(path: Path, columns: Optional[Sequence[str]] = None) -> "pa.Table":
+    """
+    A Parquet/Arrow IPC file as a table of only those of ``columns`` it has.
+    Arrow IPC columns stay zero-copy views of the memory-mapped file.
+    """
+    _require_pyarrow()
+    if _is_parquet(path):
+        names = pq.read_schema(path).names
+        present = None if columns is None else [c for c in columns if c in names]
+        return pq.read_table(path, columns=present, memory_map=True)
+    with pa.memory_map(str(path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table if columns is None else table.select([c for c in columns if c in table.column_names])
+
+
+def load_records(path: Path, columns: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Read a JSON array, NDJSON or Parquet/Arrow file of standardized
+    records. ``columns`` limits the fields read from Parquet/Arrow files.
+    """
+    if _is_columnar(path):
+        return read_columnar_table(path, columns).to_pylist()
+    with path.open("r", encoding="utf-8") as f:
+        if _is_ndjson(path):
+            # Streaming output of standardize_business_categories.py
+            data = [json.loads(line) for line in f if line.strip()]
+        else:
+            data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError(f"Expected a JSON array of records; got {type(data)}")
+    return data
+
+
+def ndjson_shards(path: Path, count: int) -> List[Tuple[int, int]]:
+    """
+    Split an NDJSON file into up to ``count`` byte ranges on line boundaries.
+    """
+    size = path.stat().st_size
+    count = max(1, min(count, size))
+    bounds = [0]
+    with path.open("rb") as f:
+        for i in range(1, count):
+            target = size * i // count
+            if target <= bounds[-1]:
+                continue
+            f.seek(target - 1)
+            # A range boundary lands just past the next newline
+            f.readline()
+            position = f.tell()
+            if bounds[-1] < position < size:
+                bounds.append(position)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _ndjson_range(path: Path, start: int = 0, end: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Records of the NDJSON lines starting in the byte range ``[start, end)``."""
+    with path.open("rb") as f:
+        f.seek(start)
+        position = start
+        for line in f:
+            if end is not None and position >= end:
+                break
+            position += len(line)
+            if line.strip():
+                yield json.loads(line)
+
+
+def partial_from_file(
+    path: str,
+    group_by: Union[str, Sequence[str]],
+    start: int = 0,
+    end: Optional[int] = None,
+    sketch_capacity: Optional[int] = None,
+    layers: Optional[Dict[str, str]] = None,
+) -> Union[PartialAggregate, RollupAggregate]:
+    """
+    Partial aggregate of one input file, of the NDJSON byte range
+    ``[start, end)`` (see ``ndjson_shards``) or of the Parquet/Arrow batch
+    range ``[start, end)`` (see ``columnar_shards``). A sequence of levels
+    for ``group_by`` gives a ``RollupAggregate``. ``layers`` maps fields to
+    polygon files used to fill them first (see ``spatial_assignment``).
+    """
+    file_path = Path(path)
+    partial = _new_partial(group_by, sketch_capacity)
+    levels = [group_by] if isinstance(group_by, str) else group_by
+    if _is_columnar(file_path):
+        for batch in iter_columnar_batches(file_path, needed_columns(levels, layers), start, end):
+            partial.update(_derive(batch.to_pylist(), levels, layers))
+        return partial
+    if not _is_ndjson(file_path):
+        return partial.update(_derive(load_records(file_path), levels, layers))
+    return partial.update(_iter_derived(_ndjson_range(file_path, start, end), levels, layers))
+
+
+def aggregate_files(
+    paths: Sequence[str],
+    group_by: Union[str, Sequence[str]] = "zip_code",
+    top_n: int = 5,
+    workers: int = 1,
+    engine: str = "python",
+    sketch_capacity: Optional[int] = None,
+    layers: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Aggregate one or more standardized record files.
+
+    With ``workers > 1`` partial aggregates are computed in a process pool,
+    one per JSON file and one per line-aligned byte range of each NDJSON
+    file, and merged in input order. The result is identical to
+    ``aggregate_territories`` over the concatenated records, or, when
+    ``group_by`` is a sequence of levels, to ``aggregate_rollups``.
+
+    The numpy engine loads all records into memory and runs in this
+    process; ``workers`` is ignored. When every input is Parquet/Arrow it
+    reads only the needed columns into Arrow arrays and never builds
+    record dicts.
+
+    ``layers`` (``{field: polygon file}``) fills those fields on records
+    that lack them with the containing polygon's name, e.g.
+    ``{"community": "data/sd_community_boundaries.csv"}`` for grouping by
+    community.
+    """
+    if engine == "numpy":
+        if workers > 1:
+            logger.warning("--workers is ignored by the numpy engine")
+        levels = [group_by] if isinstance(group_by, str) else group_by
+        columns = needed_columns(levels, layers)
+        source: Union[List[Dict[str, Any]], ColumnarRecords]
+        if paths and all(_is_columnar(Path(path)) for path in paths) and NUMPY_AVAILABLE:
+            tables = [read_columnar_table(Path(path), columns) for path in paths]
+            table = tables[0] if len(tables) == 1 else pa.concat_tables(tables, promote_options="permissive")
+            source = ArrowColumnarRecords(_derive_table(table, levels, layers))
+        else:
+            source = []
+            for path in paths:
+                source.extend(load_records(Path(path), columns))
+            _derive(source, levels, layers)
+        results = aggregate_rollups(source, levels, top_n, "numpy", sketch_capacity)
+        return results[group_by] if isinstance(group_by, str) else results
+    if engine != "python":
+        raise ValueError(f"Unknown aggregation engine: {engine!r}")
+    return partial_from_files(paths, group_by, workers, sketch_capacity, layers).finalize(top_n)
+
+
+def partial_from_files(
+    paths: Sequence[str],
+    group_by: Union[str, Sequence[str]] = "zip_code",
+    workers: int = 1,
+    sketch_capacity: Optional[int] = None,
+    layers: Optional[Dict[str, str]] = None,
+) -> Union[PartialAggregate, RollupAggregate]:
+    """The merged, un-finalized aggregate behind ``aggregate_files`` (python engine)."""
+    tasks: List[Tuple[str, int, Optional[int]]] = []
+    for path in paths:
+        file_path = Path(path)
+        if workers > 1 and _is_ndjson(file_path):
+            shards = ndjson_shards(file_path, workers)
+            tasks.extend((str(file_path), start, end) for start, end in shards)
+        elif workers > 1 and _is_columnar(file_path):
+            shards = columnar_shards(file_path, workers)
+            tasks.extend((str(file_path), start, end) for start, end in shards)
+        else:
+            tasks.append((str(file_path), 0, None))
+
+    total = _new_partial(group_by, sketch_capacity)
+    if workers <= 1 or len(tasks) == 1:
+        for path, start, end in tasks:
+            total.merge(partial_from_file(path, group_by, start, end, sketch_capacity, layers))
+        return total
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        futures = [
+            pool.submit(partial_from_file, path, group_by, start, end, sketch_capacity, layers)
+            for path, start, end in tasks
+        ]
+        # Merge in input order so first-seen key order matches a single pass
+        for future in futures:
+            total.merge(future.result())
+    return total
+
+
+STATE_VERSION = 4
+
+
+def state_path_for(output_path: Path) -> Path:
+    """Accumulator state file kept next to a metrics file: ``<stem>.state.json``."""
+    return output_path.with_name(f"{output_path.stem}.state.json")
+
+
+def save_state(path: Path, rollup: RollupAggregate, top_n: int) -> None:
+    """Persist the un-finalized accumulators of ``rollup`` (exact mode only)."""
+    payload = {"version": STATE_VERSION, "top_n": top_n, **rollup.to_state()}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def load_state(path: Path) -> Tuple[RollupAggregate, int]:
+    """Accumulators and ``top_n`` saved by ``save_state``."""
+    with path.open("r", encoding="utf-8") as f:
+        payload = json.load(f)
+    if payload.get("version") != STATE_VERSION:
+        raise ValueError(f"Unsupported aggregation state version in {path}: {payload.get('version')!r}")
+    return RollupAggregate.from_state(payload), payload["top_n"]
+
+
+def read_delta(path: Path) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Read a record delta file and return ``(inserted, deleted)`` records.
+
+    The file is a JSON object with optional lists of standardized records::
+
+        {
+          "inserted": [<record>, ...],
+          "deleted": [<record as previously aggregated>, ...],
+          "updated": [{"before": <record>, "after": <record>}, ...]
+        }
+
+    An update is applied as deleting ``before`` and inserting ``after``.
+    """
+    with path.open("r", encoding="utf-8") as f:
+        delta = json.load(f)
+    if not isinstance(delta, dict):
+        raise ValueError(f"Expected a JSON object in {path}; got {type(delta)}")
+    inserted = list(delta.get("inserted") or [])
+    deleted = list(delta.get("deleted") or [])
+    for change in delta.get("updated") or []:
+        deleted.append(change["before"])
+        inserted.append(change["after"])
+    return inserted, deleted
+
+
+def apply_delta(
+    rollup: RollupAggregate,
+    inserted: Iterable[Dict[str, Any]],
+    deleted: Iterable[Dict[str, Any]],
+) -> Dict[str, set]:
+    """
+    Remove ``deleted`` and add ``inserted`` records in place; returns the
+    affected territory_ids per level.
+
+    Counts and sums stay exact, but not record positions. Ties follow the
+    first-seen record order, and a deleted record no longer counts as
+    first and an updated one is re-added as if seen last. So after any
+    delete or update, which names make the top-n lists at tied counts (and
+    their order, and the key order of ``classification_method_counts``)
+    can differ from a full rerun over the new input.
+    """
+    touched: Dict[str, set] = {level: set() for level in rollup.levels}
+    for rec in deleted:
+        for level, partial in rollup.levels.items():
+            touched[level].add(partial.remove(rec))
+    for rec in inserted:
+        for level, partial in rollup.levels.items():
+            partial.add(rec)
+            touched[level].add(partial.key(rec))
+    return touched
+
+
+def refresh_result(
+    previous: Optional[Dict[str, Any]],
+    partial: PartialAggregate,
+    touched: Iterable[str],
+    top_n: int,
+) -> Dict[str, Any]:
+    """
+    ``aggregate_territories`` output after a delta: re-finalize the
+    ``touched`` territories and reuse the other entries of ``previous``.
+    """
+    if previous is None:
+        return partial.finalize(top_n)
+    if top_n < 0:
+        top_n = 0
+    entries = {t["territory_id"]: t for t in previous["territories"]}
+    for key in touched:
+        t = partial.territories.get(key)
+        if t is None:
+            entries.pop(key, None)
+        else:
+            entries[key] = t.finalize(top_n)
+    return _aggregate_result(partial.group_by, [entries[key] for key in sorted(entries)])
+
+
+def territories_table(result: Dict[str, Any]) -> "pa.Table":
+    """
+    One row per territory of an ``aggregate_territories`` result, with
+    ``group_by`` and the JSON-encoded ``summary`` in the schema metadata.
+    ``classification_method_counts`` becomes a map<string, int64> column.
+    """
+    _require_pyarrow()
+    territories = result["territories"]
+    table = pa.Table.from_pylist(
+        [{k: v for k, v in t.items() if k != "classification_method_counts"} for t in territories]
+    )
+    if territories:
+        methods = pa.array(
+            [list(t["classification_method_counts"].items()) for t in territories],
+            type=pa.map_(pa.string(), pa.int64()),
+        )
+        position = list(territories[0]).index("classification_method_counts")
+        table = table.add_column(position, "classification_method_counts", methods)
+    return table.replace_schema_metadata(
+        {
+            "group_by": result["group_by"],
+            "summary": json.dumps(result["summary"], ensure_ascii=False),
+        }
+    )
+
+
+def write_territories_table(path: Path, result: Dict[str, Any]) -> None:
+    """Write ``territories_table(result)`` as Parquet or Arrow IPC, by extension."""
+    table = territories_table(result)
+    if _is_parquet(path):
+        pq.write_table(table, path)
+        return
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+OUTPUT_FORMATS = {"json": ".json", "parquet": ".parquet", "arrow": ".arrow"}
+
+
+def default_output_path(level: str, suffix: str = ".json") -> Path:
+    """``data/ca_businesses_standardized_by_<level>.json`` ("+" becomes "_")."""
+    slug = level.replace(LEVEL_SEPARATOR, "_")
+    return Path("data") / f"ca_businesses_standardized_by_{slug}{suffix}"
+
+
+def _level_arg(text: str) -> str:
+    try:
+        fields = parse_level(text)
+        grids = [field for field in fields if parse_grid_field(field) is not None]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+    allowed = GROUP_FIELDS + SPATIAL_GROUP_FIELDS
+    unknown = [field for field in fields if field not in allowed and field not in grids]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"Unknown group field(s) {unknown}; choose from {list(allowed)}, "
+            f"a grid level (e.g. 'hex_500m', 'square_1km') or {STATEWIDE!r}"
+        )
+    return text
+
+
+def _layer_arg(text: str) -> Tuple[str, str]:
+    try:
+        return parse_layer_spec(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def _spatial_layers(levels: List[str], specs: Optional[List[Tuple[str, str]]]) -> Dict[str, str]:
+    """``--layer`` specs plus the default layer of each spatial field grouped by."""
+    layers = dict(specs or [])
+    for level in levels:
+        for field in parse_level(level):
+            if field in SPATIAL_GROUP_FIELDS and field not in layers:
+                layers[field] = str(DEFAULT_LAYERS[field])
+    return layers
+
+
+def _write_output(path: Path, payload: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    logger.info("Writing territory metrics to %s", path)
+    try:
+        if _is_columnar(path):
+            write_territories_table(path, payload)
+            return
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+    except (OSError, ImportError) as exc:
+        logger.error("Failed to write %s: %s", path, exc)
+        raise SystemExit(1)
+
+
+def _output_targets(
+    levels: List[str], output: Optional[str], combined: bool, suffix: str = ".json"
+) -> List[Tuple[Path, List[str], bool]]:
+    """``(path, levels, combined)`` for each output file."""
+    if len(levels) == 1:
+        return [(Path(output) if output else default_output_path(levels[0], suffix), levels, False)]
+    if combined:
+        path = Path(output) if output else Path("data") / "ca_businesses_standardized_rollups.json"
+        return [(path, levels, True)]
+    targets = []
+    for level in levels:
+        path = default_output_path(level, suffix)
+        if output:
+            path = Path(output) / path.name
+        targets.append((path, [level], False))
+    return targets
+
+
+def _target_payload(
+    results: Dict[str, Dict[str, Any]], levels: List[str], combined: bool
+) -> Dict[str, Any]:
+    if combined:
+        return {"levels": {level: results[level] for level in levels}}
+    return results[levels[0]]
+
+
+def _sub_rollup(rollup: RollupAggregate, levels: List[str]) -> RollupAggregate:
+    sub = RollupAggregate(levels)
+    sub.levels = {level: rollup.levels[level] for level in levels}
+    return sub
+
+
+def _write_state(output_path: Path, rollup: RollupAggregate, top_n: int) -> None:
+    state_path = state_path_for(output_path)
+    logger.info("Writing aggregation state to %s", state_path)
+    try:
+        save_state(state_path, rollup, top_n)
+    except OSError as exc:
+        logger.error("Failed to write %s: %s", state_path, exc)
+        raise SystemExit(1)
+
+
+def _run_apply_delta(
+    delta_path: Path,
+    targets: List[Tuple[Path, List[str], bool]],
+    top_n: int,
+    layers: Optional[Dict[str, str]] = None,
+) -> None:
+    try:
+        inserted, deleted = read_delta(delta_path)
+    except (OSError, ValueError, KeyError) as exc:
+        logger.error("Failed to read delta %s: %s", delta_path, exc)
+        raise SystemExit(1)
+    try:
+        # Deleted records must land where they were counted, so they are
+        # assigned with the same layers and grids as the full run
+        levels = [level for _, target_levels, _ in targets for level in target_levels]
+        _derive(inserted, levels, layers)
+        _derive(deleted, levels, layers)
+    except (ImportError, OSError, ValueError) as exc:
+        logger.error("Failed to assign delta records spatially: %s", exc)
+        raise SystemExit(1)
+    logger.info(
+        "Applying delta %s: %d inserted, %d deleted record(s)",
+        delta_path,
+        len(inserted),
+        len(deleted),
+    )
+
+    updates = []
+    for output_path, levels, combined in targets:
+        state_path = state_path_for(output_path)
+        try:
+            rollup, state_top_n = load_state(state_path)
+        except FileNotFoundError:
+            logger.error("No aggregation state at %s; rerun with --save-state", state_path)
+            raise SystemExit(1)
+        except (OSError, ValueError, KeyError) as exc:
+            logger.error("Failed to load %s: %s", state_path, exc)
+            raise SystemExit(1)
+        if list(rollup.levels) != levels:
+            logger.error(
+                "%s holds levels %s, not %s", state_path, list(rollup.levels), levels
+            )
+            raise SystemExit(1)
+
+        previous = None
+        # Parquet/Arrow outputs are rewritten whole, from the state alone
+        if output_path.exists() and not _is_columnar(output_path):
+            with output_path.open("r", encoding="utf-8") as f:
+                document = json.load(f)
+            previous = document["levels"] if combined else {levels[0]: document}
+
+        try:
+            touched = apply_delta(rollup, inserted, deleted)
+        except ValueError as exc:
+            logger.error("Delta does not match %s: %s", state_path, exc)
+            raise SystemExit(1)
+
+        results = {}
+        for level, partial in rollup.levels.items():
+            if top_n != state_top_n:
+                # A different top-n changes every territory's lists
+                touched[level] = set(partial.territories)
+            previous_result = previous.get(level) if previous else None
+            results[level] = refresh_result(previous_result, partial, touched[level], top_n)
+            logger.info("%s: %d territories updated", level, len(touched[level]))
+        updates.append((output_path, levels, combined, results, rollup))
+
+    # Write only after every target applied cleanly
+    for output_path, levels, combined, results, rollup in updates:
+        _write_output(output_path, _target_payload(results, levels, combined))
+        _write_state(output_path, rollup, top_n)
 
 
 def main() -> None:
@@ -248,20 +2189,65 @@ def main() -> None:
     parser.add_argument(
         "--input",
         type=str,
-        default=str(Path("data") / "ca_businesses_standardized.json"),
-        help="Path to standardized business JSON (default: data/ca_businesses_standardized.json)",
+        nargs="+",
+        default=[str(Path("data") / "ca_businesses_standardized.json")],
+        help=(
+            "Standardized business JSON/NDJSON/Parquet/Arrow file(s), e.g. "
+            "per-county shards; the format follows the extension "
+            "(default: data/ca_businesses_standardized.json)"
+        ),
     )
     parser.add_argument(
         "--output",
         type=str,
-        help="Output JSON path (default: data/ca_businesses_standardized_by_<group>.json)",
+        help=(
+            "Output path (default: data/ca_businesses_standardized_by_<group>.json); "
+            ".parquet/.arrow paths write one row per territory. With several "
+            "--group-by levels: the directory for the per-level files, or the "
+            "JSON file path with --combined"
+        ),
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=sorted(OUTPUT_FORMATS),
+        default="json",
+        help=(
+            "Format of default and per-level output files; an explicit "
+            "--output file path uses its own extension (default: json)"
+        ),
     )
     parser.add_argument(
         "--group-by",
-        type=str,
-        default="zip_code",
-        choices=["zip_code", "blockgroup", "city"],
-        help="Field to group by (default: zip_code)",
+        type=_level_arg,
+        nargs="+",
+        default=["zip_code"],
+        help=(
+            "Grouping level(s), all computed in one pass: zip_code, blockgroup, "
+            "city, community (located from --layer polygons), grid cells such as "
+            "hex_500m or square_1km, composites such as city+zip_code, or "
+            "statewide (default: zip_code)"
+        ),
+    )
+    parser.add_argument(
+        "--layer",
+        type=_layer_arg,
+        action="append",
+        metavar="FIELD=PATH",
+        help=(
+            "Fill FIELD on records without one from the polygon in PATH that "
+            "contains their coordinates; repeatable. Grouping by community "
+            "uses data/sd_community_boundaries.csv unless given; a bare 'city' "
+            "fills missing cities from data/city.json"
+        ),
+    )
+    parser.add_argument(
+        "--combined",
+        action="store_true",
+        help=(
+            "With several --group-by levels, write one document "
+            '{"levels": {<level>: ...}} instead of one file per level '
+            "(default path: data/ca_businesses_standardized_rollups.json)"
+        ),
     )
     parser.add_argument(
         "--top-n",
@@ -269,6 +2255,53 @@ def main() -> None:
         default=5,
         help="Number of top sectors/subsectors per territory (default: 5)",
     )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="python",
+        help=(
+            "python: per-record dict/Counter updates, streams NDJSON; numpy: "
+            "dictionary-encoded columns and grouped reductions, loads all "
+            "records (default: python). Output is identical"
+        ),
+    )
+    parser.add_argument(
+        "--sketch-capacity",
+        type=int,
+        help=(
+            "Approximate the top sector/subsector lists with a Space-Saving "
+            "summary of this many counters per territory instead of exact "
+            "counts; entries then report an error bound (python engine only; "
+            "default: exact)"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Processes computing partial aggregates, one per input file or "
+            "NDJSON byte range (default: 1)"
+        ),
+    )
+    parser.add_argument(
+        "--save-state",
+        action="store_true",
+        help=(
+            "Also persist the un-finalized accumulators next to each output "
+            "as <output stem>.state.json, for later --apply-delta runs"
+        ),
+    )
+    parser.add_argument(
+        "--apply-delta",
+        type=str,
+        metavar="DELTA_JSON",
+        help=(
+            'Instead of reading --input, apply a {"inserted", "deleted", '
+            '"updated"} record delta to the saved state of each output and '
+            "re-emit only the affected territories"
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -277,52 +2310,87 @@ def main() -> None:
         format="%(asctime)s - %(levelname)s - %(message)s",
     )
 
-    input_path = Path(args.input)
-    if not input_path.exists():
-        logger.error("Input file not found: %s", input_path)
+    levels = list(dict.fromkeys(args.group_by))
+    if args.combined and len(levels) == 1:
+        logger.warning("--combined is ignored with a single --group-by level; writing one %s document", levels[0])
+    layers = _spatial_layers(levels, args.layer)
+    targets = _output_targets(levels, args.output, args.combined, OUTPUT_FORMATS[args.output_format])
+    if any(combined and _is_columnar(path) for path, _, combined in targets):
+        logger.error("--combined writes JSON only; drop --combined for Parquet/Arrow output")
         raise SystemExit(1)
 
-    logger.info("Loading standardized data from %s", input_path)
     try:
-        with input_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as exc:
-        logger.error("Failed to parse JSON from %s: %s", input_path, exc)
-        raise SystemExit(1)
-    except OSError as exc:
-        logger.error("Failed to read %s: %s", input_path, exc)
+        # Fail early on a bad layer; workers forked later reuse the cache
+        load_layers(layers)
+    except (ImportError, OSError, ValueError) as exc:
+        logger.error("Failed to load polygon layer: %s", exc)
         raise SystemExit(1)
 
-    if not isinstance(data, list):
-        logger.error("Expected a JSON array of records; got %s", type(data))
+    if args.apply_delta:
+        _run_apply_delta(Path(args.apply_delta), targets, args.top_n, layers)
+        return
+
+    if args.save_state and (args.engine != "python" or args.sketch_capacity):
+        logger.error("--save-state needs the python engine in exact mode")
         raise SystemExit(1)
 
+    input_paths = [Path(path) for path in args.input]
+    for input_path in input_paths:
+        if not input_path.exists():
+            logger.error("Input file not found: %s", input_path)
+            raise SystemExit(1)
+
     logger.info(
-        "Aggregating %d records by %s", len(data), args.group_by
+        "Aggregating %s by %s (%d worker(s))",
+        ", ".join(str(path) for path in input_paths),
+        ", ".join(levels),
+        args.workers,
     )
-    result = aggregate_territories(
-        records=data, group_by=args.group_by, top_n=args.top_n
-    )
-
-    if args.output:
-        output_path = Path(args.output)
-    else:
-        output_name = (
-            f"ca_businesses_standardized_by_{args.group_by}.json"
-        )
-        output_path = Path("data") / output_name
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    logger.info("Writing territory metrics to %s", output_path)
+    rollup = None
     try:
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        if args.save_state:
+            rollup = partial_from_files(
+                [str(path) for path in input_paths],
+                group_by=levels,
+                workers=args.workers,
+                layers=layers,
+            )
+            results = rollup.finalize(args.top_n)
+        else:
+            results = aggregate_files(
+                [str(path) for path in input_paths],
+                group_by=levels,
+                top_n=args.top_n,
+                workers=args.workers,
+                engine=args.engine,
+                sketch_capacity=args.sketch_capacity,
+                layers=layers,
+            )
+    except ImportError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+    except json.JSONDecodeError as exc:
+        logger.error("Failed to parse JSON input: %s", exc)
+        raise SystemExit(1)
+    except ValueError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
     except OSError as exc:
-        logger.error("Failed to write %s: %s", output_path, exc)
+        logger.error("Failed to read input: %s", exc)
         raise SystemExit(1)
+    logger.info("Aggregated %d records", results[levels[0]]["summary"]["total_businesses"])
+
+    for output_path, target_levels, combined in targets:
+        _write_output(output_path, _target_payload(results, target_levels, combined))
+        if rollup is not None:
+            _write_state(output_path, _sub_rollup(rollup, target_levels), args.top_n)
 
-    logger.info("Aggregation complete: %d territories", result["summary"]["territory_count"])
+    for level, result in results.items():
+        logger.info(
+            "Aggregation complete: %d territories by %s",
+            result["summary"]["territory_count"],
+            level,
+        )
 
 
 if __name__ == "__main__":
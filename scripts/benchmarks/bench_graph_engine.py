@@ -0,0 +1,261 @@
+"""
+Benchmark the in-memory CSR graph against the equivalent Cypher queries.
+
+Loads ``--input`` (default ``data/relationships.json``) into a
+``graph_engine.HopGraph`` and runs each query in ``QUERIES`` for every
+node of its source label at once:
+
+- fixed-hop patterns (``traverse``/``expand``): business -> zip code,
+  zip code <- business, community -> block group, business -> city ->
+  county;
+- ``k_hop`` neighborhoods: cities within two adjacencies, communities
+  within three nearby/adjacent hops (with their distance).
+
+Each query is also evaluated by ``reference``, a per-source Python
+expansion over adjacency sets with Cypher's semantics, and both must
+return the same rows. With ``--uri`` the Cypher text is run on that
+Neo4j server as well (graph loaded by ``neo4j_graph_sync`` or the bulk
+exporter, endpoints keyed as in ``EXPORT_KEYS``) and its rows compared.
+
+Reports the load time (warm ``load_graph`` and, for reference, building
+from decoded JSON), and per query the batched engine time (node arrays,
+then with the rows turned into id tuples), the mean time of a
+single-source query, the reference time and, with ``--uri``, the server
+time. Engine timings are the best of ``--repeat`` runs.
+
+Usage
+-----
+From the project root:
+
+    python -m scripts.benchmarks.bench_graph_engine
+    python -m scripts.benchmarks.bench_graph_engine --uri bolt://localhost:7687
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from scripts.graph_engine import DEFAULT_INPUT, HopGraph, load_graph
+from scripts.neo4j_bulk_export import EXPORT_KEYS, canonical_label, join_key
+from scripts.neo4j_relationship_loader import (
+    DEFAULT_KEY,
+    EDGE_FIELDS,
+    SOURCE_KEYS,
+    TARGET_KEYS,
+    quote_name,
+    read_relationships,
+)
+
+# Source label plus either fixed ``steps`` of (predicate(s), direction, label)
+# or a ``k``-hop neighborhood over ``predicate`` keeping ``node_type`` nodes
+QUERIES: Dict[str, Dict[str, Any]] = {
+    "business_zipcode": {"source": "Business", "steps": [("contained_in", "out", "Zipcode")]},
+    "zipcode_businesses": {"source": "Zipcode", "steps": [("contained_in", "in", "Business")]},
+    "community_blockgroup": {"source": "Community", "steps": [("overlaps_with", "out", "BlockGroup")]},
+    "business_city_county": {
+        "source": "Business",
+        "steps": [("contained_in", "out", "City"), ("contained_in", "out", "County")],
+    },
+    "city_adjacency_2hop": {"source": "City", "k": 2, "predicate": ["adjacent_to"], "node_type": "City"},
+    "community_nearby_3hop": {
+        "source": "Community",
+        "k": 3,
+        "predicate": ["nearby", "adjacent_to"],
+        "node_type": "Community",
+    },
+}
+
+Entity = Tuple[str, str]
+Rows = Set[Tuple[Any, ...]]
+
+
+def key_property(label: str) -> str:
+    """Property a synced/exported node of ``label`` is identified by."""
+    return EXPORT_KEYS.get(label) or SOURCE_KEYS.get(label) or TARGET_KEYS.get(label, DEFAULT_KEY)
+
+
+def _arrow(predicates: List[str], direction: str, suffix: str = "") -> str:
+    types = "|".join(quote_name(predicate) for predicate in predicates)
+    return {"out": f"-[:{types}{suffix}]->", "in": f"<-[:{types}{suffix}]-", "both": f"-[:{types}{suffix}]-"}[direction]
+
+
+def cypher(spec: Dict[str, Any]) -> str:
+    """The Cypher query ``spec`` answers."""
+    source = spec["source"]
+    returned = f"s.{quote_name(key_property(source))} AS source"
+    if "steps" in spec:
+        pattern = f"(s:{quote_name(source)})"
+        for i, (predicate, direction, label) in enumerate(spec["steps"]):
+            last = i == len(spec["steps"]) - 1
+            node = f"(t:{quote_name(label)})" if last else f"(:{quote_name(label)})"
+            pattern += _arrow([predicate], direction) + node
+        target = spec["steps"][-1][2]
+        return f"MATCH {pattern}\nRETURN DISTINCT {returned}, t.{quote_name(key_property(target))} AS target"
+    target = spec["node_type"]
+    pattern = (
+        f"(s:{quote_name(source)})"
+        + _arrow(spec["predicate"], spec.get("direction", "both"), f"*1..{spec['k']}")
+        + f"(t:{quote_name(target)})"
+    )
+    return (
+        f"MATCH p = {pattern}\nWHERE t <> s\n"
+        f"RETURN {returned}, t.{quote_name(key_property(target))} AS target, min(length(p)) AS hops"
+    )
+
+
+def engine_query(graph: HopGraph, spec: Dict[str, Any], sources) -> Tuple[Any, ...]:
+    """``spec`` on the engine: ``(origin, node)`` or ``(origin, node, hops)`` arrays."""
+    if "steps" in spec:
+        return graph.traverse(sources, spec["steps"])
+    return graph.k_hop(sources, spec["k"], spec["predicate"], spec.get("direction", "both"), spec["node_type"])
+
+
+def engine_rows(graph: HopGraph, spec: Dict[str, Any], sources) -> Rows:
+    origin, nodes, *hops = engine_query(graph, spec, sources)
+    columns = [graph.keys_of(sources[origin]), graph.keys_of(nodes)] + [column.tolist() for column in hops]
+    return set(zip(*columns))
+
+
+class Reference:
+    """Per-source Python expansion over adjacency sets, as a Cypher executor walks the pattern."""
+
+    def __init__(self, records: List[Dict[str, Any]]):
+        self.out: Dict[str, Dict[Entity, Set[Entity]]] = defaultdict(lambda: defaultdict(set))
+        self.into: Dict[str, Dict[Entity, Set[Entity]]] = defaultdict(lambda: defaultdict(set))
+        self.labels: Dict[str, Set[Entity]] = defaultdict(set)
+        for rec in records:
+            if any(rec.get(field) is None for field in EDGE_FIELDS):
+                continue
+            start = (canonical_label(str(rec["entitytype1"])), join_key(rec["entity1"]))
+            end = (canonical_label(str(rec["entitytype2"])), join_key(rec["entity2"]))
+            self.out[rec["predicate"]][start].add(end)
+            self.into[rec["predicate"]][end].add(start)
+            self.labels[start[0]].add(start)
+            self.labels[end[0]].add(end)
+
+    def hop(self, node: Entity, predicates: List[str], direction: str) -> Set[Entity]:
+        found: Set[Entity] = set()
+        for predicate in predicates:
+            if direction in ("out", "both"):
+                found |= self.out[predicate].get(node, set())
+            if direction in ("in", "both"):
+                found |= self.into[predicate].get(node, set())
+        return found
+
+    def rows(self, spec: Dict[str, Any]) -> Rows:
+        rows: Rows = set()
+        for source in self.labels[canonical_label(spec["source"])]:
+            if "steps" in spec:
+                frontier = {source}
+                for predicate, direction, label in spec["steps"]:
+                    frontier = {
+                        node for current in frontier
+                        for node in self.hop(current, [predicate], direction) if node[0] == label
+                    }
+                rows.update((source[1], node[1]) for node in frontier)
+                continue
+            seen, frontier = {source}, {source}
+            for hops in range(1, spec["k"] + 1):
+                frontier = {
+                    node for current in frontier
+                    for node in self.hop(current, spec["predicate"], spec.get("direction", "both"))
+                } - seen
+                seen |= frontier
+                rows.update((source[1], node[1], hops) for node in frontier if node[0] == spec["node_type"])
+        return rows
+
+
+def best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def server_rows(driver: Any, query: str, database: Optional[str]) -> Tuple[Rows, float]:
+    start = time.perf_counter()
+    with driver.session(database=database) as session:
+        records = list(session.run(query))
+    seconds = time.perf_counter() - start
+    rows = {tuple(join_key(value) if i < 2 else value for i, value in enumerate(record.values())) for record in records}
+    return rows, seconds
+
+
+def run(args: argparse.Namespace, driver: Any = None) -> Dict[str, Any]:
+    path = Path(args.input)
+    graph = load_graph(path)
+    records = read_relationships(path)
+    results: Dict[str, Any] = {
+        "nodes": len(graph),
+        "edges": graph.edge_count(),
+        "load_graph_seconds": best_of(args.repeat, lambda: load_graph(path)),
+        "from_records_seconds": best_of(args.repeat, lambda: HopGraph.from_records(records)),
+        "queries": {},
+    }
+    reference = Reference(records)
+    for name, spec in QUERIES.items():
+        sources = graph.nodes_of(spec["source"])
+        rows = engine_rows(graph, spec, sources)
+        start = time.perf_counter()
+        expected = reference.rows(spec)
+        reference_seconds = time.perf_counter() - start
+        batched = best_of(args.repeat, lambda: engine_query(graph, spec, sources))
+        with_keys = best_of(args.repeat, lambda: engine_rows(graph, spec, sources))
+        single = best_of(1, lambda: [engine_query(graph, spec, sources[i:i + 1]) for i in range(len(sources))])
+        entry: Dict[str, Any] = {
+            "cypher": cypher(spec),
+            "sources": len(sources),
+            "rows": len(rows),
+            "engine_batched_seconds": batched,
+            "engine_with_keys_seconds": with_keys,
+            "engine_per_source_seconds": single / max(len(sources), 1),
+            "reference_seconds": reference_seconds,
+            "speedup_vs_reference": reference_seconds / batched if batched else float("inf"),
+            "matches_reference": rows == expected,
+        }
+        if driver is not None:
+            cypher_rows, seconds = server_rows(driver, entry["cypher"], args.database)
+            entry["cypher_seconds"] = seconds
+            entry["speedup_vs_cypher"] = seconds / batched if batched else float("inf")
+            entry["matches_cypher"] = cypher_rows == rows
+        results["queries"][name] = entry
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the in-memory CSR graph against equivalent Cypher.")
+    parser.add_argument(
+        "--input",
+        type=str,
+        default=str(DEFAULT_INPUT),
+        help="Relationship file (default: data/relationships.json)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per engine timing, best kept (default: 5)")
+    parser.add_argument("--uri", type=str, help="Also run the Cypher on this Neo4j server (NEO4J_USER/NEO4J_PASSWORD)")
+    parser.add_argument("--database", type=str, help="Neo4j database (default: NEO4J_DATABASE)")
+    args = parser.parse_args()
+
+    driver = None
+    if args.uri:
+        from scripts.config import get_config
+        from scripts.neo4j_relationship_loader import connect
+
+        config = get_config()
+        args.database = args.database or config.neo4j_database
+        driver = connect(args.uri, config.neo4j_user, config.neo4j_password)
+    try:
+        print(json.dumps(run(args, driver), indent=2))
+    finally:
+        if driver is not None:
+            driver.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Benchmark incremental graph sync against the notebook's full reload.
+
+Both run against the in-process ``stub_neo4j`` driver (same cost model as
+``bench_neo4j_loader``), after a simulated small refresh of the data in
+``data/``: ``--fraction`` of the businesses change a property, as many
+are removed and added, and as many relationship rows are dropped.
+
+- ``rebuild``: the notebook path on a graph holding the old data - per
+  label ``MATCH (n:L) DETACH DELETE n`` then ``CREATE`` of every node,
+  then every relationship through ``load_relationships``;
+- ``initial_sync``: ``sync_graph`` of the old data into an empty graph
+  (what the first sync costs);
+- ``incremental_sync``: ``sync_graph`` of the refreshed data with the
+  manifest of the initial sync;
+- ``noop_sync``: the same sync once more, which must write nothing.
+
+Reports rows sent, stub writes and seconds, and checks that the rebuilt
+graph, the incrementally synced graph and a fresh sync of the refreshed
+data are identical.
+
+Usage
+-----
+From the project root:
+
+    python -m scripts.benchmarks.bench_graph_sync
+    python -m scripts.benchmarks.bench_graph_sync --fraction 0.05 --latency 0.002
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from scripts.benchmarks.stub_neo4j import StubDriver
+from scripts.neo4j_bulk_export import (
+    DATA_DIR,
+    DEFAULT_RELATIONSHIPS,
+    EXPORT_KEYS,
+    NODE_FILES,
+    group_relationships,
+    load_nodes,
+    synthesize_nodes,
+)
+from scripts.neo4j_graph_sync import node_properties, node_tables, snapshot, sync_graph
+from scripts.neo4j_relationship_loader import KeyResolver, load_relationships, quote_name, read_relationships
+
+
+def refreshed(
+    node_rows: Dict[str, List[Dict[str, Any]]], records: List[Dict[str, Any]], fraction: float, seed: int
+) -> Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """A copy of the data with ``fraction`` of businesses changed, removed and added, and of relationships dropped."""
+    rng = random.Random(seed)
+    node_rows = copy.deepcopy(node_rows)
+    businesses = node_rows["Business"]
+    count = max(1, int(len(businesses) * fraction))
+    for row in rng.sample(businesses, count):
+        row["num_locations"] = int(row.get("num_locations") or 0) + 1
+    removed = set(rng.sample(range(len(businesses)), count))
+    next_id = max(int(row["id"]) for row in businesses) + 1
+    node_rows["Business"] = [row for i, row in enumerate(businesses) if i not in removed] + [
+        {"id": next_id + i, "name": f"New business {i}", "num_locations": 1, "categories": []} for i in range(count)
+    ]
+    dropped = set(rng.sample(range(len(records)), max(1, int(len(records) * fraction))))
+    return node_rows, [rec for i, rec in enumerate(records) if i not in dropped]
+
+
+def rebuild(driver: StubDriver, node_rows: Dict[str, List[Dict[str, Any]]], records: List[Dict[str, Any]]) -> None:
+    """The notebook reload: wipe and create every label, then create every relationship."""
+    keys = KeyResolver(EXPORT_KEYS)
+    tables = node_tables(node_rows, keys)
+    groups, _ = group_relationships(records)
+    synthesize_nodes(groups, tables, keys)
+    state, _ = snapshot(tables, groups, keys)
+    with driver.session() as session:
+        for label, table in tables.items():
+            session.run(f"MATCH (n:{quote_name(label)}) DETACH DELETE n  RETURN count(n) AS deleted_count")
+            data = [node_properties(table, row) for row in table.rows]
+            query = f"UNWIND $data AS row CREATE (n:{quote_name(label)}) SET n = row RETURN count(n) AS created"
+            session.run(query, {"data": data})
+    edge_groups = {
+        (group["start"], group["type"], group["end"]): [{"source": a, "target": b} for a, b in group["edges"]]
+        for group in state["relationships"].values()
+    }
+    load_relationships(driver, edge_groups, keys=keys)
+
+
+def timed_sync(driver: StubDriver, node_rows, records, manifest: Path) -> Dict[str, Any]:
+    requests, writes = driver.requests, driver.writes
+    start = time.perf_counter()
+    report = sync_graph(driver, node_tables(node_rows, KeyResolver(EXPORT_KEYS)), records, manifest_path=manifest)
+    return {
+        "seconds": time.perf_counter() - start,
+        "plan_seconds": report["plan_seconds"],
+        "write_seconds": report["seconds"],
+        "rows_sent": report["rows"],
+        "writes": driver.writes - writes,
+        "requests": driver.requests - requests,
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    keys = KeyResolver(EXPORT_KEYS)
+    node_rows = {label: table.rows for label, table in load_nodes(DATA_DIR, NODE_FILES, keys).items()}
+    records = read_relationships(Path(args.input))
+    new_rows, new_records = refreshed(node_rows, records, args.fraction, args.seed)
+
+    def stub() -> StubDriver:
+        return StubDriver(latency=args.latency, row_cost=args.row_cost, scan_cost=args.scan_cost)
+
+    results: Dict[str, Any] = {"fraction": args.fraction}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Old graph, then the notebook's reload of the refreshed data
+        rebuilt = stub()
+        sync_graph(rebuilt, node_tables(node_rows, keys), records, manifest_path=Path(tmp) / "rebuilt.json")
+        writes, start = rebuilt.writes, time.perf_counter()
+        rebuild(rebuilt, new_rows, new_records)
+        results["rebuild"] = {"seconds": time.perf_counter() - start, "writes": rebuilt.writes - writes}
+
+        synced, manifest = stub(), Path(tmp) / "synced.json"
+        results["initial_sync"] = timed_sync(synced, node_rows, records, manifest)
+        results["incremental_sync"] = timed_sync(synced, new_rows, new_records, manifest)
+        results["noop_sync"] = timed_sync(synced, new_rows, new_records, manifest)
+
+        fresh = stub()
+        timed_sync(fresh, new_rows, new_records, Path(tmp) / "fresh.json")
+
+    results["write_ratio_incremental_vs_rebuild"] = (
+        results["incremental_sync"]["writes"] / results["rebuild"]["writes"]
+    )
+    results["identical_to_fresh_sync"] = synced.graph() == fresh.graph()
+    results["identical_to_rebuild"] = synced.graph() == rebuilt.graph()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark incremental graph sync vs the notebook's full reload.")
+    parser.add_argument(
+        "--input",
+        type=str,
+        default=str(DEFAULT_RELATIONSHIPS),
+        help="Relationship file (default: data/relationship.json)",
+    )
+    parser.add_argument(
+        "--fraction",
+        type=float,
+        default=0.01,
+        help="Share of businesses/relationships changed by the refresh (default: 0.01)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the refresh (default: 0)")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0005,
+        help="Seconds per round trip (default: 0.0005, a local container)",
+    )
+    parser.add_argument("--row-cost", type=float, default=2e-6, help="Seconds per processed row (default: 2e-6)")
+    parser.add_argument(
+        "--scan-cost",
+        type=float,
+        default=1e-7,
+        help="Seconds per node scanned by an unindexed lookup (default: 1e-7)",
+    )
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
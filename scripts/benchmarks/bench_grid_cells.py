@@ -0,0 +1,135 @@
+"""
+Benchmark vectorized grid cell IDs against a per-point loop.
+
+Draws seeded random points over California (some with missing
+coordinates), computes the cell IDs of every ``--levels`` entry with
+``grid_cells.cell_ids`` (one projection, NumPy binning per level), and
+computes a subsample with a scalar per-point loop using ``math``. Checks
+that both agree on the subsample and reports points/sec for each; the
+loop rate is measured on the subsample only.
+
+Usage
+-----
+From the project root:
+
+    python -m scripts.benchmarks.bench_grid_cells --count 2000000
+    python -m scripts.benchmarks.bench_grid_cells --levels hex_250m hex_1km hex_4km
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from scripts.grid_cells import (
+    EARTH_RADIUS_M,
+    STANDARD_PARALLEL,
+    GridSpec,
+    cell_ids,
+    parse_grid_field,
+)
+
+
+# Longitude/latitude bounding box of California
+CA_BOUNDS = (-124.5, 32.5, -114.1, 42.0)
+
+
+def _scalar_cell(spec: GridSpec, lon: float, lat: float) -> Optional[str]:
+    if not (math.isfinite(lon) and math.isfinite(lat)):
+        return None
+    cos_parallel = math.cos(math.radians(STANDARD_PARALLEL))
+    x = EARTH_RADIUS_M * cos_parallel * math.radians(lon)
+    y = EARTH_RADIUS_M * math.sin(math.radians(lat)) / cos_parallel
+    if spec.kind == "square":
+        return f"{math.floor(x / spec.size)}:{math.floor(y / spec.size)}"
+    q = (math.sqrt(3.0) / 3.0 * x - y / 3.0) / spec.size
+    r = (2.0 / 3.0 * y) / spec.size
+    s = -q - r
+    rq, rr, rs = round(q), round(r), round(s)
+    dq, dr, ds = abs(rq - q), abs(rr - r), abs(rs - s)
+    if dq > dr and dq > ds:
+        rq = -rr - rs
+    elif dr > ds:
+        rr = -rq - rs
+    return f"{rq}:{rr}"
+
+
+def naive_cell_ids(specs: Sequence[GridSpec], lon: np.ndarray, lat: np.ndarray) -> Dict[str, List[Optional[str]]]:
+    """``cell_ids`` one point and one level at a time."""
+    points = list(zip(lon.tolist(), lat.tolist()))
+    return {spec.name: [_scalar_cell(spec, x, y) for x, y in points] for spec in specs}
+
+
+def run(levels: Sequence[str], count: int, naive_count: int, missing_share: float, seed: int) -> Dict[str, Any]:
+    specs = [parse_grid_field(level) for level in levels]
+    rng = np.random.default_rng(seed)
+    xmin, ymin, xmax, ymax = CA_BOUNDS
+    lon = rng.uniform(xmin, xmax, count)
+    lat = rng.uniform(ymin, ymax, count)
+    missing = rng.random(count) < missing_share
+    lon[missing] = np.nan
+    lat[missing] = np.nan
+
+    start = time.perf_counter()
+    vectorized = cell_ids(specs, lon, lat)
+    vectorized_seconds = time.perf_counter() - start
+
+    sample = min(naive_count, count)
+    start = time.perf_counter()
+    naive = naive_cell_ids(specs, lon[:sample], lat[:sample])
+    naive_seconds = time.perf_counter() - start
+
+    vectorized_rate = count / vectorized_seconds
+    naive_rate = sample / naive_seconds if naive_seconds else float("inf")
+    return {
+        "levels": list(levels),
+        "points": count,
+        "cells": {name: len(set(ids) - {None}) for name, ids in vectorized.items()},
+        "vectorized": {"seconds": vectorized_seconds, "points_per_sec": vectorized_rate},
+        "naive": {"points": sample, "seconds": naive_seconds, "points_per_sec": naive_rate},
+        "speedup_vs_naive": vectorized_rate / naive_rate,
+        "identical_on_sample": all(vectorized[name][:sample] == ids for name, ids in naive.items()),
+    }
+
+
+def _grid_level(text: str) -> str:
+    if parse_grid_field(text) is None:
+        raise argparse.ArgumentTypeError(f"Not a grid level: {text!r} (e.g. 'hex_500m', 'square_1km')")
+    return text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark vectorized grid cell IDs.")
+    parser.add_argument(
+        "--levels",
+        type=_grid_level,
+        nargs="+",
+        default=["hex_500m", "hex_2km", "hex_8km", "square_1km"],
+        help="Grid levels (default: hex_500m hex_2km hex_8km square_1km)",
+    )
+    parser.add_argument("--count", type=int, default=1_000_000, help="Points to bin (default: 1000000)")
+    parser.add_argument(
+        "--naive-count",
+        type=int,
+        default=100_000,
+        help="Points binned with the per-point loop (default: 100000)",
+    )
+    parser.add_argument(
+        "--missing-share",
+        type=float,
+        default=0.05,
+        help="Share of points with missing coordinates (default: 0.05)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.levels, args.count, args.naive_count, args.missing_share, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark the batched relationship loader against the notebook's per-edge load.
+
+Both run against the in-process ``stub_neo4j`` driver, seeded with one
+node per distinct edge endpoint, with a cost model for network round
+trips, per-row work and label scans on unindexed lookups (see
+``stub_neo4j``):
+
+- ``per_edge``: the ``notebooks/spencer.ipynb`` loop - a session and an
+  auto-commit ``MATCH ... CREATE`` per edge, no indexes - over the first
+  ``--per-edge-count`` edges (too slow for all of them);
+- ``batched``: ``load_relationships`` over every edge, once per
+  ``--batch-sizes`` entry, with edges/sec per relationship type.
+
+The batched loader is also run on the per-edge sample, and both must
+create the same edges.
+
+Usage
+-----
+From the project root:
+
+    python -m scripts.benchmarks.bench_neo4j_loader
+    python -m scripts.benchmarks.bench_neo4j_loader --latency 0.002 --batch-sizes 500 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List
+
+from scripts.benchmarks.stub_neo4j import StubDriver
+from scripts.neo4j_relationship_loader import (
+    DEFAULT_INPUT,
+    EdgeType,
+    KeyResolver,
+    group_edges,
+    load_relationships,
+    read_relationships,
+)
+
+
+def seeded_driver(groups: Dict[EdgeType, List[Dict[str, Any]]], args: argparse.Namespace) -> StubDriver:
+    """A stub graph with one node per distinct endpoint, keyed as the loader looks it up."""
+    driver = StubDriver(latency=args.latency, row_cost=args.row_cost, scan_cost=args.scan_cost)
+    keys = KeyResolver()
+    endpoints: Dict[tuple, set] = {}
+    for (source, _, target), rows in groups.items():
+        endpoints.setdefault((source, keys.source(source)), set()).update(row["source"] for row in rows)
+        endpoints.setdefault((target, keys.target(target)), set()).update(row["target"] for row in rows)
+    for (label, prop), values in endpoints.items():
+        driver.add_nodes(label, prop, values)
+    return driver
+
+
+def per_edge_load(driver: StubDriver, records: List[Dict[str, Any]]) -> None:
+    """The notebook's load: one session and one MATCH/CREATE per edge."""
+    keys = KeyResolver()
+    for rec in records:
+        label1, label2, relationship = rec["entitytype1"], rec["entitytype2"], rec["predicate"]
+        attr1, attr2 = keys.source(label1), keys.target(label2)
+        with driver.session() as session:
+            query = (
+                f"MATCH (a:`{label1}` {{{attr1}: $entity1}}), "
+                f"(b:`{label2}` {{{attr2}: $entity2}}) "
+                f"CREATE (a)-[r:`{relationship}`]->(b) "
+            )
+            session.run(query, entity1=rec["entity1"], entity2=rec["entity2"])
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    records = [rec for rec in read_relationships(Path(args.input)) if all(v is not None for v in rec.values())]
+    groups, _ = group_edges(records)
+    sample = records[: args.per_edge_count]
+
+    driver = seeded_driver(groups, args)
+    start = time.perf_counter()
+    per_edge_load(driver, sample)
+    per_edge_seconds = time.perf_counter() - start
+    per_edge_edges = Counter(driver.relationships)
+
+    check = seeded_driver(groups, args)
+    load_relationships(check, group_edges(sample)[0], batch_size=max(args.batch_sizes))
+    identical = Counter(check.relationships) == per_edge_edges
+
+    per_edge_rate = len(sample) / per_edge_seconds if per_edge_seconds else float("inf")
+    results: Dict[str, Any] = {
+        "edges": len(records),
+        "relationship_types": len(groups),
+        "per_edge": {
+            "edges": len(sample),
+            "seconds": per_edge_seconds,
+            "edges_per_sec": per_edge_rate,
+            "requests": driver.requests,
+            "projected_seconds_for_all": len(records) / per_edge_rate,
+        },
+        "batched": {},
+        "identical_on_sample": identical,
+    }
+    for batch_size in args.batch_sizes:
+        driver = seeded_driver(groups, args)
+        start = time.perf_counter()
+        reports = load_relationships(driver, groups, batch_size=batch_size)
+        seconds = time.perf_counter() - start
+        results["batched"][str(batch_size)] = {
+            "seconds": seconds,
+            "edges_per_sec": len(records) / seconds,
+            "speedup_vs_per_edge": (len(records) / seconds) / per_edge_rate,
+            "requests": driver.requests,
+            "created": len(driver.relationships),
+            "by_type": {
+                report["edge_type"]: {"edges": report["edges"], "edges_per_sec": report["edges_per_sec"]}
+                for report in reports
+            },
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark batched vs per-edge Neo4j relationship loads.")
+    parser.add_argument(
+        "--input",
+        type=str,
+        default=str(DEFAULT_INPUT),
+        help="Relationship file (default: data/relationship.json)",
+    )
+    parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 5_000],
+        help="UNWIND batch sizes to run (default: 1000 5000)",
+    )
+    parser.add_argument(
+        "--per-edge-count",
+        type=int,
+        default=2_000,
+        help="Edges loaded one by one (default: 2000)",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0005,
+        help="Seconds per round trip (default: 0.0005, a local container)",
+    )
+    parser.add_argument("--row-cost", type=float, default=2e-6, help="Seconds per processed row (default: 2e-6)")
+    parser.add_argument(
+        "--scan-cost",
+        type=float,
+        default=1e-7,
+        help="Seconds per node scanned by an unindexed lookup (default: 1e-7)",
+    )
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
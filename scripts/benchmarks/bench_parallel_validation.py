@@ -0,0 +1,89 @@
+"""
+Benchmark serial vs. process-pool record validation.
+
+Validates the same seeded synthetic records with
+``DataQualityValidator.validate_record`` in a loop and with
+``validate_records_parallel`` at increasing worker counts, checks that the
+cleaned records and issue report are identical, and reports throughput and
+speedup for each worker count.
+
+Usage
+-----
+From the project root:
+
+    python -m scripts.benchmarks.bench_parallel_validation --count 500000 --max-workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from typing import Any, Dict, List
+
+from scripts.benchmarks.synthetic import generate_raw_records
+from scripts.standardize_business_categories import DataQualityValidator
+
+
+def _serial(records: List[dict]):
+    validator = DataQualityValidator()
+    cleaned = [validator.validate_record(record, index) for index, record in enumerate(records)]
+    return cleaned, validator.generate_report()
+
+
+def _parallel(records: List[dict], workers: int):
+    validator = DataQualityValidator()
+    cleaned = validator.validate_records_parallel(records, workers=workers)
+    return cleaned, validator.generate_report()
+
+
+def run(count: int, max_workers: int, seed: int) -> Dict[str, Any]:
+    records = generate_raw_records(count, seed=seed, dirty_share=0.2)
+
+    start = time.perf_counter()
+    serial_cleaned, serial_report = _serial(records)
+    serial_seconds = time.perf_counter() - start
+
+    results: Dict[str, Any] = {
+        "records": count,
+        "serial": {"seconds": serial_seconds, "records_per_sec": count / serial_seconds},
+        "parallel": [],
+    }
+
+    workers = 1
+    while workers <= max_workers:
+        start = time.perf_counter()
+        cleaned, report = _parallel(records, workers)
+        seconds = time.perf_counter() - start
+        results["parallel"].append(
+            {
+                "workers": workers,
+                "seconds": seconds,
+                "records_per_sec": count / seconds,
+                "speedup_vs_serial": serial_seconds / seconds,
+                "identical_to_serial": cleaned == serial_cleaned and report == serial_report,
+            }
+        )
+        workers *= 2
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark parallel record validation.")
+    parser.add_argument("--count", type=int, default=200_000, help="Synthetic records (default: 200000)")
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Largest pool size; sizes double from 1 (default: CPU count)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.count, args.max_workers, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+"""
+End-to-end benchmark of the standardize -> aggregate pipeline.
+
+For every combination of ``--modes``, ``--sizes``,
+``--category-cardinality``, ``--dirty-share`` and
+``--missing-coords-share`` this:
+
+1. writes seeded synthetic raw records (``synthetic.iter_raw_records``) to
+   an NDJSON file, or a JSON array for ``in-memory`` (not timed);
+2. runs the pipeline in a fresh process through its public entry points,
+   with the LLM answered by a local ``stub_openai_server`` (configurable
+   latency), timing each phase:
+
+   - ``loading``, ``validation``, ``classification``, ``attach`` and
+     ``serialization``: the ``PIPELINE_PHASES`` timings reported by
+     ``process_data_streaming`` (``streaming``), ``process_data``
+     (``in-memory``) or ``process_data_columnar`` (``columnar``, NDJSON in
+     and Parquet out), from the raw input to the standardized output and
+     mapping report
+   - ``aggregation``: ``aggregate_files`` over the standardized output,
+     grouped by zip code
+
+3. records throughput and the process's peak RSS.
+
+Results (one entry per scenario plus machine metadata) are written as JSON
+so runs can be compared; ``--compare`` prints the records/sec ratio against
+an earlier results file for matching scenarios.
+
+Sizes up to 10M records run in bounded memory in ``streaming`` mode (the
+pipeline streams and keeps business ids in a disk-backed set), but the
+generated input needs ~0.5 KB of disk per record. ``in-memory`` holds
+every record, as ``process_data`` does, and ``columnar`` holds them as
+Arrow columns.
+
+Usage
+-----
+From the project root:
+
+    python -m scripts.benchmarks.bench_pipeline --sizes 10000,1000000
+    python -m scripts.benchmarks.bench_pipeline --sizes 10000,1000000,10000000 \
+        --category-cardinality 500,5000 --dirty-share 0.05,0.3 \
+        --output bench_results/nightly.json --compare bench_results/last.json
+    python -m scripts.benchmarks.bench_pipeline --modes streaming,in-memory,columnar --sizes 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import datetime
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from scripts.benchmarks.synthetic import iter_raw_records
+
+
+MODES = ["streaming", "in-memory", "columnar"]
+PHASES = ["loading", "validation", "classification", "attach", "serialization", "aggregation"]
+
+
+def _float_list(text: str) -> List[float]:
+    return [float(part) for part in text.split(",") if part.strip()]
+
+
+def _int_list(text: str) -> List[int]:
+    return [int(float(part)) for part in text.split(",") if part.strip()]
+
+
+def _mode_list(text: str) -> List[str]:
+    modes = [part.strip() for part in text.split(",") if part.strip()]
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown mode(s) {unknown}; choose from {MODES}")
+    return modes
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def write_input(path: Path, scenario: Dict[str, Any], seed: int) -> None:
+    """Write the scenario's synthetic raw records, as NDJSON or, for ``in-memory``, a JSON array."""
+    records = iter_raw_records(
+        scenario["records"],
+        seed=seed,
+        category_cardinality=scenario["category_cardinality"],
+        dirty_share=scenario["dirty_share"],
+        missing_coords_share=scenario["missing_coords_share"],
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        if scenario["mode"] == "in-memory":
+            json.dump(list(records), f, ensure_ascii=False)
+            return
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+
+
+def run_pipeline(
+    input_path: str,
+    workdir: str,
+    mode: str,
+    llm_latency: float,
+    workers: int,
+) -> Dict[str, Any]:
+    """
+    Run the pipeline over ``input_path`` and time its phases.
+
+    Meant to run in a fresh process so ``peak_rss_mb`` covers this run only.
+    """
+    from scripts.aggregate_territory_metrics import aggregate_files
+    from scripts.benchmarks.stub_openai_server import start_stub_server
+    from scripts.standardize_business_categories import (
+        mapping_report_path,
+        process_data,
+        process_data_columnar,
+        process_data_streaming,
+    )
+
+    # The standardizer logs progress (and httpx each request) to stdout
+    logging.getLogger().setLevel(logging.WARNING)
+
+    server = start_stub_server(latency=llm_latency)
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    seconds = dict.fromkeys(PHASES, 0.0)
+    clock = time.perf_counter
+
+    try:
+        if mode == "streaming":
+            output_path = str(Path(workdir) / "standardized.ndjson")
+            process_data_streaming(input_path, output_path, openai_api_key="stub", workers=workers, timings=seconds)
+        elif mode == "columnar":
+            output_path = str(Path(workdir) / "standardized.parquet")
+            process_data_columnar(input_path, output_path, openai_api_key="stub", timings=seconds)
+        else:
+            output_path = str(Path(workdir) / "standardized.json")
+            process_data(input_path, output_path, openai_api_key="stub", workers=workers, timings=seconds)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    start = clock()
+    result = aggregate_files([output_path], group_by="zip_code")
+    seconds["aggregation"] = clock() - start
+
+    # Stopping the stub server (up to its 0.5s poll interval) is not timed
+    total_seconds = sum(seconds.values())
+    with open(mapping_report_path(output_path), "r", encoding="utf-8") as f:
+        report = json.load(f)
+    total = report["summary"]["total_records"]
+    return {
+        "seconds": total_seconds,
+        "records_per_sec": total / total_seconds if total_seconds else None,
+        "peak_rss_mb": _peak_rss_mb(),
+        "phases": {
+            phase: {
+                "seconds": seconds[phase],
+                "records_per_sec": total / seconds[phase] if seconds[phase] else None,
+            }
+            for phase in PHASES
+        },
+        "unique_categories": report["summary"]["unique_categories"],
+        "methods": report["classification_report"]["methods"],
+        "llm_requests": server.request_count,
+        "data_quality_issues": report["summary"]["data_quality_issues"],
+        "territories": result["summary"]["territory_count"],
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _scenario_key(scenario: Dict[str, Any]) -> tuple:
+    return (
+        scenario.get("mode", "streaming"),
+        scenario["records"],
+        scenario["category_cardinality"],
+        scenario["dirty_share"],
+        scenario["missing_coords_share"],
+    )
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """records/sec of each scenario relative to the matching baseline scenario."""
+    previous = {_scenario_key(s): s for s in baseline.get("scenarios", [])}
+    rows = []
+    for scenario in results["scenarios"]:
+        old = previous.get(_scenario_key(scenario))
+        if not old or not old.get("records_per_sec") or not scenario.get("records_per_sec"):
+            continue
+        rows.append(
+            {
+                "scenario": dict(zip(("mode", "records", "category_cardinality", "dirty_share", "missing_coords_share"), _scenario_key(scenario))),
+                "records_per_sec_ratio": scenario["records_per_sec"] / old["records_per_sec"],
+                "peak_rss_ratio": scenario["peak_rss_mb"] / old["peak_rss_mb"] if old.get("peak_rss_mb") else None,
+                "phase_seconds_ratio": {
+                    phase: scenario["phases"][phase]["seconds"] / old["phases"][phase]["seconds"]
+                    for phase in PHASES
+                    if old["phases"].get(phase, {}).get("seconds")
+                },
+            }
+        )
+    return rows
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    results: Dict[str, Any] = {
+        "benchmark": "pipeline",
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "settings": {
+            "seed": args.seed,
+            "llm_latency": args.llm_latency,
+            "workers": args.workers,
+        },
+        "scenarios": [],
+    }
+
+    context = multiprocessing.get_context("spawn")
+    grid = itertools.product(
+        args.modes, args.sizes, args.category_cardinality, args.dirty_share, args.missing_coords_share
+    )
+    for mode, records, cardinality, dirty_share, missing_coords_share in grid:
+        scenario = {
+            "mode": mode,
+            "records": records,
+            "category_cardinality": cardinality,
+            "dirty_share": dirty_share,
+            "missing_coords_share": missing_coords_share,
+        }
+        workdir = tempfile.mkdtemp(prefix="bench_pipeline_", dir=args.workdir)
+        try:
+            input_path = Path(workdir) / ("input.json" if mode == "in-memory" else "input.ndjson")
+            print(f"Generating {records} records -> {input_path}", file=sys.stderr)
+            start = time.perf_counter()
+            write_input(input_path, scenario, args.seed)
+            scenario["generate_seconds"] = time.perf_counter() - start
+            scenario["input_bytes"] = input_path.stat().st_size
+
+            print(f"Running pipeline for {scenario}", file=sys.stderr)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                scenario.update(
+                    pool.submit(
+                        run_pipeline,
+                        str(input_path),
+                        workdir,
+                        mode,
+                        args.llm_latency,
+                        args.workers,
+                    ).result()
+                )
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        results["scenarios"].append(scenario)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the standardize -> aggregate pipeline.")
+    parser.add_argument(
+        "--modes",
+        type=_mode_list,
+        default=["streaming"],
+        help="Comma-separated pipelines: streaming (process_data_streaming), in-memory (process_data), "
+        "columnar (process_data_columnar) (default: streaming)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=_int_list,
+        default=[10_000],
+        help="Comma-separated record counts, e.g. 10000,1000000,10000000 (default: 10000)",
+    )
+    parser.add_argument(
+        "--category-cardinality",
+        type=_int_list,
+        default=[500],
+        help="Comma-separated distinct raw category counts (default: 500)",
+    )
+    parser.add_argument(
+        "--dirty-share",
+        type=_float_list,
+        default=[0.1],
+        help="Comma-separated shares of records with quality problems (default: 0.1)",
+    )
+    parser.add_argument(
+        "--missing-coords-share",
+        type=_float_list,
+        default=[0.1],
+        help="Comma-separated shares of records without coordinates (default: 0.1)",
+    )
+    parser.add_argument(
+        "--llm-latency",
+        type=float,
+        default=0.05,
+        help="Seconds the stub LLM sleeps per request (default: 0.05)",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Validation processes (default: 1)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument(
+        "--workdir",
+        type=str,
+        help="Directory for generated input and intermediate files (default: system temp)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Results JSON path (default: bench_results/pipeline_<UTC timestamp>.json)",
+    )
+    parser.add_argument("--compare", type=str, help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    results = run(args)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            results["comparison"] = {"baseline": args.compare, "scenarios": compare(results, json.load(f))}
+
+    if args.output:
+        output_path = Path(args.output)
+    else:
+        stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output_path = Path("bench_results") / f"pipeline_{stamp}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    print(json.dumps(results, indent=2))
+    print(f"Results written to {output_path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
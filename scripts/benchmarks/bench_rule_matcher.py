@@ -0,0 +1,146 @@
+"""
+Micro-benchmark for rule-based category classification.
+
+Compares the compiled ``KeywordMatcher`` automaton used by
+``CategoryStandardizer._rule_based_classification`` against the previous
+linear scan over ``category_map`` (first ``keyword in normalized`` hit wins)
+on a seeded set of synthetic category strings.
+
+Usage
+-----
+From the project root:
+
+    python -m scripts.benchmarks.bench_rule_matcher --count 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from scripts.standardize_business_categories import CategoryStandardizer
+
+
+FILLER_WORDS = [
+    "best", "golden", "family", "premier", "city", "local", "west", "coast",
+    "express", "studio", "supply", "group", "and", "the", "sunset", "bay",
+    "xyz", "general", "national", "quality", "pacific", "mission",
+]
+
+SUFFIXES = ["", "", "", " services", " store", " shop", " center", " inc.", " llc"]
+
+
+def generate_categories(count: int, seed: int = 42) -> List[str]:
+    """
+    Build ``count`` synthetic category strings.
+
+    Roughly two thirds embed one or two taxonomy keywords among filler
+    words; the rest contain filler only and exercise the no-match path.
+    """
+    rng = random.Random(seed)
+    keywords = list(CategoryStandardizer().category_map.keys())
+    categories: List[str] = []
+
+    for _ in range(count):
+        words = rng.sample(FILLER_WORDS, rng.randint(0, 3))
+        if rng.random() < 0.66:
+            for keyword in rng.sample(keywords, rng.randint(1, 2)):
+                words.insert(rng.randint(0, len(words)), keyword)
+        if not words:
+            words = [rng.choice(FILLER_WORDS)]
+        text = " ".join(words) + rng.choice(SUFFIXES)
+        categories.append(text.title() if rng.random() < 0.5 else text)
+
+    return categories
+
+
+def legacy_scan(
+    standardizer: CategoryStandardizer, category: str
+) -> Optional[Tuple[str, str, float]]:
+    """The pre-automaton rule-based classifier, kept here for comparison."""
+    normalized = standardizer._normalize_category(category)
+    if not normalized:
+        return None
+
+    for keyword, (sector, subsector) in standardizer.category_map.items():
+        if keyword in normalized:
+            if normalized == keyword:
+                confidence = 1.0
+            elif normalized.startswith(keyword) or normalized.endswith(keyword):
+                confidence = 0.9
+            else:
+                confidence = 0.8
+            return (sector, subsector, confidence)
+
+    return None
+
+
+def _time(fn: Callable[[str], object], categories: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for category in categories:
+            fn(category)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(count: int, repeat: int, seed: int) -> Dict[str, object]:
+    standardizer = CategoryStandardizer()
+    categories = generate_categories(count, seed)
+
+    legacy_seconds = _time(lambda c: legacy_scan(standardizer, c), categories, repeat)
+    matcher_seconds = _time(standardizer._rule_based_classification, categories, repeat)
+
+    matched = 0
+    changed = 0
+    for category in categories:
+        new = standardizer._rule_based_classification(category)
+        old = legacy_scan(standardizer, category)
+        matched += new is not None
+        changed += new != old
+
+    return {
+        "categories": count,
+        "keywords": len(standardizer.category_map),
+        "matched": matched,
+        "results_differing_from_legacy": changed,
+        "legacy_scan": {
+            "seconds": legacy_seconds,
+            "categories_per_sec": count / legacy_seconds,
+        },
+        "keyword_matcher": {
+            "seconds": matcher_seconds,
+            "categories_per_sec": count / matcher_seconds,
+        },
+        "speedup": legacy_seconds / matcher_seconds,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark rule-based category matching."
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=100_000,
+        help="Number of synthetic category strings (default: 100000)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timing repetitions; the best run is reported (default: 3)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.count, args.repeat, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
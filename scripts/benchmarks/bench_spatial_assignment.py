@@ -0,0 +1,120 @@
+"""
+Benchmark STR-tree point-in-polygon assignment against the naive test.
+
+Draws seeded random points over the bounding box of a polygon layer (some
+with missing coordinates), locates all of them with
+``PolygonLayer.locate`` (STR-tree candidates + vectorized prepared
+point-in-polygon), and locates a subsample with the naive all-pairs loop
+(every point against every polygon, unprepared, first match wins). Checks
+that both agree on the subsample and reports points/sec for each; the
+naive rate is measured on the subsample only, since it is too slow for
+millions of points.
+
+Usage
+-----
+From the project root:
+
+    python -m scripts.benchmarks.bench_spatial_assignment --count 2000000
+    python -m scripts.benchmarks.bench_spatial_assignment --layer data/city.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Dict
+
+import numpy as np
+import shapely
+
+from scripts.spatial_assignment import DEFAULT_LAYERS, PolygonLayer, load_layer
+
+
+def naive_locate(layer: PolygonLayer, lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+    """Index of the first polygon intersecting each point, testing all pairs."""
+    polygons = [shapely.from_wkb(shapely.to_wkb(g)) for g in layer.geometries]  # unprepared copies
+    result = np.full(len(lon), -1, dtype=np.int64)
+    for i, (x, y) in enumerate(zip(lon.tolist(), lat.tolist())):
+        if x != x or y != y:
+            continue
+        point = shapely.Point(x, y)
+        for index, polygon in enumerate(polygons):
+            if polygon.intersects(point):
+                result[i] = index
+                break
+    return result
+
+
+def run(layer_path: str, count: int, naive_count: int, missing_share: float, seed: int) -> Dict[str, Any]:
+    start = time.perf_counter()
+    layer = load_layer(layer_path)
+    load_seconds = time.perf_counter() - start
+
+    rng = np.random.default_rng(seed)
+    xmin, ymin, xmax, ymax = shapely.total_bounds(layer.geometries)
+    lon = rng.uniform(xmin, xmax, count)
+    lat = rng.uniform(ymin, ymax, count)
+    missing = rng.random(count) < missing_share
+    lon[missing] = np.nan
+    lat[missing] = np.nan
+
+    start = time.perf_counter()
+    located = layer.locate(lon, lat)
+    tree_seconds = time.perf_counter() - start
+
+    sample = min(naive_count, count)
+    start = time.perf_counter()
+    naive = naive_locate(layer, lon[:sample], lat[:sample])
+    naive_seconds = time.perf_counter() - start
+
+    tree_rate = count / tree_seconds
+    naive_rate = sample / naive_seconds if naive_seconds else float("inf")
+    return {
+        "layer": layer_path,
+        "polygons": len(layer),
+        "vertices": int(shapely.get_num_coordinates(layer.geometries).sum()),
+        "points": count,
+        "load_seconds": load_seconds,
+        "matched_share": float((located >= 0).mean()) if count else 0.0,
+        "str_tree": {"seconds": tree_seconds, "points_per_sec": tree_rate},
+        "naive": {
+            "points": sample,
+            "seconds": naive_seconds,
+            "points_per_sec": naive_rate,
+            "projected_seconds_for_all": count / naive_rate,
+        },
+        "speedup_vs_naive": tree_rate / naive_rate,
+        "identical_on_sample": bool(np.array_equal(located[:sample], naive)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark STR-tree point-in-polygon assignment.")
+    parser.add_argument(
+        "--layer",
+        type=str,
+        default=str(DEFAULT_LAYERS["community"]),
+        help="Polygon layer (default: data/sd_community_boundaries.csv)",
+    )
+    parser.add_argument("--count", type=int, default=1_000_000, help="Points to locate (default: 1000000)")
+    parser.add_argument(
+        "--naive-count",
+        type=int,
+        default=2_000,
+        help="Points located with the naive all-pairs test (default: 2000)",
+    )
+    parser.add_argument(
+        "--missing-share",
+        type=float,
+        default=0.05,
+        help="Share of points with missing coordinates (default: 0.05)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.layer, args.count, args.naive_count, args.missing_share, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
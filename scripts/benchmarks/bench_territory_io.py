@@ -0,0 +1,167 @@
+"""
+Benchmark territory aggregation input formats: JSON vs Parquet/Arrow.
+
+Writes the same seeded synthetic standardized records as a JSON array,
+NDJSON, Parquet and Arrow IPC (not timed), then, for every format and
+``--engines`` entry, runs in a fresh process:
+
+- ``load``: reading the input the way ``aggregate_files`` does for the
+  numpy engine (``load_records`` for JSON/NDJSON, ``read_columnar_table``
+  of the needed columns for Parquet/Arrow), with its own peak RSS;
+- ``aggregate``: the full ``aggregate_files`` call, with its own peak RSS.
+
+Every run's output is checked against the first run (the python engine
+on the JSON input by default).
+
+Usage
+-----
+From the project root:
+
+    python -m scripts.benchmarks.bench_territory_io --count 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import json
+import multiprocessing
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from scripts.aggregate_territory_metrics import (
+    aggregate_files,
+    load_records,
+    needed_columns,
+    read_columnar_table,
+)
+from scripts.benchmarks.synthetic import iter_standardized_records
+
+
+FORMATS = {"json": ".json", "ndjson": ".ndjson", "parquet": ".parquet", "arrow": ".arrow"}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def write_inputs(workdir: Path, count: int, seed: int, row_group_size: int) -> Dict[str, Path]:
+    """The same records in every format; returns ``{format: path}``."""
+    records = list(iter_standardized_records(count, seed=seed))
+    paths = {name: workdir / f"records{suffix}" for name, suffix in FORMATS.items()}
+    with paths["json"].open("w", encoding="utf-8") as f:
+        json.dump(records, f)
+    with paths["ndjson"].open("w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    table = pa.Table.from_pylist(records)
+    del records
+    pq.write_table(table, paths["parquet"], row_group_size=row_group_size)
+    with pa.OSFile(str(paths["arrow"]), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=row_group_size)
+    return paths
+
+
+def run_load(path: str, levels: List[str]) -> Dict[str, Any]:
+    """Meant to run in a fresh process so ``peak_rss_mb`` covers this load only."""
+    start = time.perf_counter()
+    if path.endswith((".parquet", ".arrow")):
+        rows = read_columnar_table(Path(path), needed_columns(levels)).num_rows
+    else:
+        rows = len(load_records(Path(path)))
+    return {"seconds": time.perf_counter() - start, "rows": rows, "peak_rss_mb": _peak_rss_mb()}
+
+
+def run_aggregate(path: str, levels: List[str], engine: str, workers: int) -> Dict[str, Any]:
+    """Meant to run in a fresh process so ``peak_rss_mb`` covers this run only."""
+    start = time.perf_counter()
+    result = aggregate_files([path], group_by=levels, engine=engine, workers=workers)
+    return {
+        "seconds": time.perf_counter() - start,
+        "peak_rss_mb": _peak_rss_mb(),
+        "output": json.dumps(result, sort_keys=True),
+    }
+
+
+def _in_child(context, fn, *args) -> Any:
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(fn, *args).result()
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    context = multiprocessing.get_context("spawn")
+    workdir = Path(tempfile.mkdtemp(prefix="bench_territory_io_", dir=args.workdir))
+    try:
+        print(f"Generating {args.count} records in {workdir}", file=sys.stderr)
+        # In a child too: ru_maxrss carries over to processes forked from here
+        paths = _in_child(context, write_inputs, workdir, args.count, args.seed, args.row_group_size)
+        reference = None
+        results: Dict[str, Any] = {"records": args.count, "levels": args.levels, "formats": {}}
+        for name, path in paths.items():
+            print(f"Running {name}", file=sys.stderr)
+            load = _in_child(context, run_load, str(path), args.levels)
+            entry: Dict[str, Any] = {
+                "bytes": path.stat().st_size,
+                "load": {"seconds": load["seconds"], "peak_rss_mb": load["peak_rss_mb"]},
+            }
+            for engine in args.engines:
+                run_result = _in_child(context, run_aggregate, str(path), args.levels, engine, args.workers)
+                output = run_result.pop("output")
+                if reference is None:
+                    reference = output
+                run_result["records_per_sec"] = args.count / run_result["seconds"]
+                run_result["identical_to_first"] = output == reference
+                entry[engine] = run_result
+            results["formats"][name] = entry
+
+        baseline = results["formats"]["json"]
+        for entry in results["formats"].values():
+            entry["load"]["speedup_vs_json"] = baseline["load"]["seconds"] / entry["load"]["seconds"]
+            entry["load"]["rss_ratio_vs_json"] = entry["load"]["peak_rss_mb"] / baseline["load"]["peak_rss_mb"]
+        return results
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark JSON vs Parquet/Arrow aggregation input.")
+    parser.add_argument("--count", type=int, default=200_000, help="Synthetic records (default: 200000)")
+    parser.add_argument(
+        "--levels",
+        nargs="+",
+        default=["zip_code", "blockgroup", "city"],
+        help="Grouping levels (default: zip_code blockgroup city)",
+    )
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        choices=["python", "numpy"],
+        default=["python", "numpy"],
+        help="Aggregation engines to run per format (default: python numpy)",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Python engine processes (default: 1)")
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=65_536,
+        help="Parquet row group / Arrow record batch size (default: 65536)",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--workdir", type=str, help="Directory for the generated inputs (default: system temp)")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""
+In-process stand-in for the Neo4j Python driver.
+
+Implements the parts of the driver API that
+``scripts.neo4j_relationship_loader`` and the notebook's per-edge load
+use (``driver.session()``, ``session.run``, ``session.execute_write``,
+``result.single()``/``consume()``) and executes the few Cypher shapes
+they send against an in-memory node/edge store:
+
+- ``CREATE INDEX|CONSTRAINT IF NOT EXISTS FOR (n:L) ...`` on one property;
+- ``CALL db.awaitIndexes(...)``;
+- the loader's ``UNWIND $rows AS row MATCH ... CREATE|MERGE ...`` batch;
+- the notebook's ``MATCH (a:L1 {k1: $entity1}), (b:L2 {k2: $entity2})
+  CREATE (a)-[r:T]->(b)``;
+- ``neo4j_graph_sync``'s ``UNWIND $rows`` node ``MERGE ... SET``, node
+  ``DETACH DELETE`` and relationship ``DELETE`` batches;
+- the notebook's label wipe ``MATCH (n:L) DETACH DELETE n`` and node load
+  ``UNWIND $data AS row CREATE (n:L) SET n = row``.
+
+Anything else raises ``ValueError``. A cost model makes timings
+comparable to a real server: every ``run`` (auto-commit or in a
+transaction) and every commit waits ``latency`` seconds (one network
+round trip), every processed row ``row_cost`` seconds, and every
+endpoint lookup on a (label, property) without an index ``scan_cost``
+seconds per node with that label (a label scan). The wait is one
+``sleep`` per request. ``writes`` counts nodes and relationships written
+or deleted.
+
+Usage
+-----
+    from scripts.benchmarks.stub_neo4j import StubDriver
+
+    driver = StubDriver(latency=0.0005)
+    driver.add_nodes("City", "name", ["Poway", "San Diego"])
+    load_relationships(driver, groups)
+    driver.relationships  # [(("City", "Poway"), "nearby", ("City", "San Diego")), ...]
+
+Relationship endpoints are recorded by the (label, value) they were
+matched on; deleting a node detaches the relationships recorded against
+any of its property values.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+_NAME = r"`((?:[^`]|``)+)`"
+
+_INDEX_RE = re.compile(
+    rf"^CREATE (?:INDEX|CONSTRAINT) IF NOT EXISTS FOR \(n:{_NAME}\) "
+    rf"(?:ON \(n\.{_NAME}\)|REQUIRE n\.{_NAME} IS UNIQUE)$"
+)
+_UNWIND_RE = re.compile(
+    rf"^UNWIND \$rows AS row\s+"
+    rf"MATCH \(a:{_NAME} \{{{_NAME}: row\.source\}}\)\s+"
+    rf"MATCH \(b:{_NAME} \{{{_NAME}: row\.target\}}\)\s+"
+    rf"(CREATE|MERGE) \(a\)-\[:{_NAME}\]->\(b\)\s+"
+    rf"RETURN count\(\*\) AS created$"
+)
+_NODE_UPSERT_RE = re.compile(
+    rf"^UNWIND \$rows AS row\s+"
+    rf"MERGE \(n:{_NAME} \{{{_NAME}: row\.key\}}\)\s+"
+    rf"SET n = row\.properties\s+"
+    rf"RETURN count\(\*\) AS written$"
+)
+_NODE_DELETE_RE = re.compile(
+    rf"^UNWIND \$rows AS row\s+"
+    rf"MATCH \(n:{_NAME} \{{{_NAME}: row\.key\}}\)\s+"
+    rf"DETACH DELETE n\s+"
+    rf"RETURN count\(\*\) AS written$"
+)
+_RELATIONSHIP_DELETE_RE = re.compile(
+    rf"^UNWIND \$rows AS row\s+"
+    rf"MATCH \(a:{_NAME} \{{{_NAME}: row\.source\}}\)-\[r:{_NAME}\]->\(b:{_NAME} \{{{_NAME}: row\.target\}}\)\s+"
+    rf"DELETE r\s+"
+    rf"RETURN count\(\*\) AS written$"
+)
+_LABEL_WIPE_RE = re.compile(rf"^MATCH \(n:{_NAME}\) DETACH DELETE n\s+RETURN count\(n\) AS deleted_count$")
+_NODE_CREATE_RE = re.compile(
+    rf"^UNWIND \$data AS row\s+CREATE \(n:{_NAME}\)\s+SET n = row\s+RETURN count\(n\) AS created$"
+)
+_PER_EDGE_RE = re.compile(
+    rf"^MATCH \(a:{_NAME} \{{(\w+): \$entity1\}}\), \(b:{_NAME} \{{(\w+): \$entity2\}}\) "
+    rf"CREATE \(a\)-\[r:{_NAME}\]->\(b\)\s*$"
+)
+
+
+def _unquote(name: str) -> str:
+    return name.replace("``", "`")
+
+
+def _hashable(value: Any) -> bool:
+    return not isinstance(value, (list, dict, set))
+
+
+class StubResult:
+    def __init__(self, records: List[Dict[str, Any]]):
+        self._records = records
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def single(self) -> Optional[Dict[str, Any]]:
+        return self._records[0] if self._records else None
+
+    def consume(self) -> None:
+        return None
+
+
+class StubTransaction:
+    def __init__(self, driver: "StubDriver"):
+        self._driver = driver
+
+    def run(self, query: str, parameters: Optional[Dict[str, Any]] = None, **kwargs: Any) -> StubResult:
+        result = self._driver._execute(query, {**(parameters or {}), **kwargs})
+        self._driver._round_trip()
+        return result
+
+
+class StubSession:
+    def __init__(self, driver: "StubDriver"):
+        self._driver = driver
+
+    def __enter__(self) -> "StubSession":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        return None
+
+    def run(self, query: str, parameters: Optional[Dict[str, Any]] = None, **kwargs: Any) -> StubResult:
+        result = self._driver._execute(query, {**(parameters or {}), **kwargs})
+        self._driver._round_trip()
+        return result
+
+    def execute_write(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        value = fn(StubTransaction(self._driver), *args, **kwargs)
+        self._driver._round_trip()
+        self._driver.transactions += 1
+        return value
+
+
+class StubDriver:
+    """Driver stand-in holding the graph, the indexes and request counters."""
+
+    def __init__(self, latency: float = 0.0, row_cost: float = 0.0, scan_cost: float = 0.0):
+        self.latency = latency
+        self.row_cost = row_cost
+        self.scan_cost = scan_cost
+        # {(label, property): {value: node count}}
+        self.nodes: Dict[Tuple[str, str], Counter] = defaultdict(Counter)
+        self.label_sizes: Counter = Counter()
+        # {node handle: (label, properties)}, and the handles per (label, property, value)
+        self.node_properties: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+        self._handles: Dict[Tuple[str, str, Any], Set[int]] = defaultdict(set)
+        self._next_handle = 0
+        self.indexes: Set[Tuple[str, str]] = set()
+        self.relationships: List[Tuple[Tuple[str, Any], str, Tuple[str, Any]]] = []
+        self._edge_counts: Counter = Counter()
+        self.requests = 0
+        self.transactions = 0
+        self.writes = 0
+        self._pending = 0.0
+
+    def add_nodes(self, label: str, prop: str, values: Iterable[Any]) -> None:
+        """One ``label`` node per value, keyed by ``prop``."""
+        for value in values:
+            self._create_node(label, {prop: value})
+
+    def _create_node(self, label: str, props: Dict[str, Any]) -> int:
+        handle = self._next_handle
+        self._next_handle += 1
+        self.node_properties[handle] = (label, {})
+        self.label_sizes[label] += 1
+        self._set_properties(handle, props)
+        return handle
+
+    def _set_properties(self, handle: int, props: Dict[str, Any]) -> None:
+        label, old = self.node_properties[handle]
+        for prop, value in old.items():
+            if _hashable(value):
+                self.nodes[(label, prop)][value] -= 1
+                self._handles[(label, prop, value)].discard(handle)
+        self.node_properties[handle] = (label, dict(props))
+        for prop, value in props.items():
+            if _hashable(value):
+                self.nodes[(label, prop)][value] += 1
+                self._handles[(label, prop, value)].add(handle)
+
+    def _delete_nodes(self, handles: Iterable[int]) -> int:
+        """``DETACH DELETE`` of the nodes; returns how many were deleted."""
+        ends = set()
+        deleted = 0
+        for handle in handles:
+            label, props = self.node_properties[handle]
+            ends.update((label, value) for value in props.values() if _hashable(value))
+            self._set_properties(handle, {})
+            del self.node_properties[handle]
+            self.label_sizes[label] -= 1
+            deleted += 1
+        kept = [edge for edge in self.relationships if edge[0] not in ends and edge[2] not in ends]
+        self.writes += deleted + len(self.relationships) - len(kept)
+        self.relationships = kept
+        self._edge_counts = Counter(kept)
+        return deleted
+
+    def graph(self) -> Tuple[Counter, Counter]:
+        """``(nodes, relationships)`` as multisets, for comparing two stub graphs."""
+        nodes = Counter(
+            (label, tuple(sorted((k, repr(v)) for k, v in props.items())))
+            for label, props in self.node_properties.values()
+        )
+        return nodes, Counter(self.relationships)
+
+    def session(self, database: Optional[str] = None, **kwargs: Any) -> StubSession:
+        return StubSession(self)
+
+    def verify_connectivity(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    def _round_trip(self) -> None:
+        self.requests += 1
+        delay, self._pending = self._pending + self.latency, 0.0
+        if delay > 0:
+            time.sleep(delay)
+
+    def _lookup(self, label: str, prop: str, value: Any) -> Set[int]:
+        if (label, prop) not in self.indexes:
+            self._pending += self.scan_cost * self.label_sizes[label]
+        return set(self._handles.get((label, prop, value), ()))
+
+    def _matches(self, label: str, prop: str, value: Any) -> int:
+        if (label, prop) not in self.indexes:
+            self._pending += self.scan_cost * self.label_sizes[label]
+        return self.nodes[(label, prop)].get(value, 0)
+
+    def _add_edges(
+        self, source: Tuple[str, Any], rel_type: str, target: Tuple[str, Any], pairs: int, merge: bool
+    ) -> None:
+        """One edge per matched node pair; ``MERGE`` only adds the pairs not connected yet."""
+        edge = (source, rel_type, target)
+        count = max(pairs - self._edge_counts[edge], 0) if merge else pairs
+        self.relationships.extend([edge] * count)
+        self._edge_counts[edge] += count
+        self.writes += count
+
+    def _execute(self, query: str, parameters: Dict[str, Any]) -> StubResult:
+        text = query.strip()
+        match = _INDEX_RE.match(text)
+        if match:
+            label, on_prop, unique_prop = match.groups()
+            self.indexes.add((_unquote(label), _unquote(on_prop or unique_prop)))
+            return StubResult([])
+        if text.startswith("CALL db.awaitIndexes"):
+            return StubResult([])
+
+        match = _UNWIND_RE.match(text)
+        if match:
+            source, source_key, target, target_key, verb, rel_type = map(_unquote, match.groups())
+            created = 0
+            for row in parameters["rows"]:
+                self._pending += self.row_cost
+                pairs = self._matches(source, source_key, row["source"]) * self._matches(
+                    target, target_key, row["target"]
+                )
+                self._add_edges((source, row["source"]), rel_type, (target, row["target"]), pairs, verb == "MERGE")
+                created += pairs
+            return StubResult([{"created": created}])
+
+        match = _NODE_UPSERT_RE.match(text)
+        if match:
+            label, key = map(_unquote, match.groups())
+            for row in parameters["rows"]:
+                self._pending += self.row_cost
+                handles = self._lookup(label, key, row["key"]) or {self._create_node(label, {key: row["key"]})}
+                for handle in handles:
+                    self._set_properties(handle, row["properties"])
+                    self.writes += 1
+            return StubResult([{"written": len(parameters["rows"])}])
+
+        match = _NODE_DELETE_RE.match(text)
+        if match:
+            label, key = map(_unquote, match.groups())
+            handles: Set[int] = set()
+            for row in parameters["rows"]:
+                self._pending += self.row_cost
+                handles |= self._lookup(label, key, row["key"])
+            deleted = self._delete_nodes(handles)
+            return StubResult([{"written": deleted}])
+
+        match = _RELATIONSHIP_DELETE_RE.match(text)
+        if match:
+            source, source_key, rel_type, target, target_key = map(_unquote, match.groups())
+            doomed = Counter()
+            for row in parameters["rows"]:
+                self._pending += self.row_cost
+                if self._matches(source, source_key, row["source"]) and self._matches(target, target_key, row["target"]):
+                    doomed[((source, row["source"]), rel_type, (target, row["target"]))] += 1
+            kept = [edge for edge in self.relationships if edge not in doomed]
+            deleted = len(self.relationships) - len(kept)
+            self.relationships = kept
+            self._edge_counts = Counter(kept)
+            self.writes += deleted
+            return StubResult([{"written": deleted}])
+
+        match = _LABEL_WIPE_RE.match(text)
+        if match:
+            label = _unquote(match.group(1))
+            handles = [handle for handle, (node_label, _) in self.node_properties.items() if node_label == label]
+            self._pending += self.row_cost * len(handles)
+            self._delete_nodes(handles)
+            return StubResult([{"deleted_count": len(handles)}])
+
+        match = _NODE_CREATE_RE.match(text)
+        if match:
+            label = _unquote(match.group(1))
+            for row in parameters["data"]:
+                self._pending += self.row_cost
+                self._create_node(label, row)
+                self.writes += 1
+            return StubResult([{"created": len(parameters["data"])}])
+
+        match = _PER_EDGE_RE.match(text)
+        if match:
+            source, source_key, target, target_key, rel_type = map(_unquote, match.groups())
+            self._pending += self.row_cost
+            entity1, entity2 = parameters["entity1"], parameters["entity2"]
+            pairs = self._matches(source, source_key, entity1) * self._matches(target, target_key, entity2)
+            self._add_edges((source, entity1), rel_type, (target, entity2), pairs, False)
+            return StubResult([])
+
+        raise ValueError(f"Query not supported by the stub driver: {text[:80]!r}")
@@ -0,0 +1,210 @@
+"""
+Local stand-in for the OpenAI chat completions endpoint.
+
+Answers ``POST /v1/chat/completions`` with the JSON array that
+``CategoryStandardizer._build_llm_messages`` asks for, classifying each
+category with the standardizer's keyword rules and falling back to
+"Other Services / Miscellaneous". Replies longer than the request's
+``max_tokens`` (~4 characters per token) are truncated with
+``finish_reason: "length"``. Latency and transient failures can be
+injected to exercise the async LLM engine's concurrency, timeouts,
+retries and adaptive batching without network access or API cost.
+
+Usage
+-----
+From the project root:
+
+    python -m scripts.benchmarks.stub_openai_server --port 8765 --latency 0.2
+
+then point the standardizer at it:
+
+    OPENAI_API_KEY=stub OPENAI_BASE_URL=http://127.0.0.1:8765/v1 \
+        python -m scripts.standardize_business_categories
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+
+from scripts.standardize_business_categories import CategoryStandardizer
+
+
+_CATEGORIES_RE = re.compile(r"Categories \(JSON\):\n(.*?)\n\nRules:", re.DOTALL)
+
+
+class StubOpenAIServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the stub's configuration and counters."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        super().__init__(address, _StubHandler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.standardizer = CategoryStandardizer()
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.error_count = 0
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def classify(self, categories: List[str]) -> List[Dict[str, Any]]:
+        results = []
+        for category in categories:
+            rule = self.standardizer._rule_based_classification(category)
+            sector, subsector, confidence = rule or ("Other Services", "Miscellaneous", 0.5)
+            results.append(
+                {
+                    "category": category,
+                    "sector": sector,
+                    "subsector": subsector,
+                    "confidence": confidence,
+                }
+            )
+        return results
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: StubOpenAIServer
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self) -> None:  # noqa: N802
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+
+        server = self.server
+        with server.lock:
+            server.request_count += 1
+            fail = server.rng.random() < server.error_rate
+            if fail:
+                server.error_count += 1
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        if fail:
+            self._send_json(500, {"error": {"message": "injected failure", "type": "server_error"}})
+            return
+
+        user_content = next(
+            (m.get("content", "") for m in request.get("messages", []) if m.get("role") == "user"),
+            "",
+        )
+        match = _CATEGORIES_RE.search(user_content)
+        categories = json.loads(match.group(1)) if match else []
+        content = json.dumps(server.classify(categories))
+        finish_reason = "stop"
+
+        # Emulate the token limit (~4 characters per token): long replies
+        # are cut off mid-JSON and reported with finish_reason "length"
+        max_tokens = request.get("max_tokens")
+        if isinstance(max_tokens, int) and len(content) > max_tokens * 4:
+            content = content[: max_tokens * 4]
+            finish_reason = "length"
+
+        prompt_tokens = sum(len(m.get("content", "")) for m in request.get("messages", [])) // 4
+        completion_tokens = len(content) // 4
+        self._send_json(
+            200,
+            {
+                "id": f"chatcmpl-stub-{server.request_count}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get("model", "stub"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": finish_reason,
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            },
+        )
+
+
+def start_stub_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    latency: float = 0.0,
+    error_rate: float = 0.0,
+    seed: int = 0,
+) -> StubOpenAIServer:
+    """
+    Start the stub on a background thread and return the server.
+
+    ``port=0`` picks a free port; read it back from ``server.base_url``.
+    Call ``server.shutdown()`` when done.
+    """
+    server = StubOpenAIServer((host, port), latency=latency, error_rate=error_rate, seed=seed)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local OpenAI chat completions stub.")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port (default: 8765)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to sleep per request (default: 0)")
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests answered with HTTP 500 (default: 0)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for failure injection (default: 0)")
+    args = parser.parse_args()
+
+    server = StubOpenAIServer(
+        (args.host, args.port),
+        latency=args.latency,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    print(f"Stub OpenAI endpoint listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Seeded synthetic business records for benchmarks.
+
+Raw records use the raw export shapes that
+``DataQualityValidator._normalize_schema`` accepts (``name`` vs
+``business_name``, ``categories`` list vs ``category`` string, ``zip`` vs
+``zip_code``, ``id`` vs ``business_id``, WKT ``geom`` instead of
+latitude/longitude, ...), so every validation branch gets exercised.
+
+Standardized records have the shape ``standardize_business_categories.py``
+writes, for benchmarking ``aggregate_territory_metrics.py`` without
+running the standardizer first.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, Iterator, List
+
+from scripts.standardize_business_categories import CANONICAL_TAXONOMY
+
+
+CITIES = [
+    "San Diego", "Chula Vista", "Oceanside", "Escondido", "Carlsbad",
+    "El Cajon", "Vista", "San Marcos", "Encinitas", "National City",
+]
+
+NOISE_WORDS = [
+    "best", "golden", "family", "premier", "express", "studio", "supply",
+    "group", "pacific", "mission", "coast", "local", "artisan", "urban",
+]
+
+SUFFIXES = ["", "", " services", " store", " shop", " center", " inc."]
+
+
+def category_pool(cardinality: int, seed: int = 0) -> List[str]:
+    """
+    ``cardinality`` distinct raw category strings.
+
+    About 70% are built around a taxonomy keyword (rule-classifiable); the
+    rest are noise-only and fall through to the LLM / unclassified path.
+    """
+    rng = random.Random(seed)
+    keywords = sorted(
+        {kw for subsectors in CANONICAL_TAXONOMY.values() for kws in subsectors.values() for kw in kws}
+    )
+    pool: List[str] = []
+    seen = set()
+    while len(pool) < cardinality:
+        words = rng.sample(NOISE_WORDS, rng.randint(0, 2))
+        if rng.random() < 0.7:
+            words.insert(rng.randint(0, len(words)), rng.choice(keywords))
+        elif not words:
+            words = [rng.choice(NOISE_WORDS)]
+        text = (" ".join(words) + rng.choice(SUFFIXES)).title()
+        # Disambiguate collisions so the pool has exactly `cardinality` entries
+        if text in seen:
+            text = f"{text} {len(pool)}"
+        seen.add(text)
+        pool.append(text)
+    return pool
+
+
+def iter_raw_records(
+    count: int,
+    seed: int = 42,
+    category_cardinality: int = 500,
+    dirty_share: float = 0.1,
+    missing_coords_share: float = 0.1,
+) -> Iterator[Dict]:
+    """
+    Yield ``count`` raw business records.
+
+    Args:
+        count: Number of records
+        seed: Random seed; the same arguments always yield the same records
+        category_cardinality: Distinct raw category strings in use
+        dirty_share: Fraction of records with at least one data-quality
+            problem (bad ZIP/phone/rating/coordinates, empty name or
+            category, duplicate or missing id, overlong name)
+        missing_coords_share: Fraction of records without latitude/longitude
+            (half of those carry a WKT ``geom`` point instead)
+    """
+    rng = random.Random(seed)
+    categories = category_pool(category_cardinality, seed)
+
+    for i in range(count):
+        lat = rng.uniform(32.55, 33.45)
+        lon = rng.uniform(-117.6, -116.1)
+        record: Dict = {}
+
+        # Alternate between the two id / name / zip / category spellings
+        if rng.random() < 0.5:
+            record["id"] = 100000 + i
+            record["name"] = f"Business {i}"
+        else:
+            record["business_id"] = f"ca_biz_{100000 + i}"
+            record["business_name"] = f"Business {i}"
+
+        category = rng.choice(categories)
+        if rng.random() < 0.7:
+            record["categories"] = [category, rng.choice(categories)]
+        else:
+            record["category"] = category
+
+        zip_code = str(rng.randint(91901, 92199))
+        if rng.random() < 0.5:
+            record["zip"] = int(zip_code)
+        else:
+            record["zip_code"] = zip_code if rng.random() < 0.8 else f"{zip_code}-{rng.randint(1000, 9999)}"
+
+        record["city"] = rng.choice(CITIES)
+        record["address"] = f"{rng.randint(1, 9999)} Main St"
+        record["phone"] = f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+        record["blockgroup"] = rng.randint(1, 999999)
+        record["avg_rating"] = round(rng.uniform(1.0, 5.0), 1) if rng.random() < 0.9 else None
+        record["franchise"] = rng.choice(["FRANCHISE", "CHAIN", "INDEPENDENT", "LOCAL", "UNKNOWN"])
+
+        if rng.random() < missing_coords_share:
+            if rng.random() < 0.5:
+                record["geom"] = f"POINT ({lon:.6f} {lat:.6f})"
+        else:
+            record["latitude"] = round(lat, 6)
+            record["longitude"] = round(lon, 6)
+
+        if rng.random() < dirty_share:
+            problem = rng.randrange(8)
+            if problem == 0:
+                record["zip_code"] = "9210"
+                record.pop("zip", None)
+            elif problem == 1:
+                record["phone"] = "555-01"
+            elif problem == 2:
+                record["avg_rating"] = rng.choice([7.5, -1, "n/a"])
+            elif problem == 3:
+                record["latitude"] = rng.choice([47.6, "unknown"])
+                record["longitude"] = -122.3
+            elif problem == 4:
+                record.pop("name", None)
+                record["business_name"] = "   "
+            elif problem == 5:
+                record.pop("categories", None)
+                record["category"] = " "
+            elif problem == 6:
+                record.pop("id", None)
+                if rng.random() < 0.5:
+                    record["business_id"] = f"ca_biz_{100000 + rng.randrange(i + 1)}"
+                else:
+                    # No usable id at all: the validator generates one
+                    record.pop("business_id", None)
+            else:
+                record["business_name"] = "X" * 250
+                record.pop("name", None)
+
+        yield record
+
+
+def generate_raw_records(count: int, **kwargs) -> List[Dict]:
+    """List form of ``iter_raw_records``."""
+    return list(iter_raw_records(count, **kwargs))
+
+
+def iter_standardized_records(
+    count: int,
+    seed: int = 42,
+    zip_cardinality: int = 300,
+    blockgroup_cardinality: int = 2000,
+    category_cardinality: int = 500,
+    missing_coords_share: float = 0.1,
+) -> Iterator[Dict]:
+    """
+    Yield ``count`` standardized (cleaned and classified) business records.
+
+    Args:
+        count: Number of records
+        seed: Random seed; the same arguments always yield the same records
+        zip_cardinality: Distinct ZIP codes
+        blockgroup_cardinality: Distinct block groups
+        category_cardinality: Distinct raw categories, each mapped to a
+            fixed taxonomy sector/subsector
+        missing_coords_share: Fraction of records without valid coordinates
+    """
+    rng = random.Random(seed)
+    subsectors = [
+        (sector, subsector) for sector, subs in CANONICAL_TAXONOMY.items() for subsector in subs
+    ]
+    categories = []
+    for category in category_pool(category_cardinality, seed):
+        if rng.random() < 0.85:
+            sector, subsector = rng.choice(subsectors)
+            method = "rule_based" if rng.random() < 0.8 else "llm"
+            confidence = round(rng.uniform(0.6, 1.0), 2)
+        else:
+            sector, subsector, method, confidence = "Other Services", "Miscellaneous", "unclassified", 0.0
+        categories.append((category, sector, subsector, confidence, method))
+    zip_codes = [str(91901 + i) for i in range(zip_cardinality)]
+    blockgroups = [f"06073{rng.randrange(10**7):07d}" for _ in range(blockgroup_cardinality)]
+    franchise_types = [("FRANCHISE", True), ("INDEPENDENT", False), ("UNKNOWN", None)]
+
+    for i in range(count):
+        category, sector, subsector, confidence, method = rng.choice(categories)
+        franchise_type, is_franchise = rng.choice(franchise_types)
+        has_coords = rng.random() >= missing_coords_share
+        yield {
+            "business_id": f"ca_biz_{100000 + i}",
+            "business_name": f"Business {i}",
+            "address": f"{rng.randint(1, 9999)} Main St",
+            "city": rng.choice(CITIES),
+            "zip_code": rng.choice(zip_codes),
+            "blockgroup": rng.choice(blockgroups),
+            "latitude": round(rng.uniform(32.55, 33.45), 6) if has_coords else None,
+            "longitude": round(rng.uniform(-117.6, -116.1), 6) if has_coords else None,
+            "has_valid_coordinates": has_coords,
+            "franchise_type": franchise_type,
+            "is_franchise": is_franchise,
+            "category_original": category,
+            "category_sector": sector,
+            "category_subsector": subsector,
+            "category_confidence": confidence,
+            "category_method": method,
+            "avg_rating": round(rng.uniform(1.0, 5.0), 1) if rng.random() < 0.9 else None,
+        }
+
+
+def generate_standardized_records(count: int, **kwargs) -> List[Dict]:
+    """List form of ``iter_standardized_records``."""
+    return list(iter_standardized_records(count, **kwargs))
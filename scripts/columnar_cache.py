@@ -0,0 +1,353 @@
+"""
+Columnar cache for the pandas JSON tables in ``data/``.
+
+Purpose
+-------
+``business.json``, ``city.json``, ``relationship.json`` and the other
+notebook exports are pandas column-oriented JSON
+(``{"col": {"0": v, ...}}``), and every consumer decodes the whole file,
+3 MB of city geometry included, to read a couple of columns. This module
+converts each file once into an Arrow IPC file and memory-maps it on
+later loads, so reading a file costs little more than opening it and
+selecting columns only touches the bytes of those columns.
+
+Cache
+-----
+``<source dir>/cache/columnar/<stem>-<path digest>.arrow`` with a
+``.json`` sidecar holding the source's mtime, size and SHA-256. A cache
+whose sidecar matches the source's mtime and size is used as is; on an
+mtime change the source is hashed and, when only touched, the sidecar is
+refreshed instead of the cache. Any other change rebuilds it. Writes are
+atomic.
+
+- String columns with at most ``DICTIONARY_RATIO`` distinct values per
+  row are dictionary-encoded (``entitytype1``, ``predicate``, ...).
+- Columns Arrow cannot type (mixed ints and strings) are stored as JSON
+  text and decoded on read.
+- Row labels are kept in ``__index__`` and restored by ``read_frame``.
+- Values keep their JSON types (as ``pd.read_json(..., dtype=False)``,
+  not its default type inference): numeric-looking strings such as zip
+  codes stay strings, matching the relationship endpoints that refer to
+  them.
+
+JSON arrays of records (``relationships.json``) are cached the same way.
+Without pyarrow, ``read_records``/``read_frame`` decode the JSON each
+time, as before.
+
+Usage
+-----
+    from scripts.columnar_cache import read_frame, read_records
+
+    cities = read_frame("data/city.json", columns=["id", "name"])
+    edges = read_records("data/relationship.json")
+
+Prebuild (or inspect) the caches from the project root:
+
+    python -m scripts.columnar_cache data/*.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_SUBDIR = Path("cache") / "columnar"
+
+# Bump when the cached layout or the conversion changes
+CACHE_VERSION = 1
+
+INDEX_COLUMN = "__index__"
+
+# Dictionary-encode string columns with at most this many distinct values per row
+DICTIONARY_RATIO = 0.5
+
+_JSON_ENCODING = {b"encoding": b"json"}
+_HASH_CHUNK = 1 << 20
+
+PathLike = Union[str, Path]
+
+
+class NotTabularError(ValueError):
+    """The JSON file is neither pandas column-oriented nor an array of records."""
+
+
+def _require_pyarrow() -> None:
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for the columnar cache (pip install pyarrow)")
+
+
+def _file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_paths(source: Path, cache_dir: Optional[Path] = None) -> Tuple[Path, Path]:
+    """(Arrow file, sidecar) caching ``source``."""
+    source = Path(source)
+    directory = Path(cache_dir) if cache_dir is not None else source.parent / CACHE_SUBDIR
+    digest = hashlib.sha1(str(source.resolve()).encode("utf-8")).hexdigest()[:12]
+    stem = directory / f"{source.stem}-{digest}"
+    return stem.with_suffix(".arrow"), stem.with_suffix(".json")
+
+
+# ---------------------------------------------------------------------------
+# Conversion
+# ---------------------------------------------------------------------------
+
+def parse_columns(path: Path) -> Tuple[List[Any], Dict[str, List[Any]]]:
+    """``(row labels, {column: values})`` of a pandas column-oriented JSON file or JSON array of records."""
+    with path.open("r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict) and data and all(isinstance(values, dict) for values in data.values()):
+        # pandas DataFrame.to_json() default: {column: {row label: value}}
+        labels = list(next(iter(data.values())))
+        columns = {column: [values.get(label) for label in labels] for column, values in data.items()}
+    elif isinstance(data, list) and all(isinstance(row, dict) for row in data):
+        names = list(dict.fromkeys(name for row in data for name in row))
+        labels = list(range(len(data)))
+        columns = {name: [row.get(name) for row in data] for name in names}
+    else:
+        raise NotTabularError(f"{path} is not a pandas column-oriented JSON table or an array of records")
+    if labels and all(isinstance(label, str) and label.isdigit() for label in labels):
+        labels = [int(label) for label in labels]
+    return labels, columns
+
+
+def _arrow_column(values: List[Any]) -> Tuple["pa.Array", Optional[Dict[bytes, bytes]]]:
+    try:
+        array = pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        text = [None if value is None else json.dumps(value, ensure_ascii=False) for value in values]
+        return pa.array(text, type=pa.string()), _JSON_ENCODING
+    if pa.types.is_string(array.type) and len(array):
+        encoded = array.dictionary_encode()
+        if len(encoded.dictionary) <= DICTIONARY_RATIO * len(array):
+            return encoded, None
+    return array, None
+
+
+def to_arrow(labels: List[Any], columns: Dict[str, List[Any]]) -> "pa.Table":
+    _require_pyarrow()
+    arrays, fields = [], []
+    for name, values in [(INDEX_COLUMN, labels), *columns.items()]:
+        array, metadata = _arrow_column(values)
+        arrays.append(array)
+        fields.append(pa.field(name, array.type, metadata=metadata))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def _write_atomic(path: Path, write) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def build_cache(source: Path, cache_dir: Optional[Path] = None) -> Path:
+    """Convert ``source`` and write its cache; returns the Arrow file."""
+    arrow_path, meta_path = cache_paths(source, cache_dir)
+    stat = source.stat()
+    table = to_arrow(*parse_columns(source))
+
+    def write_table(f) -> None:
+        with pa.ipc.new_file(f, table.schema) as writer:
+            writer.write_table(table)
+
+    _write_atomic(arrow_path, write_table)
+    meta = {
+        "version": CACHE_VERSION,
+        "source": str(source),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": _file_hash(source),
+        "rows": table.num_rows,
+    }
+    _write_atomic(meta_path, lambda f: f.write(json.dumps(meta, indent=2).encode("utf-8")))
+    logger.info("Cached %s (%d rows, %d columns) in %s", source, table.num_rows, table.num_columns - 1, arrow_path)
+    return arrow_path
+
+
+def is_fresh(source: Path, cache_dir: Optional[Path] = None) -> bool:
+    """Whether the cache of ``source`` exists and matches its content."""
+    arrow_path, meta_path = cache_paths(source, cache_dir)
+    if not arrow_path.exists() or not meta_path.exists():
+        return False
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    stat = source.stat()
+    if meta.get("version") != CACHE_VERSION or meta.get("size") != stat.st_size:
+        return False
+    if meta.get("mtime_ns") == stat.st_mtime_ns:
+        return True
+    if meta.get("sha256") != _file_hash(source):
+        return False
+    # Touched but unchanged: keep the cache, remember the new mtime
+    meta["mtime_ns"] = stat.st_mtime_ns
+    _write_atomic(meta_path, lambda f: f.write(json.dumps(meta, indent=2).encode("utf-8")))
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+def cached_table(
+    source: PathLike, columns: Optional[Sequence[str]] = None, cache_dir: Optional[Path] = None
+) -> "pa.Table":
+    """
+    Memory-mapped Arrow table of ``source`` (built or rebuilt as needed),
+    with ``columns`` only when given, plus ``__index__``.
+    """
+    _require_pyarrow()
+    source = Path(source)
+    arrow_path, _ = cache_paths(source, cache_dir)
+    if not is_fresh(source, cache_dir):
+        build_cache(source, cache_dir)
+    # The table's buffers keep the mapping alive after the file is closed
+    with pa.memory_map(str(arrow_path), "r") as mapped:
+        table = pa.ipc.open_file(mapped).read_all()
+    if columns is None:
+        return table
+    missing = [column for column in columns if column not in table.column_names]
+    if missing:
+        raise KeyError(f"{source} has no column(s) {missing}; available: {table.column_names[1:]}")
+    return table.select([INDEX_COLUMN, *[column for column in columns if column != INDEX_COLUMN]])
+
+
+def _column_values(table: "pa.Table", name: str) -> List[Any]:
+    column = table.column(name)
+    if pa.types.is_dictionary(column.type):
+        # Decoding through the dictionary is ~30x faster than to_pylist()
+        # on the dictionary array itself
+        column = column.cast(column.type.value_type)
+    values = column.to_pylist()
+    metadata = table.schema.field(name).metadata or {}
+    if metadata.get(b"encoding") == b"json":
+        values = [None if value is None else json.loads(value) for value in values]
+    return values
+
+
+def read_columns(
+    source: PathLike, columns: Optional[Sequence[str]] = None, cache_dir: Optional[Path] = None
+) -> Dict[str, List[Any]]:
+    """``{column: values}`` of ``source`` as Python lists (row labels excluded)."""
+    if not PYARROW_AVAILABLE:
+        _, data = parse_columns(Path(source))
+        return {column: data[column] for column in (columns or data)}
+    table = cached_table(source, columns, cache_dir)
+    return {name: _column_values(table, name) for name in table.column_names if name != INDEX_COLUMN}
+
+
+def read_records(
+    source: PathLike, columns: Optional[Sequence[str]] = None, cache_dir: Optional[Path] = None
+) -> List[Dict[str, Any]]:
+    """
+    Rows of ``source`` as dicts. Requested columns the file lacks are
+    None in every row, as ``row.get`` would give.
+    """
+    source = Path(source)
+    if PYARROW_AVAILABLE:
+        table = cached_table(source, cache_dir=cache_dir)
+        count, names = table.num_rows, table.column_names[1:]
+        wanted = list(columns) if columns is not None else names
+        data = {column: _column_values(table, column) for column in wanted if column in names}
+    else:
+        labels, data = parse_columns(source)
+        count = len(labels)
+        wanted = list(columns) if columns is not None else list(data)
+    values = [data[column] if column in data else [None] * count for column in wanted]
+    return [dict(zip(wanted, row)) for row in zip(*values)]
+
+
+def read_frame(source: PathLike, columns: Optional[Sequence[str]] = None, cache_dir: Optional[Path] = None):
+    """
+    ``source`` as a pandas DataFrame, like ``pd.read_json(source,
+    dtype=False)`` (row labels as the index, JSON value types kept, list
+    values as Python lists), restricted to ``columns`` when given.
+    """
+    import pandas as pd
+
+    if not PYARROW_AVAILABLE:
+        df = pd.read_json(source, dtype=False)
+        return df[list(columns)] if columns is not None else df
+    table = cached_table(source, columns, cache_dir)
+    data = {}
+    for name in table.column_names[1:]:
+        column_type = table.schema.field(name).type
+        metadata = table.schema.field(name).metadata or {}
+        if pa.types.is_dictionary(column_type):
+            data[name] = table.column(name).cast(column_type.value_type).to_pandas()
+        elif metadata.get(b"encoding") == b"json" or pa.types.is_nested(column_type):
+            data[name] = pd.Series(_column_values(table, name), dtype=object)
+        else:
+            data[name] = table.column(name).to_pandas()
+    df = pd.DataFrame(data, columns=table.column_names[1:])
+    df.index = pd.Index(table.column(INDEX_COLUMN).to_pandas())
+    df.index.name = None
+    return df
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the columnar cache of pandas JSON tables.")
+    parser.add_argument("sources", nargs="+", help="JSON files to cache")
+    parser.add_argument("--cache-dir", type=str, help="Cache directory (default: <source dir>/cache/columnar)")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild even if the cache is current")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+    try:
+        _require_pyarrow()
+    except ImportError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
+    failed = False
+    for name in args.sources:
+        source = Path(name)
+        try:
+            if args.rebuild or not is_fresh(source, cache_dir):
+                build_cache(source, cache_dir)
+            else:
+                logger.info("%s: cache is current (%s)", source, cache_paths(source, cache_dir)[0])
+        except NotTabularError as exc:
+            logger.warning("Skipping %s", exc)
+        except (OSError, ValueError) as exc:
+            logger.error("Failed to cache %s: %s", source, exc)
+            failed = True
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
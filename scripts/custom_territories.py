@@ -0,0 +1,356 @@
+"""
+Territory metrics for user-drawn territory polygons.
+
+Purpose
+-------
+Planners draw custom territories that follow neither administrative
+boundaries nor a regular grid. This module aggregates the usual territory
+metrics (see ``aggregate_territory_metrics.py``) per polygon of a
+GeoJSON, WKT, CSV or JSON polygon file (formats as in
+``spatial_assignment``). Territories may overlap: a business inside
+several territories is counted in each of them, and businesses outside
+every territory (or without coordinates) are filed under "UNKNOWN".
+Polygons sharing a name are parts of one territory: a business inside
+several of them is counted once.
+
+Assignment cache
+----------------
+Locating every business is the expensive step, and it only depends on the
+polygons and the record coordinates. The membership pairs (record,
+polygon) computed through the STR-tree are cached, before polygons are
+merged by name (so one cache serves every ``--name-field``), as
+``<cache dir>/<polygon hash>-<coordinates hash>.npz``, keyed by the
+SHA-256 of the polygon file and of the records' longitude/latitude in
+input order. Repeated metric runs over the same inputs reuse the cache;
+editing a polygon or any coordinate, or reordering the records, gives a
+new key.
+
+Output
+------
+``aggregate_territories`` output grouped by ``territory``. The summary
+also carries ``record_count`` (distinct input records; with overlaps,
+``total_businesses`` counts memberships), ``multi_territory_records`` and
+``polygon_file``.
+
+Usage
+-----
+From the project root:
+
+    python -m scripts.custom_territories \
+        --territories data/planner_territories.geojson \
+        --input data/ca_businesses_standardized.ndjson \
+        --output data/ca_businesses_standardized_by_territory.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from scripts.aggregate_territory_metrics import ENGINES, aggregate_territories, load_records
+from scripts.spatial_assignment import coordinates, load_layer
+
+
+logger = logging.getLogger(__name__)
+
+# Group field holding the territory name
+TERRITORY_FIELD = "territory"
+
+DEFAULT_CACHE_DIR = Path("data") / "cache" / "territory_assignments"
+
+# Bump when the cached layout or the membership rule changes
+CACHE_VERSION = 3
+
+_HASH_CHUNK = 1 << 20
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def coordinates_hash(lon: "np.ndarray", lat: "np.ndarray") -> str:
+    """SHA-256 hex digest of the coordinate arrays (all NaNs hash alike)."""
+    digest = hashlib.sha256()
+    for values in (lon, lat):
+        values = np.asarray(values, dtype=np.float64)
+        digest.update(np.where(np.isnan(values), np.nan, values).tobytes())
+    return digest.hexdigest()
+
+
+class TerritoryAssignment:
+    """
+    Record-to-territory memberships: record ``rows[k]`` lies in territory
+    ``names[territories[k]]``. Pairs are sorted by row, then territory (in
+    polygon file order); a row may appear several times, once per
+    distinct territory name, or not at all.
+    """
+
+    def __init__(self, rows: "np.ndarray", territories: "np.ndarray", names: Sequence[str], record_count: int):
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.territories = np.asarray(territories, dtype=np.int64)
+        self.names = list(names)
+        self.record_count = record_count
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def per_record(self) -> "np.ndarray":
+        """Number of territories containing each record."""
+        return np.bincount(self.rows, minlength=self.record_count)
+
+    def save(self, path: Path) -> None:
+        """Write to ``path`` (.npz) atomically, so concurrent runs never read a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    rows=self.rows,
+                    territories=self.territories,
+                    territory_count=np.int64(len(self.names)),
+                    record_count=np.int64(self.record_count),
+                )
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: Path, names: Sequence[str]) -> "TerritoryAssignment":
+        """Read a ``save``d assignment; ``names`` are the territory names, in polygon order."""
+        with np.load(path, allow_pickle=False) as data:
+            territory_count = int(data["territory_count"])
+            if territory_count != len(names):
+                raise ValueError(f"Cached assignment has {territory_count} territories, expected {len(names)}")
+            return cls(data["rows"], data["territories"], names, int(data["record_count"]))
+
+
+def cache_path(cache_dir: Path, polygon_path: Path, lon: "np.ndarray", lat: "np.ndarray") -> Path:
+    """Cache file for ``polygon_path`` and these coordinates."""
+    key = f"{file_hash(polygon_path)[:20]}-{coordinates_hash(lon, lat)[:20]}-v{CACHE_VERSION}"
+    return cache_dir / f"{key}.npz"
+
+
+def distinct_memberships(
+    rows: "np.ndarray", polygons: "np.ndarray", names: Sequence[str]
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    (row, polygon) pairs with every polygon replaced by the first polygon
+    of the same name, each pair kept once, sorted by row, then polygon.
+    """
+    first: Dict[str, int] = {}
+    canonical = np.array([first.setdefault(name, i) for i, name in enumerate(names)], dtype=np.int64)
+    if not len(rows):
+        return rows, polygons
+    pairs = np.unique(np.stack([rows, canonical[polygons]], axis=1), axis=0)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def assign_territories(
+    lon: "np.ndarray",
+    lat: "np.ndarray",
+    polygon_path: Path,
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+    name_field: Optional[str] = None,
+) -> TerritoryAssignment:
+    """
+    Memberships of the points in the polygons of ``polygon_path``, read
+    from ``cache_dir`` when an assignment for the same polygon file and
+    coordinates exists, else computed and stored there. ``cache_dir=None``
+    always computes.
+
+    The cache holds one pair per containing polygon; polygons are merged by
+    their ``name_field`` names after loading, so the key does not depend on
+    the name field.
+    """
+    # Names are cheap to re-read; only the per-polygon memberships are cached
+    layer = load_layer(str(polygon_path), name_field)
+    path = None
+    memberships = None
+    if cache_dir is not None:
+        path = cache_path(Path(cache_dir), polygon_path, lon, lat)
+        if path.exists():
+            try:
+                cached = TerritoryAssignment.load(path, layer.names)
+            except (OSError, ValueError, KeyError) as exc:
+                logger.warning("Ignoring unreadable assignment cache %s: %s", path, exc)
+            else:
+                logger.info("Reusing territory assignment %s", path)
+                memberships = cached.rows, cached.territories
+
+    if memberships is None:
+        memberships = layer.memberships(lon, lat)
+        if path is not None:
+            TerritoryAssignment(*memberships, layer.names, len(lon)).save(path)
+            logger.info("Cached territory assignment in %s", path)
+    rows, territories = distinct_memberships(*memberships, layer.names)
+    return TerritoryAssignment(rows, territories, layer.names, len(lon))
+
+
+def expand_records(
+    records: Sequence[Dict[str, Any]], assignment: TerritoryAssignment, field: str = TERRITORY_FIELD
+) -> Iterator[Dict[str, Any]]:
+    """
+    One shallow copy of each record per containing territory, with
+    ``field`` set to the territory name, in record order; records in no
+    territory are yielded once with ``field`` set to None.
+    """
+    if len(records) != assignment.record_count:
+        raise ValueError(f"Assignment covers {assignment.record_count} records, got {len(records)}")
+    names = assignment.names
+    bounds = np.searchsorted(assignment.rows, np.arange(len(records) + 1)).tolist()
+    territories = assignment.territories.tolist()
+    for row, rec in enumerate(records):
+        start, end = bounds[row], bounds[row + 1]
+        if start == end:
+            yield {**rec, field: None}
+        for k in range(start, end):
+            yield {**rec, field: names[territories[k]]}
+
+
+def aggregate_custom_territories(
+    records: Sequence[Dict[str, Any]],
+    polygon_path: Path,
+    top_n: int = 5,
+    engine: str = "python",
+    cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+    name_field: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    ``aggregate_territories`` output grouped by the polygons of
+    ``polygon_path``, counting a record in every territory containing it.
+
+    Parameters
+    ----------
+    records:
+        Standardized business records, in a stable order (the cache key
+        depends on it).
+    polygon_path:
+        GeoJSON, WKT, CSV or JSON polygon file (see ``spatial_assignment``).
+    top_n, engine:
+        As for ``aggregate_territories``.
+    cache_dir:
+        Directory of cached assignments; None disables the cache.
+    name_field:
+        Polygon property naming each territory (default: first of
+        ``spatial_assignment.NAME_FIELDS`` present).
+    """
+    lon, lat = coordinates(records)
+    assignment = assign_territories(lon, lat, Path(polygon_path), cache_dir, name_field)
+    result = aggregate_territories(
+        expand_records(records, assignment), group_by=TERRITORY_FIELD, top_n=top_n, engine=engine
+    )
+    per_record = assignment.per_record()
+    result["summary"]["record_count"] = len(records)
+    result["summary"]["multi_territory_records"] = int((per_record > 1).sum())
+    result["summary"]["polygon_file"] = str(polygon_path)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Aggregate territory metrics per user-drawn (possibly overlapping) polygon."
+    )
+    parser.add_argument(
+        "--territories",
+        type=str,
+        required=True,
+        help="Territory polygons: .geojson, .wkt ([name<TAB>]WKT per line), .csv or .json",
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        default=str(Path("data") / "ca_businesses_standardized.json"),
+        help="Standardized business JSON/NDJSON/Parquet/Arrow file (default: data/ca_businesses_standardized.json)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=str(Path("data") / "ca_businesses_standardized_by_territory.json"),
+        help="Output JSON path (default: data/ca_businesses_standardized_by_territory.json)",
+    )
+    parser.add_argument("--name-field", type=str, help="Polygon property holding the territory name")
+    parser.add_argument(
+        "--top-n",
+        type=int,
+        default=5,
+        help="Number of top sectors/subsectors per territory (default: 5)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="python",
+        help="Aggregation engine (default: python)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=str(DEFAULT_CACHE_DIR),
+        help="Directory of cached assignments (default: data/cache/territory_assignments)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always recompute the assignment")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+    polygon_path, input_path, output_path = Path(args.territories), Path(args.input), Path(args.output)
+    for path in (polygon_path, input_path):
+        if not path.exists():
+            logger.error("File not found: %s", path)
+            raise SystemExit(1)
+
+    try:
+        records: List[Dict[str, Any]] = load_records(input_path)
+    except (OSError, ValueError) as exc:
+        logger.error("Failed to read %s: %s", input_path, exc)
+        raise SystemExit(1)
+
+    try:
+        result = aggregate_custom_territories(
+            records,
+            polygon_path,
+            top_n=args.top_n,
+            engine=args.engine,
+            cache_dir=None if args.no_cache else Path(args.cache_dir),
+            name_field=args.name_field,
+        )
+    except ImportError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+    except (OSError, ValueError) as exc:
+        logger.error("Failed to assign territories from %s: %s", polygon_path, exc)
+        raise SystemExit(1)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    logger.info("Writing territory metrics to %s", output_path)
+    with output_path.open("w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+
+    summary = result["summary"]
+    logger.info(
+        "Aggregation complete: %d territories, %d records, %d in several territories",
+        summary["territory_count"],
+        summary["record_count"],
+        summary["multi_territory_records"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,507 @@
+"""
+In-memory CSR graph for fixed-hop queries over the relationship files.
+
+Purpose
+-------
+Questions such as "which zip codes hold these businesses", "which block
+groups overlap this community" or "which cities are within two
+adjacencies of Poway" are short traversals over ``relationships.json``
+that otherwise need a running Neo4j and a round trip per query. This
+module loads the same edges in-process:
+
+- every endpoint ``(entity type, id)`` is interned to an integer node,
+  sorted by type and then id, so each type owns one contiguous range of
+  node numbers and a type filter is a range check;
+- every predicate gets one CSR adjacency (``indptr``/``indices`` NumPy
+  arrays) per direction, with neighbors sorted, so one hop for any
+  number of nodes is a handful of array operations.
+
+Queries take arrays of nodes and are batched over all of them at once:
+``expand`` (typed one-hop neighbors), ``traverse`` (a fixed sequence of
+typed hops, like a Cypher pattern) and ``k_hop`` (everything within
+``k`` hops, with its distance). Results are distinct ``(origin, node)``
+pairs, as ``RETURN DISTINCT`` would give; parallel edges collapse.
+
+Input
+-----
+``data/relationships.json`` (JSON array of records), or any file
+``neo4j_relationship_loader.read_relationships`` reads
+(``data/relationship.json``, NDJSON), with ``entity1``, ``entitytype1``,
+``predicate``, ``entity2`` and ``entitytype2``. Entity types are
+canonicalized as in the bulk exporter (``"blockgroup"`` ->
+``"BlockGroup"``) and ids compared as text, so ``92101`` and ``"92101"``
+are the same zip code.
+
+Usage
+-----
+    from scripts.graph_engine import load_graph
+
+    graph = load_graph("data/relationships.json")
+    communities = graph.lookup("Community", ["MIRA MESA", "POWAY"])
+    origin, blockgroups = graph.expand(communities, "overlaps_with", node_type="BlockGroup")
+    graph.keys_of(blockgroups)
+
+    cities = graph.nodes_of("City")
+    origin, node, hops = graph.k_hop(cities, 2, "adjacent_to", direction="both")
+
+From the project root, the neighborhood of one entity:
+
+    python -m scripts.graph_engine Community "MIRA MESA" --hops 2 --type BlockGroup
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from scripts.columnar_cache import PYARROW_AVAILABLE, cached_table
+from scripts.neo4j_bulk_export import canonical_label, join_key
+from scripts.neo4j_relationship_loader import EDGE_FIELDS, read_relationships
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+if PYARROW_AVAILABLE:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INPUT = Path("data") / "relationships.json"
+
+DIRECTIONS = ("out", "in", "both")
+
+# One hop of ``traverse``: (predicate(s) or None for all, direction, node type or None)
+Step = Tuple[Union[str, Sequence[str], None], str, Optional[str]]
+
+
+def _require_numpy() -> None:
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy is required for the in-memory graph")
+
+
+def _empty() -> "np.ndarray":
+    return np.zeros(0, dtype=np.int64)
+
+
+# A column as (code per row, distinct values); -1 codes a missing value
+Coded = Tuple["np.ndarray", List[Any]]
+
+
+def factorize(values: Sequence[Any]) -> Coded:
+    """Codes and distinct values of a Python column, in first-seen order."""
+    distinct: Dict[Any, int] = {}
+    codes = np.fromiter(
+        (-1 if value is None else distinct.setdefault(value, len(distinct)) for value in values),
+        np.int64,
+        len(values),
+    )
+    return codes, list(distinct)
+
+
+def arrow_codes(table: "pa.Table", name: str) -> Coded:
+    """
+    Codes and distinct values of an Arrow column, read off its dictionary
+    (dictionary-encoding it first if the cache did not).
+    """
+    column = table.column(name)
+    if not pa.types.is_dictionary(column.type):
+        column = pc.dictionary_encode(column)
+    column = column.unify_dictionaries().combine_chunks()
+    codes = pc.fill_null(column.indices, -1).to_numpy().astype(np.int64)
+    values = column.dictionary.to_pylist()
+    metadata = table.schema.field(name).metadata or {}
+    if metadata.get(b"encoding") == b"json":
+        values = [json.loads(value) for value in values]
+    return codes, values
+
+
+def _unique(codes: "np.ndarray") -> "np.ndarray":
+    """Sorted distinct values; a sort beats ``np.unique``'s hashing on these int64 pair codes."""
+    codes = np.sort(codes)
+    keep = np.ones(len(codes), dtype=bool)
+    np.not_equal(codes[1:], codes[:-1], out=keep[1:])
+    return codes[keep]
+
+
+def _member(codes: "np.ndarray", sorted_codes: "np.ndarray") -> "np.ndarray":
+    """Whether each code is in the sorted array."""
+    if not len(sorted_codes):
+        return np.zeros(len(codes), dtype=bool)
+    position = np.minimum(np.searchsorted(sorted_codes, codes), len(sorted_codes) - 1)
+    return sorted_codes[position] == codes
+
+
+def _text(value: Any) -> str:
+    return value if type(value) is str else join_key(value)
+
+
+def _entities(types: Coded, keys: Coded, valid: "np.ndarray") -> Tuple[List[Tuple[str, str]], "np.ndarray"]:
+    """Distinct ``(label, id)`` endpoints of the valid rows, and each row's index into them."""
+    type_codes, type_values = types
+    key_codes, key_values = keys
+    width = max(len(key_values), 1)
+    pairs, index = np.unique(type_codes[valid] * width + key_codes[valid], return_inverse=True)
+    labels = [canonical_label(str(value)) for value in type_values]
+    entities = [
+        (labels[type_code], _text(key_values[key_code]))
+        for type_code, key_code in zip(*(part.tolist() for part in np.divmod(pairs, width)))
+    ]
+    return entities, index.reshape(-1)
+
+
+class CSR:
+    """Adjacency of one predicate in one direction: node ``i``'s neighbors are ``indices[indptr[i]:indptr[i + 1]]``."""
+
+    __slots__ = ("indptr", "indices")
+
+    def __init__(self, indptr: "np.ndarray", indices: "np.ndarray"):
+        self.indptr = indptr
+        self.indices = indices
+
+    @classmethod
+    def from_edges(cls, sources: "np.ndarray", targets: "np.ndarray", node_count: int) -> "CSR":
+        """CSR of distinct ``sources[i] -> targets[i]`` edges, neighbors sorted."""
+        codes = _unique(sources * node_count + targets)
+        sources, targets = np.divmod(codes, node_count)
+        indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=node_count), out=indptr[1:])
+        return cls(indptr, targets)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def degree(self, nodes: "np.ndarray") -> "np.ndarray":
+        return self.indptr[nodes + 1] - self.indptr[nodes]
+
+    def gather(self, origins: "np.ndarray", nodes: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """Every ``(origin, neighbor)`` pair of the ``nodes`` (one origin per node)."""
+        starts = self.indptr[nodes]
+        counts = self.indptr[nodes + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            return _empty(), _empty()
+        # Offset of each output slot into ``indices``: its row start plus
+        # its position within the row.
+        row_offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        return np.repeat(origins, counts), self.indices[row_offsets + np.arange(total)]
+
+
+class HopGraph:
+    """
+    Interned nodes plus one ``CSR`` per (predicate, direction).
+
+    Nodes are numbered by (type, id), so ``type_ranges[t]`` is the
+    ``[start, stop)`` range of type ``t``. Query methods take node arrays
+    (``lookup`` gives -1 for unknown entities; those are ignored) and
+    return NumPy arrays; ``origin`` values are positions in the array of
+    sources passed in.
+    """
+
+    def __init__(self, node_types: List[str], node_keys: List[str], adjacency: Dict[str, Dict[str, CSR]]):
+        self.node_types = node_types
+        self.node_keys = node_keys
+        self.adjacency = adjacency
+        self.types: List[str] = sorted(set(node_types))
+        self.type_ranges: Dict[str, Tuple[int, int]] = {}
+        start = 0
+        for name in self.types:
+            stop = start + node_types.count(name)
+            self.type_ranges[name] = (start, stop)
+            start = stop
+        self._node_ids = {key: node for node, key in enumerate(zip(node_types, node_keys))}
+
+    @classmethod
+    def from_codes(
+        cls, entity1: Coded, entitytype1: Coded, predicate: Coded, entity2: Coded, entitytype2: Coded
+    ) -> "HopGraph":
+        """
+        Graph of the edges ``entity1 -[predicate]-> entity2`` from
+        factorized columns; rows missing a field are skipped. Only
+        distinct values go through Python.
+        """
+        _require_numpy()
+        columns = (entity1, entitytype1, predicate, entity2, entitytype2)
+        valid = np.logical_and.reduce([codes >= 0 for codes, _ in columns])
+        starts, start_index = _entities(entitytype1, entity1, valid)
+        ends, end_index = _entities(entitytype2, entity2, valid)
+        entities = sorted(set(starts).union(ends))
+        node_ids = {entity: node for node, entity in enumerate(entities)}
+        sources = np.asarray([node_ids[entity] for entity in starts], dtype=np.int64)[start_index]
+        targets = np.asarray([node_ids[entity] for entity in ends], dtype=np.int64)[end_index]
+
+        predicate_codes, predicate_values = predicate
+        predicate_codes = predicate_codes[valid]
+        names = [str(value) for value in predicate_values]
+        adjacency = {}
+        for name in sorted(set(names)):
+            mask = np.isin(predicate_codes, [code for code, other in enumerate(names) if other == name])
+            if not mask.any():
+                continue
+            adjacency[name] = {
+                "out": CSR.from_edges(sources[mask], targets[mask], len(entities)),
+                "in": CSR.from_edges(targets[mask], sources[mask], len(entities)),
+            }
+        return cls([entity[0] for entity in entities], [entity[1] for entity in entities], adjacency)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "HopGraph":
+        records = list(records)
+        return cls.from_codes(*(factorize([rec.get(field) for rec in records]) for field in EDGE_FIELDS))
+
+    @classmethod
+    def from_arrow(cls, table: "pa.Table") -> "HopGraph":
+        """Graph of an Arrow table with the ``EDGE_FIELDS`` columns (``columnar_cache.cached_table``)."""
+        return cls.from_codes(*(arrow_codes(table, field) for field in EDGE_FIELDS))
+
+    # -- nodes --------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.node_keys)
+
+    @property
+    def predicates(self) -> List[str]:
+        return list(self.adjacency)
+
+    def edge_count(self, predicate: Optional[str] = None) -> int:
+        names = self._predicate_names(predicate)
+        return sum(len(self.adjacency[name]["out"]) for name in names)
+
+    def lookup(self, node_type: str, keys: Iterable[Any]) -> "np.ndarray":
+        """Node of each ``(node_type, key)``; -1 where the graph has no such entity."""
+        label = canonical_label(node_type)
+        nodes = [self._node_ids.get((label, join_key(key)), -1) for key in keys]
+        return np.asarray(nodes, dtype=np.int64)
+
+    def nodes_of(self, node_type: str) -> "np.ndarray":
+        """Every node of ``node_type``, in id order."""
+        start, stop = self.type_ranges.get(canonical_label(node_type), (0, 0))
+        return np.arange(start, stop, dtype=np.int64)
+
+    def keys_of(self, nodes: Iterable[int]) -> List[str]:
+        return [self.node_keys[node] for node in np.asarray(nodes, dtype=np.int64).tolist()]
+
+    def entities(self, nodes: Iterable[int]) -> List[Tuple[str, str]]:
+        """``(type, id)`` of each node."""
+        return [(self.node_types[node], self.node_keys[node]) for node in np.asarray(nodes, dtype=np.int64).tolist()]
+
+    def degree(self, nodes: Iterable[int], predicate: Union[str, Sequence[str], None] = None, direction: str = "out") -> "np.ndarray":
+        """Edge count of each node over ``predicate`` (all predicates for None) in ``direction``."""
+        nodes = np.asarray(nodes, dtype=np.int64)
+        total = np.zeros(len(nodes), dtype=np.int64)
+        for csr in self._adjacencies(predicate, direction):
+            total += csr.degree(nodes)
+        return total
+
+    # -- traversal ----------------------------------------------------------
+
+    def _predicate_names(self, predicate: Union[str, Sequence[str], None]) -> List[str]:
+        if predicate is None:
+            return list(self.adjacency)
+        names = [predicate] if isinstance(predicate, str) else list(predicate)
+        unknown = [name for name in names if name not in self.adjacency]
+        if unknown:
+            raise KeyError(f"Unknown predicate(s) {unknown}; the graph has {sorted(self.adjacency)}")
+        return names
+
+    def _adjacencies(self, predicate: Union[str, Sequence[str], None], direction: str) -> List[CSR]:
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown direction {direction!r}; choose from {list(DIRECTIONS)}")
+        sides = ("out", "in") if direction == "both" else (direction,)
+        return [self.adjacency[name][side] for name in self._predicate_names(predicate) for side in sides]
+
+    def _type_mask(self, nodes: "np.ndarray", node_type: Optional[str]) -> Optional["np.ndarray"]:
+        if node_type is None:
+            return None
+        start, stop = self.type_ranges.get(canonical_label(node_type), (0, 0))
+        return (nodes >= start) & (nodes < stop)
+
+    def _pairs(
+        self,
+        origins: "np.ndarray",
+        nodes: "np.ndarray",
+        predicate: Union[str, Sequence[str], None],
+        direction: str,
+        node_type: Optional[str],
+    ) -> "np.ndarray":
+        """One hop as ``origin * len(self) + neighbor`` codes, duplicates included."""
+        parts = [csr.gather(origins, nodes) for csr in self._adjacencies(predicate, direction)]
+        parts = [part for part in parts if len(part[0])]
+        if not parts:
+            return _empty()
+        origins = np.concatenate([part[0] for part in parts])
+        nodes = np.concatenate([part[1] for part in parts])
+        mask = self._type_mask(nodes, node_type)
+        if mask is not None:
+            origins, nodes = origins[mask], nodes[mask]
+        return origins * len(self) + nodes
+
+    def _step(
+        self,
+        origins: "np.ndarray",
+        nodes: "np.ndarray",
+        predicate: Union[str, Sequence[str], None],
+        direction: str,
+        node_type: Optional[str],
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        codes = _unique(self._pairs(origins, nodes, predicate, direction, node_type))
+        return np.divmod(codes, len(self))
+
+    def _sources(self, sources: Iterable[int]) -> Tuple["np.ndarray", "np.ndarray"]:
+        sources = np.asarray(sources, dtype=np.int64).reshape(-1)
+        valid = np.flatnonzero((sources >= 0) & (sources < len(self)))
+        return valid, sources[valid]
+
+    def expand(
+        self,
+        sources: Iterable[int],
+        predicate: Union[str, Sequence[str], None] = None,
+        direction: str = "out",
+        node_type: Optional[str] = None,
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        One hop from every source: distinct ``(origin, neighbor)`` arrays,
+        sorted by origin and then neighbor, over ``predicate`` (a name, a
+        list of names, or None for all) in ``direction`` (``"out"``,
+        ``"in"`` or ``"both"``), keeping neighbors of ``node_type`` only
+        when given.
+        """
+        origins, nodes = self._sources(sources)
+        return self._step(origins, nodes, predicate, direction, node_type)
+
+    def neighbors(
+        self,
+        node: int,
+        predicate: Union[str, Sequence[str], None] = None,
+        direction: str = "out",
+        node_type: Optional[str] = None,
+    ) -> "np.ndarray":
+        """Distinct neighbors of one node, sorted; see ``expand``."""
+        return self.expand([node], predicate, direction, node_type)[1]
+
+    def traverse(self, sources: Iterable[int], steps: Sequence[Step]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Distinct ``(origin, end)`` pairs reached from the sources by one
+        hop per ``(predicate, direction, node_type)`` step, in order - the
+        pattern ``(s)-[:p1]->(:T1)-[:p2]->(e:T2)``. Hops are walks: with
+        direction ``"both"`` a step may go back over the edge it came by.
+        """
+        origins, nodes = self._sources(sources)
+        for predicate, direction, node_type in steps:
+            origins, nodes = self._step(origins, nodes, predicate, direction, node_type)
+            if not len(nodes):
+                break
+        return origins, nodes
+
+    def k_hop(
+        self,
+        sources: Iterable[int],
+        k: int,
+        predicate: Union[str, Sequence[str], None] = None,
+        direction: str = "both",
+        node_type: Optional[str] = None,
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """
+        ``(origin, node, hops)`` arrays of every node within ``k`` hops of
+        each source over ``predicate`` in ``direction``, with its hop
+        distance; sorted by origin, hops and node. Paths run through
+        nodes of any type, ``node_type`` filters the results only. The
+        sources themselves are not reported.
+        """
+        if k < 0:
+            raise ValueError(f"k must be >= 0, got {k}")
+        origins, nodes = self._sources(sources)
+        seen = np.sort(origins * len(self) + nodes)
+        found: List[Tuple["np.ndarray", "np.ndarray", "np.ndarray"]] = []
+        for hops in range(1, k + 1):
+            codes = self._pairs(origins, nodes, predicate, direction, None)
+            # Sorted queries keep the membership search cache-friendly
+            codes = _unique(codes)
+            codes = codes[~_member(codes, seen)]
+            if not len(codes):
+                break
+            seen = np.sort(np.concatenate([seen, codes]))
+            origins, nodes = np.divmod(codes, len(self))
+            found.append((origins, nodes, np.full(len(nodes), hops, dtype=np.int64)))
+        if not found:
+            return _empty(), _empty(), _empty()
+        origins, nodes, hops = (np.concatenate(column) for column in zip(*found))
+        mask = self._type_mask(nodes, node_type)
+        if mask is not None:
+            origins, nodes, hops = origins[mask], nodes[mask], hops[mask]
+        order = np.lexsort((nodes, hops, origins))
+        return origins[order], nodes[order], hops[order]
+
+
+def load_graph(path: Union[str, Path] = DEFAULT_INPUT) -> HopGraph:
+    """
+    Graph of a relationship file. JSON files are read as their
+    memory-mapped ``columnar_cache`` table when pyarrow is installed.
+    """
+    path = Path(path)
+    if PYARROW_AVAILABLE and path.suffix.lower() not in (".ndjson", ".jsonl"):
+        return HopGraph.from_arrow(cached_table(path, EDGE_FIELDS))
+    return HopGraph.from_records(read_relationships(path))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Neighborhood of one entity in the in-memory relationship graph.")
+    parser.add_argument("entity_type", help="Entity type, e.g. Community or blockgroup")
+    parser.add_argument("key", help="Entity id (name, zip code, business id, ...)")
+    parser.add_argument(
+        "--input",
+        type=str,
+        default=str(DEFAULT_INPUT),
+        help="Relationship file (default: data/relationships.json)",
+    )
+    parser.add_argument("--hops", type=int, default=1, help="Maximum hop distance (default: 1)")
+    parser.add_argument("--predicate", type=str, action="append", help="Predicate to follow; repeatable (default: all)")
+    parser.add_argument("--direction", choices=DIRECTIONS, default="both", help="Edge direction (default: both)")
+    parser.add_argument("--type", type=str, dest="node_type", help="Only report nodes of this type")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+    try:
+        start = time.perf_counter()
+        graph = load_graph(args.input)
+    except ImportError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+    except (OSError, ValueError, KeyError) as exc:
+        logger.error("Failed to read %s: %s", args.input, exc)
+        raise SystemExit(1)
+    logger.info(
+        "Loaded %d nodes and %d edges over %d predicates in %.1f ms",
+        len(graph), graph.edge_count(), len(graph.predicates), (time.perf_counter() - start) * 1000,
+    )
+
+    source = graph.lookup(args.entity_type, [args.key])
+    if source[0] < 0:
+        logger.error("No %s %r in %s", canonical_label(args.entity_type), args.key, args.input)
+        raise SystemExit(1)
+    try:
+        _, nodes, hops = graph.k_hop(source, args.hops, args.predicate, args.direction, args.node_type)
+    except KeyError as exc:
+        logger.error("%s", exc.args[0])
+        raise SystemExit(1)
+    rows = [
+        {"type": node_type, "id": key, "hops": hop}
+        for (node_type, key), hop in zip(graph.entities(nodes), hops.tolist())
+    ]
+    print(json.dumps(rows, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Square and hexagonal grid cells for territory aggregation.
+
+Purpose
+-------
+Franchise territories do not follow ZIP or city lines. This module maps
+longitude/latitude to the ID of a regular grid cell with plain NumPy
+arithmetic (no per-point geometry objects), so
+``aggregate_territory_metrics.py`` can group by cells as it groups by
+administrative fields:
+
+    python -m scripts.aggregate_territory_metrics \
+        --group-by hex_500m hex_2km hex_8km square_1km
+
+Several resolutions are computed from one projection of the same
+coordinate arrays, and all levels are aggregated in the same pass, so the
+planner can zoom between them without rereading the input.
+
+Grid levels
+-----------
+``square_<size>`` and ``hex_<size>`` with ``<size>`` in ``m`` or ``km``
+(``square_250m``, ``hex_1.5km``). Squares have sides of ``<size>``;
+hexagons are pointy-top with edges (circumradius) of ``<size>``.
+
+Cells are laid out on a Lambert cylindrical equal-area projection with
+standard parallel ``STANDARD_PARALLEL`` (San Diego), so every cell of a
+level covers the same ground area anywhere in the state and shapes are
+true near the standard parallel. Cell IDs are ``"<i>:<j>"`` (column and
+row for squares, axial ``q`` and ``r`` for hexagons); ``cell_center``
+and ``cell_boundary`` turn them back into coordinates for mapping.
+
+Records whose ``has_valid_coordinates`` is false (the standardizer's
+verdict) get no cell, whatever their longitude/latitude.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from scripts.spatial_assignment import coordinates
+
+
+EARTH_RADIUS_M = 6_371_008.8
+STANDARD_PARALLEL = 33.0
+
+GRID_KINDS = ("square", "hex")
+
+# Smallest cell size in meters; keeps cell indices within 32 bits so a
+# cell packs into one int64 key
+MIN_CELL_SIZE = 1.0
+
+# Standardized records set this false when their coordinates are unusable
+VALIDITY_FIELD = "has_valid_coordinates"
+
+_GRID_FIELD_RE = re.compile(r"^(square|hex)_(\d+(?:\.\d+)?)(m|km)$")
+_SQRT3 = math.sqrt(3.0)
+_COS_PARALLEL = math.cos(math.radians(STANDARD_PARALLEL))
+
+
+class GridSpec:
+    """A grid level: ``kind`` ("square" or "hex") and cell ``size`` in meters."""
+
+    __slots__ = ("name", "kind", "size")
+
+    def __init__(self, name: str, kind: str, size: float):
+        if kind not in GRID_KINDS:
+            raise ValueError(f"Unknown grid kind {kind!r}; choose from {list(GRID_KINDS)}")
+        if not size >= MIN_CELL_SIZE:
+            raise ValueError(f"Grid cell size must be at least {MIN_CELL_SIZE:g} m, got {size!r}")
+        self.name = name
+        self.kind = kind
+        self.size = float(size)
+
+    def __repr__(self) -> str:
+        return f"GridSpec({self.name!r})"
+
+
+def parse_grid_field(field: str) -> Optional[GridSpec]:
+    """``"hex_500m"`` -> ``GridSpec``; None if ``field`` is not a grid level."""
+    match = _GRID_FIELD_RE.match(field)
+    if not match:
+        return None
+    kind, number, unit = match.groups()
+    return GridSpec(field, kind, float(number) * (1000.0 if unit == "km" else 1.0))
+
+
+def project(lon: "np.ndarray", lat: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Longitude/latitude degrees -> equal-area x/y meters."""
+    x = EARTH_RADIUS_M * _COS_PARALLEL * np.radians(lon)
+    y = EARTH_RADIUS_M * np.sin(np.radians(lat)) / _COS_PARALLEL
+    return x, y
+
+
+def unproject(x: "np.ndarray", y: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Inverse of ``project``."""
+    lon = np.degrees(np.asarray(x) / (EARTH_RADIUS_M * _COS_PARALLEL))
+    lat = np.degrees(np.arcsin(np.clip(np.asarray(y) * _COS_PARALLEL / EARTH_RADIUS_M, -1.0, 1.0)))
+    return lon, lat
+
+
+def cell_indices(spec: GridSpec, x: "np.ndarray", y: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Integer cell coordinates of projected points (finite inputs only)."""
+    if spec.kind == "square":
+        return np.floor(x / spec.size).astype(np.int64), np.floor(y / spec.size).astype(np.int64)
+
+    # Pointy-top hexagons in axial coordinates, rounded via cube coordinates
+    q = (_SQRT3 / 3.0 * x - y / 3.0) / spec.size
+    r = (2.0 / 3.0 * y) / spec.size
+    s = -q - r
+    rq, rr, rs = np.rint(q), np.rint(r), np.rint(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+    return rq.astype(np.int64), rr.astype(np.int64)
+
+
+def valid_coordinates(lon: "np.ndarray", lat: "np.ndarray") -> "np.ndarray":
+    """Mask of finite, in-range longitude/latitude pairs."""
+    with np.errstate(invalid="ignore"):
+        return np.isfinite(lon) & np.isfinite(lat) & (np.abs(lon) <= 180.0) & (np.abs(lat) <= 90.0)
+
+
+def cell_ids(
+    specs: Sequence[GridSpec], lon: "np.ndarray", lat: "np.ndarray"
+) -> Dict[str, List[Optional[str]]]:
+    """
+    ``{spec.name: [cell id or None per point]}`` for every level in
+    ``specs``; None where the coordinates are missing or out of range.
+
+    The points are projected once for all levels, and each level formats
+    only its distinct cells.
+    """
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+    valid = valid_coordinates(lon, lat)
+    x, y = project(lon[valid], lat[valid])
+    result: Dict[str, List[Optional[str]]] = {}
+    for spec in specs:
+        i, j = cell_indices(spec, x, y)
+        keys, inverse = np.unique((i << 32) | (j & 0xFFFFFFFF), return_inverse=True)
+        names = np.array(
+            [f"{a}:{b}" for a, b in zip((keys >> 32).tolist(), (keys & 0xFFFFFFFF).astype(np.int32).tolist())],
+            dtype=object,
+        )
+        ids = np.full(len(lon), None, dtype=object)
+        ids[valid] = names[inverse]
+        result[spec.name] = ids.tolist()
+    return result
+
+
+def flagged_invalid(flags: Sequence[Any]) -> "np.ndarray":
+    """Mask of ``VALIDITY_FIELD`` values marking coordinates unusable (false, but not missing)."""
+    return np.fromiter((flag is not None and not flag for flag in flags), dtype=bool, count=len(flags))
+
+
+def assign_cells(records: Sequence[Dict[str, Any]], specs: Sequence[GridSpec]) -> Sequence[Dict[str, Any]]:
+    """
+    Set ``record[spec.name]`` to the record's cell id at each level (None
+    without valid coordinates or with a false ``VALIDITY_FIELD``). Records
+    are updated in place and returned.
+    """
+    if not records or not specs:
+        return records
+    lon, lat = coordinates(records)
+    lon[flagged_invalid([rec.get(VALIDITY_FIELD) for rec in records])] = np.nan
+    for name, ids in cell_ids(specs, lon, lat).items():
+        for rec, cell in zip(records, ids):
+            rec[name] = cell
+    return records
+
+
+def _parse_cell_id(cell_id: str) -> Tuple[int, int]:
+    i, _, j = cell_id.partition(":")
+    return int(i), int(j)
+
+
+def _center_xy(spec: GridSpec, i: int, j: int) -> Tuple[float, float]:
+    if spec.kind == "square":
+        return (i + 0.5) * spec.size, (j + 0.5) * spec.size
+    return spec.size * (_SQRT3 * i + _SQRT3 / 2.0 * j), spec.size * 1.5 * j
+
+
+def cell_center(spec: GridSpec, cell_id: str) -> Tuple[float, float]:
+    """(lon, lat) of the center of a cell."""
+    x, y = _center_xy(spec, *_parse_cell_id(cell_id))
+    lon, lat = unproject(np.array([x]), np.array([y]))
+    return float(lon[0]), float(lat[0])
+
+
+def cell_boundary(spec: GridSpec, cell_id: str) -> List[Tuple[float, float]]:
+    """Closed ring of (lon, lat) vertices of a cell, counter-clockwise."""
+    i, j = _parse_cell_id(cell_id)
+    cx, cy = _center_xy(spec, i, j)
+    if spec.kind == "square":
+        half = spec.size / 2.0
+        offsets = [(-half, -half), (half, -half), (half, half), (-half, half)]
+    else:
+        offsets = [
+            (spec.size * math.cos(math.radians(60 * k - 30)), spec.size * math.sin(math.radians(60 * k - 30)))
+            for k in range(6)
+        ]
+    xs = np.array([cx + dx for dx, _ in offsets] + [cx + offsets[0][0]])
+    ys = np.array([cy + dy for _, dy in offsets] + [cy + offsets[0][1]])
+    lon, lat = unproject(xs, ys)
+    return list(zip(lon.tolist(), lat.tolist()))
@@ -0,0 +1,596 @@
+"""
+Offline neo4j-admin bulk-import export of the knowledge graph.
+
+Purpose
+-------
+A full rebuild through transactional Cypher (even batched, see
+``neo4j_relationship_loader.py``) is far slower than
+``neo4j-admin database import``, which builds the store files directly
+from CSV. This module turns the node files in ``data/`` and a
+relationship file into header-typed, gzip-compressed CSVs for it, without
+a database, and can verify the result offline.
+
+Nodes
+-----
+One ID space per label (``:ID(City)``). A node's import ID is its ``id``
+column when the file has one, else its lookup key (``ZoneType`` by
+``zone_name``), so IDs are stable across exports. Property types are
+inferred per column (``long``, ``double``, ``boolean``, ``string``, and
+``string[]``/``long[]``/... for lists). Rows repeating an ID are dropped
+and reported. Labels that only appear as relationship endpoints
+(``BlockGroup``, ``BusinessLocation``) get one node per distinct
+endpoint key, holding just that key, unless ``--no-synthesize``.
+
+Relationships
+-------------
+One group per (start label, type, end label), with
+``:START_ID(<start>)``/``:END_ID(<end>)``. Endpoint keys follow the
+loader (``KeyResolver``; ``Zipcode`` by ``zipcode``) and are resolved
+with one hash join per (label, key property); a key matching several
+nodes yields one relationship per match, as a Cypher ``MATCH`` would.
+Endpoints missing from a node file are dangling: their relationships
+are dropped and counted per group and side, with samples, in the
+report. Label spellings are unified (``blockgroup``/``BlockGroup``).
+
+Output
+------
+In ``--output`` (default ``data/neo4j_import``):
+
+    nodes/<Label>.header.csv, nodes/<Label>.part-NNN.csv.gz
+    relationships/<Start>.<type>.<End>.header.csv, ...part-NNN.csv.gz
+    import.args   neo4j-admin arguments, one per line
+    manifest.json counts, files, dangling endpoints, duplicates
+
+Parts of ``--rows-per-file`` rows are compressed by ``--workers``
+processes; gzip timestamps are zeroed so identical input gives
+byte-identical output.
+
+Usage
+-----
+From the project root:
+
+    python -m scripts.neo4j_bulk_export --workers 4
+    python -m scripts.neo4j_bulk_export --verify data/neo4j_import
+    neo4j-admin database import full neo4j @data/neo4j_import/import.args
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import csv
+import gzip
+import io
+import json
+import logging
+import math
+import re
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from scripts.columnar_cache import read_records
+from scripts.neo4j_relationship_loader import EDGE_FIELDS, EdgeType, KeyResolver, _key_arg, read_relationships
+
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path("data")
+DEFAULT_OUTPUT = DATA_DIR / "neo4j_import"
+DEFAULT_RELATIONSHIPS = DATA_DIR / "relationship.json"
+
+# Node file per label
+NODE_FILES = {
+    "State": "state.json",
+    "County": "county.json",
+    "City": "city.json",
+    "Community": "community.json",
+    "Zipcode": "zipcode.json",
+    "Business": "business.json",
+    "ZoneType": "zone_type.json",
+}
+
+# Labels known only from relationship endpoints
+ENDPOINT_LABELS = ("BlockGroup", "BusinessLocation")
+
+# Endpoint keys where the node files differ from the loader's defaults
+EXPORT_KEYS = {"Zipcode": "zipcode", "ZoneType": "zone_name", "BusinessLocation": "id"}
+
+ID_FIELD = "id"
+ARRAY_DELIMITER = ";"
+DEFAULT_ROWS_PER_FILE = 500_000
+DANGLING_SAMPLES = 5
+
+_LABEL_KEYS = {label.lower(): label for label in (*NODE_FILES, *ENDPOINT_LABELS)}
+_UNSAFE_FILE_CHARS = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+def canonical_label(name: str) -> str:
+    """``"blockgroup"``, ``"block_group"`` -> ``"BlockGroup"``; unknown names are CamelCased."""
+    known = _LABEL_KEYS.get(name.replace("_", "").lower())
+    return known or "".join(word.capitalize() for word in name.split("_"))
+
+
+# ---------------------------------------------------------------------------
+# Header typing
+# ---------------------------------------------------------------------------
+
+def _scalar_type(values: Sequence[Any]) -> str:
+    kinds = {type(v) for v in values}
+    if kinds == {bool}:
+        return "boolean"
+    if kinds and kinds <= {int}:
+        return "long"
+    if kinds and kinds <= {int, float}:
+        return "double"
+    return "string"
+
+
+def infer_type(values: Sequence[Any]) -> str:
+    """neo4j-admin type of a column from its non-null values."""
+    present = [v for v in values if v is not None and not (isinstance(v, float) and math.isnan(v))]
+    if present and all(isinstance(v, list) for v in present):
+        return _scalar_type([item for v in present for item in v if item is not None]) + "[]"
+    return _scalar_type(present)
+
+
+def _format_scalar(value: Any, kind: str) -> str:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    if kind == "boolean":
+        return "true" if value else "false"
+    if kind == "double":
+        return repr(float(value))
+    if kind == "string" and isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def format_value(value: Any, kind: str) -> str:
+    if kind.endswith("[]"):
+        if value is None:
+            return ""
+        return ARRAY_DELIMITER.join(_format_scalar(item, kind[:-2]) for item in value)
+    return _format_scalar(value, kind)
+
+
+# ---------------------------------------------------------------------------
+# Nodes and hash joins
+# ---------------------------------------------------------------------------
+
+class NodeTable:
+    """Nodes of one label: import IDs, typed properties and lookup indexes."""
+
+    def __init__(self, label: str, rows: List[Dict[str, Any]], id_field: str, synthesized: bool = False):
+        self.label = label
+        self.id_field = id_field
+        self.synthesized = synthesized
+        self.columns: List[str] = list(dict.fromkeys(column for row in rows for column in row))
+        self.ids: List[str] = []
+        self.rows: List[Dict[str, Any]] = []
+        self.duplicates = 0
+        seen = set()
+        for row in rows:
+            node_id = join_key(row.get(id_field))
+            if node_id is None or node_id in seen:
+                self.duplicates += 1
+                continue
+            seen.add(node_id)
+            self.ids.append(node_id)
+            self.rows.append(row)
+        self.types = {column: infer_type([row.get(column) for row in self.rows]) for column in self.columns}
+        self._indexes: Dict[str, Dict[str, List[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def index(self, prop: str) -> Dict[str, List[str]]:
+        """Hash index ``{key: [import ID, ...]}`` on ``prop`` (built once)."""
+        index = self._indexes.get(prop)
+        if index is None:
+            index = defaultdict(list)
+            if prop in self.columns:
+                for node_id, row in zip(self.ids, self.rows):
+                    key = join_key(row.get(prop))
+                    if key is not None:
+                        index[key].append(node_id)
+            self._indexes[prop] = index = dict(index)
+        return index
+
+    def header(self) -> List[str]:
+        return [f":ID({self.label})"] + [f"{column}:{self.types[column]}" for column in self.columns]
+
+    def csv_rows(self) -> Iterator[List[str]]:
+        types = [self.types[column] for column in self.columns]
+        for node_id, row in zip(self.ids, self.rows):
+            yield [node_id] + [format_value(row.get(column), kind) for column, kind in zip(self.columns, types)]
+
+
+def join_key(value: Any) -> Optional[str]:
+    """Relationship files hold strings, node files ints or strings: join on the text."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def node_table(label: str, rows: List[Dict[str, Any]], keys: KeyResolver) -> NodeTable:
+    """Nodes of ``label`` identified by their ``id`` column, else by their lookup key."""
+    columns = set().union(*(row.keys() for row in rows)) if rows else set()
+    return NodeTable(label, rows, ID_FIELD if ID_FIELD in columns else keys.target(label))
+
+
+def load_nodes(data_dir: Path, node_files: Dict[str, str], keys: KeyResolver) -> Dict[str, NodeTable]:
+    tables = {}
+    for label, filename in node_files.items():
+        path = data_dir / filename
+        if not path.exists():
+            logger.warning("Node file not found, skipping %s: %s", label, path)
+            continue
+        tables[label] = node_table(label, read_records(path), keys)
+        logger.info("%s: %d nodes from %s", label, len(tables[label]), path)
+    return tables
+
+
+def group_relationships(records: List[Dict[str, Any]]) -> Tuple[Dict[EdgeType, List[Tuple[str, str]]], int]:
+    """``{(start label, type, end label): [(start key, end key), ...]}`` and the skipped row count."""
+    groups: Dict[EdgeType, List[Tuple[str, str]]] = defaultdict(list)
+    skipped = 0
+    for rec in records:
+        if any(rec.get(field) is None for field in EDGE_FIELDS):
+            skipped += 1
+            continue
+        edge_type = (canonical_label(str(rec["entitytype1"])), str(rec["predicate"]), canonical_label(str(rec["entitytype2"])))
+        groups[edge_type].append((join_key(rec["entity1"]), join_key(rec["entity2"])))
+    return dict(groups), skipped
+
+
+def synthesize_nodes(
+    groups: Dict[EdgeType, List[Tuple[str, str]]], tables: Dict[str, NodeTable], keys: KeyResolver
+) -> None:
+    """Add a key-only node table for every endpoint label without a node file."""
+    values: Dict[Tuple[str, str], Dict[str, None]] = defaultdict(dict)
+    for (start, _, end), pairs in groups.items():
+        if start not in tables:
+            values[(start, keys.source(start))].update((source, None) for source, _ in pairs)
+        if end not in tables:
+            values[(end, keys.target(end))].update((target, None) for _, target in pairs)
+    by_label: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for (label, prop), keys_seen in values.items():
+        by_label[label].extend({prop: key} for key in keys_seen)
+    for label, rows in by_label.items():
+        # Import ID is the key value, whichever property it was looked up by
+        tables[label] = NodeTable(label, [{"_key": next(iter(row.values())), **row} for row in rows], "_key", True)
+        tables[label].columns.remove("_key")
+        logger.info("%s: %d nodes synthesized from relationship endpoints", label, len(tables[label]))
+
+
+def join_relationships(
+    edge_type: EdgeType, pairs: List[Tuple[str, str]], tables: Dict[str, NodeTable], keys: KeyResolver
+) -> Tuple[List[Tuple[str, str]], Dict[str, Any]]:
+    """Resolve (start key, end key) pairs to import ID pairs; returns them and a report."""
+    start, _, end = edge_type
+    start_index = tables[start].index(keys.source(start)) if start in tables else {}
+    end_index = tables[end].index(keys.target(end)) if end in tables else {}
+    resolved: List[Tuple[str, str]] = []
+    dangling: Dict[str, Counter] = {"start": Counter(), "end": Counter()}
+    ambiguous = 0
+    for source, target in pairs:
+        start_ids = start_index.get(source)
+        end_ids = end_index.get(target)
+        if not start_ids:
+            dangling["start"][source] += 1
+        if not end_ids:
+            dangling["end"][target] += 1
+        if not start_ids or not end_ids:
+            continue
+        if len(start_ids) > 1 or len(end_ids) > 1:
+            ambiguous += 1
+        resolved.extend((a, b) for a in start_ids for b in end_ids)
+    report = {
+        "rows": len(pairs),
+        "relationships": len(resolved),
+        "ambiguous_rows": ambiguous,
+        "dangling_rows": sum(
+            1 for source, target in pairs if not start_index.get(source) or not end_index.get(target)
+        ),
+        "dangling": {
+            side: {
+                "label": label,
+                "key": key,
+                "endpoints": len(counter),
+                "rows": sum(counter.values()),
+                "samples": [value for value, _ in counter.most_common(DANGLING_SAMPLES)],
+            }
+            for side, label, key, counter in (
+                ("start", start, keys.source(start), dangling["start"]),
+                ("end", end, keys.target(end), dangling["end"]),
+            )
+            if counter
+        },
+    }
+    return resolved, report
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+def _csv_bytes(rows: Sequence[Sequence[str]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def write_part(path: str, rows: List[List[str]]) -> Tuple[str, int]:
+    """Write one gzip CSV part (no header); returns (path, rows). Runs in worker processes."""
+    with open(path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+        f.write(_csv_bytes(rows))
+    return path, len(rows)
+
+
+def _file_stem(*parts: str) -> str:
+    return ".".join(_UNSAFE_FILE_CHARS.sub("_", part) for part in parts)
+
+
+def _chunks(rows: Iterator[List[str]], size: int) -> Iterator[List[List[str]]]:
+    chunk: List[List[str]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def export_graph(
+    output_dir: Path,
+    data_dir: Path = DATA_DIR,
+    relationship_paths: Sequence[Path] = (DEFAULT_RELATIONSHIPS,),
+    node_files: Optional[Dict[str, str]] = None,
+    keys: Optional[KeyResolver] = None,
+    synthesize: bool = True,
+    rows_per_file: int = DEFAULT_ROWS_PER_FILE,
+    workers: int = 1,
+) -> Dict[str, Any]:
+    """
+    Write the import files to ``output_dir`` and return the manifest
+    (also written as ``manifest.json``).
+    """
+    if rows_per_file < 1:
+        raise ValueError("Rows per file must be at least 1")
+    keys = keys or KeyResolver(EXPORT_KEYS)
+    tables = load_nodes(Path(data_dir), node_files or NODE_FILES, keys)
+
+    records: List[Dict[str, Any]] = []
+    for path in relationship_paths:
+        records.extend(read_relationships(Path(path)))
+    groups, skipped = group_relationships(records)
+    if synthesize:
+        synthesize_nodes(groups, tables, keys)
+
+    nodes_dir, rels_dir = output_dir / "nodes", output_dir / "relationships"
+    for directory in (nodes_dir, rels_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+        for stale in list(directory.glob("*.csv")) + list(directory.glob("*.csv.gz")):
+            stale.unlink()
+
+    # (kind, name, header path, header, rows) per import group
+    outputs: List[Tuple[str, str, Path, List[str], Iterator[List[str]]]] = []
+    manifest: Dict[str, Any] = {"nodes": {}, "relationships": {}, "skipped_relationship_rows": skipped}
+    for label, table in tables.items():
+        stem = nodes_dir / _file_stem(label)
+        outputs.append(("nodes", label, stem, table.header(), table.csv_rows()))
+        manifest["nodes"][label] = {
+            "count": len(table),
+            "id_field": None if table.synthesized else table.id_field,
+            "synthesized": table.synthesized,
+            "duplicate_ids_dropped": table.duplicates,
+        }
+    for edge_type, pairs in groups.items():
+        resolved, report = join_relationships(edge_type, pairs, tables, keys)
+        start, rel_type, end = edge_type
+        name = f"{start}-[{rel_type}]->{end}"
+        stem = rels_dir / _file_stem(start, rel_type, end)
+        header = [f":START_ID({start})", f":END_ID({end})"]
+        outputs.append(("relationships", name, stem, header, (list(pair) for pair in resolved)))
+        manifest["relationships"][name] = {"type": rel_type, "start": start, "end": end, **report}
+        if report["dangling_rows"]:
+            logger.warning(
+                "%s: %d of %d rows dangling (%s)",
+                name,
+                report["dangling_rows"],
+                report["rows"],
+                ", ".join(f"{side} {d['label']}.{d['key']}: {d['endpoints']} keys" for side, d in report["dangling"].items()),
+            )
+
+    # Headers are tiny and written here; the parts go to the pool
+    tasks: List[Tuple[str, str, str, List[List[str]]]] = []
+    for kind, name, stem, header, rows in outputs:
+        header_path = stem.with_name(stem.name + ".header.csv")
+        header_path.write_bytes(_csv_bytes([header]))
+        files = [header_path]
+        for number, chunk in enumerate(_chunks(rows, rows_per_file)):
+            part = stem.with_name(f"{stem.name}.part-{number:03d}.csv.gz")
+            files.append(part)
+            tasks.append((kind, name, str(part), chunk))
+        manifest[kind][name]["files"] = [str(path.relative_to(output_dir)) for path in files]
+
+    if workers > 1 and len(tasks) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            futures = [pool.submit(write_part, path, chunk) for _, _, path, chunk in tasks]
+            for future in futures:
+                future.result()
+    else:
+        for _, _, path, chunk in tasks:
+            write_part(path, chunk)
+
+    manifest["import_args"] = import_args(manifest, output_dir)
+    (output_dir / "import.args").write_text("\n".join(manifest["import_args"]) + "\n", encoding="utf-8")
+    with (output_dir / "manifest.json").open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+
+def import_args(manifest: Dict[str, Any], output_dir: Path) -> List[str]:
+    """``neo4j-admin database import full`` arguments for the exported files."""
+    def files(entry: Dict[str, Any]) -> str:
+        return ",".join(str((output_dir / path).resolve()) for path in entry["files"])
+
+    args = [f"--nodes={label}={files(entry)}" for label, entry in manifest["nodes"].items()]
+    args += [
+        f"--relationships={entry['type']}={files(entry)}"
+        for entry in manifest["relationships"].values()
+        if entry["relationships"]
+    ]
+    args += [f"--array-delimiter={ARRAY_DELIMITER}", "--multiline-fields=true", "--overwrite-destination=true"]
+    return args
+
+
+# ---------------------------------------------------------------------------
+# Offline verification
+# ---------------------------------------------------------------------------
+
+def _read_csv(path: Path) -> Iterator[List[str]]:
+    # City geometries exceed the csv module's default 128 KiB field limit
+    csv.field_size_limit(1 << 30)
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8", newline="") as f:
+        yield from csv.reader(f)
+
+
+def verify_export(output_dir: Path) -> List[str]:
+    """
+    Re-read an export and check it the way the importer would: headers
+    present, IDs unique per ID space, every relationship endpoint present,
+    row counts as in the manifest. Returns the problems found.
+    """
+    with (output_dir / "manifest.json").open("r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    problems: List[str] = []
+    id_spaces: Dict[str, set] = {}
+    for label, entry in manifest["nodes"].items():
+        header_path, *parts = [output_dir / path for path in entry["files"]]
+        header = next(_read_csv(header_path), [])
+        if not header or header[0] != f":ID({label})":
+            problems.append(f"{header_path}: expected :ID({label}) first, got {header[:1]}")
+        ids = id_spaces[label] = set()
+        rows = 0
+        for part in parts:
+            for row in _read_csv(part):
+                rows += 1
+                if len(row) != len(header):
+                    problems.append(f"{part}: row {rows} has {len(row)} fields, header {len(header)}")
+                if row[0] in ids:
+                    problems.append(f"{part}: duplicate ID {row[0]!r} in {label}")
+                ids.add(row[0])
+        if rows != entry["count"]:
+            problems.append(f"{label}: {rows} node rows, manifest says {entry['count']}")
+
+    for name, entry in manifest["relationships"].items():
+        header_path, *parts = [output_dir / path for path in entry["files"]]
+        header = next(_read_csv(header_path), [])
+        expected = [f":START_ID({entry['start']})", f":END_ID({entry['end']})"]
+        if header != expected:
+            problems.append(f"{header_path}: expected {expected}, got {header}")
+        start_ids, end_ids = id_spaces.get(entry["start"], set()), id_spaces.get(entry["end"], set())
+        rows = missing = 0
+        for part in parts:
+            for row in _read_csv(part):
+                rows += 1
+                missing += row[0] not in start_ids or row[1] not in end_ids
+        if missing:
+            problems.append(f"{name}: {missing} relationship(s) with an endpoint missing from the node files")
+        if rows != entry["relationships"]:
+            problems.append(f"{name}: {rows} relationship rows, manifest says {entry['relationships']}")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export the graph as neo4j-admin bulk-import CSVs.")
+    parser.add_argument("--data-dir", type=str, default=str(DATA_DIR), help="Node file directory (default: data)")
+    parser.add_argument(
+        "--relationships",
+        type=str,
+        nargs="+",
+        default=[str(DEFAULT_RELATIONSHIPS)],
+        help="Relationship file(s) (default: data/relationship.json)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=str(DEFAULT_OUTPUT),
+        help="Output directory (default: data/neo4j_import)",
+    )
+    parser.add_argument(
+        "--key",
+        type=_key_arg,
+        action="append",
+        metavar="LABEL=PROPERTY",
+        help="Endpoint lookup property for a label; repeatable",
+    )
+    parser.add_argument(
+        "--no-synthesize",
+        action="store_true",
+        help="Treat endpoints of labels without a node file as dangling",
+    )
+    parser.add_argument(
+        "--rows-per-file",
+        type=int,
+        default=DEFAULT_ROWS_PER_FILE,
+        help=f"Rows per compressed part (default: {DEFAULT_ROWS_PER_FILE})",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Processes compressing parts (default: 1)")
+    parser.add_argument("--verify", type=str, metavar="DIR", help="Only verify an existing export")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+    if args.verify:
+        problems = verify_export(Path(args.verify))
+        for problem in problems:
+            logger.error("%s", problem)
+        if problems:
+            raise SystemExit(1)
+        logger.info("Export in %s is consistent", args.verify)
+        return
+
+    for path in args.relationships:
+        if not Path(path).exists():
+            logger.error("Relationship file not found: %s", path)
+            raise SystemExit(1)
+    output_dir = Path(args.output)
+    try:
+        manifest = export_graph(
+            output_dir,
+            data_dir=Path(args.data_dir),
+            relationship_paths=[Path(path) for path in args.relationships],
+            keys=KeyResolver({**EXPORT_KEYS, **dict(args.key or [])}),
+            synthesize=not args.no_synthesize,
+            rows_per_file=args.rows_per_file,
+            workers=args.workers,
+        )
+    except (OSError, ValueError) as exc:
+        logger.error("Export failed: %s", exc)
+        raise SystemExit(1)
+
+    nodes = sum(entry["count"] for entry in manifest["nodes"].values())
+    relationships = manifest["relationships"].values()
+    logger.info(
+        "Exported %d nodes and %d of %d relationships (%d dangling rows) to %s",
+        nodes,
+        sum(entry["relationships"] for entry in relationships),
+        sum(entry["rows"] for entry in relationships),
+        sum(entry["dangling_rows"] for entry in relationships),
+        output_dir,
+    )
+    logger.info("Import with: neo4j-admin database import full <database> @%s", output_dir / "import.args")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,709 @@
+"""
+Incremental Neo4j graph sync from content-hash diffs.
+
+Purpose
+-------
+Re-running the notebook load deletes every node of a label
+(``DETACH DELETE``) and creates it again, so each refresh writes the
+whole graph twice and leaves it empty while it runs. This module pushes
+only what changed since the last sync:
+
+- every node (one per row of a node file, identified like the
+  ``neo4j_bulk_export`` import IDs) is hashed over its properties, and
+  every relationship is identified by its (start key, end key) tuple
+  within its (start label, type, end label) group;
+- a local manifest records the hashes and tuples last pushed;
+- the diff against the manifest becomes batched, idempotent writes:
+  ``MERGE ... SET n = row.properties`` for new or changed nodes, ``MERGE``
+  for new relationships, ``DELETE``/``DETACH DELETE`` for removed ones.
+
+Writes go in the order relationship deletes, node upserts, relationship
+merges, node deletes (so renaming a node's lookup key never strands its
+old relationships), each batch in its own transaction: the graph stays
+queryable throughout and a small refresh costs writes proportional to the
+change. Every committed batch is appended to ``<manifest>.journal``, and
+the manifest is rewritten with the journal folded in at the end (also
+when a batch fails), so a sync interrupted at any point, the process
+killed included, resumes where it stopped.
+
+Input
+-----
+Node files and relationship file(s) as for ``neo4j_bulk_export``
+(``data/*.json``); endpoint keys, label spellings and key-only nodes for
+endpoint-only labels also follow it. ``sync_graph`` takes node rows and
+relationship records directly, e.g. from the notebook DataFrames.
+
+Manifest
+--------
+``--manifest`` (default ``data/neo4j_sync_manifest.json``) is tied to the
+target URI/database it was written for; syncing another database with it
+is refused. Delete it and its ``.journal`` (and clear the graph) to start
+over.
+
+Usage
+-----
+From the project root, with NEO4J_URI/NEO4J_USER/NEO4J_PASSWORD set (see
+``scripts/config.py``):
+
+    python -m scripts.neo4j_graph_sync --dry-run
+    python -m scripts.neo4j_graph_sync --batch-size 5000 --unique
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from scripts.neo4j_bulk_export import (
+    DATA_DIR,
+    DEFAULT_RELATIONSHIPS,
+    EXPORT_KEYS,
+    NODE_FILES,
+    NodeTable,
+    group_relationships,
+    join_key,
+    load_nodes,
+    node_table,
+    synthesize_nodes,
+)
+from scripts.neo4j_relationship_loader import (
+    DEFAULT_BATCH_SIZE,
+    KeyResolver,
+    _key_arg,
+    connect,
+    create_indexes,
+    quote_name,
+    read_relationships,
+)
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST = DATA_DIR / "neo4j_sync_manifest.json"
+
+# Bump when the manifest layout or the hashing changes
+MANIFEST_VERSION = 1
+
+
+def _property_value(value: Any) -> Any:
+    """A node property as the driver and the hash see it (numpy/Decimal to Python)."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, "tolist") and not isinstance(value, (str, bytes)):
+        value = value.tolist()
+    if isinstance(value, list):
+        return [_property_value(item) for item in value]
+    return value
+
+
+def node_properties(table: NodeTable, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Properties stored on a node: the table's columns, without nulls (Neo4j has none)."""
+    props = {}
+    for column in table.columns:
+        value = _property_value(row.get(column))
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            continue
+        props[column] = value
+    return props
+
+
+def content_hash(props: Dict[str, Any]) -> str:
+    """Order-independent digest of a node's properties (``1`` and ``1.0`` differ)."""
+    text = json.dumps(props, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def merge_key(table: NodeTable) -> str:
+    """Property a node of ``table`` is MERGEd on."""
+    # Key-only nodes hold just the property they were looked up by
+    return table.columns[0] if table.synthesized else table.id_field
+
+
+def group_name(start: str, rel_type: str, end: str) -> str:
+    return f"{start}-[{rel_type}]->{end}"
+
+
+# ---------------------------------------------------------------------------
+# Snapshots and diffs
+# ---------------------------------------------------------------------------
+
+def snapshot(
+    tables: Dict[str, NodeTable], groups: Dict[Tuple[str, str, str], List[Tuple[str, str]]], keys: KeyResolver
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Dict[str, Any]]]]:
+    """
+    ``(state, properties)`` of a graph: ``state`` in manifest layout
+    (``{"nodes": {label: {"key", "entries": {node ID: [key value, hash]}}},
+    "relationships": {group: {"type", "start", "end", "start_key",
+    "end_key", "edges": {(start value, end value): None}}}}``, plus
+    ``dangling`` counts) and the properties per label and node ID.
+
+    Relationship endpoints take the typed key value of the node they join
+    to; rows whose endpoint is missing from a node table are dangling and
+    left out.
+    """
+    state: Dict[str, Any] = {"nodes": {}, "relationships": {}}
+    properties: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for label, table in tables.items():
+        key = merge_key(table)
+        entries, props_by_id = {}, {}
+        for node_id, row in zip(table.ids, table.rows):
+            props = node_properties(table, row)
+            if props.get(key) is None:
+                continue
+            entries[node_id] = [props[key], content_hash(props)]
+            props_by_id[node_id] = props
+        state["nodes"][label] = {"key": key, "entries": entries}
+        properties[label] = props_by_id
+
+    def typed_values(label: str, prop: str) -> Optional[Dict[str, Any]]:
+        table = tables.get(label)
+        if table is None:
+            return None
+        return {join_key(row.get(prop)): row.get(prop) for row in table.rows if row.get(prop) is not None}
+
+    for (start, rel_type, end), pairs in groups.items():
+        start_key, end_key = keys.source(start), keys.target(end)
+        start_values, end_values = typed_values(start, start_key), typed_values(end, end_key)
+        edges: Dict[Tuple[Any, Any], None] = {}
+        dangling = 0
+        for source, target in pairs:
+            a = source if start_values is None else _property_value(start_values.get(source))
+            b = target if end_values is None else _property_value(end_values.get(target))
+            if a is None or b is None:
+                dangling += 1
+                continue
+            edges[(a, b)] = None
+        state["relationships"][group_name(start, rel_type, end)] = {
+            "type": rel_type,
+            "start": start,
+            "end": end,
+            "start_key": start_key,
+            "end_key": end_key,
+            "edges": edges,
+            "dangling": dangling,
+        }
+    return state, properties
+
+
+def _edge_meta(group: Dict[str, Any]) -> Tuple[str, str, str, str, str]:
+    return group["start"], group["type"], group["end"], group["start_key"], group["end_key"]
+
+
+def plan_sync(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Writes turning the graph of ``old`` into that of ``new`` (both in
+    ``snapshot`` state layout):
+    ``{"relationship_deletes": [(group, [(a, b), ...])],
+    "node_upserts": [(label, [node ID, ...])],
+    "relationship_merges": [(group, [(a, b), ...])],
+    "node_deletes": [(label, [node ID, ...])], "counts": {...}}``.
+    """
+    plan: Dict[str, Any] = {
+        "relationship_deletes": [],
+        "node_upserts": [],
+        "relationship_merges": [],
+        "node_deletes": [],
+        "counts": {"nodes": {}, "relationships": {}},
+    }
+    for label, nodes in new["nodes"].items():
+        previous = old["nodes"].get(label, {"key": nodes["key"], "entries": {}})
+        if previous["key"] != nodes["key"]:
+            raise ValueError(
+                f"{label} nodes were synced by {previous['key']!r} and are now keyed by {nodes['key']!r}; "
+                "remove the manifest and clear the graph to resync"
+            )
+        before, after = previous["entries"], nodes["entries"]
+        inserted = [node_id for node_id in after if node_id not in before]
+        updated = [node_id for node_id, entry in after.items() if node_id in before and before[node_id][1] != entry[1]]
+        deleted = [node_id for node_id in before if node_id not in after]
+        if inserted or updated:
+            plan["node_upserts"].append((label, inserted + updated))
+        if deleted:
+            plan["node_deletes"].append((label, deleted))
+        plan["counts"]["nodes"][label] = {
+            "inserted": len(inserted),
+            "updated": len(updated),
+            "deleted": len(deleted),
+            "unchanged": len(after) - len(inserted) - len(updated),
+        }
+    for label, nodes in old["nodes"].items():
+        if label not in new["nodes"]:
+            plan["node_deletes"].append((label, list(nodes["entries"])))
+            plan["counts"]["nodes"][label] = {
+                "inserted": 0,
+                "updated": 0,
+                "deleted": len(nodes["entries"]),
+                "unchanged": 0,
+            }
+
+    for name in dict.fromkeys([*old["relationships"], *new["relationships"]]):
+        previous, group = old["relationships"].get(name), new["relationships"].get(name)
+        before = previous["edges"] if previous else {}
+        after = group["edges"] if group else {}
+        if previous and group and _edge_meta(previous) != _edge_meta(group):
+            # Looked up by other properties now: replace every edge
+            before_kept: Dict[Tuple[Any, Any], None] = {}
+        else:
+            before_kept = before
+        deleted = [edge for edge in before if edge not in before_kept or edge not in after]
+        inserted = [edge for edge in after if edge not in before_kept]
+        if deleted:
+            plan["relationship_deletes"].append((name, deleted))
+        if inserted:
+            plan["relationship_merges"].append((name, inserted))
+        plan["counts"]["relationships"][name] = {
+            "inserted": len(inserted),
+            "deleted": len(deleted),
+            "unchanged": len(after) - len(inserted),
+            "dangling": group["dangling"] if group else 0,
+        }
+    return plan
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+def empty_state() -> Dict[str, Any]:
+    return {"nodes": {}, "relationships": {}}
+
+
+def journal_path(manifest_path: Path) -> Path:
+    """File the batches committed since ``manifest_path`` was last saved are appended to."""
+    return manifest_path.with_name(manifest_path.name + ".journal")
+
+
+def apply_change(state: Dict[str, Any], change: Dict[str, Any]) -> None:
+    """
+    Record one committed batch (as passed to ``apply_sync``'s
+    ``checkpoint``) in the manifest ``state``. Replaying a change that
+    ``state`` already holds leaves it as it is.
+    """
+    step = change["step"]
+    if step == "relationship_deletes":
+        group = state["relationships"].get(change["name"])
+        if group is None:
+            return
+        for edge in change["edges"]:
+            group["edges"].pop(tuple(edge), None)
+        if not group["edges"]:
+            del state["relationships"][change["name"]]
+    elif step == "node_upserts":
+        nodes = state["nodes"].setdefault(change["label"], {"key": change["key"], "entries": {}})
+        nodes["entries"].update(change["entries"])
+    elif step == "relationship_merges":
+        group = state["relationships"].setdefault(change["name"], {"edges": {}})
+        # Old edges under other lookup keys were deleted before
+        group.update(change["meta"])
+        group["edges"].update((tuple(edge), None) for edge in change["edges"])
+    elif step == "node_deletes":
+        nodes = state["nodes"].get(change["label"])
+        if nodes is None:
+            return
+        for node_id in change["ids"]:
+            nodes["entries"].pop(node_id, None)
+        if not nodes["entries"]:
+            del state["nodes"][change["label"]]
+    else:
+        raise ValueError(f"Unknown sync step {step!r}")
+
+
+def _replay_journal(path: Path, state: Dict[str, Any]) -> int:
+    """Apply the changes journaled at ``path`` to ``state``; returns how many."""
+    with path.open("r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    replayed = 0
+    for number, line in enumerate(lines, 1):
+        try:
+            change = json.loads(line)
+        except ValueError:
+            if number == len(lines):
+                # Cut short by an interrupted write; that batch is re-sent
+                logger.warning("Ignoring incomplete last line of %s", path)
+                break
+            raise ValueError(f"{path}: line {number} is not valid JSON") from None
+        apply_change(state, change)
+        replayed += 1
+    return replayed
+
+
+def load_manifest(path: Path, target: Optional[str] = None) -> Dict[str, Any]:
+    """
+    State last pushed to ``target``: the manifest at ``path`` (empty when
+    missing) plus any batches journaled after it was saved.
+    """
+    state = empty_state()
+    if path.exists():
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"{path} is manifest version {data.get('version')}, expected {MANIFEST_VERSION}")
+        if target is not None and data.get("target") not in (None, target):
+            raise ValueError(f"{path} was written for {data['target']}, not {target}; use another --manifest")
+        state = {"nodes": data["nodes"], "relationships": {}}
+        for name, group in data["relationships"].items():
+            state["relationships"][name] = {
+                **{field: group[field] for field in ("type", "start", "end", "start_key", "end_key")},
+                "edges": {tuple(edge): None for edge in group["edges"]},
+                "dangling": group.get("dangling", 0),
+            }
+    journal = journal_path(path)
+    if journal.exists():
+        logger.info("Resuming from %d batches journaled in %s", _replay_journal(journal, state), journal)
+    return state
+
+
+def save_manifest(path: Path, state: Dict[str, Any], target: Optional[str] = None) -> None:
+    """Write ``state`` to ``path`` atomically, then drop the journal it supersedes."""
+    data = {
+        "version": MANIFEST_VERSION,
+        "target": target,
+        "nodes": state["nodes"],
+        "relationships": {
+            name: {**group, "edges": [list(edge) for edge in group["edges"]]}
+            for name, group in state["relationships"].items()
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    journal_path(path).unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+def node_upsert_query(label: str, key: str) -> str:
+    return (
+        "UNWIND $rows AS row\n"
+        f"MERGE (n:{quote_name(label)} {{{quote_name(key)}: row.key}})\n"
+        "SET n = row.properties\n"
+        "RETURN count(*) AS written"
+    )
+
+
+def node_delete_query(label: str, key: str) -> str:
+    return (
+        "UNWIND $rows AS row\n"
+        f"MATCH (n:{quote_name(label)} {{{quote_name(key)}: row.key}})\n"
+        "DETACH DELETE n\n"
+        "RETURN count(*) AS written"
+    )
+
+
+def relationship_delete_query(start: str, rel_type: str, end: str, start_key: str, end_key: str) -> str:
+    return (
+        "UNWIND $rows AS row\n"
+        f"MATCH (a:{quote_name(start)} {{{quote_name(start_key)}: row.source}})"
+        f"-[r:{quote_name(rel_type)}]->"
+        f"(b:{quote_name(end)} {{{quote_name(end_key)}: row.target}})\n"
+        "DELETE r\n"
+        "RETURN count(*) AS written"
+    )
+
+
+def relationship_merge_query(start: str, rel_type: str, end: str, start_key: str, end_key: str) -> str:
+    """As the loader's ``relationship_query`` in merge mode, with explicit lookup keys."""
+    return (
+        "UNWIND $rows AS row\n"
+        f"MATCH (a:{quote_name(start)} {{{quote_name(start_key)}: row.source}})\n"
+        f"MATCH (b:{quote_name(end)} {{{quote_name(end_key)}: row.target}})\n"
+        f"MERGE (a)-[:{quote_name(rel_type)}]->(b)\n"
+        "RETURN count(*) AS created"
+    )
+
+
+def _write_batch(tx: Any, query: str, rows: List[Dict[str, Any]]) -> int:
+    record = tx.run(query, rows=rows).single()
+    return int(next(iter(record.values()))) if record is not None else 0
+
+
+def _batches(items: Sequence[Any], batch_size: int):
+    for offset in range(0, len(items), batch_size):
+        yield items[offset : offset + batch_size]
+
+
+def apply_sync(
+    driver: Any,
+    plan: Dict[str, Any],
+    new: Dict[str, Any],
+    properties: Dict[str, Dict[str, Dict[str, Any]]],
+    pushed: Dict[str, Any],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    database: Optional[str] = None,
+    unique: bool = False,
+    checkpoint: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, int]:
+    """
+    Run ``plan`` (see ``plan_sync``) through ``driver``. After every
+    committed batch its change is applied to ``pushed`` (the manifest
+    state, see ``apply_change``) and passed to ``checkpoint``. Returns
+    ``{"batches", "rows"}`` sent.
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
+    sent = {"batches": 0, "rows": 0}
+
+    def write(session: Any, query: str, rows: List[Dict[str, Any]], change: Dict[str, Any]) -> None:
+        session.execute_write(_write_batch, query, rows)
+        sent["batches"] += 1
+        sent["rows"] += len(rows)
+        apply_change(pushed, change)
+        if checkpoint is not None:
+            checkpoint(change)
+
+    with driver.session(database=database) as session:
+        lookups: Dict[Tuple[str, str], None] = {}
+        for label, nodes in new["nodes"].items():
+            lookups[(label, nodes["key"])] = None
+        for group in new["relationships"].values():
+            lookups[(group["start"], group["start_key"])] = None
+            lookups[(group["end"], group["end_key"])] = None
+        create_indexes(session, list(lookups), unique)
+
+        for name, edges in plan["relationship_deletes"]:
+            query = relationship_delete_query(*_edge_meta(pushed["relationships"][name]))
+            for batch in _batches(edges, batch_size):
+                change = {"step": "relationship_deletes", "name": name, "edges": batch}
+                write(session, query, [{"source": a, "target": b} for a, b in batch], change)
+
+        for label, node_ids in plan["node_upserts"]:
+            nodes = new["nodes"][label]
+            query = node_upsert_query(label, nodes["key"])
+            for batch in _batches(node_ids, batch_size):
+                rows = [{"key": nodes["entries"][node_id][0], "properties": properties[label][node_id]} for node_id in batch]
+                entries = {node_id: nodes["entries"][node_id] for node_id in batch}
+                write(session, query, rows, {"step": "node_upserts", "label": label, "key": nodes["key"], "entries": entries})
+
+        for name, edges in plan["relationship_merges"]:
+            group = new["relationships"][name]
+            query = relationship_merge_query(*_edge_meta(group))
+            meta = {field: value for field, value in group.items() if field != "edges"}
+            for batch in _batches(edges, batch_size):
+                change = {"step": "relationship_merges", "name": name, "meta": meta, "edges": batch}
+                write(session, query, [{"source": a, "target": b} for a, b in batch], change)
+
+        for label, node_ids in plan["node_deletes"]:
+            nodes = pushed["nodes"][label]
+            query = node_delete_query(label, nodes["key"])
+            for batch in _batches(node_ids, batch_size):
+                rows = [{"key": nodes["entries"][node_id][0]} for node_id in batch]
+                write(session, query, rows, {"step": "node_deletes", "label": label, "ids": batch})
+    return sent
+
+
+def node_tables(node_rows: Dict[str, List[Dict[str, Any]]], keys: KeyResolver) -> Dict[str, NodeTable]:
+    """Node tables from rows per label (e.g. ``df.to_dict(orient="records")``)."""
+    return {label: node_table(label, rows, keys) for label, rows in node_rows.items()}
+
+
+def sync_graph(
+    driver: Any,
+    tables: Dict[str, NodeTable],
+    relationship_records: Sequence[Dict[str, Any]],
+    manifest_path: Path = DEFAULT_MANIFEST,
+    keys: Optional[KeyResolver] = None,
+    synthesize: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    database: Optional[str] = None,
+    target: Optional[str] = None,
+    unique: bool = False,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    Bring the graph behind ``driver`` in line with ``tables`` and
+    ``relationship_records``, writing only the difference from the
+    manifest at ``manifest_path``.
+
+    Returns the report: per-label and per-group ``counts`` (inserted,
+    updated, deleted, unchanged, dangling), ``batches`` and ``rows`` sent,
+    ``plan_seconds`` (hashing and diffing) and ``seconds`` (writing).
+    ``dry_run`` plans without writing (``driver`` may be None).
+    """
+    keys = keys or KeyResolver(EXPORT_KEYS)
+    start = time.perf_counter()
+    groups, skipped = group_relationships(list(relationship_records))
+    if synthesize:
+        synthesize_nodes(groups, tables, keys)
+    new, properties = snapshot(tables, groups, keys)
+    pushed = load_manifest(Path(manifest_path), target)
+    plan = plan_sync(pushed, new)
+    report: Dict[str, Any] = {
+        "counts": plan["counts"],
+        "skipped_relationship_rows": skipped,
+        "plan_seconds": time.perf_counter() - start,
+    }
+
+    start = time.perf_counter()
+    if dry_run:
+        steps = ("relationship_deletes", "node_upserts", "relationship_merges", "node_deletes")
+        sizes = [len(items) for step in steps for _, items in plan[step]]
+        report.update(batches=sum(-(-size // batch_size) for size in sizes), rows=sum(sizes))
+    else:
+        journal = journal_path(Path(manifest_path))
+        journal.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with journal.open("a", encoding="utf-8") as f:
+
+                def checkpoint(change: Dict[str, Any]) -> None:
+                    f.write(json.dumps(change, ensure_ascii=False, separators=(",", ":")) + "\n")
+                    f.flush()
+
+                report.update(
+                    apply_sync(driver, plan, new, properties, pushed, batch_size, database, unique, checkpoint)
+                )
+        finally:
+            save_manifest(Path(manifest_path), pushed, target)
+    report["seconds"] = time.perf_counter() - start
+    return report
+
+
+def _totals(counts: Dict[str, Dict[str, int]]) -> Dict[str, int]:
+    totals: Dict[str, int] = {}
+    for entry in counts.values():
+        for field, value in entry.items():
+            totals[field] = totals.get(field, 0) + value
+    return totals
+
+
+def main() -> None:
+    from scripts.config import get_config
+
+    config = get_config()
+    parser = argparse.ArgumentParser(description="Sync node and relationship changes into Neo4j incrementally.")
+    parser.add_argument("--data-dir", type=str, default=str(DATA_DIR), help="Node file directory (default: data)")
+    parser.add_argument(
+        "--relationships",
+        type=str,
+        nargs="+",
+        default=[str(DEFAULT_RELATIONSHIPS)],
+        help="Relationship file(s) (default: data/relationship.json)",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        default=str(DEFAULT_MANIFEST),
+        help="State last pushed (default: data/neo4j_sync_manifest.json)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Rows per write transaction (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--key",
+        type=_key_arg,
+        action="append",
+        metavar="LABEL=PROPERTY",
+        help="Endpoint lookup property for a label; repeatable",
+    )
+    parser.add_argument(
+        "--unique",
+        action="store_true",
+        help="Create uniqueness constraints instead of plain indexes on key properties",
+    )
+    parser.add_argument(
+        "--no-synthesize",
+        action="store_true",
+        help="Do not create key-only nodes for labels without a node file",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Report the changes without connecting")
+    parser.add_argument("--uri", type=str, default=config.neo4j_uri, help="Neo4j URI (default: NEO4J_URI)")
+    parser.add_argument("--user", type=str, default=config.neo4j_user, help="Neo4j user (default: NEO4J_USER)")
+    parser.add_argument(
+        "--database",
+        type=str,
+        default=config.neo4j_database,
+        help="Neo4j database (default: NEO4J_DATABASE)",
+    )
+    parser.add_argument("--report", type=str, help="Also write the sync report as JSON here")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+    keys = KeyResolver({**EXPORT_KEYS, **dict(args.key or [])})
+    try:
+        tables = load_nodes(Path(args.data_dir), NODE_FILES, keys)
+        records: List[Dict[str, Any]] = []
+        for path in args.relationships:
+            records.extend(read_relationships(Path(path)))
+    except (OSError, ValueError) as exc:
+        logger.error("Failed to read the graph data: %s", exc)
+        raise SystemExit(1)
+
+    driver = None
+    if not args.dry_run:
+        try:
+            driver = connect(args.uri, args.user, config.neo4j_password)
+        except ImportError as exc:
+            logger.error("%s", exc)
+            raise SystemExit(1)
+        except Exception as exc:  # driver errors (auth, unreachable service) have no common base here
+            logger.error("Failed to connect to %s: %s", args.uri, exc)
+            raise SystemExit(1)
+
+    try:
+        report = sync_graph(
+            driver,
+            tables,
+            records,
+            manifest_path=Path(args.manifest),
+            keys=keys,
+            synthesize=not args.no_synthesize,
+            batch_size=args.batch_size,
+            database=args.database,
+            target=f"{args.uri}/{args.database or ''}",
+            unique=args.unique,
+            dry_run=args.dry_run,
+        )
+    except ValueError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+    finally:
+        if driver is not None:
+            driver.close()
+
+    nodes, relationships = _totals(report["counts"]["nodes"]), _totals(report["counts"]["relationships"])
+    logger.info(
+        "Nodes: %d inserted, %d updated, %d deleted, %d unchanged",
+        nodes.get("inserted", 0),
+        nodes.get("updated", 0),
+        nodes.get("deleted", 0),
+        nodes.get("unchanged", 0),
+    )
+    logger.info(
+        "Relationships: %d inserted, %d deleted, %d unchanged, %d dangling",
+        relationships.get("inserted", 0),
+        relationships.get("deleted", 0),
+        relationships.get("unchanged", 0),
+        relationships.get("dangling", 0),
+    )
+    logger.info("%s %d rows in %d batch(es), %.2fs", "Would write" if args.dry_run else "Wrote",
+                report["rows"], report["batches"], report["seconds"])
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+"""
+Batched Neo4j relationship loader.
+
+Purpose
+-------
+The graph load in ``notebooks/spencer.ipynb`` opens a session and runs
+one ``MATCH ... CREATE`` per row of ``data/relationship.json``, with no
+index on the properties it matches nodes by, so every edge costs a round
+trip and two label scans. This module loads the same edges:
+
+1. grouped by (entitytype1, predicate, entitytype2), so each group is one
+   parameterized query with fixed labels and relationship type;
+2. after creating an index (or, with ``--unique``, a uniqueness
+   constraint) on every (label, key property) pair used to look up
+   endpoints, and waiting for them to come online;
+3. as ``UNWIND $rows`` batches of ``--batch-size`` edges, each in its own
+   managed write transaction, all through one session of one pooled
+   driver;
+
+and reports edges/sec per relationship type.
+
+Input
+-----
+``data/relationship.json`` (pandas column-oriented export), or a JSON
+array / NDJSON file of records, with ``entity1``, ``entitytype1``,
+``predicate``, ``entity2`` and ``entitytype2``.
+
+Endpoints are matched as in the notebook: ``BlockGroup`` targets by
+``ctblockgroup``, ``Business`` sources by ``id``, everything else by
+``name`` (see ``SOURCE_KEYS``/``TARGET_KEYS``; ``--key LABEL=PROPERTY``
+overrides both). Edges whose endpoints are not in the graph are counted
+as unmatched and reported.
+
+The loader only needs a driver object with ``session(database=...)``
+whose sessions offer ``run`` and ``execute_write``, so it can run against
+a local Neo4j container or the in-process
+``scripts.benchmarks.stub_neo4j`` driver.
+
+Usage
+-----
+From the project root, with NEO4J_URI/NEO4J_USER/NEO4J_PASSWORD set (see
+``scripts/config.py``):
+
+    python -m scripts.neo4j_relationship_loader --batch-size 5000
+    python -m scripts.neo4j_relationship_loader --mode merge --unique
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from scripts.columnar_cache import read_records
+
+try:
+    from neo4j import GraphDatabase
+    NEO4J_AVAILABLE = True
+except ImportError:
+    NEO4J_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INPUT = Path("data") / "relationship.json"
+
+EDGE_FIELDS = ("entity1", "entitytype1", "predicate", "entity2", "entitytype2")
+
+# Endpoint lookup property by label, as in the notebook load
+SOURCE_KEYS = {"Business": "id"}
+TARGET_KEYS = {"BlockGroup": "ctblockgroup"}
+DEFAULT_KEY = "name"
+
+# "create" adds every edge (like the notebook); "merge" skips edges that
+# already exist, so reruns are idempotent
+MODES = ("create", "merge")
+
+DEFAULT_BATCH_SIZE = 5_000
+
+# Relationship group: (source label, relationship type, target label)
+EdgeType = Tuple[str, str, str]
+
+
+def _require_neo4j() -> None:
+    if not NEO4J_AVAILABLE:
+        raise ImportError("neo4j is required to connect to Neo4j (pip install neo4j)")
+
+
+def quote_name(name: str) -> str:
+    """A label, relationship type or property name as a Cypher identifier."""
+    return "`" + str(name).replace("`", "``") + "`"
+
+
+def read_relationships(path: Path) -> List[Dict[str, Any]]:
+    """
+    Edge records from a pandas column-oriented JSON export or a JSON array
+    (both through ``columnar_cache``), or from NDJSON.
+    """
+    if path.suffix.lower() in (".ndjson", ".jsonl"):
+        with path.open("r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    return read_records(path, EDGE_FIELDS)
+
+
+def group_edges(records: Iterable[Dict[str, Any]]) -> Tuple[Dict[EdgeType, List[Dict[str, Any]]], int]:
+    """
+    ``({(entitytype1, predicate, entitytype2): [{"source", "target"}, ...]}, skipped)``
+    in first-seen group order; rows missing a field are skipped.
+    """
+    groups: Dict[EdgeType, List[Dict[str, Any]]] = defaultdict(list)
+    skipped = 0
+    for rec in records:
+        if any(rec.get(field) is None for field in EDGE_FIELDS):
+            skipped += 1
+            continue
+        edge_type = (str(rec["entitytype1"]), str(rec["predicate"]), str(rec["entitytype2"]))
+        groups[edge_type].append({"source": rec["entity1"], "target": rec["entity2"]})
+    return dict(groups), skipped
+
+
+class KeyResolver:
+    """Lookup property of a label at the source or target end of an edge."""
+
+    def __init__(self, overrides: Optional[Dict[str, str]] = None):
+        self.overrides = dict(overrides or {})
+
+    def source(self, label: str) -> str:
+        return self.overrides.get(label) or SOURCE_KEYS.get(label, DEFAULT_KEY)
+
+    def target(self, label: str) -> str:
+        return self.overrides.get(label) or TARGET_KEYS.get(label, DEFAULT_KEY)
+
+    def lookups(self, edge_types: Iterable[EdgeType]) -> List[Tuple[str, str]]:
+        """Distinct (label, property) pairs the edges are matched on."""
+        pairs: Dict[Tuple[str, str], None] = {}
+        for source, _, target in edge_types:
+            pairs[(source, self.source(source))] = None
+            pairs[(target, self.target(target))] = None
+        return list(pairs)
+
+
+def index_statement(label: str, prop: str, unique: bool = False) -> str:
+    node = f"(n:{quote_name(label)})"
+    if unique:
+        return f"CREATE CONSTRAINT IF NOT EXISTS FOR {node} REQUIRE n.{quote_name(prop)} IS UNIQUE"
+    return f"CREATE INDEX IF NOT EXISTS FOR {node} ON (n.{quote_name(prop)})"
+
+
+def relationship_query(edge_type: EdgeType, keys: KeyResolver, mode: str = "create") -> str:
+    """``UNWIND $rows`` query creating one batch of edges of ``edge_type``."""
+    if mode not in MODES:
+        raise ValueError(f"Unknown load mode {mode!r}; choose from {list(MODES)}")
+    source, predicate, target = edge_type
+    verb = "MERGE" if mode == "merge" else "CREATE"
+    return (
+        "UNWIND $rows AS row\n"
+        f"MATCH (a:{quote_name(source)} {{{quote_name(keys.source(source))}: row.source}})\n"
+        f"MATCH (b:{quote_name(target)} {{{quote_name(keys.target(target))}: row.target}})\n"
+        f"{verb} (a)-[:{quote_name(predicate)}]->(b)\n"
+        "RETURN count(*) AS created"
+    )
+
+
+def _write_batch(tx: Any, query: str, rows: List[Dict[str, Any]]) -> int:
+    record = tx.run(query, rows=rows).single()
+    return int(record["created"]) if record is not None else 0
+
+
+def create_indexes(session: Any, lookups: Sequence[Tuple[str, str]], unique: bool = False) -> None:
+    """Create the endpoint lookup indexes/constraints and wait until they are online."""
+    for label, prop in lookups:
+        session.run(index_statement(label, prop, unique)).consume()
+    session.run("CALL db.awaitIndexes(300)").consume()
+
+
+def load_relationships(
+    driver: Any,
+    groups: Dict[EdgeType, List[Dict[str, Any]]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    database: Optional[str] = None,
+    mode: str = "create",
+    keys: Optional[KeyResolver] = None,
+    unique: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Load grouped edges (see ``group_edges``) through ``driver``.
+
+    Returns one report per relationship type, in load order:
+    ``{"edge_type", "edges", "created", "unmatched", "batches", "seconds",
+    "edges_per_sec"}``. ``created`` counts edges whose endpoints were both
+    found (for ``mode="merge"``, found or already present).
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
+    keys = keys or KeyResolver()
+    reports = []
+    with driver.session(database=database) as session:
+        start = time.perf_counter()
+        create_indexes(session, keys.lookups(groups), unique)
+        logger.info("Lookup indexes ready in %.2fs", time.perf_counter() - start)
+
+        for edge_type, rows in groups.items():
+            query = relationship_query(edge_type, keys, mode)
+            created = batches = 0
+            start = time.perf_counter()
+            for offset in range(0, len(rows), batch_size):
+                created += session.execute_write(_write_batch, query, rows[offset : offset + batch_size])
+                batches += 1
+            seconds = time.perf_counter() - start
+            report = {
+                "edge_type": "{}-[{}]->{}".format(*edge_type),
+                "edges": len(rows),
+                "created": created,
+                "unmatched": max(len(rows) - created, 0),
+                "batches": batches,
+                "seconds": seconds,
+                "edges_per_sec": len(rows) / seconds if seconds else float("inf"),
+            }
+            logger.info(
+                "%s: %d edges (%d unmatched) in %d batch(es), %.2fs, %.0f edges/sec",
+                report["edge_type"],
+                report["edges"],
+                report["unmatched"],
+                batches,
+                seconds,
+                report["edges_per_sec"],
+            )
+            reports.append(report)
+    return reports
+
+
+def connect(uri: str, user: str, password: str, pool_size: int = 10) -> Any:
+    """A pooled driver for ``uri``; connectivity is checked up front."""
+    _require_neo4j()
+    driver = GraphDatabase.driver(uri, auth=(user, password), max_connection_pool_size=pool_size)
+    driver.verify_connectivity()
+    return driver
+
+
+def _key_arg(text: str) -> Tuple[str, str]:
+    label, separator, prop = text.partition("=")
+    if not separator or not label.strip() or not prop.strip():
+        raise argparse.ArgumentTypeError(f"Expected LABEL=PROPERTY, got {text!r}")
+    return label.strip(), prop.strip()
+
+
+def main() -> None:
+    from scripts.config import get_config
+
+    config = get_config()
+    parser = argparse.ArgumentParser(description="Load relationships into Neo4j in grouped UNWIND batches.")
+    parser.add_argument(
+        "--input",
+        type=str,
+        default=str(DEFAULT_INPUT),
+        help="Relationship JSON/NDJSON file (default: data/relationship.json)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Edges per UNWIND transaction (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument("--mode", choices=MODES, default="create", help="CREATE or MERGE edges (default: create)")
+    parser.add_argument(
+        "--unique",
+        action="store_true",
+        help="Create uniqueness constraints instead of plain indexes on lookup properties",
+    )
+    parser.add_argument(
+        "--key",
+        type=_key_arg,
+        action="append",
+        metavar="LABEL=PROPERTY",
+        help="Lookup property for a label at either end; repeatable",
+    )
+    parser.add_argument("--uri", type=str, default=config.neo4j_uri, help="Neo4j URI (default: NEO4J_URI)")
+    parser.add_argument("--user", type=str, default=config.neo4j_user, help="Neo4j user (default: NEO4J_USER)")
+    parser.add_argument(
+        "--database",
+        type=str,
+        default=config.neo4j_database,
+        help="Neo4j database (default: NEO4J_DATABASE)",
+    )
+    parser.add_argument("--report", type=str, help="Also write the per-type report as JSON here")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        logger.error("Input file not found: %s", input_path)
+        raise SystemExit(1)
+    try:
+        groups, skipped = group_edges(read_relationships(input_path))
+    except (OSError, ValueError) as exc:
+        logger.error("Failed to read %s: %s", input_path, exc)
+        raise SystemExit(1)
+    if skipped:
+        logger.warning("Skipped %d relationship row(s) with missing fields", skipped)
+    total = sum(len(rows) for rows in groups.values())
+    logger.info("Loading %d relationships of %d types from %s", total, len(groups), input_path)
+
+    try:
+        driver = connect(args.uri, args.user, config.neo4j_password)
+    except ImportError as exc:
+        logger.error("%s", exc)
+        raise SystemExit(1)
+    except Exception as exc:  # driver errors (auth, unreachable service) have no common base here
+        logger.error("Failed to connect to %s: %s", args.uri, exc)
+        raise SystemExit(1)
+
+    start = time.perf_counter()
+    try:
+        reports = load_relationships(
+            driver,
+            groups,
+            batch_size=args.batch_size,
+            database=args.database,
+            mode=args.mode,
+            keys=KeyResolver(dict(args.key or [])),
+            unique=args.unique,
+        )
+    finally:
+        driver.close()
+    seconds = time.perf_counter() - start
+
+    created = sum(report["created"] for report in reports)
+    logger.info(
+        "Loaded %d of %d relationships in %.2fs (%.0f edges/sec)",
+        created,
+        total,
+        seconds,
+        total / seconds if seconds else float("inf"),
+    )
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({"seconds": seconds, "relationship_types": reports}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,17 +17,31 @@ Input:
 Output:
     ca_businesses_standardized.json - Cleaned data with standardized categories
     category_mapping_report.json - Detailed mapping statistics and decisions
+    category_classification_cache.sqlite - Classifications reused across runs
+        (CLASSIFICATION_CACHE_PATH / CLASSIFICATION_CACHE_MAX_ENTRIES)
+    ca_businesses_standardized_manifest.sqlite - Per-record state for
+        --incremental runs
 
 Author: Business Opportunity Graph Team
 Date: 2025-11-18
 """
 
+import argparse
+import asyncio
+import concurrent.futures
+import gc
+import hashlib
+import heapq
 import json
+import multiprocessing
 import os
+import random
+import sqlite3
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Set, Tuple, Optional
-from collections import defaultdict, Counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Set, Tuple, Optional, Union
+from collections import defaultdict, deque, Counter
 import re
 import logging
 
@@ -40,6 +54,33 @@ except ImportError:
     print("WARNING: openai package not installed. LLM classification will be skipped.")
     print("Install with: pip install openai")
 
+# openai>=1.0 ships an asyncio client; older releases fall back to the
+# sequential ChatCompletion path.
+ASYNC_OPENAI_AVAILABLE = OPENAI_AVAILABLE and hasattr(openai, "AsyncOpenAI")
+
+# Optional: NumPy/pyarrow for the columnar validation backend (--columnar),
+# shapely for its bulk WKT parsing
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import shapely
+    SHAPELY_AVAILABLE = True
+except ImportError:
+    SHAPELY_AVAILABLE = False
+
 
 # Configure logging
 logging.basicConfig(
@@ -141,21 +182,746 @@ CANONICAL_TAXONOMY = {
 }
 
 
+# Precompiled normalisation patterns used by CategoryStandardizer
+_CATEGORY_SUFFIX_RE = re.compile(r'\s*(services?|store|shop|center|company|inc\.?|llc|corp\.?)\s*$')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Precompiled field-cleaning patterns used by DataQualityValidator
+_WKT_POINT_RE = re.compile(r"POINT\s*\(([-\d\.]+)\s+([-\d\.]+)\)")
+_NON_DIGIT_RE = re.compile(r"[^\d]")
+_ZIP_CODE_RE = re.compile(r"^\d{5}(-\d{4})?$")
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over the taxonomy keywords.
+
+    The automaton is compiled once into a deterministic transition table
+    (failure links are folded into the per-state dictionaries), so a single
+    left-to-right pass over a normalized category string reports every
+    keyword occurrence, including overlapping ones.
+    """
+
+    def __init__(self, keyword_map: Dict[str, Tuple[str, str]]):
+        """
+        Compile the automaton.
+
+        Args:
+            keyword_map: Mapping of lowercase keyword -> (sector, subsector).
+                Insertion order is used as the final tie-breaker.
+        """
+        self.keywords: List[str] = list(keyword_map.keys())
+        self.targets: List[Tuple[str, str]] = list(keyword_map.values())
+
+        # Trie construction: goto[state] maps a character to the next state,
+        # outputs[state] lists keyword ids ending at that state.
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(keyword_id)
+
+        # Breadth-first pass to compute failure links and complete the
+        # transition table so matching never has to follow a failure chain.
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            # Inherit the failure state's transitions, then override with
+            # this state's own trie edges.
+            transitions = dict(delta[fail[state]])
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                transitions[ch] = nxt
+                queue.append(nxt)
+            delta[state] = transitions
+            outputs[state] = outputs[state] + outputs[fail[state]]
+
+        self._delta = delta
+        self._outputs = [tuple(ids) for ids in outputs]
+
+    def find_all(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Return every keyword occurrence in ``text``.
+
+        Returns:
+            List of (keyword_id, start_offset) tuples in order of match end
+        """
+        delta = self._delta
+        outputs = self._outputs
+        keywords = self.keywords
+        state = 0
+        hits: List[Tuple[int, int]] = []
+
+        for end, ch in enumerate(text, 1):
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                for keyword_id in outputs[state]:
+                    hits.append((keyword_id, end - len(keywords[keyword_id])))
+
+        return hits
+
+    def best_match(self, text: str) -> Optional[Tuple[str, str, float]]:
+        """
+        Pick the best-scoring keyword hit for ``text``.
+
+        Hits are ranked by confidence (exact 1.0, prefix/suffix 0.9, partial
+        0.8), then longer keywords, then whole-word matches, then earlier
+        positions and finally taxonomy order, so the result is deterministic.
+
+        Returns:
+            Tuple of (sector, subsector, confidence) or None if no match
+        """
+        best_rank = None
+        best_id = -1
+        best_confidence = 0.0
+        length = len(text)
+
+        for keyword_id, start in self.find_all(text):
+            end = start + len(self.keywords[keyword_id])
+            if start == 0 and end == length:
+                confidence = 1.0  # Exact match
+            elif start == 0 or end == length:
+                confidence = 0.9  # Strong match
+            else:
+                confidence = 0.8  # Partial match
+
+            whole_word = (start == 0 or not text[start - 1].isalnum()) and (
+                end == length or not text[end].isalnum()
+            )
+            rank = (confidence, end - start, whole_word, -start, -keyword_id)
+            if best_rank is None or rank > best_rank:
+                best_rank = rank
+                best_id = keyword_id
+                best_confidence = confidence
+
+        if best_rank is None:
+            return None
+
+        sector, subsector = self.targets[best_id]
+        return (sector, subsector, best_confidence)
+
+
+def taxonomy_fingerprint(taxonomy: Dict[str, Dict[str, List[str]]]) -> str:
+    """
+    Stable hash of a taxonomy definition.
+
+    Any change to sectors, subsectors or keywords yields a new fingerprint,
+    which invalidates cached classifications made against the old taxonomy.
+    """
+    canonical = json.dumps(taxonomy, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ClassificationCache:
+    """
+    On-disk (SQLite) store of category classifications shared across runs.
+
+    Entries are keyed by normalized category and tagged with the taxonomy
+    fingerprint they were produced under; entries from any other taxonomy
+    are purged when the cache is opened. Only rule-based and LLM results
+    are stored, so categories that ended up unclassified (e.g. because the
+    LLM was unavailable or capped) are retried on the next run.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        taxonomy_hash: str,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: SQLite database file
+            taxonomy_hash: Fingerprint of the active taxonomy
+            max_entries: Optional cap; least recently used entries beyond
+                this count are evicted on ``flush``
+        """
+        self.path = str(path)
+        self.taxonomy_hash = taxonomy_hash
+        self.max_entries = max_entries if max_entries and max_entries > 0 else None
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS classifications (
+                category_key TEXT PRIMARY KEY,
+                taxonomy_hash TEXT NOT NULL,
+                sector TEXT NOT NULL,
+                subsector TEXT NOT NULL,
+                confidence REAL NOT NULL,
+                method TEXT NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        purged = self._conn.execute(
+            "DELETE FROM classifications WHERE taxonomy_hash != ?",
+            (self.taxonomy_hash,),
+        ).rowcount
+        self._conn.commit()
+        if purged:
+            logger.info("Invalidated %d cached classifications (taxonomy changed)", purged)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Tuple[str, str, float, str]]:
+        """
+        Look up cached classifications.
+
+        Returns:
+            Mapping of key -> (sector, subsector, confidence, method) for hits
+        """
+        found: Dict[str, Tuple[str, str, float, str]] = {}
+        unique_keys = list(dict.fromkeys(keys))
+
+        # Stay well below SQLite's host-parameter limit
+        for i in range(0, len(unique_keys), 500):
+            chunk = unique_keys[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                "SELECT category_key, sector, subsector, confidence, method "
+                f"FROM classifications WHERE taxonomy_hash = ? AND category_key IN ({placeholders})",
+                [self.taxonomy_hash, *chunk],
+            )
+            for key, sector, subsector, confidence, method in rows:
+                found[key] = (sector, subsector, confidence, method)
+
+        if found:
+            now = time.time()
+            self._conn.executemany(
+                "UPDATE classifications SET last_used = ? WHERE category_key = ?",
+                [(now, key) for key in found],
+            )
+
+        self.hits += len(found)
+        self.misses += len(unique_keys) - len(found)
+        return found
+
+    def put_many(self, entries: Dict[str, Tuple[str, str, float, str]]) -> None:
+        """Store (sector, subsector, confidence, method) results by key."""
+        if not entries:
+            return
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO classifications "
+            "(category_key, taxonomy_hash, sector, subsector, confidence, method, last_used) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (key, self.taxonomy_hash, sector, subsector, confidence, method, now)
+                for key, (sector, subsector, confidence, method) in entries.items()
+            ],
+        )
+
+    def flush(self) -> None:
+        """Enforce the size cap and commit pending writes."""
+        if self.max_entries is not None:
+            self.evicted += self._conn.execute(
+                "DELETE FROM classifications WHERE category_key IN ("
+                "SELECT category_key FROM classifications "
+                "ORDER BY last_used DESC, category_key LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+        self._conn.commit()
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def entry_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM classifications").fetchone()[0]
+
+    def bytes_used(self) -> int:
+        page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+        return page_count * page_size
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and storage usage for the mapping report."""
+        return {
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": self.entry_count(),
+            "evicted": self.evicted,
+            "max_entries": self.max_entries,
+            "bytes_used": self.bytes_used(),
+        }
+
+
+def _env_number(name: str, default, cast=int):
+    """Read a numeric setting from the environment, falling back on bad values."""
+    try:
+        return cast(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _run_coroutine(coro):
+    """
+    Run ``coro`` to completion from synchronous code.
+
+    Inside an already running event loop (e.g. Jupyter) the coroutine is run
+    on a helper thread with its own loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+class RateLimiter:
+    """
+    Async token-bucket limiter for requests per minute and tokens per minute.
+
+    Both buckets hold at most one minute of allowance and refill
+    continuously. A limit of 0 disables that bucket.
+    """
+
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        self.requests_per_minute = max(requests_per_minute, 0)
+        self.tokens_per_minute = max(tokens_per_minute, 0)
+        self._requests = float(self.requests_per_minute)
+        self._tokens = float(self.tokens_per_minute)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.requests_per_minute:
+            self._requests = min(
+                float(self.requests_per_minute),
+                self._requests + elapsed * self.requests_per_minute / 60.0,
+            )
+        if self.tokens_per_minute:
+            self._tokens = min(
+                float(self.tokens_per_minute),
+                self._tokens + elapsed * self.tokens_per_minute / 60.0,
+            )
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request and ``tokens`` tokens may be spent."""
+        async with self._lock:
+            while True:
+                self._refill()
+                need_requests = 1.0 if self.requests_per_minute else 0.0
+                # A single oversized request may use the whole bucket
+                need_tokens = float(min(tokens, self.tokens_per_minute)) if self.tokens_per_minute else 0.0
+
+                if self._requests >= need_requests and self._tokens >= need_tokens:
+                    self._requests -= need_requests
+                    self._tokens -= need_tokens
+                    return
+
+                wait = 0.0
+                if self._requests < need_requests:
+                    wait = (need_requests - self._requests) * 60.0 / self.requests_per_minute
+                if self._tokens < need_tokens:
+                    wait = max(wait, (need_tokens - self._tokens) * 60.0 / self.tokens_per_minute)
+                await asyncio.sleep(wait)
+
+
+class AdaptiveBatchController:
+    """
+    Chooses LLM batch sizes and token budgets from observed outcomes.
+
+    - A truncated or unparsable response halves the batch size and raises
+      the per-category token budget; the failed batch itself is split and
+      retried by the engine.
+    - After ``growth_window`` consecutive healthy batches (parsed, within
+      ``target_latency``) the batch size grows by 50%, up to ``max_batch_size``.
+    - A healthy but slow batch shrinks the batch size by 25%.
+
+    Settings (environment variable defaults):
+        LLM_BATCH_SIZE            starting batch size (20)
+        LLM_MAX_BATCH_SIZE        upper bound for growth (4 x LLM_BATCH_SIZE)
+        LLM_TOKENS_PER_CATEGORY   starting reply budget per category (30)
+        LLM_MAX_TOKENS            hard cap on max_tokens per request (4096)
+        LLM_TARGET_LATENCY        seconds a batch may take and count as healthy (15)
+    """
+
+    # Reply tokens reserved for the surrounding JSON array brackets
+    BASE_TOKENS = 20
+
+    def __init__(
+        self,
+        batch_size: int,
+        max_batch_size: Optional[int] = None,
+        tokens_per_category: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        target_latency: Optional[float] = None,
+        growth_window: int = 3,
+    ):
+        self.batch_size = max(batch_size, 1)
+        self.min_batch_size = 1
+        self.max_batch_size = max(
+            max_batch_size
+            if max_batch_size is not None
+            else _env_number("LLM_MAX_BATCH_SIZE", self.batch_size * 4),
+            self.batch_size,
+        )
+        self.tokens_per_category = (
+            tokens_per_category
+            if tokens_per_category is not None
+            else _env_number("LLM_TOKENS_PER_CATEGORY", 30.0, float)
+        )
+        self.max_tokens = max_tokens if max_tokens is not None else _env_number("LLM_MAX_TOKENS", 4096)
+        self.target_latency = (
+            target_latency
+            if target_latency is not None
+            else _env_number("LLM_TARGET_LATENCY", 15.0, float)
+        )
+        self.growth_window = max(growth_window, 1)
+        self._healthy_streak = 0
+
+    def token_budget(self, batch_len: int) -> int:
+        """max_tokens to request for a batch of ``batch_len`` categories."""
+        budget = self.BASE_TOKENS + int(round(self.tokens_per_category * batch_len))
+        return max(1, min(self.max_tokens, budget))
+
+    def record_truncation(self, batch_len: int, tokens_per_category: float) -> None:
+        """
+        Shrink after a truncated/unparsable reply.
+
+        Concurrent batches sent with an already superseded size or budget
+        do not shrink the settings again.
+        """
+        self._healthy_streak = 0
+        self.batch_size = max(self.min_batch_size, min(self.batch_size, batch_len // 2))
+        if tokens_per_category >= self.tokens_per_category:
+            self.tokens_per_category = min(float(self.max_tokens), self.tokens_per_category * 1.5)
+
+    def record_success(self, latency: float) -> None:
+        if latency > self.target_latency:
+            self._healthy_streak = 0
+            self.batch_size = max(self.min_batch_size, int(self.batch_size * 0.75))
+            return
+
+        self._healthy_streak += 1
+        if self._healthy_streak >= self.growth_window:
+            self._healthy_streak = 0
+            self.batch_size = min(self.max_batch_size, max(self.batch_size + 1, int(self.batch_size * 1.5)))
+
+    def record_failure(self) -> None:
+        self._healthy_streak = 0
+
+
+class AsyncLLMClassifier:
+    """
+    Concurrent LLM classification engine built on ``openai.AsyncOpenAI``.
+
+    Workers pull categories from a shared queue in batches sized by an
+    AdaptiveBatchController and run with bounded concurrency behind a
+    RateLimiter. Failed or timed-out requests are retried with full-jitter
+    exponential backoff; truncated (``finish_reason == "length"``) or
+    unparsable replies are split in half and re-queued. Prompt construction
+    and response parsing are shared with ``CategoryStandardizer``, and a
+    category is only ever taken from the reply to its own batch.
+
+    Settings (environment variable defaults):
+        LLM_CONCURRENCY          concurrent requests in flight (4)
+        LLM_REQUESTS_PER_MINUTE  request rate limit, 0 = unlimited (0)
+        LLM_TOKENS_PER_MINUTE    token rate limit, 0 = unlimited (0)
+        LLM_MAX_RETRIES          retries per batch after the first attempt (3)
+        OPENAI_TIMEOUT           per-request timeout in seconds (30)
+        OPENAI_BASE_URL          alternate endpoint, e.g. a local stub server
+
+    Per-batch telemetry (size, token budget and usage, latency, outcome) is
+    collected in ``batch_log`` and summarised by ``telemetry()``.
+    """
+
+    def __init__(
+        self,
+        standardizer: "CategoryStandardizer",
+        concurrency: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        timeout: Optional[float] = None,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        base_url: Optional[str] = None,
+        controller: Optional[AdaptiveBatchController] = None,
+    ):
+        self.standardizer = standardizer
+        self.concurrency = max(
+            concurrency if concurrency is not None else _env_number("LLM_CONCURRENCY", 4), 1
+        )
+        self.requests_per_minute = (
+            requests_per_minute
+            if requests_per_minute is not None
+            else _env_number("LLM_REQUESTS_PER_MINUTE", 0)
+        )
+        self.tokens_per_minute = (
+            tokens_per_minute
+            if tokens_per_minute is not None
+            else _env_number("LLM_TOKENS_PER_MINUTE", 0)
+        )
+        self.max_retries = max(
+            max_retries if max_retries is not None else _env_number("LLM_MAX_RETRIES", 3), 0
+        )
+        self.timeout = timeout if timeout is not None else _env_number("OPENAI_TIMEOUT", 30.0, float)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL") or None
+        self.controller = controller or AdaptiveBatchController(standardizer.llm_batch_size)
+        self.stats: Counter = Counter()
+        self.batch_log: List[Dict[str, Any]] = []
+
+    @staticmethod
+    def _estimate_tokens(messages: List[Dict[str, str]], max_tokens: int) -> int:
+        """Rough token estimate (~4 characters per token) plus the reply budget."""
+        return sum(len(m["content"]) for m in messages) // 4 + max_tokens
+
+    @staticmethod
+    def _is_retryable(exc: Exception) -> bool:
+        """Client errors other than timeouts, conflicts and rate limits are final."""
+        status = getattr(exc, "status_code", None)
+        if isinstance(status, int) and 400 <= status < 500:
+            return status in (408, 409, 429)
+        return True
+
+    async def _request(
+        self, client, limiter: RateLimiter, batch: List[str], max_tokens: int
+    ) -> Tuple[str, Optional[Any], float]:
+        """
+        Send one batch, retrying transient failures.
+
+        Returns:
+            (status, response, latency) where status is "ok" or "failed"
+        """
+        messages = self.standardizer._build_llm_messages(batch)
+        estimate = self._estimate_tokens(messages, max_tokens)
+
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire(estimate)
+            self.stats["requests"] += 1
+            started = time.perf_counter()
+            try:
+                response = await asyncio.wait_for(
+                    client.chat.completions.create(
+                        model=self.standardizer.llm_model,
+                        messages=messages,
+                        temperature=0.3,
+                        max_tokens=max_tokens,
+                    ),
+                    timeout=self.timeout,
+                )
+                return "ok", response, time.perf_counter() - started
+
+            except Exception as exc:
+                if isinstance(exc, asyncio.TimeoutError):
+                    self.stats["timeouts"] += 1
+                if attempt >= self.max_retries or not self._is_retryable(exc):
+                    logger.error(
+                        "LLM batch classification failed for categories %s: %s", batch, str(exc) or type(exc).__name__
+                    )
+                    return "failed", None, time.perf_counter() - started
+
+                self.stats["retries"] += 1
+                delay = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+                logger.warning(
+                    "LLM batch attempt %d failed (%s); retrying in %.2fs",
+                    attempt + 1,
+                    str(exc) or type(exc).__name__,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+        return "failed", None, 0.0
+
+    async def _classify_batch(
+        self, client, limiter: RateLimiter, batch: List[str]
+    ) -> Tuple[str, Dict[str, Tuple[str, str, float]]]:
+        """
+        Classify one batch and feed the outcome back to the controller.
+
+        Returns:
+            (status, mapping) where status is "ok", "truncated",
+            "parse_error" or "failed"
+        """
+        tokens_per_category = self.controller.tokens_per_category
+        max_tokens = self.controller.token_budget(len(batch))
+        status, response, latency = await self._request(client, limiter, batch, max_tokens)
+
+        entry: Dict[str, Any] = {
+            "size": len(batch),
+            "max_tokens": max_tokens,
+            "latency_seconds": round(latency, 4),
+            "prompt_tokens": None,
+            "completion_tokens": None,
+            "finish_reason": None,
+        }
+        mapping: Dict[str, Tuple[str, str, float]] = {}
+
+        if status == "ok":
+            choice = response.choices[0]
+            usage = getattr(response, "usage", None)
+            entry["prompt_tokens"] = getattr(usage, "prompt_tokens", None)
+            entry["completion_tokens"] = getattr(usage, "completion_tokens", None)
+            entry["finish_reason"] = getattr(choice, "finish_reason", None)
+
+            result_text = (choice.message.content or "").strip()
+            parsed = self.standardizer._decode_llm_array(batch, result_text)
+
+            if entry["finish_reason"] == "length":
+                status = "truncated"
+            elif parsed is None:
+                status = "parse_error"
+            else:
+                # Only accept answers for categories that were in this batch
+                members = set(batch)
+                mapping = {
+                    cat: result
+                    for cat, result in self.standardizer._validate_llm_items(parsed).items()
+                    if cat in members
+                }
+
+        if status == "ok":
+            self.controller.record_success(latency)
+        elif status in ("truncated", "parse_error"):
+            self.controller.record_truncation(len(batch), tokens_per_category)
+        else:
+            self.controller.record_failure()
+
+        entry["status"] = status
+        self.stats[f"{status}_batches"] += 1
+        self.batch_log.append(entry)
+        return status, mapping
+
+    async def classify(self, categories: List[str]) -> Dict[str, Tuple[str, str, float]]:
+        """
+        Classify ``categories`` with adaptive batching.
+
+        Returns:
+            Mapping of category -> (sector, subsector, confidence); categories
+            the LLM could not classify are omitted
+        """
+        client = openai.AsyncOpenAI(
+            api_key=self.standardizer.openai_api_key,
+            base_url=self.base_url,
+            max_retries=0,
+        )
+        limiter = RateLimiter(self.requests_per_minute, self.tokens_per_minute)
+        pending = deque(categories)
+        single_retries: Counter = Counter()
+        results: Dict[str, Tuple[str, str, float]] = {}
+        # A batch in flight may come back split or retried, so workers only
+        # stop once nothing is pending and nothing is in flight
+        in_flight = 0
+        changed = asyncio.Condition()
+
+        async def worker() -> None:
+            nonlocal in_flight
+            while True:
+                async with changed:
+                    await changed.wait_for(lambda: pending or not in_flight)
+                    if not pending:
+                        return
+                    size = min(self.controller.batch_size, len(pending))
+                    batch = [pending.popleft() for _ in range(size)]
+                    in_flight += 1
+
+                try:
+                    status, mapping = await self._classify_batch(client, limiter, batch)
+                    results.update(mapping)
+                    self.standardizer._cache_results(mapping, "llm")
+
+                    if status in ("truncated", "parse_error"):
+                        if len(batch) > 1:
+                            # Re-queue at the front; the controller has already
+                            # cut the batch size to at most half of this batch
+                            self.stats["splits"] += 1
+                            pending.extendleft(reversed(batch))
+                        elif single_retries[batch[0]] < self.max_retries:
+                            single_retries[batch[0]] += 1
+                            pending.appendleft(batch[0])
+                finally:
+                    async with changed:
+                        in_flight -= 1
+                        changed.notify_all()
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        finally:
+            await client.close()
+
+        return results
+
+    def run(self, categories: List[str]) -> Dict[str, Tuple[str, str, float]]:
+        """Synchronous wrapper around ``classify``."""
+        return _run_coroutine(self.classify(categories))
+
+    def telemetry(self) -> Dict[str, Any]:
+        """Summary of batch outcomes, token usage and latency for the mapping report."""
+        latencies = [entry["latency_seconds"] for entry in self.batch_log]
+        return {
+            "batches": len(self.batch_log),
+            "requests": self.stats["requests"],
+            "retries": self.stats["retries"],
+            "timeouts": self.stats["timeouts"],
+            "splits": self.stats["splits"],
+            "ok_batches": self.stats["ok_batches"],
+            "truncated_batches": self.stats["truncated_batches"],
+            "parse_failures": self.stats["parse_error_batches"],
+            "failed_batches": self.stats["failed_batches"],
+            "prompt_tokens": sum(entry["prompt_tokens"] or 0 for entry in self.batch_log),
+            "completion_tokens": sum(entry["completion_tokens"] or 0 for entry in self.batch_log),
+            "latency_seconds": {
+                "total": round(sum(latencies), 4),
+                "mean": round(sum(latencies) / len(latencies), 4) if latencies else None,
+                "max": max(latencies) if latencies else None,
+            },
+            "final_batch_size": self.controller.batch_size,
+            "final_tokens_per_category": round(self.controller.tokens_per_category, 2),
+            "batch_log": self.batch_log,
+        }
+
+
 class CategoryStandardizer:
     """
     Standardizes business categories using rule-based mapping and LLM classification.
     """
 
-    def __init__(self, openai_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        openai_api_key: Optional[str] = None,
+        cache: Optional[ClassificationCache] = None,
+    ):
         """
         Initialize the standardizer.
 
         Args:
             openai_api_key: OpenAI API key for LLM classification (optional)
+            cache: Persistent classification cache shared across runs (optional)
         """
         self.taxonomy = CANONICAL_TAXONOMY
         self.category_map = self._build_category_map()
         self.openai_api_key = openai_api_key
+        self.cache = cache
+        # Telemetry from the most recent async LLM run (see AsyncLLMClassifier)
+        self.llm_telemetry: Optional[Dict[str, Any]] = None
 
         if openai_api_key and OPENAI_AVAILABLE:
             openai.api_key = openai_api_key
@@ -167,15 +933,8 @@ class CategoryStandardizer:
         # - MAX_LLM_CATEGORIES: cap on how many unique categories
         #   will ever be sent to the LLM.
         # - LLM_BATCH_SIZE: how many categories per request.
-        try:
-            self.max_llm_categories = int(os.getenv("MAX_LLM_CATEGORIES", "250"))
-        except ValueError:
-            self.max_llm_categories = 250
-
-        try:
-            self.llm_batch_size = int(os.getenv("LLM_BATCH_SIZE", "20"))
-        except ValueError:
-            self.llm_batch_size = 20
+        self.max_llm_categories = _env_number("MAX_LLM_CATEGORIES", 250)
+        self.llm_batch_size = _env_number("LLM_BATCH_SIZE", 20)
 
         # Model name can be overridden via OPENAI_MODEL
         self.llm_model = os.getenv("OPENAI_MODEL", "gpt-4")
@@ -184,6 +943,9 @@ class CategoryStandardizer:
         """
         Build a mapping from keywords to (sector, subsector) tuples.
 
+        Also compiles ``self.keyword_matcher``, the multi-keyword automaton
+        used by rule-based classification.
+
         Returns:
             Dictionary mapping keywords to taxonomy paths
         """
@@ -194,6 +956,8 @@ class CategoryStandardizer:
                 for keyword in keywords:
                     category_map[keyword.lower()] = (sector, subsector)
 
+        self.keyword_matcher = KeywordMatcher(category_map)
+
         logger.info(f"Built category map with {len(category_map)} keyword mappings")
         return category_map
 
@@ -214,10 +978,10 @@ class CategoryStandardizer:
         normalized = category.lower().strip()
 
         # Remove common suffixes and prefixes
-        normalized = re.sub(r'\s*(services?|store|shop|center|company|inc\.?|llc|corp\.?)\s*$', '', normalized)
+        normalized = _CATEGORY_SUFFIX_RE.sub('', normalized)
 
         # Replace multiple spaces with single space
-        normalized = re.sub(r'\s+', ' ', normalized)
+        normalized = _WHITESPACE_RE.sub(' ', normalized)
 
         return normalized
 
@@ -225,6 +989,9 @@ class CategoryStandardizer:
         """
         Classify category using rule-based keyword matching.
 
+        All keyword hits are found in one pass by ``self.keyword_matcher``
+        and the best-scoring one wins (see ``KeywordMatcher.best_match``).
+
         Args:
             category: Category string to classify
 
@@ -236,40 +1003,10 @@ class CategoryStandardizer:
         if not normalized:
             return None
 
-        # Direct keyword match
-        for keyword, (sector, subsector) in self.category_map.items():
-            if keyword in normalized:
-                # Calculate confidence based on match quality
-                if normalized == keyword:
-                    confidence = 1.0  # Exact match
-                elif normalized.startswith(keyword) or normalized.endswith(keyword):
-                    confidence = 0.9  # Strong match
-                else:
-                    confidence = 0.8  # Partial match
-
-                return (sector, subsector, confidence)
-
-        return None
-
-    def _llm_classification_batch(
-        self, categories: List[str]
-    ) -> Dict[str, Tuple[str, str, float]]:
-        """
-        Classify a batch of categories using OpenAI LLM.
-
-        Returns a mapping:
-            category -> (sector, subsector, confidence)
-
-        Any category that cannot be reliably parsed or validated
-        will be omitted from the returned mapping and should be
-        treated as unclassified by the caller.
-        """
-        if not self.openai_api_key or not OPENAI_AVAILABLE:
-            return {}
-
-        if not categories:
-            return {}
+        return self.keyword_matcher.best_match(normalized)
 
+    def _build_llm_messages(self, categories: List[str]) -> List[Dict[str, str]]:
+        """Build the chat messages asking the LLM to classify ``categories``."""
         # Build taxonomy description for prompt once
         taxonomy_desc = []
         for sector, subsectors in self.taxonomy.items():
@@ -279,11 +1016,6 @@ class CategoryStandardizer:
         taxonomy_str = "\n".join(taxonomy_desc)
 
         # Construct prompt asking for a JSON array with one object per category.
-        payload = {
-            "taxonomy": taxonomy_str,
-            "categories": categories,
-        }
-
         system_msg = (
             "You are a business classification expert. "
             "You must classify each category into the provided taxonomy. "
@@ -305,69 +1037,120 @@ class CategoryStandardizer:
             "Return ONLY a JSON array as described."
         )
 
-        try:
-            response = openai.ChatCompletion.create(
-                model=self.llm_model,
-                messages=[
-                    {"role": "system", "content": system_msg},
-                    {"role": "user", "content": user_msg},
-                ],
-                temperature=0.3,
-                max_tokens=400,
-            )
-
-            result_text = response.choices[0].message.content.strip()
+        return [
+            {"role": "system", "content": system_msg},
+            {"role": "user", "content": user_msg},
+        ]
 
-            try:
-                parsed = json.loads(result_text)
-            except json.JSONDecodeError:
-                # Try to extract a JSON array from the response
-                json_match = re.search(r"\[.*\]", result_text, re.DOTALL)
-                if not json_match:
-                    logger.warning(
-                        "LLM returned non-JSON response for batch %s: %s",
-                        categories,
-                        result_text,
-                    )
-                    return {}
-                try:
-                    parsed = json.loads(json_match.group())
-                except json.JSONDecodeError as exc:
-                    logger.warning(
-                        "LLM batch JSON parse failed for %s: %s", categories, exc
-                    )
-                    return {}
+    def _decode_llm_array(
+        self, categories: List[str], result_text: str
+    ) -> Optional[List[Any]]:
+        """
+        Decode the JSON array from an LLM batch response.
 
-            if not isinstance(parsed, list):
+        Returns:
+            The decoded list, or None when the response is not a JSON array
+            (e.g. prose, or JSON cut off by the token limit)
+        """
+        try:
+            parsed = json.loads(result_text)
+        except json.JSONDecodeError:
+            # Try to extract a JSON array from the response
+            json_match = re.search(r"\[.*\]", result_text, re.DOTALL)
+            if not json_match:
                 logger.warning(
-                    "LLM batch result is not a list for categories %s: %s",
+                    "LLM returned non-JSON response for batch %s: %s",
                     categories,
                     result_text,
                 )
-                return {}
+                return None
+            try:
+                parsed = json.loads(json_match.group())
+            except json.JSONDecodeError as exc:
+                logger.warning(
+                    "LLM batch JSON parse failed for %s: %s", categories, exc
+                )
+                return None
 
-            mapping: Dict[str, Tuple[str, str, float]] = {}
+        if not isinstance(parsed, list):
+            logger.warning(
+                "LLM batch result is not a list for categories %s: %s",
+                categories,
+                result_text,
+            )
+            return None
 
-            for item in parsed:
-                if not isinstance(item, dict):
-                    continue
+        return parsed
 
-                cat = str(item.get("category", "")).strip()
-                sector = item.get("sector")
-                subsector = item.get("subsector")
-                try:
-                    confidence = float(item.get("confidence", 0.5))
-                except (TypeError, ValueError):
-                    confidence = 0.5
+    def _validate_llm_items(self, items: List[Any]) -> Dict[str, Tuple[str, str, float]]:
+        """Keep well-formed LLM items whose sector/subsector exist in the taxonomy."""
+        mapping: Dict[str, Tuple[str, str, float]] = {}
 
-                if not cat:
-                    continue
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+
+            cat = str(item.get("category", "")).strip()
+            sector = item.get("sector")
+            subsector = item.get("subsector")
+            try:
+                confidence = float(item.get("confidence", 0.5))
+            except (TypeError, ValueError):
+                confidence = 0.5
+
+            if not cat:
+                continue
+
+            # Validate against taxonomy
+            if sector in self.taxonomy and subsector in self.taxonomy[sector]:
+                mapping[cat] = (sector, subsector, confidence)
+
+        return mapping
+
+    def _parse_llm_response(
+        self, categories: List[str], result_text: str
+    ) -> Dict[str, Tuple[str, str, float]]:
+        """
+        Parse and validate an LLM batch response.
+
+        Returns:
+            Mapping of category -> (sector, subsector, confidence); items that
+            cannot be parsed or are outside the taxonomy are omitted
+        """
+        parsed = self._decode_llm_array(categories, result_text)
+        if parsed is None:
+            return {}
+        return self._validate_llm_items(parsed)
+
+    def _llm_classification_batch(
+        self, categories: List[str]
+    ) -> Dict[str, Tuple[str, str, float]]:
+        """
+        Classify a batch of categories using OpenAI LLM.
+
+        Returns a mapping:
+            category -> (sector, subsector, confidence)
+
+        Any category that cannot be reliably parsed or validated
+        will be omitted from the returned mapping and should be
+        treated as unclassified by the caller.
+        """
+        if not self.openai_api_key or not OPENAI_AVAILABLE:
+            return {}
+
+        if not categories:
+            return {}
 
-                # Validate against taxonomy
-                if sector in self.taxonomy and subsector in self.taxonomy[sector]:
-                    mapping[cat] = (sector, subsector, confidence)
+        try:
+            response = openai.ChatCompletion.create(
+                model=self.llm_model,
+                messages=self._build_llm_messages(categories),
+                temperature=0.3,
+                max_tokens=400,
+            )
 
-            return mapping
+            result_text = response.choices[0].message.content.strip()
+            return self._parse_llm_response(categories, result_text)
 
         except Exception as e:
             logger.error(
@@ -397,6 +1180,10 @@ class CategoryStandardizer:
           respecting MAX_LLM_CATEGORIES and LLM_BATCH_SIZE limits.
         - Any remaining or failed items fall back to the default
           "Other Services / Miscellaneous" bucket.
+        - When a ClassificationCache is configured, categories it already
+          knows are answered from it and never reach the rules or the LLM.
+
+        The returned mapping follows the order of ``categories``.
         """
         # Deduplicate while preserving order
         seen: Set[str] = set()
@@ -409,13 +1196,40 @@ class CategoryStandardizer:
 
         mappings: Dict[str, Dict[str, Any]] = {}
         ambiguous: List[str] = []
-
-        # First pass: rule-based classification
-        for category in unique_categories:
-            rule_result = self._rule_based_classification(category)
-            if rule_result:
-                sector, subsector, confidence = rule_result
-                mappings[category] = {
+        pending = unique_categories
+
+        if self.cache is not None:
+            cache_keys = {category: self._cache_key(category) for category in unique_categories}
+            cached = self.cache.get_many(list(cache_keys.values()))
+            pending = []
+            for category in unique_categories:
+                hit = cached.get(cache_keys[category])
+                if hit:
+                    sector, subsector, confidence, method = hit
+                    mappings[category] = {
+                        "original_category": category,
+                        "standardized_sector": sector,
+                        "standardized_subsector": subsector,
+                        "confidence": confidence,
+                        "method": method,
+                    }
+                else:
+                    pending.append(category)
+
+            logger.info(
+                "Classification cache: %d hits, %d misses",
+                len(unique_categories) - len(pending),
+                len(pending),
+            )
+
+        # First pass: rule-based classification
+        rule_results: Dict[str, Tuple[str, str, float]] = {}
+        for category in pending:
+            rule_result = self._rule_based_classification(category)
+            if rule_result:
+                rule_results[category] = rule_result
+                sector, subsector, confidence = rule_result
+                mappings[category] = {
                     "original_category": category,
                     "standardized_sector": sector,
                     "standardized_subsector": subsector,
@@ -424,12 +1238,13 @@ class CategoryStandardizer:
                 }
             else:
                 ambiguous.append(category)
+        self._cache_results(rule_results, "rule_based")
 
         # If LLM is not available or not configured, mark all ambiguous as unclassified
         if not (self.openai_api_key and OPENAI_AVAILABLE and self.max_llm_categories > 0):
             for category in ambiguous:
                 mappings[category] = self._default_classification(category)
-            return mappings
+            return {category: mappings[category] for category in unique_categories}
 
         # Respect global cap on how many unique categories we ever send to the LLM
         llm_targets = ambiguous[: self.max_llm_categories]
@@ -442,29 +1257,426 @@ class CategoryStandardizer:
                 self.max_llm_categories,
             )
 
-        # Batch LLM calls
-        for i in range(0, len(llm_targets), max(self.llm_batch_size, 1)):
-            batch = llm_targets[i : i + max(self.llm_batch_size, 1)]
-            llm_results = self._llm_classification_batch(batch)
-
-            for category in batch:
-                if category in llm_results:
-                    sector, subsector, confidence = llm_results[category]
-                    mappings[category] = {
-                        "original_category": category,
-                        "standardized_sector": sector,
-                        "standardized_subsector": subsector,
-                        "confidence": confidence,
-                        "method": "llm",
-                    }
-                else:
-                    mappings[category] = self._default_classification(category)
+        # Classify with the LLM: adaptive concurrent batches when the async
+        # client is available, otherwise fixed-size sequential batches
+        if ASYNC_OPENAI_AVAILABLE:
+            engine = AsyncLLMClassifier(self)
+            logger.info(
+                "Classifying %d categories with the LLM (concurrency=%d, initial batch size=%d)",
+                len(llm_targets),
+                engine.concurrency,
+                engine.controller.batch_size,
+            )
+            llm_results = engine.run(llm_targets)
+            self.llm_telemetry = engine.telemetry()
+            logger.info(
+                "LLM engine: %d batches, %d requests, %d truncated, %d parse failures, final batch size %d",
+                self.llm_telemetry["batches"],
+                self.llm_telemetry["requests"],
+                self.llm_telemetry["truncated_batches"],
+                self.llm_telemetry["parse_failures"],
+                self.llm_telemetry["final_batch_size"],
+            )
+        else:
+            llm_results = {}
+            batch_size = max(self.llm_batch_size, 1)
+            for i in range(0, len(llm_targets), batch_size):
+                batch = llm_targets[i : i + batch_size]
+                batch_results = self._llm_classification_batch(batch)
+                batch_results = {cat: batch_results[cat] for cat in batch if cat in batch_results}
+                llm_results.update(batch_results)
+                self._cache_results(batch_results, "llm")
+
+        for category in llm_targets:
+            if category in llm_results:
+                sector, subsector, confidence = llm_results[category]
+                mappings[category] = {
+                    "original_category": category,
+                    "standardized_sector": sector,
+                    "standardized_subsector": subsector,
+                    "confidence": confidence,
+                    "method": "llm",
+                }
+            else:
+                mappings[category] = self._default_classification(category)
 
         # Any categories not processed by LLM (because of caps) default to unclassified
         for category in skipped_for_cost:
             mappings[category] = self._default_classification(category)
 
-        return mappings
+        return {category: mappings[category] for category in unique_categories}
+
+    def _cache_key(self, category: str) -> str:
+        """Cache key for a category: its normalized form, else lowercased text."""
+        return self._normalize_category(category) or category.strip().lower()
+
+    def _cache_results(self, results: Dict[str, Tuple[str, str, float]], method: str) -> None:
+        """
+        Persist category -> (sector, subsector, confidence) ``results`` to
+        the cache (if any) as soon as they are known, so an interrupted run
+        keeps the LLM answers it already paid for.
+        """
+        if self.cache is None or not results:
+            return
+        self.cache.put_many(
+            {
+                self._cache_key(category): (sector, subsector, confidence, method)
+                for category, (sector, subsector, confidence) in results.items()
+            }
+        )
+        self.cache.flush()
+
+
+class DiskBackedIdSet:
+    """
+    Set of strings stored in a temporary SQLite file.
+
+    Used in place of an in-memory ``set`` for business-id uniqueness when
+    streaming, so memory does not grow with the number of records.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.exists(path):
+            os.remove(path)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute("CREATE TABLE ids (id TEXT PRIMARY KEY) WITHOUT ROWID")
+
+    def __contains__(self, value: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM ids WHERE id = ?", (value,)).fetchone() is not None
+
+    def add(self, value: str) -> None:
+        self._conn.execute("INSERT OR IGNORE INTO ids (id) VALUES (?)", (value,))
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM ids").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def record_fingerprint(record: dict) -> str:
+    """Content hash of a raw record, independent of key order."""
+    payload = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def file_fingerprint(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's bytes, read ``chunk_size`` bytes at a time."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _record_key(record: dict, fingerprint: str) -> str:
+    """
+    Stable identity of a raw record across runs: the business_id
+    ``_normalize_schema`` would derive, or the content hash for records
+    without any id.
+    """
+    source_id = record.get("business_id")
+    if source_id:
+        return str(source_id)
+    if record.get("id") is not None:
+        return f"ca_biz_{record['id']}"
+    return f"sha256:{fingerprint}"
+
+
+class RecordManifest:
+    """
+    On-disk (SQLite) state of the last incremental run.
+
+    For every input record, keyed by ``_record_key``, stores its content
+    hash, its standardized output record (serialized as it appears in the
+    output file) and its data-quality issues; plus the classification of
+    every category in use. A run only validates and
+    classifies records whose hash changed, and rebuilds the output from
+    the stored records. Stored results depend on the taxonomy, so a
+    taxonomy change empties the manifest.
+
+    The ``last_run`` meta entry records the input file (size, mtime,
+    SHA-256) and the output it produced, so a rerun over an unchanged file
+    can stop before reading any record.
+    """
+
+    def __init__(self, path: str, taxonomy_hash: str):
+        """
+        Open (or create) the manifest.
+
+        Args:
+            path: SQLite database file
+            taxonomy_hash: Fingerprint of the active taxonomy
+        """
+        self.path = str(path)
+        self.taxonomy_hash = taxonomy_hash
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS records (
+                record_key TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                business_id TEXT NOT NULL,
+                category TEXT NOT NULL,
+                output TEXT NOT NULL,
+                issues TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS categories (
+                category TEXT PRIMARY KEY,
+                mapping TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS records_business_id ON records (business_id);
+            """
+        )
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'taxonomy_hash'").fetchone()
+        if row is not None and row[0] != taxonomy_hash:
+            purged = self._conn.execute("DELETE FROM records").rowcount
+            self._conn.execute("DELETE FROM categories")
+            self._conn.execute("DELETE FROM meta WHERE key = 'last_run'")
+            logger.info("Invalidated %d manifest records (taxonomy changed)", purged)
+        self.set_meta("taxonomy_hash", taxonomy_hash)
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _select(self, columns: str, keys: List[str]) -> Iterator[tuple]:
+        # Stay well below SQLite's host-parameter limit
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            yield from self._conn.execute(
+                f"SELECT record_key, {columns} FROM records WHERE record_key IN ({placeholders})",
+                chunk,
+            )
+
+    def fingerprints(self, keys: List[str]) -> Dict[str, str]:
+        """Stored content hash by key, for the keys that are present."""
+        return dict(self._select("fingerprint", keys))
+
+    def entries(self, keys: List[str]) -> Dict[str, Tuple[str, str, str]]:
+        """Stored (category, output JSON, issues JSON) by key."""
+        return {
+            key: (category, output, issues)
+            for key, category, output, issues in self._select("category, output, issues", keys)
+        }
+
+    def entries_in_categories(self, categories: List[str]) -> List[Tuple[str, str, str]]:
+        """(key, category, output JSON) of every stored record in ``categories``."""
+        rows: List[Tuple[str, str, str]] = []
+        for i in range(0, len(categories), 500):
+            chunk = categories[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows.extend(
+                self._conn.execute(
+                    f"SELECT record_key, category, output FROM records WHERE category IN ({placeholders})",
+                    chunk,
+                )
+            )
+        return rows
+
+    def update_outputs(self, rows: List[Tuple[str, str]]) -> None:
+        """Replace the stored output JSON of (output, key) rows."""
+        self._conn.executemany("UPDATE records SET output = ? WHERE record_key = ?", rows)
+
+    def has_business_id(self, business_id: str) -> bool:
+        row = self._conn.execute("SELECT 1 FROM records WHERE business_id = ? LIMIT 1", (business_id,)).fetchone()
+        return row is not None
+
+    def categories(self) -> Set[str]:
+        return {category for (category,) in self._conn.execute("SELECT DISTINCT category FROM records")}
+
+    def keys(self) -> Iterator[str]:
+        for (key,) in self._conn.execute("SELECT record_key FROM records"):
+            yield key
+
+    def put_many(self, rows: List[Tuple[str, str, str, str, str, str]]) -> None:
+        """Store (key, fingerprint, business_id, category, output JSON, issues JSON) rows."""
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO records "
+            "(record_key, fingerprint, business_id, category, output, issues) VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def delete_many(self, keys: List[str]) -> None:
+        self._conn.executemany("DELETE FROM records WHERE record_key = ?", [(key,) for key in keys])
+
+    def category_mappings(self) -> Dict[str, Dict[str, Any]]:
+        rows = self._conn.execute("SELECT category, mapping FROM categories")
+        return {category: json.loads(mapping) for category, mapping in rows}
+
+    def replace_category_mappings(self, mappings: Dict[str, Dict[str, Any]]) -> None:
+        """Make ``mappings`` the full set of stored classifications."""
+        self._conn.execute("DELETE FROM categories")
+        self._conn.executemany(
+            "INSERT INTO categories (category, mapping) VALUES (?, ?)",
+            [(category, json.dumps(mapping, ensure_ascii=False)) for category, mapping in mappings.items()],
+        )
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close without committing; uncommitted changes are rolled back."""
+        self._conn.close()
+
+
+class ManifestIdSet:
+    """
+    Business ids already taken, for validating an incremental delta: the
+    ids stored in the manifest (looked up by index, not loaded) plus those
+    assigned during this run.
+    """
+
+    def __init__(self, manifest: RecordManifest):
+        self._manifest = manifest
+        self._added: Set[str] = set()
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._added or self._manifest.has_business_id(value)
+
+    def add(self, value: str) -> None:
+        self._added.add(value)
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _splitmix64(value: int) -> int:
+    """SplitMix64 finalizer: a well-mixed 64-bit hash of a 64-bit integer."""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+def _splitmix64_array(values: "np.ndarray") -> "np.ndarray":
+    """``_splitmix64`` over a uint64 array (NumPy wraps like the masks above)."""
+    values = values + np.uint64(0x9E3779B97F4A7C15)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+class IssueTracker:
+    """
+    Data-quality issues with bounded memory.
+
+    Keeps an exact count per issue type and a uniform sample of at most
+    ``sample_size`` details per type, so the report stays the same size
+    however dirty the input is. The sample is bottom-k: the n-th issue of a
+    type gets a key hashed from (seed, type, n) and the ``sample_size``
+    smallest keys win. The same issues in the same order always give the
+    same sample, whether they arrive one at a time (``add``) or in bulk
+    (``add_many``). Every issue can also be appended to an NDJSON log for
+    full forensics.
+    """
+
+    def __init__(self, sample_size: int = 100, log_path: Optional[str] = None, seed: int = 0):
+        """
+        Args:
+            sample_size: Details kept per issue type
+            log_path: Optional NDJSON file receiving every issue
+                (``{"issue_type": ..., "detail": ...}`` per line)
+            seed: Seed for the sample keys
+        """
+        self.sample_size = max(0, sample_size)
+        self.log_path = log_path
+        self.seed = seed
+        self.counts: Dict[str, int] = {}
+        # Per type, a max-heap of (-key, -position, detail)
+        self._samples: Dict[str, List[Tuple[int, int, Any]]] = {}
+        self._key_offsets: Dict[str, int] = {}
+        self._log = None
+        if log_path:
+            Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+            self._log = open(log_path, "w", encoding="utf-8")
+
+    def _key_offset(self, issue_type: str) -> int:
+        offset = self._key_offsets.get(issue_type)
+        if offset is None:
+            digest = hashlib.blake2b(f"{self.seed}:{issue_type}".encode("utf-8"), digest_size=8).digest()
+            offset = self._key_offsets[issue_type] = int.from_bytes(digest, "big")
+        return offset
+
+    def _offer(self, issue_type: str, key: int, position: int, detail: Callable[[], Any]) -> None:
+        # Keep the sample_size smallest (key, position) pairs
+        heap = self._samples.setdefault(issue_type, [])
+        if len(heap) < self.sample_size:
+            heapq.heappush(heap, (-key, -position, detail()))
+        elif (key, position) < (-heap[0][0], -heap[0][1]):
+            heapq.heapreplace(heap, (-key, -position, detail()))
+
+    def add(self, issue_type: str, detail: Any) -> None:
+        seen = self.counts.get(issue_type, 0)
+        self.counts[issue_type] = seen + 1
+        if self.sample_size:
+            key = _splitmix64((self._key_offset(issue_type) + seen) & _MASK64)
+            self._offer(issue_type, key, seen, lambda: detail)
+        if self._log is not None:
+            self._log.write(json.dumps({"issue_type": issue_type, "detail": detail}, ensure_ascii=False))
+            self._log.write("\n")
+
+    def add_many(self, issue_type: str, count: int, detail: Callable[[int], Any]) -> None:
+        """
+        Record ``count`` issues of one type, in order; same result as
+        ``count`` calls to ``add``. ``detail(i)`` builds the i-th detail and
+        is only called for the sampled issues, unless a log is open.
+        """
+        if count <= 0:
+            return
+        if self._log is not None or not NUMPY_AVAILABLE:
+            for i in range(count):
+                self.add(issue_type, detail(i))
+            return
+        seen = self.counts.get(issue_type, 0)
+        self.counts[issue_type] = seen + count
+        if not self.sample_size:
+            return
+        positions = np.arange(seen, seen + count, dtype=np.uint64)
+        keys = _splitmix64_array(positions + np.uint64(self._key_offset(issue_type)))
+        candidates = np.arange(count)
+        if count > self.sample_size:
+            candidates = np.argpartition(keys, self.sample_size - 1)[: self.sample_size]
+        heap = self._samples.setdefault(issue_type, [])
+        if not heap:
+            # Nothing sampled yet, so every candidate is kept
+            heap.extend((-int(keys[i]), -(seen + i), detail(i)) for i in candidates.tolist())
+            heapq.heapify(heap)
+            return
+        for i in candidates.tolist():
+            self._offer(issue_type, int(keys[i]), seen + i, lambda: detail(i))
+
+    def extend(self, issue_type: str, details: Iterable[Any]) -> None:
+        for detail in details:
+            self.add(issue_type, detail)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def samples(self) -> Dict[str, List[Any]]:
+        """Sampled details per issue type, in the order they were recorded."""
+        return {
+            issue_type: [detail for _, _, detail in sorted(self._samples.get(issue_type, []), key=lambda item: -item[1])]
+            for issue_type in self.counts
+        }
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._log.close()
+            self._log = None
 
 
 class DataQualityValidator:
@@ -472,11 +1684,26 @@ class DataQualityValidator:
     Validates data quality for Neo4j compatibility.
     """
 
-    def __init__(self):
-        self.issues = defaultdict(list)
+    def __init__(
+        self,
+        seen_business_ids=None,
+        issue_sample_size: Optional[int] = None,
+        issues_log: Optional[str] = None,
+    ):
+        """
+        Args:
+            seen_business_ids: Optional set-like store (``in`` / ``add``) for
+                business-id uniqueness; defaults to an in-memory set
+            issue_sample_size: Example details kept per issue type in the
+                report (default: ISSUE_SAMPLE_SIZE env var, or 100)
+            issues_log: Optional NDJSON file receiving every issue
+        """
+        if issue_sample_size is None:
+            issue_sample_size = _env_number("ISSUE_SAMPLE_SIZE", 100)
+        self.issues = IssueTracker(issue_sample_size, issues_log)
         self.stats = defaultdict(int)
         # Track business_ids we have already seen to guarantee uniqueness
-        self.seen_business_ids: Set[str] = set()
+        self.seen_business_ids: Set[str] = seen_business_ids if seen_business_ids is not None else set()
 
     @staticmethod
     def _normalize_schema(record: dict) -> dict:
@@ -514,15 +1741,10 @@ class DataQualityValidator:
 
         # 5) Franchise metadata (INDEPENDENT vs FRANCHISE)
         if "franchise" in cleaned and cleaned["franchise"] is not None:
-            raw = str(cleaned["franchise"]).strip().upper()
-            if raw in {"FRANCHISE", "CHAIN"}:
-                cleaned["franchise_type"] = "FRANCHISE"
-                cleaned["is_franchise"] = True
-            elif raw in {"INDEPENDENT", "LOCAL"}:
-                cleaned["franchise_type"] = "INDEPENDENT"
-                cleaned["is_franchise"] = False
-            else:
-                cleaned["franchise_type"] = raw or "UNKNOWN"
+            franchise_type, is_franchise = DataQualityValidator._franchise_type(cleaned["franchise"])
+            cleaned["franchise_type"] = franchise_type
+            if is_franchise is not None:
+                cleaned["is_franchise"] = is_franchise
 
         # 6) Rating normalisation
         if "avg_rating" in cleaned and cleaned["avg_rating"] is not None:
@@ -540,33 +1762,48 @@ class DataQualityValidator:
 
         return cleaned
 
-    def validate_record(self, record: dict, index: int) -> dict:
+    @staticmethod
+    def _franchise_type(franchise: Any) -> Tuple[str, Optional[bool]]:
+        """(franchise_type, is_franchise) for a raw franchise value; None leaves is_franchise as is."""
+        raw = str(franchise).strip().upper()
+        if raw in {"FRANCHISE", "CHAIN"}:
+            return "FRANCHISE", True
+        if raw in {"INDEPENDENT", "LOCAL"}:
+            return "INDEPENDENT", False
+        return raw or "UNKNOWN", None
+
+    @staticmethod
+    def _check_fields(record: dict, index: int) -> Tuple[dict, List[Tuple[str, Any]]]:
         """
-        Validate a single business record.
+        Record-local part of validation: everything except business_id
+        generation and uniqueness, which depend on the records before it.
+
+        Has no side effects, so it can run in worker processes.
 
         Args:
             record: Business record dictionary
             index: Record index for error reporting
 
         Returns:
-            Cleaned record
+            Tuple of (cleaned record, [(issue_type, detail), ...])
         """
-        cleaned = self._normalize_schema(record)
+        cleaned = DataQualityValidator._normalize_schema(record)
         record_id = f"record_{index}"
+        issues: List[Tuple[str, Any]] = []
 
         # Check for required fields
         required_fields = ["business_name", "category"]
         for field in required_fields:
             if not record.get(field):
-                self.issues["missing_required_fields"].append((record_id, field))
+                issues.append(("missing_required_fields", (record_id, field)))
 
         # Validate and clean business_name
         if "business_name" in cleaned:
             name = str(cleaned["business_name"]).strip()
             if not name:
-                self.issues["empty_business_name"].append(record_id)
+                issues.append(("empty_business_name", record_id))
             elif len(name) > 200:
-                self.issues["long_business_name"].append(record_id)
+                issues.append(("long_business_name", record_id))
                 cleaned["business_name"] = name[:200]
             else:
                 cleaned["business_name"] = name
@@ -575,7 +1812,7 @@ class DataQualityValidator:
         if "category" in cleaned:
             category = str(cleaned["category"]).strip()
             if not category:
-                self.issues["empty_category"].append(record_id)
+                issues.append(("empty_category", record_id))
                 cleaned["category"] = "Unknown"
             else:
                 cleaned["category"] = category
@@ -588,7 +1825,7 @@ class DataQualityValidator:
 
                 # California bounds check (roughly)
                 if not (32.5 <= lat <= 42.0 and -124.5 <= lon <= -114.0):
-                    self.issues["invalid_coordinates"].append(record_id)
+                    issues.append(("invalid_coordinates", record_id))
                     cleaned["has_valid_coordinates"] = False
                 else:
                     cleaned["has_valid_coordinates"] = True
@@ -597,7 +1834,7 @@ class DataQualityValidator:
                 cleaned["longitude"] = lon
 
             except (ValueError, TypeError):
-                self.issues["invalid_coordinates"].append(record_id)
+                issues.append(("invalid_coordinates", record_id))
                 cleaned["latitude"] = None
                 cleaned["longitude"] = None
                 cleaned["has_valid_coordinates"] = False
@@ -605,7 +1842,7 @@ class DataQualityValidator:
         # If lat/lon are missing but we have a WKT geom string, attempt recovery
         if (cleaned.get("latitude") is None or cleaned.get("longitude") is None) and cleaned.get("geom"):
             geom = str(cleaned["geom"])
-            match = re.search(r"POINT\s*\(([-\d\.]+)\s+([-\d\.]+)\)", geom)
+            match = _WKT_POINT_RE.search(geom)
             if match:
                 try:
                     lon = float(match.group(1))
@@ -615,22 +1852,28 @@ class DataQualityValidator:
                     if 32.5 <= lat <= 42.0 and -124.5 <= lon <= -114.0:
                         cleaned["has_valid_coordinates"] = True
                 except ValueError:
-                    self.issues["invalid_geom_coordinates"].append(record_id)
+                    issues.append(("invalid_geom_coordinates", record_id))
 
         # Clean phone numbers
         if "phone" in cleaned and cleaned["phone"]:
-            phone = re.sub(r"[^\d]", "", str(cleaned["phone"]))
+            phone = _NON_DIGIT_RE.sub("", str(cleaned["phone"]))
             cleaned["phone"] = phone if len(phone) == 10 else None
 
         # Clean zip codes
         if "zip_code" in cleaned and cleaned["zip_code"]:
             zip_code = str(cleaned["zip_code"]).strip()
-            if not re.match(r"^\d{5}(-\d{4})?$", zip_code):
-                self.issues["invalid_zip_code"].append(record_id)
+            if not _ZIP_CODE_RE.match(zip_code):
+                issues.append(("invalid_zip_code", record_id))
             else:
                 # Normalise to 5‑digit base ZIP for territory joins
                 cleaned["zip_code"] = zip_code[:5]
 
+        return cleaned, issues
+
+    def _assign_business_id(self, cleaned: dict, index: int, issues: List[Tuple[str, Any]]) -> None:
+        """Generate a missing business_id and enforce uniqueness, in record order."""
+        record_id = f"record_{index}"
+
         # Ensure unique identifiers exist for Neo4j nodes
         if "business_id" not in cleaned or not cleaned["business_id"]:
             # Generate from available data
@@ -639,28 +1882,232 @@ class DataQualityValidator:
         # Enforce uniqueness of business_id across the dataset
         bid = str(cleaned["business_id"])
         if bid in self.seen_business_ids:
-            self.issues["duplicate_business_id"].append((record_id, bid))
+            issues.append(("duplicate_business_id", (record_id, bid)))
             cleaned["business_id_original"] = bid
             bid = f"{bid}_{index}"
             cleaned["business_id"] = bid
         self.seen_business_ids.add(bid)
 
+    def _merge_checked(self, cleaned: dict, index: int, issues: List[Tuple[str, Any]]) -> dict:
+        """Finish a record from ``_check_fields``: assign its id, then log its issues."""
+        self._assign_business_id(cleaned, index, issues)
+        for issue_type, detail in issues:
+            self.issues.add(issue_type, detail)
         return cleaned
 
+    def validate_record(self, record: dict, index: int) -> dict:
+        """
+        Validate a single business record.
+
+        Args:
+            record: Business record dictionary
+            index: Record index for error reporting
+
+        Returns:
+            Cleaned record
+        """
+        cleaned, issues = self._check_fields(record, index)
+        return self._merge_checked(cleaned, index, issues)
+
+    def validate_records_parallel(
+        self,
+        records: List[dict],
+        start_index: int = 0,
+        workers: Optional[int] = None,
+        shard_size: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Validate ``records`` across a process pool.
+
+        Shards are checked independently with ``_check_fields``; the merge
+        then walks the results in input order, generating missing ids,
+        applying the ``<business_id>_<index>`` duplicate rule against
+        ``seen_business_ids`` and appending issues. Cleaned records and the
+        issue report are therefore identical to calling ``validate_record``
+        on each record in turn.
+
+        To keep inter-process traffic small, workers inherit ``records``
+        through fork where the platform supports it, and send back only the
+        fields ``_check_fields`` added or changed.
+
+        Args:
+            records: Raw business records
+            start_index: Index of ``records[0]`` in the full dataset
+            workers: Pool size (default: CPU count)
+            shard_size: Records per task (default: ~4 tasks per worker)
+
+        Returns:
+            Cleaned records in input order
+        """
+        global _SHARED_RECORDS
+
+        if not records:
+            return []
+
+        workers = workers or os.cpu_count() or 1
+        if shard_size is None:
+            shard_size = max(1, -(-len(records) // (workers * 4)))
+
+        fork_context = (
+            multiprocessing.get_context("fork")
+            if "fork" in multiprocessing.get_all_start_methods()
+            else None
+        )
+        tasks = [
+            (
+                offset,
+                start_index + offset,
+                None if fork_context else records[offset : offset + shard_size],
+                shard_size,
+            )
+            for offset in range(0, len(records), shard_size)
+        ]
+
+        cleaned_records: List[dict] = []
+        _SHARED_RECORDS = records if fork_context else None
+        # Unpickling shard results allocates millions of acyclic objects;
+        # pausing the cyclic GC avoids repeated full-heap collections
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, mp_context=fork_context
+            ) as pool:
+                for (offset, shard_index, _, _), checked in zip(tasks, pool.map(_check_shard, tasks)):
+                    for position, (changes, issues) in enumerate(checked):
+                        cleaned = records[offset + position].copy()
+                        cleaned.update(changes)
+                        cleaned_records.append(
+                            self._merge_checked(cleaned, shard_index + position, issues)
+                        )
+        finally:
+            _SHARED_RECORDS = None
+            if gc_was_enabled:
+                gc.enable()
+
+        return cleaned_records
+
     def generate_report(self) -> dict:
         """
         Generate data quality report.
 
+        Counts are exact; ``detailed_issues`` holds a sample of at most
+        ``issue_sample_size`` details per type (see ``IssueTracker``).
+
         Returns:
             Dictionary with quality metrics
         """
-        total_issues = sum(len(issues) for issues in self.issues.values())
-
-        return {
-            "total_issues": total_issues,
-            "issues_by_type": {k: len(v) for k, v in self.issues.items()},
-            "detailed_issues": dict(self.issues)
+        report = {
+            "total_issues": self.issues.total,
+            "issues_by_type": dict(self.issues.counts),
+            "issue_sample_size": self.issues.sample_size,
+            "detailed_issues": self.issues.samples()
         }
+        if self.issues.log_path:
+            report["issues_log"] = self.issues.log_path
+        return report
+
+    def close(self) -> None:
+        """Close the issues log, if any."""
+        self.issues.close()
+
+
+# Records inherited by forked validation workers (see validate_records_parallel)
+_SHARED_RECORDS: Optional[List[dict]] = None
+
+
+def _check_shard(
+    task: Tuple[int, int, Optional[List[dict]], int]
+) -> List[Tuple[Dict[str, Any], List[Tuple[str, Any]]]]:
+    """
+    Process-pool task: run ``DataQualityValidator._check_fields`` over a shard.
+
+    ``task`` is (offset, first record index, records or None, shard size);
+    with None the shard is read from the fork-inherited ``_SHARED_RECORDS``.
+    Returns, per record, the fields that differ from the raw record (in the
+    cleaned record's key order) and the record's issues.
+    """
+    offset, first_index, records, size = task
+    if records is None:
+        records = _SHARED_RECORDS[offset : offset + size]
+
+    results = []
+    for position, record in enumerate(records):
+        cleaned, issues = DataQualityValidator._check_fields(record, first_index + position)
+        changes = {}
+        for key, value in cleaned.items():
+            # Compare types too: 33 -> 33.0 must survive the round trip
+            if key not in record or type(record[key]) is not type(value) or record[key] != value:
+                changes[key] = value
+        results.append((changes, issues))
+    return results
+
+
+def _iter_validated(
+    validator: "DataQualityValidator",
+    records: Iterable[dict],
+    workers: int = 1,
+    chunk_records: int = 200000,
+) -> Iterator[dict]:
+    """
+    Validate a record stream in order, serially or with a process pool.
+
+    With ``workers > 1`` records are buffered ``chunk_records`` at a time and
+    each chunk is sharded across a pool.
+    """
+    if workers <= 1:
+        for index, record in enumerate(records):
+            yield validator.validate_record(record, index)
+        return
+
+    chunk: List[dict] = []
+    start = 0
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_records:
+            yield from validator.validate_records_parallel(chunk, start, workers=workers)
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield from validator.validate_records_parallel(chunk, start, workers=workers)
+
+
+# Fields kept in the slim planner-friendly output
+SLIM_FIELDS = [
+    # Identity / location
+    "business_id",
+    "business_name",
+    "address",
+    "city",
+    "zip_code",
+    "blockgroup",
+    "latitude",
+    "longitude",
+    "has_valid_coordinates",
+    # Franchise metadata
+    "franchise",
+    "franchise_type",
+    "is_franchise",
+    "confidence",
+    "reasoning",
+    # Categories
+    "categories_raw",
+    "category_original",
+    "category_sector",
+    "category_subsector",
+    "category_confidence",
+    "category_method",
+    # Quality / scoring
+    "avg_rating",
+    # Optional link for UI
+    "url",
+]
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+# Phases reported through the ``timings`` argument of process_data and
+# process_data_streaming, in pipeline order
+PIPELINE_PHASES = ("loading", "validation", "classification", "attach", "serialization")
 
 
 def load_data(file_path: str) -> List[dict]:
@@ -697,6 +2144,1042 @@ def load_data(file_path: str) -> List[dict]:
         return []
 
 
+def iter_records(file_path: str, chunk_size: int = 1 << 20) -> Iterator[dict]:
+    """
+    Stream business records from a JSON array or NDJSON file.
+
+    NDJSON is used for ``.ndjson``/``.jsonl`` files; otherwise the file must
+    be a top-level JSON array (or a ``{"businesses": [...]}`` object), which
+    is decoded one element at a time so only ``chunk_size`` characters plus
+    the current record are held in memory.
+
+    Args:
+        file_path: Path to JSON array or NDJSON file
+        chunk_size: Characters read per refill of the parse buffer
+
+    Yields:
+        Business records
+    """
+    if Path(file_path).suffix.lower() in NDJSON_SUFFIXES:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid NDJSON at {file_path}:{line_num}: {e}") from e
+        return
+
+    decoder = json.JSONDecoder()
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        buf = f.read(chunk_size)
+        pos = 0
+        eof = not buf
+
+        def skip(chars: str) -> None:
+            # Advance past whitespace/separators, refilling as needed
+            nonlocal buf, pos, eof
+            while True:
+                while pos < len(buf) and (buf[pos].isspace() or buf[pos] in chars):
+                    pos += 1
+                if pos < len(buf) or eof:
+                    return
+                buf, pos = f.read(chunk_size), 0
+                eof = not buf
+
+        def decode() -> Any:
+            # Decode the JSON value at ``pos``, refilling until it is complete
+            nonlocal buf, pos, eof
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                    # A scalar ending exactly at the buffer edge may be incomplete
+                    complete = end < len(buf) or eof
+                except json.JSONDecodeError:
+                    complete = False
+                if complete:
+                    pos = end
+                    return value
+                if eof:
+                    raise ValueError(f"Truncated JSON record in {file_path}")
+                more = f.read(chunk_size)
+                eof = not more
+                buf = buf[pos:] + more
+                pos = 0
+
+        skip("")
+        if buf[pos:pos + 1] == "{":
+            # Wrapped export: {"businesses": [...]} -- walk the top-level
+            # keys, decoding (and dropping) the values that come before it
+            pos += 1
+            while True:
+                skip(",")
+                if buf[pos:pos + 1] != '"':
+                    raise ValueError(f"Unexpected JSON structure in {file_path}: no top-level \"businesses\" key")
+                key = decode()
+                skip("")
+                if buf[pos:pos + 1] != ":":
+                    raise ValueError(f"Unexpected JSON structure in {file_path}")
+                pos += 1
+                skip("")
+                if key == "businesses":
+                    break
+                decode()
+
+        if buf[pos:pos + 1] != "[":
+            raise ValueError(f"Expected a JSON array of records in {file_path}")
+        pos += 1
+
+        while True:
+            skip(",")
+            if pos >= len(buf):
+                raise ValueError(f"Unterminated JSON array in {file_path}")
+            if buf[pos] == "]":
+                return
+
+            yield decode()
+
+            # Drop consumed text once it dominates the buffer
+            if pos > chunk_size:
+                buf, pos = buf[pos:], 0
+
+
+# ---------------------------------------------------------------------------
+# Columnar backend (--columnar)
+# ---------------------------------------------------------------------------
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+# Raw fields DataQualityValidator reads
+VALIDATED_FIELDS = (
+    "business_name", "name", "category", "categories", "zip_code", "zip", "business_id", "id",
+    "franchise", "avg_rating", "blockgroup", "latitude", "longitude", "geom", "phone",
+)
+
+# Fields the columnar pipeline loads: those validation reads plus the rest
+# of the slim output, except what _attach_classification overwrites
+COLUMNAR_FIELDS = tuple(
+    dict.fromkeys(
+        VALIDATED_FIELDS
+        + tuple(field for field in SLIM_FIELDS if not field.startswith("category_"))
+    )
+)
+
+# Fields _check_fields may set or change
+CHECKED_FIELDS = (
+    "business_name", "category", "categories_raw", "zip_code", "business_id", "franchise_type",
+    "is_franchise", "avg_rating", "blockgroup", "latitude", "longitude", "has_valid_coordinates", "phone",
+)
+
+# _WKT_POINT_RE for ASCII text, in RE2 syntax: Python's \s also matches
+# the \x1c-\x1f separators
+_WKT_POINT_PATTERN = (
+    r"POINT[\x09-\x0d\x1c-\x20]*\((?P<lon>[-0-9.]+)[\x09-\x0d\x1c-\x20]+(?P<lat>[-0-9.]+)\)"
+)
+# What float() accepts among strings of [-0-9.]
+_FLOAT_TEXT_PATTERN = r"^-?([0-9]+\.?[0-9]*|\.[0-9]+)$"
+
+# Rank of the duplicate-id issue among one record's issues: always last
+_DUPLICATE_ISSUE_RANK = 1 << 20
+
+_MISSING = object()
+
+
+def _objects(values: Sequence[Any]) -> "np.ndarray":
+    # fromiter never nests list values the way np.array() would
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _is_text(arrow_type) -> bool:
+    return pa.types.is_string(arrow_type)
+
+
+def _is_number(arrow_type) -> bool:
+    return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+
+
+def _is_text_list(arrow_type) -> bool:
+    return pa.types.is_list(arrow_type) and (
+        pa.types.is_string(arrow_type.value_type) or pa.types.is_null(arrow_type.value_type)
+    )
+
+
+def _exact_type(arrow_type, kinds: Set[type]) -> bool:
+    """Whether Python values of ``kinds`` convert to ``arrow_type`` and back unchanged."""
+    if pa.types.is_null(arrow_type):
+        return not kinds
+    if pa.types.is_string(arrow_type):
+        return kinds == {str}
+    if pa.types.is_boolean(arrow_type):
+        return kinds == {bool}
+    if pa.types.is_int64(arrow_type):
+        return kinds == {int}
+    if pa.types.is_float64(arrow_type):
+        return kinds == {float}
+    if _is_text_list(arrow_type):
+        return kinds == {list}
+    return False
+
+
+def _text_lists(values: Iterable[Any]) -> bool:
+    return all(type(item) is str or item is None for value in values for item in value)
+
+
+def _arrow_values(values: "np.ndarray") -> Tuple["pa.Array", Dict[int, Any]]:
+    """
+    Python values (None for null) as a typed Arrow array, plus the values
+    that do not fit its type by position.
+
+    With mixed types the array takes the most common one. Only str, bool,
+    int, float and lists of str are typed; anything else stays a Python
+    value.
+    """
+    kinds = set(map(type, values))
+    kinds.discard(type(None))
+    try:
+        array = pa.array(values)
+        exact = _exact_type(array.type, kinds)
+        if exact and kinds == {list}:
+            exact = _text_lists(values[values != None])  # noqa: E711 - elementwise
+    except (pa.ArrowException, OverflowError):
+        exact = False
+    if exact:
+        return array, {}
+
+    kinds = np.fromiter(map(type, values), dtype=object, count=len(values))
+    given = kinds != type(None)
+    counts = Counter(kinds[given].tolist())
+    keep = kinds == counts.most_common(1)[0][0]
+    if counts.most_common(1)[0][0] is list:
+        keep[keep] = [_text_lists([value]) for value in values[keep]]
+    kept = np.where(keep, values, None)
+    try:
+        array = pa.array(kept)
+        exact = _exact_type(array.type, set(kinds[keep].tolist()))
+    except (pa.ArrowException, OverflowError):
+        exact = False
+    if not exact:
+        array, keep = pa.nulls(len(values)), np.zeros(len(values), dtype=bool)
+    return array, {row: values[row] for row in np.flatnonzero(given & ~keep).tolist()}
+
+
+def _plain_array(array: "pa.Array") -> "pa.Array":
+    """Decode dictionaries and narrow large string/list types, as the kernels below expect."""
+    if pa.types.is_dictionary(array.type):
+        array = array.dictionary_decode()
+    if pa.types.is_large_string(array.type):
+        array = array.cast(pa.string())
+    if pa.types.is_large_list(array.type) or pa.types.is_list(array.type):
+        value_type = array.type.value_type
+        if pa.types.is_large_string(value_type):
+            value_type = pa.string()
+        array = array.cast(pa.list_(value_type))
+    return array
+
+
+def _bits(bitmap: "pa.Buffer", offset: int, length: int) -> "np.ndarray":
+    """Bits ``offset`` to ``offset + length`` of an Arrow bitmap as a NumPy mask."""
+    bits = np.unpackbits(np.frombuffer(bitmap, dtype=np.uint8), count=offset + length, bitorder="little")
+    return bits[offset:].view(bool)
+
+
+def _valid(array: "pa.Array") -> "np.ndarray":
+    if not array.null_count:
+        return np.ones(len(array), dtype=bool)
+    validity = array.buffers()[0]
+    if validity is None:
+        return np.zeros(len(array), dtype=bool)
+    return _bits(validity, array.offset, len(array))
+
+
+def _mask(array: "pa.Array") -> "np.ndarray":
+    """A boolean Arrow array as a NumPy mask, null as False."""
+    data = array.buffers()[1]
+    if data is None:
+        return np.zeros(len(array), dtype=bool)
+    return _bits(data, array.offset, len(array)) & _valid(array)
+
+
+def _replace(array: "pa.Array", mask: "np.ndarray", values: "pa.Array") -> "pa.Array":
+    """
+    ``array`` with its ``mask`` rows set to ``values``: either one value per
+    ``mask`` row, in order, or one per row of ``array``.
+    """
+    if not mask.any():
+        return array
+    dense = len(values) == len(array)
+    if pa.types.is_nested(array.type):
+        # No replace_with_mask or if_else kernels for these: take from both
+        indices = np.arange(len(array))
+        indices[mask] = len(array) + (np.flatnonzero(mask) if dense else np.arange(len(values)))
+        return pa.concat_arrays([array, values]).take(pa.array(indices))
+    if dense:
+        return pc.if_else(pa.array(mask), values, array)
+    if not pa.types.is_primitive(array.type):
+        # replace_with_mask is slower than a take for strings
+        indices = np.arange(len(array))
+        indices[mask] = len(array) + np.arange(len(values))
+        return pa.concat_arrays([array, values]).take(pa.array(indices))
+    return pc.replace_with_mask(array, pa.array(mask), values)
+
+
+def _repeat(value: str, count: int) -> "pa.Array":
+    """A string array of ``count`` times ``value``."""
+    return pa.array([value], pa.string()).take(pa.array(np.zeros(count, dtype=np.int64)))
+
+
+def _nulled(array: "pa.Array", mask: "np.ndarray") -> "pa.Array":
+    """``array`` with its ``mask`` rows set to null."""
+    if not mask.any():
+        return array
+    if array.offset or pa.types.is_nested(array.type) or pa.types.is_null(array.type):
+        return pc.if_else(pa.array(mask), pa.scalar(None, array.type), array)
+    # Only the validity bitmap changes
+    validity = pa.array(_valid(array) & ~mask).buffers()[1]
+    return pa.Array.from_buffers(array.type, len(array), [validity, *array.buffers()[1:]])
+
+
+def _nonempty(array: "pa.Array") -> "np.ndarray":
+    """Mask of the non-null, non-empty strings, from the offsets buffer."""
+    offsets = array.buffers()[1]
+    if offsets is None:
+        return np.zeros(len(array), dtype=bool)
+    offsets = np.frombuffer(offsets, dtype=np.int32)[array.offset : array.offset + len(array) + 1]
+    return (np.diff(offsets) > 0) & _valid(array)
+
+
+def _ascii_digits(array: "pa.Array") -> Tuple["pa.Array", "np.ndarray"]:
+    """
+    ``replace_substring_regex(array, "[^0-9]", "")`` for ASCII strings, and
+    the digit count of each, computed on the string bytes directly.
+    """
+    validity, offsets, data = array.buffers()
+    if data is None:
+        digits = pc.replace_substring_regex(array, "[^0-9]", "")
+        return digits, pc.fill_null(pc.utf8_length(digits), 0).to_numpy(zero_copy_only=False)
+    if array.offset and validity is not None:
+        validity = pa.array(_valid(array)).buffers()[1]
+    offsets = np.frombuffer(offsets, dtype=np.int32)[array.offset : array.offset + len(array) + 1]
+    data = np.frombuffer(data, dtype=np.uint8)[offsets[0] : offsets[-1]]
+    is_digit = (data - np.uint8(ord("0"))) < 10
+    starts = offsets[:-1] - offsets[0]
+    filled = np.diff(offsets) > 0
+    counts = np.zeros(len(array), dtype=np.int32)
+    if filled.any():
+        counts[filled] = np.add.reduceat(is_digit.view(np.uint8), starts[filled], dtype=np.int32)
+    digit_offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int32)
+    digits = pa.Array.from_buffers(
+        pa.string(),
+        len(array),
+        [validity, pa.py_buffer(digit_offsets), pa.py_buffer(data[is_digit])],
+        null_count=array.null_count,
+    )
+    return digits, counts
+
+
+def _zip_code_mask(array: "pa.Array") -> "np.ndarray":
+    """``_ZIP_CODE_RE`` matches for ASCII strings, checked on the string bytes directly."""
+    offsets, data = array.buffers()[1:]
+    if data is None:
+        return np.zeros(len(array), dtype=bool)
+    offsets = np.frombuffer(offsets, dtype=np.int32)[array.offset : array.offset + len(array) + 1]
+    # Padded so that short strings at the end can be read past
+    data = np.concatenate((np.frombuffer(data, dtype=np.uint8), np.zeros(10, dtype=np.uint8)))
+    starts = offsets[:-1]
+    lengths = np.diff(offsets)
+    extended = lengths == 10
+    matches = ((lengths == 5) | extended) & _valid(array)
+    for position in range(10):
+        byte = data[starts + position]
+        if position < 5:
+            matches &= (byte - np.uint8(ord("0"))) < 10
+        elif position == 5:
+            matches &= ~extended | (byte == ord("-"))
+        else:
+            matches &= ~extended | ((byte - np.uint8(ord("0"))) < 10)
+    return matches
+
+
+def _in_california(lat: "pa.Array", lon: "pa.Array") -> "np.ndarray":
+    """The validator's California bounds check, null as False."""
+    return _mask(
+        pc.and_(
+            pc.and_(pc.greater_equal(lat, 32.5), pc.less_equal(lat, 42.0)),
+            pc.and_(pc.greater_equal(lon, -124.5), pc.less_equal(lon, -114.0)),
+        )
+    )
+
+
+def _parse_points(lon_text: "pa.Array", lat_text: "pa.Array") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Coordinates from WKT point number texts: parsed in bulk by shapely, else by an Arrow cast."""
+    if SHAPELY_AVAILABLE:
+        wkt = pc.binary_join_element_wise("POINT (", lon_text, " ", lat_text, ")", "")
+        points = shapely.from_wkt(wkt.to_numpy(zero_copy_only=False))
+        return shapely.get_x(points), shapely.get_y(points)
+    return (
+        pc.cast(lon_text, pa.float64()).to_numpy(zero_copy_only=False),
+        pc.cast(lat_text, pa.float64()).to_numpy(zero_copy_only=False),
+    )
+
+
+class RecordColumns:
+    """
+    Business records as one column per field, for the columnar backend.
+
+    Each field is a typed Arrow array, null where a record lacks the field
+    or holds None; ``present`` tells the two apart, as the validator does
+    (``"latitude": null`` is not a missing latitude). Values that do not
+    fit the column type (a string among numbers, a dict) are kept as
+    Python objects in ``odd``, by row.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.arrays: Dict[str, "pa.Array"] = {}
+        self.present: Dict[str, "np.ndarray"] = {}
+        self.odd: Dict[str, Dict[int, Any]] = {}
+
+    @classmethod
+    def from_records(cls, records: List[dict], fields: Sequence[str] = COLUMNAR_FIELDS) -> "RecordColumns":
+        """Columns of those ``fields`` any record has."""
+        columns = cls(len(records))
+        for field in fields:
+            values = _objects([record.get(field, _MISSING) for record in records])
+            present = values != _MISSING
+            if not present.any():
+                continue
+            values[~present] = None
+            array, odd = _arrow_values(values)
+            columns.set(field, array, present, odd)
+        return columns
+
+    @classmethod
+    def from_table(cls, table: "pa.Table", fields: Sequence[str] = COLUMNAR_FIELDS) -> "RecordColumns":
+        """
+        Columns of those ``fields`` an Arrow table has. Parquet/Arrow cannot
+        tell a missing field from a null one, so nulls count as missing.
+        """
+        columns = cls(table.num_rows)
+        for field in fields:
+            if field in table.column_names:
+                array = _plain_array(table.column(field).combine_chunks())
+                present = _valid(array)
+                if present.any():
+                    columns.set(field, array, present)
+        return columns
+
+    def set(self, field: str, array: "pa.Array", present: "np.ndarray", odd: Optional[Dict[int, Any]] = None) -> None:
+        self.arrays[field] = array
+        self.present[field] = present
+        self.odd[field] = odd if odd is not None else {}
+
+    def has(self, field: str) -> "np.ndarray":
+        """Mask of the records that have ``field`` (a copy)."""
+        present = self.present.get(field)
+        return present.copy() if present is not None else np.zeros(self.size, dtype=bool)
+
+    def records(self, rows: Sequence[int], fields: Optional[Sequence[str]] = None) -> List[dict]:
+        """Records ``rows`` as dicts of the fields each has (of ``fields``, if given)."""
+        indices = pa.array(rows, pa.int64())
+        columns = []
+        for field in self.arrays if fields is None else [field for field in fields if field in self.arrays]:
+            array = self.arrays[field]
+            values = array.take(indices).to_pylist()
+            odd = self.odd[field]
+            if odd:
+                for position, row in enumerate(rows):
+                    if row in odd:
+                        values[position] = odd[row]
+            columns.append((field, values, self.present[field][rows].tolist()))
+        return [
+            {field: values[position] for field, values, present in columns if present[position]}
+            for position in range(len(rows))
+        ]
+
+    def values(self, field: str) -> List[Any]:
+        """Python values of ``field``, ``_MISSING`` where a record lacks it."""
+        values = self.arrays[field].to_pylist()
+        for row, value in self.odd[field].items():
+            values[row] = value
+        for row in np.flatnonzero(~self.present[field]).tolist():
+            values[row] = _MISSING
+        return values
+
+    def patch(self, field: str, rows: Sequence[int], values: Sequence[Any]) -> None:
+        """Set ``field`` at ``rows`` (ascending) to Python ``values`` (``_MISSING`` drops it)."""
+        if field not in self.arrays:
+            self.set(field, pa.nulls(self.size), np.zeros(self.size, dtype=bool))
+        array = self.arrays[field]
+        present = self.present[field].copy()
+        odd = self.odd[field]
+        if pa.types.is_null(array.type):
+            # Type the column after the new values, if they share a type
+            given = _objects([value for value in values if value is not None and value is not _MISSING])
+            if len(given):
+                array = array.cast(_arrow_values(given)[0].type)
+
+        fits = {kind for kind in (str, bool, int, float, list) if _exact_type(array.type, {kind})}
+        replacements: List[Any] = []
+        for row, value in zip(rows, values):
+            odd.pop(row, None)
+            present[row] = value is not _MISSING
+            kind = type(value)
+            if kind in fits and (kind is not list or _text_lists([value])):
+                replacements.append(value)
+                continue
+            if value is not _MISSING and value is not None:
+                odd[row] = value
+            replacements.append(None)
+
+        if not pa.types.is_null(array.type):
+            touched = np.zeros(self.size, dtype=bool)
+            touched[np.asarray(rows, dtype=np.int64)] = True
+            array = _replace(array, touched, pa.array(replacements, type=array.type))
+        self.arrays[field] = array
+        self.present[field] = present
+
+    def overlay(self, field: str, rows: "np.ndarray", values: "pa.Array") -> None:
+        """Set ``field`` at the ``rows`` mask to ``values`` (see ``_replace``)."""
+        dense = len(values) == self.size
+        if field not in self.arrays:
+            self.set(field, values if dense else _replace(pa.nulls(self.size, values.type), rows, values), rows.copy())
+            return
+        base = self.arrays[field]
+        odd = self.odd[field]
+        for row in [row for row in odd if rows[row]]:
+            del odd[row]
+        if dense and not odd and not (~rows & _valid(base)).any():
+            # Nothing outside ``rows`` but nulls to keep
+            self.arrays[field] = _nulled(values, ~rows)
+            self.present[field] = self.present[field] | rows
+            return
+        if base.type != values.type and not pa.types.is_null(base.type):
+            # Other rows keep their values, as Python objects
+            keep = ~rows & _valid(base)
+            for row, value in zip(np.flatnonzero(keep).tolist(), base.filter(pa.array(keep)).to_pylist()):
+                odd[row] = value
+            base = pa.nulls(self.size, values.type)
+        self.arrays[field] = _replace(base.cast(values.type), rows, values)
+        self.present[field] = self.present[field] | rows
+
+    def to_records(self, fields: Sequence[str]) -> List[dict]:
+        """Record dicts with ``fields`` in that order, leaving out those a record lacks."""
+        names = [field for field in fields if field in self.arrays]
+        if not names:
+            return [{} for _ in range(self.size)]
+        columns = [self.values(field) for field in names]
+        return [
+            {name: value for name, value in zip(names, row) if value is not _MISSING}
+            for row in zip(*columns)
+        ]
+
+    def to_table(self, fields: Sequence[str]) -> "pa.Table":
+        """
+        Arrow table of ``fields``, missing values as nulls. A column whose
+        values share no Arrow type is stored as JSON text, with
+        ``{"encoding": "json"}`` field metadata.
+        """
+        arrays = []
+        schema = []
+        for field in fields:
+            if field not in self.arrays:
+                continue
+            if not self.odd[field]:
+                array = pc.if_else(pa.array(self.present[field]), self.arrays[field], pa.nulls(self.size, self.arrays[field].type))
+                schema.append(pa.field(field, array.type))
+            else:
+                values = _objects([None if value is _MISSING else value for value in self.values(field)])
+                array, odd = _arrow_values(values)
+                if odd:
+                    array = pa.array(
+                        [None if value is None else json.dumps(value, ensure_ascii=False) for value in values],
+                        pa.string(),
+                    )
+                    schema.append(pa.field(field, pa.string(), metadata={b"encoding": b"json"}))
+                else:
+                    schema.append(pa.field(field, array.type))
+            arrays.append(array)
+        return pa.Table.from_arrays(arrays, schema=pa.schema(schema))
+
+
+class ColumnarDataQualityValidator(DataQualityValidator):
+    """
+    ``DataQualityValidator`` over ``RecordColumns``: each rule of
+    ``_normalize_schema`` and ``_check_fields`` runs once per column as an
+    Arrow/NumPy kernel, WKT points are parsed in bulk by shapely and the
+    duplicate-id rule runs on a dictionary encoding of the id column.
+
+    Records the kernels do not cover exactly -- values of an unexpected
+    type, non-ASCII text where Python's Unicode ``\\d``/``\\s`` differ from
+    the kernels' ASCII classes, a latitude without a longitude -- go
+    through ``_check_fields`` one at a time. Cleaned fields and the issue
+    report match ``validate_record`` on every record.
+    """
+
+    def __init__(self, issue_sample_size: Optional[int] = None, issues_log: Optional[str] = None):
+        super().__init__(issue_sample_size=issue_sample_size, issues_log=issues_log)
+        # Ids of earlier validate_columns calls not yet in seen_business_ids,
+        # as (ids, renamed rows, their new ids)
+        self._batch_ids: List[Tuple["pa.Array", "np.ndarray", "pa.Array"]] = []
+
+    def validate_columns(self, columns: RecordColumns, start_index: int = 0) -> RecordColumns:
+        """
+        Validate records given as columns.
+
+        Args:
+            columns: Raw records (see ``RecordColumns``)
+            start_index: Index of the first record in the full dataset
+
+        Returns:
+            Cleaned records as columns
+        """
+        # The kernels allocate few Python objects, but enough to set off
+        # full-heap collections over whatever the caller holds
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self._validate_columns(columns, start_index)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def _validate_columns(self, columns: RecordColumns, start_index: int) -> RecordColumns:
+        size = columns.size
+        string = pa.string()
+        fallback = np.zeros(size, dtype=bool)
+        cleaned = RecordColumns(size)
+        for field in columns.arrays:
+            cleaned.set(field, columns.arrays[field], columns.present[field], dict(columns.odd[field]))
+
+        def column(field: str, *kinds: Callable[[Any], bool]) -> Optional["pa.Array"]:
+            # The field if its type is one of ``kinds``; values the kernels
+            # cannot take send their records to the fallback
+            array = columns.arrays.get(field)
+            if array is None:
+                return None
+            if columns.odd[field]:
+                fallback[list(columns.odd[field])] = True
+            if pa.types.is_null(array.type):
+                return None
+            if not any(kind(array.type) for kind in kinds):
+                fallback[_valid(array)] = True
+                return None
+            return array
+
+        def number(field: str, convertible: "np.ndarray") -> Tuple[Optional["pa.Array"], "np.ndarray"]:
+            # The field as float64, and the mask of its values the row rules
+            # pass to float() one by one, which happens here too
+            array = columns.arrays.get(field)
+            converted = np.zeros(size, dtype=bool)
+            if array is None or not (pa.types.is_null(array.type) or _is_number(array.type)):
+                return column(field, _is_number), converted
+            values = pc.cast(array, pa.float64(), safe=False)
+            floats: List[Optional[float]] = []
+            for row, value in sorted(columns.odd[field].items()):
+                if not convertible[row]:
+                    fallback[row] = True
+                    continue
+                try:
+                    floats.append(float(value))
+                except (TypeError, ValueError):
+                    floats.append(None)
+                except OverflowError:
+                    fallback[row] = True
+                    continue
+                converted[row] = True
+            return _replace(values, converted, pa.array(floats, pa.float64())), converted
+
+        def text(array: Optional["pa.Array"]) -> "pa.Array":
+            return array if array is not None else pa.nulls(size, string)
+
+        def select(array: "pa.Array", mask: "np.ndarray") -> "pa.Array":
+            return array.filter(pa.array(mask))
+
+        # Arrays below hold garbage for records that lack the field; only
+        # ``present`` says which values count
+
+        # _normalize_schema, step by step
+        name = text(column("business_name", _is_text))
+        alias = text(column("name", _is_text))
+        name_given = _nonempty(name)
+        from_alias = ~columns.has("business_name") & _nonempty(alias)
+        name_value = pc.if_else(pa.array(from_alias), alias, name) if from_alias.any() else name
+        has_name = columns.has("business_name") | from_alias
+
+        category = text(column("category", _is_text))
+        category_given = _nonempty(category)
+        category_value = category
+        has_category = columns.has("category")
+        categories = column("categories", _is_text_list, _is_text)
+        if categories is not None and _is_text(categories.type):
+            stripped = pc.utf8_trim_whitespace(categories)
+            from_text = ~has_category & _nonempty(stripped)
+            category_value = _replace(category_value, from_text, stripped)
+            has_category |= from_text
+        elif categories is not None:
+            offsets = categories.offsets.to_numpy()
+            from_list = ~has_category & _valid(categories) & (offsets[1:] > offsets[:-1])
+            if from_list.any():
+                # Rows with no first element take any, as they are not used
+                starts = np.minimum(offsets[:-1], len(categories.values) - 1)
+                first = categories.values.take(pa.array(starts)).cast(string)
+                primary = pc.utf8_trim_whitespace(pc.fill_null(first, "None"))
+                blank = ~_nonempty(primary)
+                primary = _replace(primary, blank, _repeat("Unknown", int(blank.sum())))
+                category_value = _replace(category_value, from_list, primary)
+                has_category |= from_list
+                if "categories_raw" in cleaned.arrays:
+                    cleaned.overlay("categories_raw", from_list, select(categories, from_list))
+                else:
+                    cleaned.set("categories_raw", categories, from_list)
+
+        zip_value = text(column("zip_code", _is_text))
+        zip_alias = column("zip", _is_text, pa.types.is_integer)
+        has_zip = columns.has("zip_code")
+        if zip_alias is not None:
+            from_zip = ~has_zip & _valid(zip_alias)
+            derived = zip_alias.cast(string)
+            if _is_text(zip_alias.type):
+                derived = pc.utf8_trim_whitespace(derived)
+            zip_value = _replace(zip_value, from_zip, derived)
+            has_zip |= from_zip
+
+        id_value = text(column("business_id", _is_text))
+        source_id = column("id", _is_text, pa.types.is_integer)
+        has_id = columns.has("business_id")
+        if source_id is not None:
+            from_source = ~_nonempty(id_value) & _valid(source_id)
+            derived = pc.binary_replace_slice(source_id.cast(string), 0, 0, "ca_biz_")
+            id_value = _replace(id_value, from_source, derived)
+            has_id |= from_source
+
+        franchise = column("franchise", _is_text)
+        if franchise is not None:
+            # The rule runs once per distinct franchise value
+            encoded = pc.dictionary_encode(franchise)
+            kinds = [self._franchise_type(value) for value in encoded.dictionary.to_pylist()]
+            franchise_type = pa.array([kind for kind, _ in kinds], string).take(encoded.indices)
+            is_franchise = pa.array([flag for _, flag in kinds], pa.bool_()).take(encoded.indices)
+            cleaned.overlay("franchise_type", _valid(franchise), franchise_type)
+            cleaned.overlay("is_franchise", _valid(is_franchise), is_franchise)
+
+        rating, converted = number("avg_rating", np.ones(size, dtype=bool))
+        if rating is not None:
+            in_range = _mask(pc.and_(pc.greater_equal(rating, 0.0), pc.less_equal(rating, 5.0)))
+            cleaned.overlay("avg_rating", _valid(rating) | converted, _nulled(rating, ~in_range))
+
+        blockgroup = column("blockgroup", _is_text, pa.types.is_integer)
+        if blockgroup is not None:
+            if _is_text(blockgroup.type):
+                fallback |= _valid(blockgroup) & ~_mask(pc.string_is_ascii(blockgroup))
+                blockgroup_text = pc.utf8_trim_whitespace(blockgroup)
+                digits = _mask(pc.match_substring_regex(blockgroup_text, "^[0-9]+$"))
+            else:
+                negative = _mask(pc.less(blockgroup, 0))
+                fallback |= negative
+                blockgroup_text = blockgroup
+                digits = _valid(blockgroup) & ~negative
+            padded = pc.utf8_lpad(blockgroup_text.cast(string), width=6, padding="0")
+            cleaned.overlay("blockgroup", digits, padded)
+
+        # _check_fields: names and categories
+        name_text = pc.utf8_trim_whitespace(pc.fill_null(name_value, "None"))
+        empty_name = has_name & ~_nonempty(name_text)
+        # A name has at least as many bytes as characters
+        long_name = has_name & (pc.binary_length(name_text).to_numpy(zero_copy_only=False) > 200)
+        if long_name.any():
+            long_name[long_name] = pc.utf8_length(select(name_text, long_name)).to_numpy(zero_copy_only=False) > 200
+        clean_name = _replace(name_text, empty_name, select(name_value, empty_name))
+        clean_name = _replace(clean_name, long_name, pc.utf8_slice_codeunits(select(name_text, long_name), 0, 200))
+        cleaned.set("business_name", clean_name, has_name)
+
+        category_text = pc.utf8_trim_whitespace(pc.fill_null(category_value, "None"))
+        empty_category = has_category & ~_nonempty(category_text)
+        unknown = _repeat("Unknown", int(empty_category.sum()))
+        cleaned.set("category", _replace(category_text, empty_category, unknown), has_category)
+
+        # Coordinates, then WKT recovery where one is still missing
+        has_lat = columns.has("latitude")
+        has_lon = columns.has("longitude")
+        latitude, _ = number("latitude", has_lat & has_lon)
+        longitude, _ = number("longitude", has_lat & has_lon)
+        lat = latitude if latitude is not None else pa.nulls(size, pa.float64())
+        lon = longitude if longitude is not None else pa.nulls(size, pa.float64())
+        # A lone coordinate passes through as is
+        fallback |= (has_lat & ~has_lon & _valid(lat)) | (has_lon & ~has_lat & _valid(lon))
+        both = has_lat & has_lon
+        numeric = _valid(lat) & _valid(lon)
+        in_bounds = _in_california(lat, lon)
+        invalid_coordinates = both & ~(numeric & in_bounds)
+        unparsable = both & ~numeric
+        lat = _nulled(lat, unparsable)
+        lon = _nulled(lon, unparsable)
+        cleaned.overlay("has_valid_coordinates", both, pa.array(numeric & in_bounds))
+
+        geom_error = np.zeros(size, dtype=bool)
+        geom = column("geom", _is_text)
+        if geom is not None:
+            candidates = ~(_valid(lat) & _valid(lon)) & _nonempty(geom)
+            wkt = select(geom, candidates)
+            fallback[np.flatnonzero(candidates)[~_mask(pc.string_is_ascii(wkt))]] = True
+            point = pc.extract_regex(wkt, _WKT_POINT_PATTERN)
+            matched = _valid(point)
+            lon_text = point.field("lon")
+            lat_text = point.field("lat")
+            parsed = (
+                matched
+                & _mask(pc.match_substring_regex(lon_text, _FLOAT_TEXT_PATTERN))
+                & _mask(pc.match_substring_regex(lat_text, _FLOAT_TEXT_PATTERN))
+            )
+            geom_error[np.flatnonzero(candidates)[matched & ~parsed]] = True
+            if parsed.any():
+                rows = np.zeros(size, dtype=bool)
+                rows[np.flatnonzero(candidates)[parsed]] = True
+                point_lon, point_lat = _parse_points(select(lon_text, parsed), select(lat_text, parsed))
+                point_lon = pa.array(point_lon, pa.float64())
+                point_lat = pa.array(point_lat, pa.float64())
+                lat = _replace(lat, rows, point_lat)
+                lon = _replace(lon, rows, point_lon)
+                has_lat |= rows
+                has_lon |= rows
+                recovered = _in_california(point_lat, point_lon)
+                if recovered.any():
+                    rows[rows] = recovered
+                    cleaned.overlay("has_valid_coordinates", rows, pa.array(np.ones(int(recovered.sum()), dtype=bool)))
+        if has_lat.any() or "latitude" in cleaned.arrays:
+            cleaned.set("latitude", lat, has_lat)
+        if has_lon.any() or "longitude" in cleaned.arrays:
+            cleaned.set("longitude", lon, has_lon)
+
+        phone = column("phone", _is_text, pa.types.is_integer)
+        if phone is not None:
+            if _is_text(phone.type):
+                phone_given = _nonempty(phone)
+                fallback |= phone_given & ~_mask(pc.string_is_ascii(phone))
+                phone_digits, digit_counts = _ascii_digits(phone)
+            else:
+                phone_given = _mask(pc.not_equal(phone, 0))
+                phone_digits, digit_counts = _ascii_digits(phone.cast(string))
+            cleaned.overlay("phone", phone_given, _nulled(phone_digits, digit_counts != 10))
+
+        zip_given = has_zip & _nonempty(zip_value)
+        fallback |= zip_given & ~_mask(pc.string_is_ascii(zip_value))
+        zip_text = pc.utf8_trim_whitespace(zip_value)
+        zip_valid = _zip_code_mask(zip_text)
+        invalid_zip = zip_given & ~zip_valid
+        clean_zip = _replace(zip_value, zip_given & zip_valid, pc.utf8_slice_codeunits(zip_text, 0, 5))
+        if has_zip.any() or "zip_code" in cleaned.arrays:
+            cleaned.set("zip_code", clean_zip, has_zip)
+        if has_id.any() or "business_id" in cleaned.arrays:
+            cleaned.set("business_id", id_value, has_id)
+
+        # Issues of the records the kernels covered, with their rank in
+        # _check_fields' order
+        kernel_rows = ~fallback
+        segments: List[Tuple[str, "np.ndarray", Any, Callable[[int], Any]]] = []
+        for issue_type, mask, rank, field in (
+            ("missing_required_fields", ~name_given, 0, "business_name"),
+            ("missing_required_fields", ~category_given, 1, "category"),
+            ("empty_business_name", empty_name, 2, None),
+            ("long_business_name", long_name, 2, None),
+            ("empty_category", empty_category, 3, None),
+            ("invalid_coordinates", invalid_coordinates, 4, None),
+            ("invalid_geom_coordinates", geom_error, 5, None),
+            ("invalid_zip_code", invalid_zip, 6, None),
+        ):
+            rows = np.flatnonzero(mask & kernel_rows)
+            if field is None:
+                detail = lambda k, rows=rows: f"record_{start_index + int(rows[k])}"
+            else:
+                detail = lambda k, rows=rows, field=field: (f"record_{start_index + int(rows[k])}", field)
+            segments.append((issue_type, rows, rank, detail))
+
+        # Everything else: the row rules, one record at a time
+        rows = np.flatnonzero(fallback).tolist()
+        if rows:
+            checked = []
+            fallback_issues: Dict[str, Tuple[List[int], List[int], List[Any]]] = {}
+            for row, record in zip(rows, columns.records(rows)):
+                record, issues = self._check_fields(record, start_index + row)
+                checked.append(record)
+                for rank, (issue_type, detail) in enumerate(issues):
+                    entry = fallback_issues.setdefault(issue_type, ([], [], []))
+                    entry[0].append(row)
+                    entry[1].append(rank)
+                    entry[2].append(detail)
+            # Other fields are copied from the raw record unchanged; fields
+            # the kernels already got right for these records stay as they are
+            current = cleaned.records(rows, CHECKED_FIELDS)
+            for field in CHECKED_FIELDS:
+                values = [record.get(field, _MISSING) for record in checked]
+                if any(
+                    type(value) is not type(kernel.get(field, _MISSING)) or value != kernel.get(field, _MISSING)
+                    for value, kernel in zip(values, current)
+                ):
+                    cleaned.patch(field, rows, values)
+            for issue_type, (issue_rows, ranks, details) in fallback_issues.items():
+                segments.append((issue_type, np.array(issue_rows), np.array(ranks), details.__getitem__))
+
+        self._assign_business_ids(cleaned, start_index, segments)
+        self._add_issues(segments)
+        return cleaned
+
+    def _assign_business_ids(
+        self,
+        cleaned: RecordColumns,
+        start_index: int,
+        segments: List[Tuple[str, "np.ndarray", Any, Callable[[int], Any]]],
+    ) -> None:
+        """Columnar ``_assign_business_id``; appends the duplicate-id issues to ``segments``."""
+        size = cleaned.size
+        string = pa.string()
+        ids = cleaned.arrays.get("business_id")
+        if ids is not None and _is_text(ids.type) and not cleaned.odd["business_id"]:
+            given = cleaned.has("business_id") & _nonempty(ids)
+            id_text = ids
+        else:
+            values = cleaned.values("business_id") if ids is not None else [_MISSING] * size
+            given = np.array([value is not _MISSING and bool(value) for value in values], dtype=bool)
+            id_text = pa.array([str(value) if given[row] else None for row, value in enumerate(values)], string)
+
+        generate = np.flatnonzero(~given).tolist()
+        if generate:
+            generated = [
+                f"biz_{start_index + row}_{hash(record.get('business_name', ''))}"
+                for row, record in zip(generate, cleaned.records(generate, ["business_name"]))
+            ]
+            if id_text is ids:
+                id_text = _replace(id_text, ~given, pa.array(generated, string))
+                cleaned.set("business_id", id_text, np.ones(size, dtype=bool))
+            else:
+                cleaned.patch("business_id", generate, generated)
+                id_text = _replace(id_text, ~given, pa.array(generated, string))
+        if not size:
+            return
+
+        # Dictionary indices count up in order of first appearance, so a
+        # record repeats an earlier id unless its index is a new maximum
+        indices = pc.dictionary_encode(id_text).indices.to_numpy(zero_copy_only=False)
+        duplicate = np.zeros(size, dtype=bool)
+        duplicate[1:] = indices[1:] <= np.maximum.accumulate(indices)[:-1]
+        rows = np.flatnonzero(duplicate)
+        renamed = pc.binary_join_element_wise(
+            id_text.take(pa.array(rows)), pa.array(rows + start_index).cast(string), "_"
+        )
+        # A renamed id can only clash with another record's id, or with an
+        # id from an earlier call; then take the records in order
+        clash = len(rows) > 0 and pc.any(pc.is_in(id_text, value_set=renamed)).as_py()
+        if self.seen_business_ids or self._batch_ids or clash:
+            for batch_ids, batch_rows, batch_renamed in self._batch_ids:
+                batch = batch_ids.to_pylist()
+                for row, bid in zip(batch_rows.tolist(), batch_renamed.to_pylist()):
+                    batch[row] = bid
+                self.seen_business_ids.update(batch)
+            self._batch_ids = []
+            duplicate[:] = False
+            for row, bid in enumerate(id_text.to_pylist()):
+                if bid in self.seen_business_ids:
+                    duplicate[row] = True
+                    bid = f"{bid}_{start_index + row}"
+                self.seen_business_ids.add(bid)
+            rows = np.flatnonzero(duplicate)
+            renamed = pc.binary_join_element_wise(
+                id_text.take(pa.array(rows)), pa.array(rows + start_index).cast(string), "_"
+            )
+        else:
+            # Ids of this call join the seen set when another call needs them
+            self._batch_ids.append((id_text, rows, renamed))
+
+        if len(rows):
+            cleaned.overlay("business_id_original", duplicate, id_text.take(pa.array(rows)))
+            cleaned.overlay("business_id", duplicate, renamed)
+            segments.append(
+                (
+                    "duplicate_business_id",
+                    rows,
+                    _DUPLICATE_ISSUE_RANK,
+                    lambda k: (f"record_{start_index + int(rows[k])}", id_text[int(rows[k])].as_py()),
+                )
+            )
+
+    def _add_issues(self, segments: List[Tuple[str, "np.ndarray", Any, Callable[[int], Any]]]) -> None:
+        """
+        Add issues given as (issue_type, rows, rank or ranks, detail(k))
+        segments in the order ``validate_record`` would: by record, then by
+        rank within a record.
+        """
+        segments = [segment for segment in segments if len(segment[1])]
+        if not segments:
+            return
+        sizes = np.array([len(rows) for _, rows, _, _ in segments])
+        starts = np.cumsum(sizes) - sizes
+        # Issue order as one sortable key: record, then rank
+        keys = np.concatenate(
+            [(rows.astype(np.int64) << 21) | np.asarray(rank, dtype=np.int64) for _, rows, rank, _ in segments]
+        )
+        owner = np.repeat(np.arange(len(segments)), sizes)
+        offset = np.arange(len(keys)) - np.repeat(starts, sizes)
+
+        def detail(entry: int) -> Any:
+            return segments[owner[entry]][3](int(offset[entry]))
+
+        if self.issues.log_path:
+            # The log lists every issue, so keep the exact interleaving
+            for entry in np.argsort(keys, kind="stable").tolist():
+                self.issues.add(segments[owner[entry]][0], detail(entry))
+            return
+
+        # Each segment is already in record order, so a type only needs its
+        # segments merged (a stable sort finds the sorted runs)
+        by_type: Dict[str, List[int]] = {}
+        for position, (issue_type, _, _, _) in enumerate(segments):
+            by_type.setdefault(issue_type, []).append(position)
+        ordered = []
+        for issue_type, members in by_type.items():
+            entries = np.concatenate([np.arange(starts[j], starts[j] + sizes[j]) for j in members])
+            if len(members) > 1:
+                entries = entries[np.argsort(keys[entries], kind="stable")]
+            ordered.append((keys[entries[0]], issue_type, entries))
+        for _, issue_type, entries in sorted(ordered, key=lambda item: item[0]):
+            self.issues.add_many(issue_type, len(entries), lambda i, entries=entries: detail(int(entries[i])))
+
+
+def load_columns(file_path: str) -> RecordColumns:
+    """
+    Load raw business records as ``RecordColumns``.
+
+    Parquet/Arrow IPC files are read straight into columns (nulls count as
+    missing fields). JSON arrays, ``{"businesses": [...]}`` objects and
+    NDJSON are parsed once and transposed.
+
+    Raises:
+        ValueError: Malformed input
+    """
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+    if suffix in PARQUET_SUFFIXES + ARROW_SUFFIXES:
+        logger.info(f"Loading data from {file_path}")
+        if suffix in PARQUET_SUFFIXES:
+            names = pq.read_schema(path).names
+            table = pq.read_table(path, columns=[f for f in COLUMNAR_FIELDS if f in names], memory_map=True)
+        else:
+            with pa.memory_map(str(path), "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+        logger.info(f"Loaded {table.num_rows} records")
+        return RecordColumns.from_table(table)
+    if suffix in NDJSON_SUFFIXES:
+        logger.info(f"Loading data from {file_path}")
+        records = list(iter_records(file_path))
+        logger.info(f"Loaded {len(records)} records")
+    else:
+        records = load_data(file_path)
+    return RecordColumns.from_records(records)
+
+
 def analyze_categories(data: List[dict]) -> Dict[str, int]:
     """
     Analyze category distribution in the dataset.
@@ -718,69 +3201,63 @@ def analyze_categories(data: List[dict]) -> Dict[str, int]:
     return dict(category_counts)
 
 
-def process_data(input_file: str, output_file: str, openai_api_key: Optional[str] = None):
-    """
-    Main processing function.
-
-    Args:
-        input_file: Path to input JSON file
-        output_file: Path to output JSON file
-        openai_api_key: Optional OpenAI API key for LLM classification
-    """
-    logger.info("=" * 80)
-    logger.info("Business Category Standardization Process Starting")
-    logger.info("=" * 80)
-
-    # Load data
-    data = load_data(input_file)
-    if not data:
-        logger.error("No data loaded. Exiting.")
-        return
-
-    # Initialize standardizer and validator
-    standardizer = CategoryStandardizer(openai_api_key)
-    validator = DataQualityValidator()
-
-    # First pass: validate / clean all records
-    logger.info("Validating and normalizing records...")
-    cleaned_records: List[Dict[str, Any]] = []
-    for index, record in enumerate(data):
-        if index % 100 == 0:
-            logger.info("Validated %d/%d records", index, len(data))
-        cleaned_records.append(validator.validate_record(record, index))
-
-    # Analyze categories (for logging / diagnostics only)
-    analyze_categories(cleaned_records)
-
-    # Build unique list of categories for classification
-    unique_categories = sorted(
-        {rec.get("category", "Unknown") for rec in cleaned_records}
+def _open_cache(cache_path: Optional[str], cache_max_entries: Optional[int]) -> Optional[ClassificationCache]:
+    if not cache_path:
+        return None
+    return ClassificationCache(
+        cache_path,
+        taxonomy_fingerprint(CANONICAL_TAXONOMY),
+        max_entries=cache_max_entries,
     )
-    logger.info("Classifying %d unique categories", len(unique_categories))
 
-    category_mappings = standardizer.classify_categories_bulk(unique_categories)
 
-    # Second pass: attach standardized category info
-    logger.info("Attaching standardized categories to records...")
-    standardized_data: List[Dict[str, Any]] = []
+def _close_cache(cache: Optional[ClassificationCache]) -> Optional[Dict[str, Any]]:
+    """Flush and close the cache, returning its stats for the report."""
+    if cache is None:
+        return None
+    cache.flush()
+    stats = cache.stats()
+    cache.close()
+    return stats
 
-    for rec in cleaned_records:
-        category = rec.get("category", "Unknown")
-        classification = category_mappings.get(category) or CategoryStandardizer._default_classification(category)
 
-        rec["category_original"] = category
-        rec["category_sector"] = classification["standardized_sector"]
-        rec["category_subsector"] = classification["standardized_subsector"]
-        rec["category_confidence"] = classification["confidence"]
-        rec["category_method"] = classification["method"]
+def _attach_classification(rec: dict, category_mappings: Dict[str, Dict[str, Any]]) -> dict:
+    """Copy the standardized category for ``rec["category"]`` onto the record."""
+    category = rec.get("category", "Unknown")
+    classification = category_mappings.get(category) or CategoryStandardizer._default_classification(category)
 
-        standardized_data.append(rec)
+    rec["category_original"] = category
+    rec["category_sector"] = classification["standardized_sector"]
+    rec["category_subsector"] = classification["standardized_subsector"]
+    rec["category_confidence"] = classification["confidence"]
+    rec["category_method"] = classification["method"]
+    return rec
 
-    logger.info(f"Completed processing {len(standardized_data)} records")
 
-    # Generate reports
-    quality_report = validator.generate_report()
+def _slim_record(rec: dict) -> dict:
+    return {key: rec.get(key) for key in SLIM_FIELDS if key in rec}
 
+
+def _timed_iter(items: Iterable[Any], timings: Dict[str, float], phase: str) -> Iterator[Any]:
+    """Yield from ``items``, adding the time spent producing them to ``timings[phase]``."""
+    clock = time.perf_counter
+    iterator = iter(items)
+    while True:
+        start = clock()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            timings[phase] += clock() - start
+            return
+        timings[phase] += clock() - start
+        yield item
+
+
+def _build_classification_report(
+    category_mappings: Dict[str, Dict[str, Any]],
+    standardizer: CategoryStandardizer,
+    cache_stats: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
     classification_report = {
         "total_unique_categories": len(category_mappings),
         "methods": {
@@ -796,54 +3273,44 @@ def process_data(input_file: str, output_file: str, openai_api_key: Optional[str
         "sector_distribution": Counter(m["standardized_sector"] for m in category_mappings.values()),
         "category_mappings": category_mappings
     }
-
-    # Save standardized data (slim planner-friendly view)
-    logger.info(f"Saving standardized data to {output_file}")
-    slim_fields = [
-        # Identity / location
-        "business_id",
-        "business_name",
-        "address",
-        "city",
-        "zip_code",
-        "blockgroup",
-        "latitude",
-        "longitude",
-        "has_valid_coordinates",
-        # Franchise metadata
-        "franchise",
-        "franchise_type",
-        "is_franchise",
-        "confidence",
-        "reasoning",
-        # Categories
-        "categories_raw",
-        "category_original",
-        "category_sector",
-        "category_subsector",
-        "category_confidence",
-        "category_method",
-        # Quality / scoring
-        "avg_rating",
-        # Optional link for UI
-        "url",
-    ]
-
-    slim_records: List[Dict[str, Any]] = []
-    for rec in standardized_data:
-        slim = {key: rec.get(key) for key in slim_fields if key in rec}
-        slim_records.append(slim)
-
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(slim_records, f, indent=2, ensure_ascii=False)
-
-    # Save reports
-    report_file = output_file.replace('.json', '_mapping_report.json')
+    if cache_stats is not None:
+        classification_report["cache"] = cache_stats
+    if standardizer.llm_telemetry is not None:
+        classification_report["llm_telemetry"] = standardizer.llm_telemetry
+    return classification_report
+
+
+def mapping_report_path(output_file: str) -> str:
+    """Mapping report path next to the standardized output."""
+    path = Path(output_file)
+    if path.suffix.lower() in (".json",) + NDJSON_SUFFIXES + PARQUET_SUFFIXES + ARROW_SUFFIXES:
+        return str(path.with_name(f"{path.stem}_mapping_report.json"))
+    return f"{output_file}_mapping_report.json"
+
+
+def manifest_path(output_file: str) -> str:
+    """Incremental-run manifest path next to the standardized output."""
+    path = Path(output_file)
+    if path.suffix.lower() in (".json",) + NDJSON_SUFFIXES:
+        return str(path.with_name(f"{path.stem}_manifest.sqlite"))
+    return f"{output_file}_manifest.sqlite"
+
+
+def _write_report_and_summary(
+    output_file: str,
+    total_records: int,
+    category_mappings: Dict[str, Dict[str, Any]],
+    classification_report: Dict[str, Any],
+    quality_report: Dict[str, Any],
+    incremental: Optional[Dict[str, int]] = None,
+) -> None:
+    """Save the mapping report and log the end-of-run summary."""
+    report_file = mapping_report_path(output_file)
     logger.info(f"Saving mapping report to {report_file}")
 
     full_report = {
         "summary": {
-            "total_records": len(standardized_data),
+            "total_records": total_records,
             "unique_categories": len(category_mappings),
             "data_quality_issues": quality_report["total_issues"]
         },
@@ -851,43 +3318,861 @@ def process_data(input_file: str, output_file: str, openai_api_key: Optional[str
         "quality_report": quality_report,
         "detailed_mappings": classification_report["category_mappings"]
     }
+    if incremental is not None:
+        full_report["summary"]["incremental"] = incremental
 
     with open(report_file, 'w', encoding='utf-8') as f:
         json.dump(full_report, f, indent=2, ensure_ascii=False)
 
+    cache_stats = classification_report.get("cache")
+
     # Print summary
     logger.info("=" * 80)
     logger.info("PROCESSING COMPLETE")
     logger.info("=" * 80)
-    logger.info(f"Total records processed: {len(standardized_data)}")
+    logger.info(f"Total records processed: {total_records}")
     logger.info(f"Unique categories: {len(category_mappings)}")
     logger.info(f"Classification methods:")
     logger.info(f"  - Rule-based: {classification_report['methods']['rule_based']}")
     logger.info(f"  - LLM: {classification_report['methods']['llm']}")
     logger.info(f"  - Unclassified: {classification_report['methods']['unclassified']}")
+    if cache_stats is not None:
+        logger.info(
+            f"Classification cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+            f"{cache_stats['entries']} entries ({cache_stats['bytes_used']} bytes)"
+        )
     logger.info(f"Data quality issues: {quality_report['total_issues']}")
+    if incremental is not None:
+        logger.info(
+            f"Incremental: {incremental['records_new']} new, {incremental['records_changed']} changed, "
+            f"{incremental['records_unchanged']} unchanged, {incremental['records_deleted']} deleted"
+        )
     logger.info(f"\nOutput files:")
     logger.info(f"  - Standardized data: {output_file}")
     logger.info(f"  - Mapping report: {report_file}")
     logger.info("=" * 80)
 
 
+def process_data(
+    input_file: str,
+    output_file: str,
+    openai_api_key: Optional[str] = None,
+    cache_path: Optional[str] = None,
+    cache_max_entries: Optional[int] = None,
+    workers: int = 1,
+    issues_log: Optional[str] = None,
+    timings: Optional[Dict[str, float]] = None,
+):
+    """
+    Main processing function.
+
+    Args:
+        input_file: Path to input JSON file
+        output_file: Path to output JSON file
+        openai_api_key: Optional OpenAI API key for LLM classification
+        cache_path: Optional SQLite file for the persistent classification cache
+        cache_max_entries: Optional cap on the number of cached classifications
+        workers: Validation processes; >1 shards validation across a pool
+        issues_log: Optional NDJSON file receiving every data-quality issue
+        timings: Optional dict that receives the wall seconds of each of
+            ``PIPELINE_PHASES``; serialization includes the reports
+    """
+    logger.info("=" * 80)
+    logger.info("Business Category Standardization Process Starting")
+    logger.info("=" * 80)
+
+    seconds = dict.fromkeys(PIPELINE_PHASES, 0.0)
+    if timings is not None:
+        timings.update(seconds)
+        seconds = timings
+    clock = time.perf_counter
+    start = clock()
+
+    # Load data
+    data = load_data(input_file)
+    seconds["loading"] = clock() - start
+    if not data:
+        logger.error("No data loaded. Exiting.")
+        return
+
+    # Initialize standardizer and validator
+    cache = _open_cache(cache_path, cache_max_entries)
+    standardizer = CategoryStandardizer(openai_api_key, cache=cache)
+    validator = DataQualityValidator(issues_log=issues_log)
+    try:
+        # First pass: validate / clean all records
+        logger.info("Validating and normalizing records...")
+        start = clock()
+        cleaned_records: List[Dict[str, Any]] = []
+        if workers > 1:
+            logger.info("Validating %d records across %d processes", len(data), workers)
+            cleaned_records = validator.validate_records_parallel(data, workers=workers)
+        else:
+            for index, record in enumerate(data):
+                if index % 100 == 0:
+                    logger.info("Validated %d/%d records", index, len(data))
+                cleaned_records.append(validator.validate_record(record, index))
+
+        # Analyze categories (for logging / diagnostics only)
+        analyze_categories(cleaned_records)
+
+        # Build unique list of categories for classification
+        unique_categories = sorted(
+            {rec.get("category", "Unknown") for rec in cleaned_records}
+        )
+        logger.info("Classifying %d unique categories", len(unique_categories))
+        seconds["validation"] = clock() - start
+        start = clock()
+
+        category_mappings = standardizer.classify_categories_bulk(unique_categories)
+        cache_stats = _close_cache(cache)
+        cache = None
+        seconds["classification"] = clock() - start
+        start = clock()
+
+        # Second pass: attach standardized category info
+        logger.info("Attaching standardized categories to records...")
+        standardized_data: List[Dict[str, Any]] = [
+            _attach_classification(rec, category_mappings) for rec in cleaned_records
+        ]
+        seconds["attach"] = clock() - start
+        start = clock()
+
+        logger.info(f"Completed processing {len(standardized_data)} records")
+
+        # Generate reports
+        quality_report = validator.generate_report()
+    finally:
+        _close_cache(cache)
+        validator.close()
+    classification_report = _build_classification_report(category_mappings, standardizer, cache_stats)
+
+    # Save standardized data (slim planner-friendly view)
+    logger.info(f"Saving standardized data to {output_file}")
+    slim_records: List[Dict[str, Any]] = [_slim_record(rec) for rec in standardized_data]
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(slim_records, f, indent=2, ensure_ascii=False)
+
+    _write_report_and_summary(
+        output_file,
+        len(standardized_data),
+        category_mappings,
+        classification_report,
+        quality_report,
+    )
+    seconds["serialization"] = clock() - start
+
+
+def process_data_streaming(
+    input_file: str,
+    output_file: str,
+    openai_api_key: Optional[str] = None,
+    cache_path: Optional[str] = None,
+    cache_max_entries: Optional[int] = None,
+    workers: int = 1,
+    issues_log: Optional[str] = None,
+    timings: Optional[Dict[str, float]] = None,
+):
+    """
+    Constant-memory variant of ``process_data`` writing NDJSON output.
+
+    Pass 1 streams records from ``input_file`` (JSON array or NDJSON)
+    through ``DataQualityValidator``, collects the unique categories and
+    spools the cleaned slim records to a temporary NDJSON file next to the
+    output. Categories are then classified once, and pass 2 streams the
+    spool, attaches the classification and writes one slim record per line.
+    Business-id uniqueness is tracked in a disk-backed set, so peak memory
+    grows with the number of unique categories rather than records.
+
+    Args:
+        input_file: Path to input JSON array or NDJSON file
+        output_file: Path to output NDJSON file
+        openai_api_key: Optional OpenAI API key for LLM classification
+        cache_path: Optional SQLite file for the persistent classification cache
+        cache_max_entries: Optional cap on the number of cached classifications
+        workers: Validation processes; >1 validates each chunk across a pool
+        issues_log: Optional NDJSON file receiving every data-quality issue
+        timings: Optional dict that receives the wall seconds of each of
+            ``PIPELINE_PHASES``; validation includes spooling, attach
+            includes reading the spool back, serialization the reports
+    """
+    logger.info("=" * 80)
+    logger.info("Business Category Standardization Process Starting (streaming)")
+    logger.info("=" * 80)
+
+    seconds = dict.fromkeys(PIPELINE_PHASES, 0.0)
+    if timings is not None:
+        timings.update(seconds)
+        seconds = timings
+    clock = time.perf_counter
+
+    if not Path(input_file).exists():
+        logger.error(f"File not found: {input_file}")
+        return
+
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    spool_path = output_path.with_name(f".{output_path.name}.spool")
+
+    cache = _open_cache(cache_path, cache_max_entries)
+    standardizer = CategoryStandardizer(openai_api_key, cache=cache)
+    seen_ids = DiskBackedIdSet(str(output_path.with_name(f".{output_path.name}.ids.sqlite")))
+    validator = DataQualityValidator(seen_business_ids=seen_ids, issues_log=issues_log)
+    category_counts: Counter = Counter()
+    total_records = 0
+
+    try:
+        # Pass 1: validate, collect categories, spool cleaned records
+        logger.info("Pass 1: validating and spooling records from %s", input_file)
+        start = clock()
+        try:
+            with open(spool_path, "w", encoding="utf-8") as spool:
+                records = _timed_iter(iter_records(input_file), seconds, "loading")
+                validated = _iter_validated(validator, records, workers)
+                for index, cleaned in enumerate(validated):
+                    if index % 100000 == 0:
+                        logger.info("Validated %d records", index)
+                    category_counts[cleaned.get("category", "Unknown")] += 1
+                    slim = _slim_record(cleaned)
+                    slim["category"] = cleaned.get("category", "Unknown")
+                    spool.write(json.dumps(slim, ensure_ascii=False))
+                    spool.write("\n")
+                    total_records += 1
+        except ValueError as e:
+            logger.error(f"Invalid JSON: {str(e)}")
+            return
+        # Parsing happens inside the validation loop; count it once
+        seconds["validation"] = clock() - start - seconds["loading"]
+
+        if not total_records:
+            logger.error("No data loaded. Exiting.")
+            return
+
+        logger.info(f"Found {len(category_counts)} unique categories")
+        logger.info(f"Top 10 categories: {category_counts.most_common(10)}")
+
+        unique_categories = sorted(category_counts)
+        logger.info("Classifying %d unique categories", len(unique_categories))
+        start = clock()
+        category_mappings = standardizer.classify_categories_bulk(unique_categories)
+        cache_stats = _close_cache(cache)
+        cache = None
+        seconds["classification"] = clock() - start
+
+        # Pass 2: attach classifications and stream NDJSON output
+        logger.info(f"Pass 2: saving standardized data to {output_file}")
+        attach_seconds = serialize_seconds = 0.0
+        with open(spool_path, "r", encoding="utf-8") as spool, open(output_file, "w", encoding="utf-8") as out:
+            for line in spool:
+                start = clock()
+                rec = _attach_classification(json.loads(line), category_mappings)
+                attached = clock()
+                out.write(json.dumps(_slim_record(rec), ensure_ascii=False))
+                out.write("\n")
+                attach_seconds += attached - start
+                serialize_seconds += clock() - attached
+
+        logger.info(f"Completed processing {total_records} records")
+
+        start = clock()
+        quality_report = validator.generate_report()
+        classification_report = _build_classification_report(category_mappings, standardizer, cache_stats)
+        _write_report_and_summary(
+            output_file,
+            total_records,
+            category_mappings,
+            classification_report,
+            quality_report,
+        )
+        seconds["attach"] = attach_seconds
+        seconds["serialization"] = serialize_seconds + clock() - start
+    finally:
+        _close_cache(cache)
+        validator.close()
+        seen_ids.close()
+        if spool_path.exists():
+            spool_path.unlink()
+
+
+def _attach_classification_columns(
+    columns: RecordColumns,
+    categories: "pa.Array",
+    category_mappings: Dict[str, Dict[str, Any]],
+) -> None:
+    """Columnar ``_attach_classification``: each distinct category is looked up once."""
+    encoded = pc.dictionary_encode(categories)
+    indices = encoded.indices.to_numpy(zero_copy_only=False)
+    classifications = [
+        category_mappings.get(category) or CategoryStandardizer._default_classification(category)
+        for category in encoded.dictionary.to_pylist()
+    ]
+    present = np.ones(columns.size, dtype=bool)
+    columns.set("category_original", categories, present)
+    for field, key in (
+        ("category_sector", "standardized_sector"),
+        ("category_subsector", "standardized_subsector"),
+        ("category_confidence", "confidence"),
+        ("category_method", "method"),
+    ):
+        values = _objects([classification[key] for classification in classifications])
+        array, odd = _arrow_values(values)
+        if odd:
+            array, odd = _arrow_values(values[indices])
+        else:
+            array = array.take(pa.array(indices))
+        columns.set(field, array, present, odd)
+
+
+def _write_columns(columns: RecordColumns, output_file: str) -> None:
+    """Write the slim fields as Parquet/Arrow IPC, NDJSON or a JSON array, by suffix."""
+    path = Path(output_file)
+    suffix = path.suffix.lower()
+    if suffix in PARQUET_SUFFIXES:
+        pq.write_table(columns.to_table(SLIM_FIELDS), path)
+    elif suffix in ARROW_SUFFIXES:
+        table = columns.to_table(SLIM_FIELDS)
+        with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        output_format = "ndjson" if suffix in NDJSON_SUFFIXES else "json"
+        records = columns.to_records(SLIM_FIELDS)
+        _write_output(path, (_encode_output(rec, output_format) for rec in records), output_format)
+
+
+def process_data_columnar(
+    input_file: str,
+    output_file: str,
+    openai_api_key: Optional[str] = None,
+    cache_path: Optional[str] = None,
+    cache_max_entries: Optional[int] = None,
+    issues_log: Optional[str] = None,
+    timings: Optional[Dict[str, float]] = None,
+):
+    """
+    Columnar variant of ``process_data``.
+
+    Records stay in ``RecordColumns`` from input to output: they are read
+    straight from Parquet/Arrow (or parsed once from JSON/NDJSON),
+    validated by ``ColumnarDataQualityValidator``, and given the
+    classification of their category by a dictionary lookup. Parquet/Arrow
+    output is written from the columns; JSON array and NDJSON output holds
+    the same records as ``process_data``, and so does the report.
+
+    Args:
+        input_file: Path to input JSON array, NDJSON, Parquet or Arrow IPC file
+        output_file: Path to output file; the suffix picks the format
+            (``.parquet``/``.pq``, ``.arrow``/``.feather``/``.ipc``,
+            ``.ndjson``/``.jsonl``, else a JSON array)
+        openai_api_key: Optional OpenAI API key for LLM classification
+        cache_path: Optional SQLite file for the persistent classification cache
+        cache_max_entries: Optional cap on the number of cached classifications
+        issues_log: Optional NDJSON file receiving every data-quality issue
+        timings: Optional dict that receives the wall seconds of each of
+            ``PIPELINE_PHASES``; serialization includes the reports
+    """
+    if not (NUMPY_AVAILABLE and PYARROW_AVAILABLE):
+        raise ImportError("numpy and pyarrow are required for the columnar backend")
+
+    logger.info("=" * 80)
+    logger.info("Business Category Standardization Process Starting (columnar)")
+    logger.info("=" * 80)
+
+    seconds = dict.fromkeys(PIPELINE_PHASES, 0.0)
+    if timings is not None:
+        timings.update(seconds)
+        seconds = timings
+    clock = time.perf_counter
+
+    if not Path(input_file).exists():
+        logger.error(f"File not found: {input_file}")
+        return
+
+    start = clock()
+    try:
+        columns = load_columns(input_file)
+    except ValueError as e:
+        logger.error(f"Invalid input: {str(e)}")
+        return
+    seconds["loading"] = clock() - start
+    if not columns.size:
+        logger.error("No data loaded. Exiting.")
+        return
+
+    cache = _open_cache(cache_path, cache_max_entries)
+    standardizer = CategoryStandardizer(openai_api_key, cache=cache)
+    validator = ColumnarDataQualityValidator(issues_log=issues_log)
+    try:
+        logger.info("Validating and normalizing %d records...", columns.size)
+        start = clock()
+        cleaned = validator.validate_columns(columns)
+        del columns
+
+        categories = cleaned.arrays.get("category", pa.nulls(cleaned.size)).cast(pa.string())
+        categories = pc.if_else(pa.array(cleaned.has("category")), categories, "Unknown")
+        encoded = pc.dictionary_encode(categories)
+        unique_categories = encoded.dictionary.to_pylist()
+        counts = np.bincount(encoded.indices.to_numpy(zero_copy_only=False), minlength=len(unique_categories))
+        category_counts = Counter(dict(zip(unique_categories, counts.tolist())))
+        logger.info(f"Found {len(category_counts)} unique categories")
+        logger.info(f"Top 10 categories: {category_counts.most_common(10)}")
+
+        unique_categories = sorted(unique_categories)
+        logger.info("Classifying %d unique categories", len(unique_categories))
+        seconds["validation"] = clock() - start
+        start = clock()
+
+        category_mappings = standardizer.classify_categories_bulk(unique_categories)
+        cache_stats = _close_cache(cache)
+        cache = None
+        seconds["classification"] = clock() - start
+        start = clock()
+
+        logger.info("Attaching standardized categories to records...")
+        _attach_classification_columns(cleaned, categories, category_mappings)
+        seconds["attach"] = clock() - start
+        start = clock()
+
+        logger.info(f"Completed processing {cleaned.size} records")
+
+        quality_report = validator.generate_report()
+    finally:
+        _close_cache(cache)
+        validator.close()
+    classification_report = _build_classification_report(category_mappings, standardizer, cache_stats)
+
+    logger.info(f"Saving standardized data to {output_file}")
+    _write_columns(cleaned, output_file)
+
+    _write_report_and_summary(
+        output_file,
+        cleaned.size,
+        category_mappings,
+        classification_report,
+        quality_report,
+    )
+    seconds["serialization"] = clock() - start
+
+
+def _encode_output(rec: dict, output_format: str) -> str:
+    """
+    Serialize one output record: a compact NDJSON line, or an element of
+    the ``json.dump(records, f, indent=2, ensure_ascii=False)`` array.
+    """
+    if output_format == "ndjson":
+        return json.dumps(rec, ensure_ascii=False)
+    return json.dumps(rec, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+
+
+def _write_output(path: Path, items: Iterable[str], output_format: str) -> None:
+    """Write records serialized by ``_encode_output``."""
+    with open(path, "w", encoding="utf-8") as f:
+        if output_format == "ndjson":
+            for item in items:
+                f.write(item)
+                f.write("\n")
+            return
+        first = True
+        for item in items:
+            f.write("[\n  " if first else ",\n  ")
+            f.write(item)
+            first = False
+        f.write("[]" if first else "\n]")
+
+
+def _stat_key(path: Union[str, Path]) -> Optional[List[int]]:
+    """[size, mtime_ns] of a file, None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def process_data_incremental(
+    input_file: str,
+    output_file: str,
+    openai_api_key: Optional[str] = None,
+    cache_path: Optional[str] = None,
+    cache_max_entries: Optional[int] = None,
+    manifest_file: Optional[str] = None,
+    issues_log: Optional[str] = None,
+):
+    """
+    Incremental variant of ``process_data`` for repeated runs over an input
+    that changes a little between runs.
+
+    Every record is hashed and compared with the manifest kept from the
+    previous run (default: ``<output stem>_manifest.sqlite``). Only new and
+    changed records are validated and classified; unchanged records are
+    taken from the manifest and records no longer in the input are
+    dropped. The output (NDJSON for .ndjson/.jsonl, otherwise a JSON array)
+    and the mapping report are then rebuilt from the merged state, in input
+    order. The first run, with no manifest, processes every record.
+
+    A rerun whose input file has the size and mtime (or, failing that, the
+    SHA-256) recorded by the last run, with that run's output, mapping
+    report and issues log still in place, returns before parsing any record
+    and leaves them as they are. Business-id collisions are checked against the
+    manifest's index rather than a set of every stored id.
+
+    Records are matched across runs by business_id (or ``ca_biz_<id>``),
+    falling back to the content hash. A changed record is validated against
+    the business ids of all unchanged records, so when ids collide the
+    ``_<index>`` suffix goes to the changed record, where a full run would
+    give it to the later record. Unchanged records keep the business_id
+    they were given when last validated: after deletions shift input
+    positions, their ``_<index>`` suffixes (and generated ``biz_<index>_...``
+    ids) still carry the old index, where a full run would use the new one.
+
+    Args:
+        input_file: Path to input JSON array or NDJSON file
+        output_file: Path to output JSON array or NDJSON file
+        openai_api_key: Optional OpenAI API key for LLM classification
+        cache_path: Optional SQLite file for the persistent classification cache
+        cache_max_entries: Optional cap on the number of cached classifications
+        manifest_file: Optional path for the run-to-run manifest
+        issues_log: Optional NDJSON file receiving every data-quality issue
+    """
+    logger.info("=" * 80)
+    logger.info("Business Category Standardization Process Starting (incremental)")
+    logger.info("=" * 80)
+
+    if not Path(input_file).exists():
+        logger.error(f"File not found: {input_file}")
+        return
+
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_format = "ndjson" if output_path.suffix.lower() in NDJSON_SUFFIXES else "json"
+    manifest = RecordManifest(manifest_file or manifest_path(output_file), taxonomy_fingerprint(CANONICAL_TAXONOMY))
+    stored_format = manifest.get_meta("output_format") or output_format
+    manifest.set_meta("output_format", output_format)
+    cache = None
+    report: Optional[DataQualityValidator] = None
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+
+    # The file-level check: an input identical to the last run's, whose
+    # output is still in place, needs no work at all
+    run_state = {
+        "input": str(Path(input_file).resolve()),
+        "output": str(output_path.resolve()),
+        "output_format": output_format,
+        "issues_log": str(Path(issues_log).resolve()) if issues_log else None,
+    }
+    last_run = json.loads(manifest.get_meta("last_run") or "{}")
+    input_stat = _stat_key(input_file)
+    input_hash = None
+    if (
+        last_run.get("state") == run_state
+        and last_run.get("output_stat") == _stat_key(output_path)
+        and Path(mapping_report_path(output_file)).exists()
+        and (issues_log is None or Path(issues_log).exists())
+    ):
+        if input_stat != last_run.get("input_stat"):
+            # Touched or rewritten: the content decides
+            input_hash = file_fingerprint(input_file)
+        if input_hash is None or input_hash == last_run.get("input_sha256"):
+            last_run["input_stat"] = input_stat
+            manifest.set_meta("last_run", json.dumps(last_run))
+            manifest.commit()
+            manifest.close()
+            logger.info("Input unchanged since the last run; %s is current", output_file)
+            return
+    if input_hash is None:
+        input_hash = file_fingerprint(input_file)
+
+    try:
+        # Pass 1: hash every record and pick out the new / changed ones
+        logger.info("Comparing %s against manifest %s", input_file, manifest.path)
+        keys: List[str] = []
+        occurrences: Counter = Counter()
+        changed: List[Tuple[int, str, str, dict]] = []
+        new_records = 0
+        batch: List[Tuple[int, str, str, dict]] = []
+
+        def compare(batch: List[Tuple[int, str, str, dict]], changed: List[Tuple[int, str, str, dict]]) -> int:
+            stored = manifest.fingerprints([key for _, key, _, _ in batch])
+            added = 0
+            for item in batch:
+                previous = stored.get(item[1])
+                if previous != item[2]:
+                    changed.append(item)
+                    added += previous is None
+            return added
+
+        try:
+            for index, record in enumerate(iter_records(input_file)):
+                fingerprint = record_fingerprint(record)
+                key = _record_key(record, fingerprint)
+                occurrences[key] += 1
+                if occurrences[key] > 1:
+                    key = f"{key}#{occurrences[key]}"
+                keys.append(key)
+                batch.append((index, key, fingerprint, record))
+                if len(batch) >= 1000:
+                    new_records += compare(batch, changed)
+                    batch = []
+        except ValueError as e:
+            logger.error(f"Invalid JSON: {str(e)}")
+            return
+        if batch:
+            new_records += compare(batch, changed)
+        del occurrences, batch
+
+        if not keys:
+            logger.error("No data loaded. Exiting.")
+            return
+
+        current = set(keys)
+        deleted = [key for key in manifest.keys() if key not in current]
+        del current
+        manifest.delete_many(deleted)
+        # Changed records get new ids below; drop their old ones
+        manifest.delete_many([key for _, key, _, _ in changed])
+        delta = {
+            "records_new": new_records,
+            "records_changed": len(changed) - new_records,
+            "records_unchanged": len(keys) - len(changed),
+            "records_deleted": len(deleted),
+        }
+        logger.info(
+            "Delta: %d new, %d changed, %d unchanged, %d deleted",
+            delta["records_new"],
+            delta["records_changed"],
+            delta["records_unchanged"],
+            delta["records_deleted"],
+        )
+
+        # Validate the delta, in input order, against the ids already taken
+        validator = DataQualityValidator(seen_business_ids=ManifestIdSet(manifest))
+        checked: List[Tuple[str, str, dict, List[Tuple[str, Any]]]] = []
+        for index, key, fingerprint, record in changed:
+            cleaned, issues = validator._check_fields(record, index)
+            validator._assign_business_id(cleaned, index, issues)
+            checked.append((key, fingerprint, cleaned, issues))
+        del changed
+
+        # Classify categories not seen before (and retry unclassified ones)
+        stored_mappings = manifest.category_mappings()
+        categories_in_use = manifest.categories() | {
+            cleaned.get("category", "Unknown") for _, _, cleaned, _ in checked
+        }
+        to_classify = sorted(
+            category
+            for category in categories_in_use
+            if category not in stored_mappings or stored_mappings[category]["method"] == "unclassified"
+        )
+        cache = _open_cache(cache_path, cache_max_entries)
+        standardizer = CategoryStandardizer(openai_api_key, cache=cache)
+        logger.info("Classifying %d new categories", len(to_classify))
+        classified = standardizer.classify_categories_bulk(to_classify) if to_classify else {}
+        cache_stats = _close_cache(cache)
+        cache = None
+        category_mappings = {
+            category: classified.get(category) or stored_mappings[category]
+            for category in sorted(categories_in_use)
+        }
+
+        # Unchanged records whose category was just reclassified
+        remapped = [c for c in classified if c in stored_mappings and classified[c] != stored_mappings[c]]
+        if remapped:
+            updates = []
+            for key, category, output in manifest.entries_in_categories(remapped):
+                rec = json.loads(output)
+                rec["category"] = category
+                slim = _slim_record(_attach_classification(rec, category_mappings))
+                updates.append((_encode_output(slim, stored_format), key))
+            manifest.update_outputs(updates)
+
+        manifest.put_many(
+            [
+                (
+                    key,
+                    fingerprint,
+                    str(cleaned["business_id"]),
+                    cleaned.get("category", "Unknown"),
+                    _encode_output(_slim_record(_attach_classification(cleaned, category_mappings)), stored_format),
+                    json.dumps(
+                        [[issue_type, detail[1] if isinstance(detail, tuple) else None] for issue_type, detail in issues],
+                        ensure_ascii=False,
+                    ),
+                )
+                for key, fingerprint, cleaned, issues in checked
+            ]
+        )
+        del checked
+        manifest.replace_category_mappings(category_mappings)
+
+        # Pass 2: rebuild the output and issue report from the manifest
+        logger.info(f"Saving standardized data to {output_file}")
+        report = DataQualityValidator(issues_log=issues_log)
+        reformatted: List[Tuple[str, str]] = []
+
+        def outputs() -> Iterator[str]:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                entries = manifest.entries(chunk)
+                for index, key in enumerate(chunk, start):
+                    _, output, issues = entries[key]
+                    if issues != "[]":
+                        record_id = f"record_{index}"
+                        for issue_type, extra in json.loads(issues):
+                            report.issues.add(issue_type, record_id if extra is None else (record_id, extra))
+                    # Stored records are re-serialized only when the output
+                    # format changed since the last run
+                    if stored_format != output_format:
+                        output = _encode_output(json.loads(output), output_format)
+                        reformatted.append((output, key))
+                    yield output
+
+        _write_output(tmp_path, outputs(), output_format)
+        os.replace(tmp_path, output_path)
+        manifest.update_outputs(reformatted)
+        manifest.set_meta(
+            "last_run",
+            json.dumps(
+                {
+                    "state": run_state,
+                    "input_stat": input_stat,
+                    "input_sha256": input_hash,
+                    "output_stat": _stat_key(output_path),
+                }
+            ),
+        )
+        manifest.commit()
+
+        logger.info(f"Completed processing {len(keys)} records")
+
+        quality_report = report.generate_report()
+        classification_report = _build_classification_report(category_mappings, standardizer, cache_stats)
+        _write_report_and_summary(
+            output_file,
+            len(keys),
+            category_mappings,
+            classification_report,
+            quality_report,
+            incremental=delta,
+        )
+    finally:
+        _close_cache(cache)
+        if report is not None:
+            report.close()
+        manifest.close()
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
 if __name__ == "__main__":
     # Configuration
     BASE_DIR = Path(__file__).parent.parent
     INPUT_FILE = BASE_DIR / "data" / "ca_businesses_with_ai_franchise copy.json"
     OUTPUT_FILE = BASE_DIR / "data" / "ca_businesses_standardized.json"
 
+    parser = argparse.ArgumentParser(
+        description="Standardize business categories and validate records."
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        default=str(INPUT_FILE),
+        help="Raw business JSON array or NDJSON file",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Output path (default: data/ca_businesses_standardized.json, "
+        "or .ndjson with --streaming)",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream records in two passes with constant memory and write NDJSON",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used for record validation (default: 1)",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Validate and classify records as Arrow columns; reads and writes "
+        "Parquet/Arrow as well as JSON (format follows the suffix)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only process records that changed since the last incremental run "
+        "and merge them into its output (format follows the output suffix)",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        help="Manifest for --incremental (default: <output stem>_manifest.sqlite)",
+    )
+    parser.add_argument(
+        "--issues-log",
+        type=str,
+        help="Write every data-quality issue to this NDJSON file; the report "
+        "keeps exact counts and ISSUE_SAMPLE_SIZE (default 100) examples per type",
+    )
+    args = parser.parse_args()
+    if args.incremental:
+        # Incremental runs validate only the delta, serially, and pick the
+        # output format from the output suffix
+        ignored = [
+            flag
+            for flag, used in (("--streaming", args.streaming), ("--workers", args.workers != 1), ("--columnar", args.columnar))
+            if used
+        ]
+        if ignored:
+            parser.error(f"--incremental cannot be combined with {' or '.join(ignored)}")
+    elif args.columnar:
+        # The columnar backend validates in one process from loaded columns
+        ignored = [flag for flag, used in (("--streaming", args.streaming), ("--workers", args.workers != 1)) if used]
+        if ignored:
+            parser.error(f"--columnar cannot be combined with {' or '.join(ignored)}")
+
+    input_file = Path(args.input)
+    if args.output:
+        output_file = Path(args.output)
+    elif args.streaming:
+        output_file = OUTPUT_FILE.with_suffix(".ndjson")
+    else:
+        output_file = OUTPUT_FILE
+
     # Get OpenAI API key from environment (optional)
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-    if not INPUT_FILE.exists():
-        logger.error(f"Input file not found: {INPUT_FILE}")
+    # Persistent classification cache; set CLASSIFICATION_CACHE_PATH="" to disable
+    CACHE_PATH = os.getenv(
+        "CLASSIFICATION_CACHE_PATH",
+        str(BASE_DIR / "data" / "category_classification_cache.sqlite"),
+    )
+    try:
+        CACHE_MAX_ENTRIES = int(os.getenv("CLASSIFICATION_CACHE_MAX_ENTRIES", "0")) or None
+    except ValueError:
+        CACHE_MAX_ENTRIES = None
+
+    if not input_file.exists():
+        logger.error(f"Input file not found: {input_file}")
         sys.exit(1)
 
     # Run processing
-    process_data(
-        input_file=str(INPUT_FILE),
-        output_file=str(OUTPUT_FILE),
-        openai_api_key=OPENAI_API_KEY
+    common = dict(
+        input_file=str(input_file),
+        output_file=str(output_file),
+        openai_api_key=OPENAI_API_KEY,
+        cache_path=CACHE_PATH or None,
+        cache_max_entries=CACHE_MAX_ENTRIES,
+        issues_log=args.issues_log,
     )
+    if args.incremental:
+        process_data_incremental(**common, manifest_file=args.manifest)
+    elif args.columnar:
+        process_data_columnar(**common)
+    else:
+        run = process_data_streaming if args.streaming else process_data
+        run(**common, workers=args.workers)